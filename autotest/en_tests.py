@@ -168,6 +168,63 @@ def deviations_test():
     s = oe_base_devs.loc["base", :].apply(np.abs).sum()
     assert s == 0.0
 
+    # deviations of an untransformed ensemble are in log space and don't change it
+    pe.back_transform()
+    org = pe._df.copy()
+    pe_devs = pe.get_deviations()
+    assert not pe.istransformed
+    assert (pe._df - org).apply(np.abs).values.max() == 0.0
+    log_vals = np.log10(org.values)
+    assert np.abs(pe_devs._df.values - (log_vals - log_vals.mean(axis=0))).max() < 1.0e-10
+
+    cov = oe.covariance_matrix()
+    assert type(cov) == pyemu.Cov
+    devs = oe.values - oe.values.mean(axis=0)
+    assert np.abs(cov.x - np.dot(devs.T, devs) / (oe.shape[0] - 1)).max() < 1.0e-10
+
+
+def arithmetic_test():
+    pst = pyemu.Pst(os.path.join("pst", "pest.pst"))
+    oe = pyemu.ObservationEnsemble.from_gaussian_draw(pst, num_reals=10)
+    vals = oe._df.values.copy()
+    for en in [oe + 1.0, 1.0 + oe, oe - oe, 1.0 - oe, oe * 2.0, oe / oe, -oe, oe ** 2,
+               oe - oe._df.iloc[0, :]]:
+        assert type(en) == pyemu.ObservationEnsemble
+        assert en.shape == oe.shape
+    assert np.abs((1.0 - oe)._df.values - (1.0 - vals)).max() == 0.0
+
+    # numpy ufuncs, abs() and array conversion
+    for en in [np.abs(oe - oe * 2.0), np.sqrt(oe * oe), abs(-oe), np.add(oe, oe)]:
+        assert type(en) == pyemu.ObservationEnsemble
+        assert en.shape == oe.shape
+    assert np.abs(np.sqrt(oe * oe)._df.values - np.abs(vals)).max() < 1.0e-10
+    assert np.array_equal(np.asarray(oe), vals)
+    assert np.abs(oe).max().max() == np.abs(vals).max()
+    m = pyemu.Matrix.from_dataframe(oe - vals.mean(axis=0))
+    assert np.abs(m.x - (vals - vals.mean(axis=0))).max() < 1.0e-10
+    assert m.row_names == [str(i) for i in oe.index]
+    # Matrix operators take Ensemble operands like DataFrames
+    r = m + oe * 2.0
+    assert np.abs(r.x - (vals - vals.mean(axis=0) + 2.0 * vals)).max() < 1.0e-10
+    r = m.T * (oe * 2.0)
+    assert np.abs(r.x - np.dot(m.x.T, 2.0 * vals)).max() < 1.0e-8
+
+    # in-place operators work on the values directly
+    values = oe._df.values
+    oe += 1.0
+    oe *= 2.0
+    oe -= np.ones(oe.shape[1])
+    assert type(oe) == pyemu.ObservationEnsemble
+    assert np.shares_memory(values, oe._df.values)
+    assert np.abs(oe._df.values - ((vals + 1.0) * 2.0 - 1.0)).max() < 1.0e-10
+
+    try:
+        oe.junk
+    except AttributeError:
+        pass
+    else:
+        raise Exception("should have failed")
+
 
 def as_pyemu_matrix_test():
     pst = pyemu.Pst(os.path.join("pst", "pest.pst"))
@@ -260,6 +317,47 @@ def enforce_test():
     pe.enforce(how="drop")
     assert pe.shape[0] == num_reals - 1
 
+    # enforce a copy in transformed space
+    num_reals = 20
+    pe = pyemu.ParameterEnsemble.from_gaussian_draw(pst, num_reals=num_reals)
+    pe._df.iloc[::2, :] *= 10.0
+    pe.transform()
+    org = pe._df.copy()
+    for how in ["reset", "scale", "drop"]:
+        pe1 = pe.enforce(how=how, inplace=False)
+        assert (pe._df - org).apply(np.abs).max().max() == 0.0
+        assert pe1.istransformed
+        pe1.back_transform()
+        assert np.all(pe1._df.values <= pe1.ubnd.loc[pe1.columns].values + 1.0e-10)
+        assert np.all(pe1._df.values >= pe1.lbnd.loc[pe1.columns].values - 1.0e-10)
+        if how == "drop":
+            assert pe1.shape[0] < num_reals
+        else:
+            assert pe1.shape[0] == num_reals
+    assert pe.enforce(how=None) is None
+
+def project_factored_test():
+    import os
+    import numpy as np
+    import pyemu
+
+    ev = pyemu.ErrVar(jco=os.path.join("la", "pest.jcb"))
+    pst = ev.pst
+    pe = pyemu.ParameterEnsemble.from_gaussian_draw(pst, num_reals=20)
+    pe_proj = pe.project(ev.get_null_proj(maxsing=3))
+    v1 = ev.get_null_proj(maxsing=3, factored=True)
+    assert v1.shape == (pst.npar, 3)
+    pe_fac = pe.project(v1)
+    assert not pe_fac.istransformed
+    assert np.abs(pe_proj._df.values - pe_fac._df.values).max() < 1.0e-10
+
+    # the projected deviations are orthogonal to the solution space
+    pe_fac = pe.project(v1, center_on=pe.index[0], enforce_bounds=None)
+    pe_fac.transform()
+    pdiff = pe_fac._df.loc[:, v1.row_names].values - pe_fac._df.loc[pe.index[0], v1.row_names].values
+    assert np.abs(np.dot(pdiff, v1.x)).max() < 1.0e-10
+
+
 def pnulpar_test():
     import os
     import pyemu
@@ -479,6 +577,80 @@ def factor_draw_test():
     pe_eig = pyemu.ParameterEnsemble.from_gaussian_draw(pst, cov=emp_cov, num_reals=num_reals, factor="eigen")
 
 
+def gaussian_draw_test():
+    import numpy as np
+    import pyemu
+    npar = 40
+    pst = pyemu.Pst.from_par_obs_names(["p{0}".format(i) for i in range(npar)], ["o1"])
+    par = pst.parameter_data
+    par.loc[:, "pargp"] = ["g{0}".format(i % 2) for i in range(npar)]
+    par.loc[par.parnme[::4], "partrans"] = "none"
+    x = np.random.random((npar, npar))
+    cov = pyemu.Cov(x=np.dot(x, x.T) / npar + np.eye(npar) * 0.1, names=pst.par_names)
+    cov_df = cov.to_dataframe()
+    num_reals = 20000
+    for factor in ["eigen", "svd", "cholesky"]:
+        cache = {}
+        for by_groups in [True, False]:
+            pe = pyemu.ParameterEnsemble.from_gaussian_draw(
+                pst, cov=cov, num_reals=num_reals, factor=factor, by_groups=by_groups,
+                factor_cache=cache)
+            pe.transform()
+            emp_df = pe.covariance_matrix().to_dataframe()
+            if by_groups:
+                # groups are drawn without cross-group correlation
+                for g in ["g0", "g1"]:
+                    names = par.loc[par.pargp == g, "parnme"].tolist()
+                    d = np.abs(emp_df.loc[names, names] - cov_df.loc[names, names])
+                    assert d.values.max() < 0.05, (factor, d.values.max())
+            else:
+                d = np.abs(emp_df - cov_df.loc[emp_df.index, emp_df.columns])
+                assert d.values.max() < 0.05, (factor, d.values.max())
+        assert len(cache) == 3
+        # cached factors give the same draws
+        pyemu.en.Ensemble.reseed()
+        pe1 = pyemu.ParameterEnsemble.from_gaussian_draw(
+            pst, cov=cov, num_reals=10, factor=factor, factor_cache=cache)
+        pyemu.en.Ensemble.reseed()
+        pe2 = pyemu.ParameterEnsemble.from_gaussian_draw(
+            pst, cov=cov, num_reals=10, factor=factor)
+        assert np.allclose(pe1.values, pe2.values)
+
+    pe = pyemu.ParameterEnsemble.from_gaussian_draw(pst, cov=cov, num_reals=10, dtype=np.float32)
+    assert (pe._df.dtypes == np.float32).all()
+    pe = pyemu.ParameterEnsemble.from_gaussian_draw(pst, num_reals=10, dtype=np.float32)
+    assert (pe._df.dtypes == np.float32).all()
+    assert pe.shape == (10, npar)
+
+
+def gaussian_draw_stream_test():
+    import numpy as np
+    import pyemu
+    npar = 30
+    pst = pyemu.Pst.from_par_obs_names(["p{0}".format(i) for i in range(npar)], ["o1"])
+    par = pst.parameter_data
+    par.loc[:, "pargp"] = ["g{0}".format(i % 3) for i in range(npar)]
+    x = np.random.random((npar, npar))
+    cov = pyemu.Cov(x=np.dot(x, x.T) / npar + np.eye(npar) * 0.1, names=pst.par_names)
+    pe1 = pyemu.ParameterEnsemble.from_gaussian_draw(pst, cov=cov, num_reals=100, seed=7)
+    pe3 = pyemu.ParameterEnsemble.from_gaussian_draw(pst, cov=cov, num_reals=100, seed=7,
+                                                     num_workers=3)
+    assert np.allclose(pe1.values, pe3.values)
+    pe = pyemu.ParameterEnsemble.from_gaussian_draw(pst, cov=cov, num_reals=100, seed=8)
+    assert not np.allclose(pe1.values, pe.values)
+
+    # seeded from np.random if only num_workers is passed
+    pyemu.en.Ensemble.reseed()
+    pe1 = pyemu.ParameterEnsemble.from_gaussian_draw(pst, num_reals=100, num_workers=2)
+    pyemu.en.Ensemble.reseed()
+    pe2 = pyemu.ParameterEnsemble.from_gaussian_draw(pst, num_reals=100, num_workers=1)
+    assert np.allclose(pe1.values, pe2.values)
+
+    oe1 = pyemu.ObservationEnsemble.from_gaussian_draw(pst, num_reals=10, seed=1)
+    oe2 = pyemu.ObservationEnsemble.from_gaussian_draw(pst, num_reals=10, seed=1)
+    assert np.allclose(oe1.values, oe2.values)
+
+
 def emp_cov_draw_test():
     import os
     import numpy as np
@@ -614,6 +786,101 @@ def binary_test():
     print((e2 - s2).total_seconds())
 
 
+def columnar_test():
+    import os
+    import numpy as np
+    import pandas as pd
+    import pyemu
+    npar = 1000
+    nreal = 50
+    par_names = ["p{0}".format(i) for i in range(npar)]
+    pst = pyemu.Pst.from_par_obs_names(par_names, ["o1"])
+    arr = np.random.random((nreal, npar))
+    par_file = os.path.join("temp", "par.col")
+    obs_file = os.path.join("temp", "obs.col")
+    pe = pyemu.ParameterEnsemble(pst=pst, df=pd.DataFrame(data=arr, columns=par_names))
+    pe.to_columnar(par_file)
+    pe1 = pyemu.ParameterEnsemble.from_columnar(pst=pst, filename=par_file)
+    assert pe1.index.tolist() == pe.index.tolist()
+    assert pe1.columns.tolist() == par_names
+    assert np.abs(pe1.values - arr).max() == 0.0
+
+    # partial reads, in the requested order
+    cols = [par_names[10], par_names[3], par_names[500]]
+    pe2 = pyemu.ParameterEnsemble.from_columnar(
+        pst=pst, filename=par_file, columns=cols, reals=[7, 2]
+    )
+    assert pe2.shape == (2, 3)
+    assert pe2.index.tolist() == [7, 2]
+    assert np.abs(pe2.values - pe.loc[[7, 2], cols].values).max() == 0.0
+
+    # memory-mapped values are copy-on-write
+    pe3 = pyemu.ParameterEnsemble.from_columnar(
+        pst=pst, filename=par_file, columns=par_names[5:9], mmap=True
+    )
+    assert np.abs(pe3.values - arr[:, 5:9]).max() == 0.0
+    pe3.loc[:, par_names[5]] = -1.0
+    pe4 = pyemu.ParameterEnsemble.from_columnar(
+        pst=pst, filename=par_file, columns=[par_names[5]]
+    )
+    assert np.abs(pe4.values[:, 0] - arr[:, 5]).max() == 0.0
+
+    # single precision with string realization names
+    oe = pyemu.ObservationEnsemble(
+        pst=pst, df=pd.DataFrame(data=arr, index=["r{0}".format(i) for i in range(nreal)],
+                                 columns=par_names))
+    oe.to_columnar(obs_file, dtype=np.float32)
+    oe1 = pyemu.ObservationEnsemble.from_columnar(pst=pst, filename=obs_file, reals=["r3"])
+    assert oe1.index.tolist() == ["r3"]
+    assert np.abs(oe1.values[0] - arr[3].astype(np.float32)).max() == 0.0
+
+    try:
+        pyemu.ParameterEnsemble.from_columnar(pst=pst, filename=par_file, columns=["junk"])
+    except Exception as e:
+        assert "junk" in str(e)
+    else:
+        raise Exception("should have failed")
+
+
+def resample_test():
+    import os
+    import numpy as np
+    import pandas as pd
+    import pyemu
+
+    pst = pyemu.Pst(os.path.join("pst", "pest.pst"))
+    pe = pyemu.ParameterEnsemble.from_gaussian_draw(pst, num_reals=57)
+    nreal = pe.shape[0]
+
+    idxs = pe.get_resample_indices(50, seed=1)
+    assert idxs.shape == (50, nreal)
+    assert np.array_equal(idxs, pe.get_resample_indices(50, seed=1))
+    idxs = pe.get_resample_indices(50, how="subset", num_reals=20)
+    assert idxs.shape == (50, 20)
+    assert all([len(set(row)) == 20 for row in idxs])
+    idxs = pe.get_resample_indices(how="jackknife")
+    assert idxs.shape == (nreal, nreal - 1)
+    assert all([i not in row for i, row in enumerate(idxs)])
+    strata = pd.Series(np.arange(nreal) % 3, index=pe.index)
+    idxs = pe.get_resample_indices(20, how="subset", num_reals=30, strata=strata)
+    assert np.all(np.bincount(strata.values[idxs].ravel()) == 20 * 10)
+    try:
+        pe.get_resample_indices(how="subset", num_reals=nreal + 1)
+    except Exception as e:
+        pass
+    else:
+        raise Exception("should have failed")
+
+    for how in ["bootstrap", "jackknife"]:
+        idxs = pe.get_resample_indices(20, how=how, strata=None)
+        means, stds = pe.get_resample_moments(idxs, columns=pst.par_names[:50])
+        assert means.shape == (idxs.shape[0], 50)
+        for rep in [0, idxs.shape[0] - 1]:
+            df = pe._df.iloc[idxs[rep], :50]
+            assert np.allclose(means.iloc[rep].values, df.mean().values)
+            assert np.allclose(stds.iloc[rep].values, df.std().values)
+
+
 if __name__ == "__main__":
     #par_gauss_draw_consistency_test()
     #obs_gauss_draw_consistency_test()
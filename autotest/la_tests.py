@@ -665,6 +665,335 @@ def plot_freyberg_dsi():
     plt.savefig("dsi_pred.pdf")
 
 
+def low_rank_schur_test():
+    import os
+    import numpy as np
+    import pyemu
+
+    pst = pyemu.Pst(os.path.join("la", "pest.pst"))
+    jco = os.path.join("la", "pest.jcb")
+    forecasts = ["h02_09", "h02_10"]
+    pe = pyemu.ParameterEnsemble.from_gaussian_draw(pst, num_reals=40)
+    names = pe.columns.tolist()
+    dist = np.abs(np.subtract.outer(np.arange(len(names)), np.arange(len(names))))
+    loc = pyemu.Matrix(x=np.exp(-dist / 5.0), row_names=names, col_names=names)
+    for localizer in [None, loc]:
+        lr_cov = pe.covariance_matrix(localizer=localizer, low_rank=True)
+        cov = pe.covariance_matrix(localizer=localizer)
+        cov = pyemu.Cov(x=cov.x, names=cov.row_names)
+        sc_lr = pyemu.Schur(jco=jco, pst=pst, parcov=lr_cov, forecasts=forecasts)
+        sc = pyemu.Schur(jco=jco, pst=pst, parcov=cov, forecasts=forecasts)
+        assert np.allclose(sc_lr.get_parameter_summary().values,
+                           sc.get_parameter_summary().values)
+        assert np.allclose(sc_lr.get_forecast_summary().values,
+                           sc.get_forecast_summary().values)
+        if localizer is None:
+            assert sc_lr.posterior_parameter.islowrank
+        assert sc_lr.parcov.islowrank
+        cond_names = pst.adj_par_names[:2]
+        assert np.allclose(
+            sc_lr.get_conditional_instance(cond_names).get_forecast_summary().values,
+            sc.get_conditional_instance(cond_names).get_forecast_summary().values)
+
+
+def ends_convergence_test():
+    import os
+    import numpy as np
+    import pandas as pd
+    import pyemu
+
+    pst = pyemu.Pst(os.path.join("la", "pest.pst"))
+    predictions = ["h02_09", "h02_10"]
+    obs = pst.observation_data
+    obs.loc[:, "weight"] = 1.0
+    obs.loc[predictions, "weight"] = 0.0
+    arr = np.dot(np.random.randn(60, pst.nobs), np.random.randn(pst.nobs, pst.nobs))
+    oe = pyemu.ObservationEnsemble(pst, pd.DataFrame(arr, columns=pst.obs_names))
+    ends = pyemu.EnDS(pst=pst, sim_ensemble=oe, predictions=predictions)
+    obslist_dict = {"first": ["h01_01", "h01_02"], "second": ["h02_01"]}
+    means = ends.get_posterior_prediction_convergence_summary(
+        [10, 60], [5, 1], obslist_dict=obslist_dict)
+    _, dfstd, _ = ends.get_posterior_prediction_moments(
+        obslist_dict=obslist_dict, include_first_moment=False)
+    assert means[10].shape == dfstd.shape
+    # all realizations - same as the moments of the full ensemble
+    assert np.allclose(means[60].loc[dfstd.index, dfstd.columns].values, dfstd.values)
+
+    # overlapping groups don't repeat names in the "posterior" group
+    obslist_dict = {"a": ["h01_02", "h01_03"],
+                    "all": ["h01_02", "h01_03", "h01_04", "h01_05"]}
+    means = ends.get_posterior_prediction_convergence_summary(
+        [60], [1], obslist_dict=obslist_dict)
+    _, dfstd, _ = ends.get_posterior_prediction_moments(
+        obslist_dict=obslist_dict, include_first_moment=False)
+    assert "posterior" in dfstd.index
+    assert np.allclose(dfstd.loc["posterior"].values, dfstd.loc["all"].values)
+    assert np.allclose(means[60].loc[dfstd.index, dfstd.columns].values, dfstd.values)
+
+
+def added_obs_importance_test():
+    import os
+    import numpy as np
+    import pyemu
+
+    pst = pyemu.Pst(os.path.join("la", "pest.pst"))
+    jco = os.path.join("la", "pest.jcb")
+    forecasts = ["h02_09", "h02_10"]
+    obs = pst.observation_data
+    base_obs = [o for o in pst.obs_names[:6] if o not in forecasts]
+    obs.loc[:, "weight"] = 0.0
+    obs.loc[base_obs, "weight"] = 1.0
+    cands = [o for o in pst.obs_names if o not in base_obs and o not in forecasts]
+    obslist_dict = {"pair": cands[:2], "single": cands[2], "triple": cands[3:6]}
+    sc = pyemu.Schur(jco=jco, pst=pst, forecasts=forecasts)
+    df = sc.get_added_obs_importance(obslist_dict=obslist_dict, base_obslist=base_obs)
+    df_mp = sc.get_added_obs_importance(obslist_dict=obslist_dict, base_obslist=base_obs,
+                                        num_workers=2)
+    assert np.allclose(df.values, df_mp.values)
+    assert list(df.index) == ["base", "pair", "single", "triple"]
+
+    # compare to forming the posterior of each case
+    pst.observation_data.loc[cands, "weight"] = 1.0
+    sc_full = pyemu.Schur(jco=jco, pst=pst, forecasts=forecasts)
+    for case, onames in obslist_dict.items():
+        if not isinstance(onames, list):
+            onames = [onames]
+        onames = base_obs + [o for o in onames if o not in base_obs]
+        post = sc_full.get(par_names=sc_full.jco.col_names, obs_names=onames).posterior_forecast
+        for forecast in forecasts:
+            assert np.isclose(df.loc[case, forecast], post[forecast])
+    base = sc_full.get(par_names=sc_full.jco.col_names, obs_names=base_obs).posterior_forecast
+    for forecast in forecasts:
+        assert np.isclose(df.loc["base", forecast], base[forecast])
+        assert df.loc[:, forecast].max() <= base[forecast] * (1.0 + 1.0e-10)
+
+
+def removed_obs_importance_test():
+    import os
+    import numpy as np
+    import pyemu
+
+    pst = pyemu.Pst(os.path.join("la", "pest.pst"))
+    jco = os.path.join("la", "pest.jcb")
+    forecasts = ["h02_09", "h02_10"]
+    obs = pst.observation_data
+    obs.loc[:, "weight"] = 1.0
+    obs.loc[forecasts, "weight"] = 0.0
+    obs.loc[pst.obs_names[:8], "obgnme"] = "head_a"
+    sc = pyemu.Schur(jco=jco, pst=pst, forecasts=forecasts)
+    df = sc.get_removed_obs_group_importance()
+    assert list(df.index) == ["base", "head", "head_a"]
+    df_mp = sc.get_removed_obs_importance(sc.get_obs_group_dict(), num_workers=2)
+    assert np.allclose(df.values, df_mp.values)
+
+    # compare to forming the posterior of the retained observations
+    for case, onames in sc.get_obs_group_dict().items():
+        keep = [o for o in pst.nnz_obs_names if o not in onames]
+        post = sc.get(par_names=sc.jco.col_names, obs_names=keep).posterior_forecast
+        for forecast in forecasts:
+            assert np.isclose(df.loc[case, forecast], post[forecast])
+            assert df.loc[case, forecast] >= df.loc["base", forecast]
+
+    df = sc.get_removed_obs_importance()
+    assert df.shape[0] == pst.nnz_obs + 1
+
+
+def greedy_dataworth_test():
+    import os
+    import numpy as np
+    import pyemu
+
+    pst = pyemu.Pst(os.path.join("la", "pest.pst"))
+    jco = os.path.join("la", "pest.jcb")
+    forecasts = ["h02_09", "h02_10"]
+    obs = pst.observation_data
+    obs.loc[obs.obsnme[::2], "weight"] = 0.0
+    obs.loc[forecasts, "weight"] = 0.0
+    sc = pyemu.Schur(jco=jco, pst=pst, forecasts=forecasts)
+    base_obslist = list(pst.nnz_obs_names)
+    zero_names = [o for o in pst.zero_weight_obs_names if o not in forecasts]
+    obslist_dict = {o: o for o in zero_names}
+    df = sc.next_most_important_added_obs(
+        forecast="h02_09",
+        niter=3,
+        obslist_dict=obslist_dict,
+        base_obslist=list(base_obslist),
+    )
+    assert df.shape[0] == 3
+    assert len(obslist_dict) == len(zero_names) - 3
+    # the selected obs are given weight in the pst
+    assert np.all(pst.observation_data.loc[df.index, "weight"] > 0.0)
+
+    # compare to forming the posterior of each iteration
+    pst.observation_data.loc[df.index, "weight"] = 0.0
+    for i in range(df.shape[0]):
+        sc = pyemu.Schur(jco=jco, pst=pst, forecasts=forecasts)
+        dw = sc.get_added_obs_importance(
+            obslist_dict={o: o for o in zero_names if o not in df.index[:i]},
+            base_obslist=base_obslist + list(df.index[:i]),
+        )
+        fore = dw.loc[:, "h02_09"].drop("base")
+        assert fore.idxmin() == df.index[i]
+        assert np.isclose(fore.min(), df.iloc[i, 1])
+        pst.observation_data.loc[df.index[i], "weight"] = 1.0
+
+    pst.observation_data.loc[df.index, "weight"] = 0.0
+    sc = pyemu.Schur(jco=jco, pst=pst, forecasts=forecasts)
+    df_lazy = sc.next_most_important_added_obs(
+        forecast="h02_09",
+        niter=3,
+        obslist_dict={o: o for o in zero_names},
+        base_obslist=list(base_obslist),
+        lazy=True,
+    )
+    assert list(df_lazy.index) == list(df.index)
+    assert np.allclose(df_lazy.iloc[:, 1:].values, df.iloc[:, 1:].values)
+
+    # parameter contribution
+    parlist_dict = {p: p for p in sc.pst.adj_par_names}
+    df = sc.next_most_par_contribution(
+        niter=3, forecast="h02_09", parlist_dict=parlist_dict
+    )
+    assert df.shape[0] == 4
+    assert len(parlist_dict) == sc.pst.npar_adj - 3
+    assert np.all(np.diff(df.values[:, 0]) < 0.0)
+    known = list(df.index[1:])
+    cond = sc.get_conditional_instance(known)
+    assert np.isclose(cond.posterior_forecast["h02_09"], df.values[-1, 0])
+    # lazy-greedy is approximate when contributions grow as parameters become known
+    df_lazy = sc.next_most_par_contribution(niter=3, forecast="h02_09", lazy=True)
+    assert list(df_lazy.index[:3]) == list(df.index[:3])
+    assert np.all(np.diff(df_lazy.values[:, 0]) < 0.0)
+
+
+def factor_cache_test():
+    import os
+    import numpy as np
+    import pyemu
+
+    pst = pyemu.Pst(os.path.join("la", "pest.pst"))
+    jco = os.path.join("la", "pest.jcb")
+    forecasts = ["h02_09", "h02_10"]
+    obs = pst.observation_data
+    obs.loc[:, "weight"] = 1.0
+    obs.loc[forecasts, "weight"] = 0.0
+    # a full prior parameter covariance matrix
+    parcov = pyemu.Cov.from_parameter_data(pst)
+    x = np.diag(parcov.x.flatten())
+    x += 0.1 * np.sqrt(np.outer(np.diag(x), np.diag(x)))
+    parcov = pyemu.Cov(x=x, names=parcov.names)
+
+    def fresh(**kwargs):
+        return pyemu.Schur(jco=jco, pst=pst, forecasts=forecasts, **kwargs)
+
+    sc = fresh(parcov=parcov)
+    xtqx = sc.xtqx.x.copy()
+    post = sc.posterior_forecast
+    # the normal matrix is not changed by forming the posterior
+    assert np.array_equal(sc.xtqx.x, xtqx)
+    pp = np.linalg.inv(xtqx + np.linalg.inv(parcov.x))
+    y = sc.predictions.x
+    assert np.allclose(np.diag(y.T.dot(pp).dot(y)), [post[f] for f in forecasts])
+    assert np.allclose(sc.posterior_parameter.x, pp)
+
+    # empty non-diagonal covariance matrices
+    inv = pyemu.la._cov_inv(pyemu.Cov(x=np.zeros((0, 0)), names=[]))
+    assert inv.shape == (0, 0)
+
+    # children share the factors
+    nnz = pst.nnz_obs_names
+    child = sc.get(par_names=sc.jco.col_names, obs_names=nnz[:10])
+    assert child._factor_cache is sc._factor_cache
+    nfactors = len(sc._factor_cache)
+    child_post = child.posterior_forecast
+    # the parcov inverse is reused
+    assert len(sc._factor_cache) == nfactors + 3
+    ref = pyemu.Schur(
+        jco=sc.jco.get(row_names=nnz[:10]),
+        parcov=parcov,
+        obscov=sc.obscov.get(nnz[:10]),
+        predictions=sc.predictions,
+    )
+    for f in forecasts:
+        assert np.isclose(child_post[f], ref.posterior_forecast[f])
+
+    # conditional instances share the blocks of the parcov inverse and normal matrix
+    cond = sc.get_conditional_instance(["k_08", "k_07"])
+    ref = pyemu.Schur(
+        jco=sc.jco.get(col_names=cond.jco.col_names),
+        parcov=parcov.condition_on(["k_08", "k_07"]),
+        obscov=sc.obscov,
+        predictions=cond.predictions,
+    )
+    for f in forecasts:
+        assert np.isclose(cond.posterior_forecast[f], ref.posterior_forecast[f])
+    df = sc.get_par_contribution()
+    for pname in ["k_07", "k_08", "stage"]:
+        ref = fresh(parcov=parcov.condition_on(pname))
+        ref = ref.get(par_names=ref.parcov.names)
+        for f in forecasts:
+            assert np.isclose(df.loc[pname, f], ref.posterior_forecast[f])
+
+    # resetting obscov invalidates the cached factors
+    sc = fresh(parcov=parcov)
+    sc.posterior_forecast
+    sc.reset_obscov(sc.obscov * 2.0)
+    child = sc.get(par_names=sc.jco.col_names, obs_names=nnz)
+    ref = fresh(parcov=parcov, obscov=sc.obscov)
+    for f in forecasts:
+        assert np.isclose(child.posterior_forecast[f], ref.posterior_forecast[f])
+
+
+def errvar_sweep_test():
+    import os
+    import numpy as np
+    from pyemu import ErrVar, Matrix, Cov
+
+    # full parcov and omitted parameters
+    np.random.seed(0)
+    pnames = ["p{0}".format(i) for i in range(30)]
+    onames = ["o{0}".format(i) for i in range(20)]
+    jco = Matrix(
+        x=np.random.randn(len(onames), len(pnames)) * np.logspace(0, -3, len(pnames)),
+        row_names=onames,
+        col_names=pnames,
+    )
+    x = np.random.randn(len(pnames), len(pnames))
+    parcov = Cov(x=np.dot(x, x.T) / len(pnames) + np.eye(len(pnames)), names=pnames)
+    obscov = Cov(
+        x=np.random.random((len(onames), 1)) + 0.1, names=onames, isdiagonal=True
+    )
+    predictions = Matrix(
+        x=np.random.randn(len(pnames), 2), row_names=pnames, col_names=["f1", "f2"]
+    )
+    svs = list(range(0, 30))
+
+    def errvar():
+        # the omitted parameters are extracted from the matrices in place
+        return ErrVar(
+            jco=jco.copy(),
+            parcov=parcov.copy(),
+            obscov=obscov,
+            predictions=predictions.copy(),
+            omitted_parameters=pnames[-3:],
+        )
+
+    df = errvar().get_errvar_dataframe(svs)
+    df_loop = errvar().get_errvar_dataframe(svs, sweep=False)
+    assert list(df.columns) == list(df_loop.columns)
+    assert list(df.index) == svs
+    assert np.allclose(df.values, df_loop.values, rtol=1.0e-10, atol=1.0e-12)
+    assert np.all(df.loc[21:, "second"].values == 1.0e35)
+
+    w_dir = os.path.join("..", "verification", "henry")
+    forecasts = ["pd_ten", "c_obs10_2"]
+    ev = ErrVar(jco=os.path.join(w_dir, "pest.jcb"), forecasts=forecasts)
+    df = ev.get_errvar_dataframe([0, 1, 5, 10])
+    ev = ErrVar(jco=os.path.join(w_dir, "pest.jcb"), forecasts=forecasts)
+    df_loop = ev.get_errvar_dataframe([0, 1, 5, 10], sweep=False)
+    assert np.allclose(df.values, df_loop.values, rtol=1.0e-8)
+
+
 if __name__ == "__main__":
     #ends_freyberg_dev()
     #ends_freyberg_dsi_test()
@@ -466,6 +466,193 @@ def coo_tests():
     assert np.array_equal(m.x, mm.x)
     os.remove(mname)
 
+def mmap_binary_test():
+    import os
+    import numpy as np
+    import pyemu
+
+    nrow = 30
+    ncol = 50
+
+    rnames = ["row_{0}".format(i) for i in range(nrow)]
+    cnames = ["col_{0}".format(i) for i in range(ncol)]
+
+    x = np.random.random((nrow, ncol))
+    x[x < 0.5] = 0.0
+    m = pyemu.Jco(x=x, row_names=rnames, col_names=cnames)
+
+    mname = os.path.join("temp", "temp_mmap.jcb")
+    for write in [m.to_coo, m.to_binary]:
+        write(mname)
+        mm = pyemu.Jco.from_binary(mname, mmap=True)
+        assert mm.shape == m.shape
+        assert mm.row_names == m.row_names
+        assert mm.col_names == m.col_names
+
+        sub_rnames = rnames[5:10]
+        sub_cnames = cnames[::-1][:7]
+        sub = mm.get(row_names=sub_rnames, col_names=sub_cnames)
+        assert np.array_equal(
+            sub.x, m.get(row_names=sub_rnames, col_names=sub_cnames).x
+        )
+
+        ext = mm.extract(row_names=rnames[:3])
+        assert np.array_equal(ext.x, x[:3, :])
+        assert mm.shape == (nrow - 3, ncol)
+        mm.drop(cnames[:4], axis=1)
+        assert mm.shape == (nrow - 3, ncol - 4)
+        assert np.array_equal(mm.x, x[3:, 4:])
+
+        mm = pyemu.Jco.from_binary(mname, mmap=True)
+        assert np.array_equal(mm.T.x, x.T)
+
+        # operators that work on the values materialize them
+        for op, expected in [(lambda m: m ** 2, x ** 2),
+                             (lambda m: m.sqrt, np.sqrt(x)),
+                             (lambda m: m * np.ones((ncol, 1)), x.sum(axis=1)[:, None])]:
+            mm = pyemu.Jco.from_binary(mname, mmap=True)
+            assert np.allclose(op(mm).x, expected)
+        mm = pyemu.Jco.from_binary(mname, mmap=True)
+        assert str(mm) == str(m)
+    os.remove(mname)
+
+
+def sparse_test():
+    import os
+    import numpy as np
+    import scipy.sparse
+    import pyemu
+
+    nrow = 20
+    ncol = 30
+    rnames = ["row_{0}".format(i) for i in range(nrow)]
+    cnames = ["col_{0}".format(i) for i in range(ncol)]
+    x = np.random.random((nrow, ncol))
+    x[x < 0.7] = 0.0
+
+    m = pyemu.Jco(x=x, row_names=rnames, col_names=cnames)
+    sm = m.to_sparse()
+    assert sm.issparse
+    assert not m.issparse
+    assert sm.x.nnz == np.count_nonzero(x)
+
+    # mult keeps sparse when both sides are sparse (or diagonal)
+    cov = pyemu.Cov(x=np.ones((ncol, 1)) * 2.0, names=cnames, isdiagonal=True)
+    r = sm * cov * sm.T
+    assert r.issparse
+    assert np.allclose(r.as_2d, (m * cov * m.T).x)
+    r = sm * m.T
+    assert not r.issparse
+    assert np.allclose(r.x, np.dot(x, x.T))
+
+    # add and sub
+    r = sm + sm
+    assert r.issparse
+    assert np.allclose(r.as_2d, 2.0 * x)
+    r = sm - m
+    assert np.abs(r.x).max() == 0.0
+    r = sm + 1.0
+    assert not r.issparse
+    assert np.allclose(r.x, x + 1.0)
+    r = sm - 1.0
+    assert not r.issparse
+    assert np.allclose(r.x, x - 1.0)
+    r = sm + 0.0
+    assert r.issparse
+    assert np.allclose(r.as_2d, x)
+
+    scov = pyemu.Cov(x=scipy.sparse.identity(ncol), names=cnames)
+    r = scov + cov
+    assert r.issparse
+    assert np.allclose(r.as_2d.diagonal(), 3.0)
+
+    # get and drop
+    sub = sm.get(row_names=rnames[:4], col_names=cnames[3:9])
+    assert sub.issparse
+    assert np.allclose(sub.as_2d, x[:4, 3:9])
+    sm2 = sm.copy()
+    sm2.drop(rnames[:3], axis=0)
+    sm2.drop(cnames[:2], axis=1)
+    assert sm2.issparse
+    assert np.allclose(sm2.as_2d, x[3:, 2:])
+    scov.drop(cnames[:3], axis=0)
+    assert scov.shape == (ncol - 3, ncol - 3)
+    assert sm.T.issparse
+
+    # io
+    mname = os.path.join("temp", "temp_sparse.jcb")
+    for write in [sm.to_binary, sm.to_coo]:
+        write(mname)
+        mm = pyemu.Jco.from_binary(mname)
+        assert np.allclose(mm.x, x)
+        mm = pyemu.Jco.from_binary(mname, sparse=True)
+        assert mm.issparse
+        assert np.allclose(mm.as_2d, x)
+    os.remove(mname)
+
+
+def binary_blocks_test():
+    import os
+    import numpy as np
+    import pandas as pd
+    import pyemu
+
+    nrow = 25
+    ncol = 12
+    rnames = ["row_{0}".format(i) for i in range(nrow)]
+    cnames = ["col_{0}".format(i) for i in range(ncol)]
+    x = np.random.random((nrow, ncol))
+    x[x < 0.5] = 0.0
+    mname = os.path.join("temp", "temp_blocks.jcb")
+
+    # named row blocks, out of column order
+    df = pd.DataFrame(x, index=rnames, columns=cnames)
+
+    def row_blocks():
+        for i in range(0, nrow, 4):
+            yield df.iloc[i:i + 4, ::-1]
+
+    nnz = pyemu.Matrix.write_binary_blocks(mname, row_blocks(), col_names=cnames)
+    assert nnz == np.count_nonzero(x)
+    m = pyemu.Matrix.from_binary(mname)
+    assert m.row_names == rnames
+    assert m.col_names == cnames
+    assert np.allclose(m.x, x)
+
+    # unnamed column blocks in PEST format
+    def col_blocks():
+        for j in range(0, ncol, 5):
+            yield x[:, j:j + 5]
+
+    pyemu.Matrix.write_binary_blocks(mname, col_blocks(), row_names=rnames,
+                                     col_names=cnames, axis=1, coo=False)
+    m = pyemu.Matrix.from_binary(mname)
+    assert np.allclose(m.x, x)
+
+    # explicit zeros are never written, even with a non-positive droptol
+    nnz = pyemu.Matrix.write_binary_blocks(mname, col_blocks(), row_names=rnames,
+                                           col_names=cnames, axis=1, droptol=0.0)
+    assert nnz == np.count_nonzero(x)
+
+    # chunked writers
+    m = pyemu.Matrix(x=x, row_names=rnames, col_names=cnames)
+    for write in [m.to_binary, m.to_coo]:
+        # chunk is records per write, row_block is elements per row block
+        for kwargs in [{"chunk": 7}, {"row_block": 30}, {"chunk": 7, "row_block": 30}]:
+            write(mname, droptol=0.75, **kwargs)
+            mm = pyemu.Matrix.from_binary(mname)
+            assert np.allclose(mm.x, np.where(x < 0.75, 0.0, x))
+
+    try:
+        pyemu.Matrix.write_binary_blocks(mname, col_blocks(),
+                                         row_names=rnames[:-1], axis=1)
+    except Exception:
+        pass
+    else:
+        raise Exception("should have failed")
+    os.remove(mname)
+
+
 def df_tests():
     import os
     import numpy as np
@@ -578,6 +765,117 @@ def dense_mat_format_test():
     print((e2-s2).total_seconds())
 
 
+def dense_append_test():
+    import os
+    import numpy as np
+    import pandas as pd
+    import pyemu
+
+    filename = os.path.join("temp", "dense_append.bin")
+    ncol = 50
+    cnames = ["col_{0}".format(i) for i in range(ncol)]
+    pst = pyemu.Pst.from_par_obs_names(["p1"], cnames)
+    arrs = []
+    for itr in range(3):
+        # realization names of varying length
+        arr = np.random.random((150, ncol))
+        df = pd.DataFrame(data=arr, columns=cnames,
+                          index=["{0}_{1}".format(itr, i) for i in range(arr.shape[0])])
+        oe = pyemu.ObservationEnsemble(pst=pst, df=df)
+        oe.to_dense(filename, append=itr > 0)
+        arrs.append(arr)
+    arr = np.vstack(arrs)
+
+    x, row_names, col_names = pyemu.Matrix.read_dense(filename)
+    assert col_names == cnames
+    assert row_names[-1] == "2_149"
+    assert np.abs(x - arr).max() == 0.0
+    oe = pyemu.ObservationEnsemble.from_binary(pst, filename)
+    assert oe.shape == arr.shape
+
+    index = pyemu.Matrix.read_dense_index(filename)
+    assert len(index[0]) == arr.shape[0]
+    rows = [299, 5, 160, 161, 162, 449, 5]
+    x, row_names, _ = pyemu.Matrix.read_dense(filename, rows=rows, index=index)
+    assert row_names == [index[0][r] for r in rows]
+    assert np.abs(x - arr[rows]).max() == 0.0
+
+    try:
+        pyemu.Matrix.write_dense(filename, ["junk"], cnames[:-1], arr[:1, :-1],
+                                 close=True, append=True)
+    except Exception as e:
+        assert "col_names" in str(e)
+    else:
+        raise Exception("should have failed")
+
+    # incomplete final record
+    with open(filename, "rb") as f:
+        data = f.read()
+    with open("dense_trunc.bin", "wb") as f:
+        f.write(data[:-8])
+    try:
+        pyemu.Matrix.read_dense("dense_trunc.bin")
+    except Exception as e:
+        assert "row 449" in str(e)
+    else:
+        raise Exception("should have failed")
+    x, _, _ = pyemu.Matrix.read_dense("dense_trunc.bin", forgive=True)
+    assert np.abs(x - arr[:-1]).max() == 0.0
+
+
+def low_rank_cov_test():
+    import numpy as np
+    import pyemu
+
+    n, nreal = 30, 50
+    names = ["par_{0}".format(i) for i in range(n)]
+    devs = np.random.randn(nreal, n) / np.sqrt(nreal - 1.0)
+    dist = np.abs(np.subtract.outer(np.arange(n), np.arange(n)))
+    loc = pyemu.Matrix(x=np.exp(-dist / 5.0), row_names=names, col_names=names)
+    jco = pyemu.Matrix(x=np.random.random((4, n)),
+                       row_names=["obs_{0}".format(i) for i in range(4)],
+                       col_names=names[::-1])
+    for localizer in [None, loc]:
+        lr_cov = pyemu.LowRankCov(devs=devs, names=names, localizer=localizer)
+        # small blocks to exercise the blockwise products
+        lr_cov._Matrix__lazy.max_block_size = 50
+        x = np.dot(devs.T, devs)
+        if localizer is not None:
+            x *= localizer.x
+        cov = pyemu.Cov(x=x, names=names)
+
+        v = np.random.random((n, 3))
+        assert np.allclose(lr_cov.dot(v), np.dot(x, v))
+        assert np.allclose(lr_cov.dot(v[:, 0]), np.dot(x, v[:, 0]))
+        assert np.allclose(lr_cov.get_diagonal_vector().x, cov.get_diagonal_vector().x)
+        sub = lr_cov.get(names[10:2:-1])
+        assert sub.islowrank
+        assert np.allclose(sub.x, cov.get(names[10:2:-1]).x)
+        assert np.allclose(lr_cov.get(names[:5], names[5:]).x,
+                           cov.get(names[:5], names[5:]).x)
+        for lr_prod, prod in [(jco * lr_cov, jco * cov),
+                              (lr_cov * jco.T, cov * jco.T),
+                              (jco * lr_cov * jco.T, jco * cov * jco.T),
+                              (cov * lr_cov, cov * cov),
+                              (lr_cov.T * cov, cov * cov),
+                              (2.0 * lr_cov, 2.0 * cov)]:
+            assert lr_prod.row_names == prod.row_names
+            assert lr_prod.col_names == prod.col_names
+            assert np.allclose(lr_prod.x, prod.x)
+        cond = lr_cov.condition_on(names[:5])
+        assert cond.row_names == names[5:]
+        assert np.allclose(cond.x, cov.condition_on(names[:5]).x)
+        dropped = lr_cov.copy()
+        dropped.drop(names[:2], axis=0)
+        assert np.allclose(dropped.x, cov.get(names[2:]).x)
+        # none of the above should have formed the dense matrix
+        assert lr_cov.islowrank
+        assert np.allclose(lr_cov.x, x)
+        assert not lr_cov.islowrank
+        lr_cov = pyemu.LowRankCov(devs=devs, names=names, localizer=localizer)
+        assert np.allclose((lr_cov ** 2).x, x ** 2)
+
+
 def from_uncfile_firstlast_test():
     import os
     import numpy as np
@@ -71,5 +71,63 @@ def res_and_ens_test():
     assert fcns['volumetric_efficiency'](m,o) == 1.0
     assert fcns['kge'](m,o) == 1.0
     
+def residual_stats_test():
+    import os
+    import pandas as pd
+    import numpy as np
+    import pyemu
+
+    np.random.seed(42)
+    obsnames = ['ob_{:03d}'.format(i) for i in range(150)]
+    pst = pyemu.pst_utils.generic_pst(obs_names=obsnames)
+    obs = pst.observation_data
+    obs['obsval'] = np.random.random(150) * 10 + 1
+    obs['weight'] = [float(i > .3) for i in np.random.random(150)]
+    obs['obgnme'] = np.random.choice(['grp_a', 'grp_b'], 150)
+    ens = pd.DataFrame(obs.obsval.values + np.random.randn(20, 150),
+                       columns=obsnames)
+    ens.iloc[3, 7] = np.nan
+    oe = pyemu.ObservationEnsemble(pst, ens.copy())
+
+    # the kernel should give the same metrics as the per-realization functions
+    stats = pyemu.metrics.calc_residual_stats(oe, pst, max_block_size=1000)
+    nnz = obs.loc[pst.nnz_obs_names]
+    for cm, f in pyemu.metrics.ALLMETRICS.items():
+        for i in [0, 3, 19]:
+            mod = ens.loc[i, nnz.obsnme]
+            assert np.isclose(stats.loc[i, "{}_total".format(cm.upper())],
+                              f(mod, nnz.obsval), rtol=1.0e-10)
+            grp = nnz.loc[nnz.obgnme == 'grp_b', 'obsnme']
+            assert np.isclose(stats.loc[i, "{}_grp_b".format(cm.upper())],
+                              f(mod[grp], nnz.obsval[grp]), rtol=1.0e-10)
+    assert np.allclose(stats.PHI_total.values, oe.phi_vector.values)
+    assert np.allclose(stats.PHI_grp_a + stats.PHI_grp_b, stats.PHI_total)
+    met = pyemu.metrics.calc_metric_ensemble(ens.copy(), pst)
+    assert np.allclose(met.values, stats.loc[:, met.columns].values)
+
+    # the streaming variant should give the same stats for all the file formats
+    oe.to_csv("res_stats.csv")
+    oe.to_binary("res_stats.jcb")
+    oe.to_dense("res_stats.bin")
+    oe.to_columnar("res_stats.col")
+    for filename in ["res_stats.csv", "res_stats.jcb", "res_stats.bin",
+                     "res_stats.col"]:
+        sstats = pyemu.metrics.calc_residual_stats_stream(filename, pst,
+                                                          chunksize=6)
+        assert list(sstats.index.astype(str)) == list(stats.index.astype(str))
+        assert np.allclose(sstats.values, stats.values, equal_nan=True)
+        os.remove(filename)
+
+    phi = pyemu.metrics.calc_residual_stats(oe, pst, metric=[], bygroups=False)
+    assert list(phi.columns) == ["PHI_total"]
+    try:
+        pyemu.metrics.calc_residual_stats(oe, pst, metric="not_a_metric")
+    except Exception:
+        pass
+    else:
+        raise Exception("should have failed")
+
+
 if __name__ == "__main__":
     res_and_ens_test()
+    residual_stats_test()
@@ -47,6 +47,95 @@ def tpl_ins_test():
                                 pst_filename=os.path.join("temp", "test.pst"))
     return
 
+def template_file_test():
+    import os
+    import pickle
+    import numpy as np
+    import pandas as pd
+    from pyemu import pst_utils
+    tpl_file = os.path.join("temp", "tf.dat.tpl")
+    with open(tpl_file, "w") as f:
+        f.write("ptf ~\n")
+        f.write("no pars here %d\n")
+        f.write("~  p1   ~ 1.0 ~ P2              ~ end\n")
+        f.write("   ~ p1 ~\n")
+        f.write("last line")
+    tf = pst_utils.TemplateFile(tpl_file)
+    assert tf.par_names == ["p1", "p2"]
+    vals = pd.Series([1.5, -2.0e-10], index=["p1", "p2"])
+    in_file = os.path.join("temp", "tf.dat")
+    tf.write(vals, in_file)
+    with open(in_file, "r") as f:
+        lines = f.readlines()
+    assert lines[0] == "no pars here %d\n"
+    assert lines[1] == "{0:9.3E} 1.0 {1:19.6E} end\n".format(1.5, -2.0e-10)
+    assert lines[2] == "   {0:6.3E}\n".format(1.5)
+    assert lines[3] == "last line"
+
+    # same as a fresh parse and from a pickled copy
+    tf2 = pickle.loads(pickle.dumps(tf))
+    assert tf2.get_values_string(vals.to_dict()) == tf.get_values_string(vals)
+    pst_utils.write_to_template(vals, tpl_file, in_file + ".2")
+    with open(in_file + ".2", "r") as f:
+        assert f.readlines() == lines
+
+    try:
+        tf.write({"p1": 1.0}, in_file)
+    except KeyError:
+        pass
+    else:
+        raise Exception("should have failed")
+
+    # names are in order of first occurence, not sorted
+    with open(tpl_file, "w") as f:
+        f.write("ptf ~\n")
+        f.write("~ zz ~ ~ aa ~\n")
+        f.write("~ aa ~ ~ zz ~\n")
+    tf = pst_utils.TemplateFile(tpl_file)
+    assert tf.par_names == ["zz", "aa"]
+    vals = [float(v) for v in tf.get_values_string({"aa": 1.0, "zz": 2.0}).split()]
+    assert vals == [2.0, 1.0, 1.0, 2.0]
+
+
+def ins_plan_test():
+    import os
+    from pyemu import pst_utils
+    ins_file = os.path.join("temp", "plan.dat.ins")
+    with open(ins_file, "w") as f:
+        f.write("pif ~\n")
+        f.write("l1 w !o1! !o2!\n")
+        f.write("l1 [o3]1:4 [dum]5:8 [o4]9:12\n")
+        f.write("l1 ~key~ !o5!\n")
+        f.write("l2 !o6! w !o7!\n")
+        f.write("l1 w !o8!\n")
+    out_file = os.path.join("temp", "plan.dat")
+    with open(out_file, "w") as f:
+        f.write("name 1.0 2.0\n")
+        f.write("3.0 9.9 4.0 \n")
+        f.write("skip key 5.0\n")
+        f.write("skipped\n")
+        f.write("\t6.0 0.0,\t7.0\n")
+        f.write(" 8.0 extra\n")
+    i = pst_utils.InstructionFile(ins_file)
+    for _ in range(2):
+        df = i.read_output_file(out_file)
+        assert list(df.index) == ["o{0}".format(j) for j in range(1, 9)]
+        assert list(df.obsval.values) == [float(j) for j in range(1, 9)]
+    # the marker line is interpreted, the others compiled
+    assert [p is None for p in i._instruction_plan] == [
+        False, False, True, False, False]
+
+    # a line that doesn't suit the plan is handed to the interpreter
+    with open(out_file, "w") as f:
+        f.write("name 1.0\n")
+    try:
+        i.read_output_file(out_file)
+    except Exception:
+        pass
+    else:
+        raise Exception("should have failed")
+
+
 def res_covreg_test():
     import os
     import numpy as np
@@ -461,6 +550,62 @@ def test_write_input_files():
     os.chdir("..")
 
 
+def io_executor_test():
+    import os
+    import gc
+    import time
+    import numpy as np
+    import pyemu
+    d = os.path.join("temp", "io_exec")
+    if not os.path.exists(d):
+        os.mkdir(d)
+    tpl_files, in_files, ins_files = [], [], []
+    for i in range(6):
+        tpl_files.append(os.path.join(d, "f{0}.dat.tpl".format(i)))
+        in_files.append(os.path.join(d, "f{0}.dat".format(i)))
+        ins_files.append(os.path.join(d, "f{0}.dat.ins".format(i)))
+        with open(tpl_files[-1], "w") as f:
+            f.write("ptf ~\n")
+            [f.write("~  p{0}_{1}  ~\n".format(i, j)) for j in range(3)]
+        with open(ins_files[-1], "w") as f:
+            f.write("pif ~\n")
+            [f.write("l1 !p{0}_{1}!\n".format(i, j)) for j in range(3)]
+    pst = pyemu.Pst.from_io_files(tpl_files, in_files, ins_files, in_files,
+                                  pst_path=".")
+    par = pst.parameter_data
+    par.loc[:, "parval1"] = np.arange(pst.npar) + 1.0
+    for num_workers in [1, 2]:
+        with pyemu.pst_utils.IOExecutor(num_workers=num_workers,
+                                        min_parallel_files=2) as ex:
+            pst.io_executor = ex
+            for scale in [1.0, 2.0]:
+                par.loc[:, "parval1"] *= scale
+                pst.write_input_files(pst_path=d)
+                df = pst.process_output_files(pst_path=d)
+                assert np.allclose(df.loc[par.parnme, "obsval"].values, par.parval1.values)
+            assert (ex._pool is not None) == (ex.num_workers > 1)
+            assert len(ex._tpl_cache) == len(tpl_files)
+        assert ex._pool is None
+
+    # the pool is released when the executor is dropped without close()
+    ex = pyemu.pst_utils.IOExecutor(num_workers=2, min_parallel_files=2)
+    ex.write_input_files(pst, pst_path=d)
+    finalizer = ex._finalizer
+    assert finalizer.alive
+    del ex
+    gc.collect()
+    assert not finalizer.alive
+
+    # changed files are parsed again
+    tpl = pst.io_executor.get_template_file(tpl_files[0])
+    time.sleep(0.01)
+    with open(tpl_files[0], "a") as f:
+        f.write("~  p1_0  ~\n")
+    assert pst.io_executor.get_template_file(tpl_files[0]) is not tpl
+    assert pst.io_executor.get_template_file(tpl_files[1]) is \
+        pst.io_executor.get_template_file(tpl_files[1])
+
+
 def res_stats_test():
     import os
     import pyemu
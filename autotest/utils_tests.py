@@ -40,6 +40,161 @@ def fac2real_test():
     # plt.colorbar(p)
     # plt.show()
 
+def fac2real_compiled_test():
+    import os
+    import shutil
+    import numpy as np
+    import pandas as pd
+    import pyemu
+    pp_file = os.path.join("utils", "points1.dat")
+    factors_file = os.path.join("temp", "factors1.dat")
+    shutil.copy2(os.path.join("utils", "factors1.dat"), factors_file)
+    if os.path.exists(factors_file + ".npz"):
+        os.remove(factors_file + ".npz")
+    arr1 = pyemu.geostats.fac2real(pp_file, factors_file, out_file=None,
+                                   compiled=False)
+    assert not os.path.exists(factors_file + ".npz")
+    arr2 = pyemu.geostats.fac2real(pp_file, factors_file, out_file=None)
+    assert os.path.exists(factors_file + ".npz")
+    assert np.allclose(arr1, arr2)
+    arr3 = pyemu.geostats.fac2real(pp_file, factors_file, out_file=None)
+    assert np.allclose(arr1, arr3)
+
+    compiled_file = pyemu.geostats.compile_factors(factors_file,
+                                                   os.path.join("temp", "fac.npz"))
+    assert os.path.exists(compiled_file)
+
+    # a same-size rewrite of the factors file must not reuse the compiled file
+    pp_data = pd.DataFrame({"name": ["p0", "p1"], "parval1": [1.0, 2.0]})
+    factors_file = os.path.join("temp", "small.fac")
+    lines = ["pp.dat", "zone.dat", " 2 1", " 2", "p0", "p1"]
+    with open(factors_file, "w") as f:
+        f.write("\n".join(lines + [" 1 0 2 0.0 1 0.25 2 0.00",
+                                   " 2 0 2 0.0 1 0.75 2 0.00"]) + "\n")
+    arr1 = pyemu.geostats.fac2real(pp_data, factors_file, out_file=None)
+    assert np.allclose(arr1, [[0.25, 0.75]])
+    stat = os.stat(factors_file)
+    with open(factors_file, "w") as f:
+        f.write("\n".join(lines + [" 1 0 2 0.0 1 0.75 2 0.00",
+                                   " 2 0 2 0.0 1 0.75 2 0.75"]) + "\n")
+    os.utime(factors_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+    assert os.stat(factors_file).st_size == stat.st_size
+    arr2 = pyemu.geostats.fac2real(pp_data, factors_file, out_file=None)
+    arr3 = pyemu.geostats.fac2real(pp_data, factors_file, out_file=None,
+                                   compiled=False)
+    assert np.allclose(arr2, [[0.75, 2.25]])
+    assert np.allclose(arr2, arr3)
+
+    # falls back to in-memory factors if the compiled file can't be written
+    os.remove(factors_file + ".npz")
+    tmp_file = "{0}.npz.{1}.tmp.npz".format(factors_file, os.getpid())
+    os.makedirs(tmp_file)
+    try:
+        arr4 = pyemu.geostats.fac2real(pp_data, factors_file, out_file=None)
+    finally:
+        os.rmdir(tmp_file)
+    assert not os.path.exists(factors_file + ".npz")
+    assert np.allclose(arr4, arr3)
+
+
+def fac2real_ensemble_test():
+    import os
+    import numpy as np
+    import pandas as pd
+    import pyemu
+    np.random.seed(1)
+    npts = 10
+    names = ["p{0}".format(i) for i in range(npts)]
+    pts_data = pd.DataFrame({"x": np.random.random(npts), "y": np.random.random(npts),
+                             "name": names})
+    gs = pyemu.utils.geostats.read_struct_file(os.path.join("utils", "struct_test.dat"))[0]
+    ok = pyemu.utils.geostats.OrdinaryKrige(gs, pts_data)
+    nnode = 50
+    ok.calc_factors(np.random.random(nnode), np.random.random(nnode))
+    factors_file = os.path.join("temp", "ens.fac")
+    ok.to_grid_factors_file(factors_file, ncol=nnode)
+
+    df = pd.DataFrame(np.random.random((5, npts)) + 1.0, columns=names,
+                      index=["r{0}".format(i) for i in range(5)])
+    arrs = pyemu.geostats.fac2real_ensemble(df, factors_file)
+    assert arrs.shape == (5, 1, nnode)
+    arrs2 = ok.ensemble_to_grid(df, ncol=nnode)
+    assert np.allclose(arrs, arrs2)
+    for i in range(df.shape[0]):
+        pp_data = pd.DataFrame({"name": names, "parval1": df.iloc[i, :].values})
+        arr = pyemu.geostats.fac2real(pp_data, factors_file, out_file=None,
+                                      compiled=False)
+        assert np.allclose(arr, arrs[i])
+
+    out_files = pyemu.geostats.fac2real_ensemble(
+        df, factors_file, par_names={n: n for n in names},
+        out_file=os.path.join("temp", "ens_{0}.ref"))
+    assert len(out_files) == df.shape[0]
+    assert np.allclose(np.loadtxt(out_files[-1]), arrs[-1].flatten(), rtol=1.0e-5)
+
+
+def binary_factors_test():
+    import os
+    import numpy as np
+    import pandas as pd
+    import pyemu
+    np.random.seed(1)
+    npts = 10
+    names = ["p{0}".format(i) for i in range(npts)]
+    pts_data = pd.DataFrame({"x": np.random.random(npts), "y": np.random.random(npts),
+                             "name": names})
+    v = pyemu.geostats.ExpVario(contribution=1.0, a=0.5)
+    gs = pyemu.geostats.GeoStruct(variograms=v, transform="log")
+    ok = pyemu.utils.geostats.OrdinaryKrige(gs, pts_data)
+    nnode = 40
+    ok.calc_factors(np.random.random(nnode), np.random.random(nnode))
+    ascii_file = os.path.join("temp", "ascii.fac")
+    bin_file = os.path.join("temp", "bin.fac")
+    ok.to_grid_factors_file(ascii_file, ncol=nnode)
+    ok.to_grid_factors_file(bin_file, ncol=nnode, binary=True)
+
+    pp_data = pd.DataFrame({"name": names, "parval1": np.random.random(npts) + 1.0})
+    arr1 = pyemu.geostats.fac2real(pp_data, ascii_file, out_file=None, compiled=False)
+    arr2 = pyemu.geostats.fac2real(pp_data, bin_file, out_file=None, compiled=False)
+    assert arr2.shape == (1, nnode)
+    assert np.allclose(arr1, arr2)
+    assert not os.path.exists(bin_file + ".npz")
+
+    df = pd.DataFrame(np.random.random((3, npts)) + 1.0, columns=names)
+    assert np.allclose(pyemu.geostats.fac2real_ensemble(df, ascii_file),
+                       pyemu.geostats.fac2real_ensemble(df, bin_file))
+
+
+def ok_kdtree_test():
+    import numpy as np
+    import pandas as pd
+    import pyemu
+    np.random.seed(1)
+    npts = 30
+    pts_data = pd.DataFrame({"x": np.random.random(npts) * 10.0,
+                             "y": np.random.random(npts) * 10.0,
+                             "name": ["p{0}".format(i) for i in range(npts)]})
+    v = pyemu.geostats.ExpVario(contribution=1.0, a=3.0, anisotropy=2.0, bearing=30.0)
+    gs = pyemu.geostats.GeoStruct(variograms=v, nugget=0.1)
+    ok = pyemu.geostats.OrdinaryKrige(gs, pts_data)
+    x, y = np.meshgrid(np.linspace(0, 10, 15), np.linspace(0, 10, 15))
+    x, y = x.ravel(), y.ravel()
+    x[0] = np.nan
+    x[1], y[1] = pts_data.x.iloc[0], pts_data.y.iloc[0]
+    for num_threads in [1, 2]:
+        df1 = ok.calc_factors(x, y, maxpts_interp=8, search_radius=2.0,
+                              minpts_interp=2).copy()
+        df2 = ok.calc_factors(x, y, maxpts_interp=8, search_radius=2.0,
+                              minpts_interp=2, use_kdtree=True,
+                              num_threads=num_threads).copy()
+        for r1, r2 in zip(df1.itertuples(), df2.itertuples()):
+            assert list(r1.inames) == list(r2.inames)
+            assert np.allclose(np.array(r1.ifacts, dtype=float), r2.ifacts)
+            assert np.allclose(np.array(r1.idist, dtype=float), r2.idist)
+        assert np.allclose(df1.err_var.values.astype(float),
+                           df2.err_var.values.astype(float), equal_nan=True)
+
+
 def vario_test():
     import numpy as np
     import pyemu
@@ -118,6 +273,7 @@ def struct_file_test():
 
 def covariance_matrix_test():
     import os
+    import numpy as np
     import pandas as pd
     import pyemu
 
@@ -129,6 +285,23 @@ def covariance_matrix_test():
 
     print(struct.covariance_matrix(pts.x,pts.y,names=pts.name).x)
 
+    # contributions are added to an existing cov in place
+    cov = struct.covariance_matrix(pts.x, pts.y, names=pts.name)
+    cov2 = pyemu.Cov(x=np.zeros(cov.shape), names=cov.row_names)
+    result = struct.covariance_matrix(pts.x, pts.y, cov=cov2)
+    assert result is cov2
+    assert np.allclose(cov2.x, cov.x)
+    v = pyemu.geostats.ExpVario(contribution=1.0, a=100.0)
+    gs = pyemu.geostats.GeoStruct(variograms=v, nugget=0.5)
+    cov = gs.covariance_matrix([0.0, 50.0, 120.0], [0.0, 0.0, 0.0], names=["a", "b", "c"])
+    assert np.allclose(np.diag(cov.x), 1.5)
+
+    # adding a diagonal matrix doesn't change the dense operand
+    x = cov.x.copy()
+    result = cov + pyemu.Cov(x=np.ones((3, 1)), names=cov.row_names, isdiagonal=True)
+    assert np.array_equal(cov.x, x)
+    assert np.allclose(np.diag(result.x), 2.5)
+
 
 def setup_ppcov_simple():
     import os
@@ -730,6 +903,12 @@ def geostat_prior_builder_test():
     cov = pyemu.helpers.geostatistical_prior_builder(pst_file,{str_file:tpl_file})
     d1 = np.diag(cov.x)
 
+    scov = pyemu.helpers.geostatistical_prior_builder(pst_file,{str_file:tpl_file},
+                                                      sparse=True)
+    assert scov.issparse
+    assert scov.row_names == cov.row_names
+    assert np.allclose(scov.as_2d, cov.x)
+
     df = pyemu.pp_utils.pp_tpl_to_dataframe(tpl_file)
     df.loc[:,"zone"] = np.arange(df.shape[0])
     gs = pyemu.geostats.read_struct_file(str_file)
@@ -802,6 +981,12 @@ def geostat_draws_test():
     pe = pyemu.helpers.geostatistical_draws(pst, {str_file: tpl_file})
     assert (pe.shape == pe.dropna().shape)
 
+    # independent streams per zone, the same for any number of workers
+    pe1 = pyemu.helpers.geostatistical_draws(pst_file, {gs: df}, seed=1)
+    pe2 = pyemu.helpers.geostatistical_draws(pst_file, {gs: df}, seed=1, num_workers=2)
+    assert list(pe1.columns) == list(pe2.columns)
+    assert np.allclose(pe1.values, pe2.values)
+
 
 
 
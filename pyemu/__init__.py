@@ -15,7 +15,7 @@ from .eds import EnDS
 
 # from .mc import MonteCarlo
 # from .inf import Influence
-from .mat import Matrix, Jco, Cov
+from .mat import Matrix, Jco, Cov, LowRankCov
 from .pst import Pst, pst_utils
 from .utils import (
     helpers,
@@ -45,6 +45,7 @@ __all__ = [
     "Matrix",
     "Jco",
     "Cov",
+    "LowRankCov",
     "Pst",
     "pst_utils",
     "helpers",
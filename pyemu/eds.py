@@ -22,7 +22,8 @@ class EnDS(object):
         pst (varies): something that can be cast into a `pyemu.Pst`.  Can be an `str` for a
             filename or an existing `pyemu.Pst`.
         sim_ensemble (varies): something that can be cast into a `pyemu.ObservationEnsemble`.  Can be
-            an `str` for a  filename or `pd.DataFrame` or an existing `pyemu.ObservationEnsemble`.
+            an `str` for a  filename (".csv" or ".col" for a columnar binary file written with
+            `Ensemble.to_columnar()`) or `pd.DataFrame` or an existing `pyemu.ObservationEnsemble`.
         noise_ensemble (varies): something that can be cast into a `pyemu.ObservationEnsemble` that is the
             obs+noise realizations.  If not passed, a noise ensemble is generated using either `obs_cov` or the
             information in `pst` (i.e. weights or standard deviations)
@@ -103,12 +104,13 @@ class EnDS(object):
         self.log("pre-loading base components")
 
         # automatically do some things that should be done
-        assert type(self.obscov) == Cov
+        assert isinstance(self.obscov, Cov)
 
     def __fromfile(self, filename, astype=None):
         """a private method to deduce and load a filename into a matrix object.
         Uses extension: 'jco' or 'jcb': binary, 'mat','vec' or 'cov': ASCII,
-        'unc': pest uncertainty file.
+        'unc': pest uncertainty file, 'csv': csv ensemble, 'col': columnar
+        binary ensemble.
 
         """
         assert os.path.exists(filename), (
@@ -148,6 +150,12 @@ class EnDS(object):
                 astype = ObservationEnsemble
             m = astype.from_csv(self.pst,filename=filename)
             self.log("loading csv format: " + filename)
+        elif ext in ["col"]:
+            self.log("loading columnar format: " + filename)
+            if astype is None:
+                astype = ObservationEnsemble
+            m = astype.from_columnar(self.pst, filename=filename)
+            self.log("loading columnar format: " + filename)
         else:
             raise Exception(
                 "EnDS.__fromfile(): unrecognized"
@@ -245,7 +253,7 @@ class EnDS(object):
 
     @property
     def sim_ensemble(self):
-        return self.__sim_en
+        return self.__sim_ensemble
 
     @property
     def obscov(self):
@@ -333,30 +341,121 @@ class EnDS(object):
                 obslist_dict=obslist_dict)
 
         """
-        real_idx = np.arange(self.sim_ensemble.shape[0],dtype=int)
-        results = {}
-        for nreals,nreps in zip(num_realization_sequence,num_replicate_sequence):
-            rep_results = []
-            print("-->testing ",nreals)
-            for rep in range(nreps):
-                rreals = np.random.choice(real_idx,nreals,False)
-                sim_ensemble = self.sim_ensemble.iloc[rreals,:].copy()
-                _,dfstd,_ = self.get_posterior_prediction_moments(obslist_dict=obslist_dict,
-                                                                 sim_ensemble=sim_ensemble,
-                                                                 include_first_moment=False)
-                rep_results.append(dfstd)
-            results[nreals] = rep_results
+        obslist_dict, onames = self.__get_obslist_dict(obslist_dict)
+        groups = list(obslist_dict.keys())
+        groups.sort()
+        names = onames + [p for p in self.predictions if p not in onames]
+        name_idx = {name: i for i, name in enumerate(names)}
+        pred_idxs = np.array([name_idx[p] for p in self.predictions])
+        group_idxs = {
+            group: np.array([name_idx[n] for n in obslist_dict[group]])
+            for group in groups
+        }
+        noise = {
+            group: self.obscov.get(obslist_dict[group], obslist_dict[group]).x
+            for group in groups
+        }
+        max_group = max([len(idxs) for idxs in group_idxs.values()] + [0])
+        # only the needed columns are extracted, once
+        values = self.sim_ensemble._df.loc[:, names].values.astype(np.float64)
 
         means = {}
-        for nreals,dfs in results.items():
-            mn = dfs[0]
-            for df in dfs[1:]:
-                mn += df
-            mn /= len(dfs)
-            means[nreals] = mn
+        for nreals,nreps in zip(num_realization_sequence,num_replicate_sequence):
+            print("-->testing ",nreals)
+            idxs = self.sim_ensemble.get_resample_indices(
+                nreps, how="subset", num_reals=nreals
+            )
+            std = np.empty((nreps, len(groups) + 1, len(self.predictions)))
+            # all replicates at once, in blocks to bound memory: each replicate
+            # needs its values and the (largest) group covariance blocks
+            rep_size = nreals * len(names) + max_group * (max_group + len(pred_idxs))
+            for reps in ObservationEnsemble._row_blocks(nreps, rep_size):
+                std[reps] = self.__get_replicate_posterior_std(
+                    values[idxs[reps]], pred_idxs, group_idxs, noise, groups
+                )
+            means[nreals] = pd.DataFrame(
+                std.mean(axis=0), index=["prior"] + groups, columns=self.predictions
+            )
 
         return means
 
+    @staticmethod
+    def __get_replicate_posterior_std(reps, pred_idxs, group_idxs, noise, groups):
+        """private method to calculate the prior and posterior prediction standard
+        deviations for a stack of replicate ensembles at once
+
+        Args:
+            reps (`numpy.ndarray`): 3-D array of replicates X realizations X names
+            pred_idxs (`numpy.ndarray`): indices of the predictions in the names
+            group_idxs (`dict`): group name: indices of the observations in the names
+            noise (`dict`): group name: noise covariance `numpy.ndarray`
+            groups ([`str`]): the group names
+
+        Returns:
+            `numpy.ndarray`: 3-D array of replicates X ("prior" + groups) X predictions
+
+        """
+        devs = reps - reps.mean(axis=1, keepdims=True)
+        devs /= np.sqrt(float(reps.shape[1] - 1))
+        # only the needed covariance blocks are formed from the deviations
+        pdevs = devs[:, :, pred_idxs]
+        prior_var = (pdevs ** 2).sum(axis=1)
+        std = [np.sqrt(prior_var)]
+        for group in groups:
+            odevs = devs[:, :, group_idxs[group]]
+            odevs_t = odevs.transpose(0, 2, 1)
+            dd = np.matmul(odevs_t, odevs) + noise[group]
+            ccov = np.matmul(odevs_t, pdevs)
+            schur = (ccov * np.linalg.solve(dd, ccov)).sum(axis=1)
+            std.append(np.sqrt(prior_var - schur))
+        return np.stack(std, axis=1)
+
+    def __get_obslist_dict(self, obslist_dict):
+        """private method to check (or create) the groups of observations to
+        treat as gained/collected.  Adds the "posterior" group (all observations)
+        if not present.
+
+        Returns:
+            tuple containing
+
+            - **dict**: group name: list of observation names
+            - **[`str`]**: the names of all observations in the groups
+
+        """
+        if obslist_dict is not None:
+            if type(obslist_dict) == list:
+                obslist_dict = dict(zip(obslist_dict, obslist_dict))
+            obs = self.pst.observation_data
+            onames = []
+            for names in obslist_dict.values():
+                onames.extend(names if isinstance(names, list) else [names])
+            oobs = obs.loc[onames,:]
+            zobs = oobs.loc[oobs.weight==0,"obsnme"].tolist()
+
+            if len(zobs) > 0:
+                raise Exception(
+                    "Observations in obslist_dict must have "
+                    + "nonzero weight. The following observations "
+                    + "violate that condition: "
+                    + ",".join(zobs)
+                )
+        else:
+            obslist_dict = {name: [name] for name in self.pst.nnz_obs_names}
+            onames = self.pst.nnz_obs_names
+
+        # unique names (in order) so that overlapping groups don't repeat
+        # observations in the "posterior" group
+        obslist_dict = {
+            group: list(dict.fromkeys(names if isinstance(names, list) else [names]))
+            for group, names in obslist_dict.items()
+        }
+        onames = []
+        for names in obslist_dict.values():
+            onames.extend(names)
+        onames = list(dict.fromkeys(onames))
+        if "posterior" not in obslist_dict:
+            obslist_dict["posterior"] = list(onames)
+        return obslist_dict, onames
 
     def get_posterior_prediction_moments(self, obslist_dict=None,sim_ensemble=None,include_first_moment=True):
         """A dataworth method to analyze the posterior (expected) mean and uncertainty as a result of conditioning with
@@ -391,31 +490,8 @@ class EnDS(object):
         """
 
 
-        if obslist_dict is not None:
-            if type(obslist_dict) == list:
-                obslist_dict = dict(zip(obslist_dict, obslist_dict))
-            obs = self.pst.observation_data
-            onames = []
-            [onames.extend(names) for gp,names in obslist_dict.items()]
-            oobs = obs.loc[onames,:]
-            zobs = oobs.loc[oobs.weight==0,"obsnme"].tolist()
-
-            if len(zobs) > 0:
-                raise Exception(
-                    "Observations in obslist_dict must have "
-                    + "nonzero weight. The following observations "
-                    + "violate that condition: "
-                    + ",".join(zobs)
-                )
-        else:
-            obslist_dict = dict(zip(self.pst.nnz_obs_names, self.pst.nnz_obs_names))
-            onames = self.pst.nnz_obs_names
-
-        if "posterior" not in obslist_dict:
-            obslist_dict["posterior"] = onames
-
-        names = onames
-        names.extend(self.predictions)
+        obslist_dict, onames = self.__get_obslist_dict(obslist_dict)
+        names = onames + [p for p in self.predictions if p not in onames]
         self.logger.log("getting deviations")
         if sim_ensemble is None:
             sim_ensemble = self.sim_ensemble
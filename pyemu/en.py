@@ -1,5 +1,7 @@
 import os
 import copy
+import hashlib
+import operator
 import warnings
 import numpy as np
 import pandas as pd
@@ -98,32 +100,106 @@ class Ensemble(object):
     def __str__(self):
         return self._df.__str__()
 
+    def _arithmetic(self, other, op):
+        """private method to apply a binary operator to the values so that
+        the result keeps the `Ensemble` type"""
+        if isinstance(other, Ensemble):
+            other = other._df
+        return self._wrap(op(self._df, other))
+
+    def __array__(self, dtype=None):
+        return np.asarray(self._df.values, dtype=dtype)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """delegate numpy ufuncs (`np.abs()`, `np.sqrt()`, etc) to the
+        underlying `pandas.DataFrame` so that the result keeps the `Ensemble` type"""
+        if any(isinstance(o, Ensemble) for o in kwargs.get("out", ())):
+            return NotImplemented
+        inputs = [i._df if isinstance(i, Ensemble) else i for i in inputs]
+        result = getattr(ufunc, method)(*inputs, **kwargs)
+        if isinstance(result, tuple):
+            return tuple(self._wrap(r) for r in result)
+        return self._wrap(result)
+
+    def _wrap(self, result):
+        """private method to give `pandas.DataFrame` results the `Ensemble` type"""
+        if isinstance(result, pd.DataFrame):
+            return type(self)(
+                pst=self.pst, df=result, istransformed=self.istransformed
+            )
+        return result
+
+    def _inplace_arithmetic(self, other, op):
+        """private method to apply an in-place operator.  Scalars and arrays are
+        applied to the values directly (no copy), while pandas objects and
+        `Ensemble` instances go through `pandas` alignment"""
+        if isinstance(other, Ensemble):
+            other = other._df
+        if isinstance(other, (pd.DataFrame, pd.Series)):
+            self._df = op(self._df, other)
+            return self
+        values = self._df.values
+        if np.issubdtype(values.dtype, np.floating):
+            op(values, other)
+            self._set_values(values)
+        else:
+            self._df = pd.DataFrame(
+                op(values.astype(np.float64), other),
+                index=self._df.index,
+                columns=self._df.columns,
+            )
+        return self
+
+    def _set_values(self, values):
+        """private method to make sure in-place changes to `values`
+        (from `self._df.values`) are reflected in `self._df`"""
+        if not np.shares_memory(values, self._df.values):
+            self._df.loc[:, :] = values
+
     def __sub__(self, other):
-        try:
-            return self._df - other
-        except:
-            return self._df - other._df
+        return self._arithmetic(other, operator.sub)
+
+    def __rsub__(self, other):
+        return self._arithmetic(other, lambda df, o: o - df)
 
     def __mul__(self, other):
-        try:
-            return self._df * other
-        except:
-            return self._df * other._df
+        return self._arithmetic(other, operator.mul)
+
+    def __rmul__(self, other):
+        return self._arithmetic(other, operator.mul)
 
     def __truediv__(self, other):
-        try:
-            return self._df / other
-        except:
-            return self._df / other._df
+        return self._arithmetic(other, operator.truediv)
+
+    def __rtruediv__(self, other):
+        return self._arithmetic(other, lambda df, o: o / df)
 
     def __add__(self, other):
-        try:
-            return self._df + other
-        except:
-            return self._df + other._df
+        return self._arithmetic(other, operator.add)
+
+    def __radd__(self, other):
+        return self._arithmetic(other, operator.add)
 
     def __pow__(self, pow):
-        return self._df ** pow
+        return self._arithmetic(pow, operator.pow)
+
+    def __neg__(self):
+        return self._arithmetic(-1.0, operator.mul)
+
+    def __abs__(self):
+        return self._wrap(abs(self._df))
+
+    def __iadd__(self, other):
+        return self._inplace_arithmetic(other, operator.iadd)
+
+    def __isub__(self, other):
+        return self._inplace_arithmetic(other, operator.isub)
+
+    def __imul__(self, other):
+        return self._inplace_arithmetic(other, operator.imul)
+
+    def __itruediv__(self, other):
+        return self._inplace_arithmetic(other, operator.itruediv)
 
     @staticmethod
     def reseed():
@@ -205,37 +281,25 @@ class Ensemble(object):
         return
 
     def __getattr__(self, item):
-        if item == "loc":
-            return self.loc[item]
-        elif item == "iloc":
-            return self.iloc[item]
-        elif item == "index":
-            return self._df.index
-        elif item == "columns":
-            return self._df.columns
-        elif item in set(dir(self)):
-            return getattr(self, item)
-        elif item in set(dir(self._df)):
-            lhs = self._df.__getattr__(item)
-            if type(lhs) == type(self._df):
-                return type(self)(
-                    pst=self.pst, df=lhs, istransformed=self.istransformed
-                )
-            elif "DataFrame" in str(lhs):
-                warnings.warn(
-                    "return type uncaught, losing Ensemble type, returning DataFrame",
-                    PyemuWarning,
-                )
-                print("return type uncaught, losing Ensemble type, returning DataFrame")
-                return lhs
-            else:
-                return lhs
-        else:
+        # only called if normal lookup fails, so just look in the dataframe
+        if item == "_df" or item.startswith("__"):
+            raise AttributeError(item)
+        try:
+            lhs = getattr(self._df, item)
+        except AttributeError:
             raise AttributeError(
                 "Ensemble error: the following item was not"
                 + "found in Ensemble or DataFrame attributes:{0}".format(item)
             )
-        return
+        if isinstance(lhs, pd.DataFrame):
+            return type(self)(pst=self.pst, df=lhs, istransformed=self.istransformed)
+        elif getattr(lhs, "__self__", None) is self._df:
+            warnings.warn(
+                "return type uncaught, losing Ensemble type, returning DataFrame",
+                PyemuWarning,
+            )
+            print("return type uncaught, losing Ensemble type, returning DataFrame")
+        return lhs
 
         # def plot(self,*args,**kwargs):
         # self._df.plot(*args,**kwargs)
@@ -386,11 +450,14 @@ class Ensemble(object):
         if retrans:
             self.transform()
 
-    def to_dense(self, filename):
+    def to_dense(self, filename, append=False):
         """write `Ensemble` to a dense-format binary file
 
         Args:
             filename (`str`): file to write
+            append (`bool`): flag to append the realizations to an existing
+                dense-format file rather than overwriting it.  The columns
+                must match the columns in the file. Default is `False`
 
         Example::
 
@@ -398,6 +465,10 @@ class Ensemble(object):
             oe = pyemu.ObservationEnsemble.from_gaussian_draw(pst)
             oe.to_dense("obs.bin")
 
+            # add another iteration to the same file
+            oe2 = pyemu.ObservationEnsemble.from_gaussian_draw(pst)
+            oe2.to_dense("obs.bin", append=True)
+
         Note:
             back transforms `ParameterEnsemble` before writing so that
             values are in arithmatic space
@@ -415,10 +486,85 @@ class Ensemble(object):
             self._df.index.tolist(),
             self._df.columns.tolist(),
             self._df.values,
+            close=True,
+            append=append,
+        )
+        if retrans:
+            self.transform()
+
+    def to_columnar(self, filename, dtype=None):
+        """write `Ensemble` to a columnar binary file that supports
+        reading a subset of columns and/or realizations
+
+        Args:
+            filename (`str`): file to write
+            dtype (`np.dtype`): the floating point type to store the values as.
+                Can be `np.float64` or `np.float32`.  Default is `None` (`np.float64`)
+
+        Example::
+
+            pst = pyemu.Pst("my.pst")
+            oe = pyemu.ObservationEnsemble.from_gaussian_draw(pst)
+            oe.to_columnar("obs.col")
+
+        Note:
+            back transforms `ParameterEnsemble` before writing so that
+            values are in arithmetic space
+
+            calls `Matrix.write_columnar()`
+
+        """
+
+        retrans = False
+        if self.istransformed:
+            self.back_transform()
+            retrans = True
+        if self._df.isnull().values.any():
+            warnings.warn("NaN in ensemble", PyemuWarning)
+        pyemu.Matrix.write_columnar(
+            filename,
+            self._df.index.tolist(),
+            self._df.columns.tolist(),
+            self._df.values,
+            dtype=dtype,
         )
         if retrans:
             self.transform()
 
+    @classmethod
+    def from_columnar(cls, pst, filename, columns=None, reals=None, mmap=False):
+        """create an `Ensemble` from a columnar binary file written
+        by `Ensemble.to_columnar()`
+
+        Args:
+            pst (`pyemu.Pst`): a control file instance
+            filename (`str`): filename containing the columnar ensemble
+            columns ([`str`]): the columns (parameter or observation names)
+                to load.  Only these columns are read from the file.  If `None`,
+                all columns are loaded.  Default is `None`
+            reals ([`str`]): the realization names to load.  If `None`, all
+                realizations are loaded.  Default is `None`
+            mmap (`bool`): flag to memory-map the values in the file rather
+                than reading them (copy-on-write, so the file is never changed).
+                See `Matrix.read_columnar()`.  Default is `False`
+
+        Returns:
+            `Ensemble`: the ensemble loaded from the columnar file
+
+        Example::
+
+            pst = pyemu.Pst("my.pst")
+            # only load the nonzero weighted observations
+            oe = pyemu.ObservationEnsemble.from_columnar(pst, "obs.col",
+                                                         columns=pst.nnz_obs_names)
+
+        """
+        x, row_names, col_names = pyemu.Matrix.read_columnar(
+            filename, row_names=reals, col_names=columns, mmap=mmap
+        )
+        df = pd.DataFrame(x, index=row_names, columns=col_names, copy=False)
+        return cls(pst=pst, df=df)
+
     @classmethod
     def from_dataframe(cls, pst, df, istransformed=False):
         warnings.warn(
@@ -430,15 +576,36 @@ class Ensemble(object):
 
     @staticmethod
     def _gaussian_draw(
-        cov, mean_values, num_reals, grouper=None, fill=True, factor="eigen"
+        cov,
+        mean_values,
+        num_reals,
+        grouper=None,
+        fill=True,
+        factor="eigen",
+        dtype=None,
+        factor_cache=None,
+        num_workers=None,
+        seed=None,
     ):
+        """private method to draw realizations from a (multivariate) gaussian
+        distribution.  All realizations of a group are formed with one matrix-matrix
+        product (in blocks of rows to bound memory), in the same order as the standard
+        normal values are drawn from `np.random`.
+
+        If `num_workers` or `seed` is not None, each group is instead drawn from its own
+        `numpy.random.Generator` spawned from a `numpy.random.SeedSequence`, so that the
+        groups can be drawn in a pool of `num_workers` processes and the realizations do
+        not depend on the number of workers.
+        """
 
         factor = factor.lower()
-        if factor not in ["eigen", "svd"]:
+        if factor not in ["eigen", "svd", "cholesky"]:
             raise Exception(
                 "Ensemble._gaussian_draw() error: unrecognized"
                 + "'factor': {0}".format(factor)
             )
+        if dtype is None:
+            dtype = np.float64
         # make sure all cov names are found in mean_values
         cov_names = set(cov.row_names)
         mv_names = set(mean_values.index.values)
@@ -448,84 +615,280 @@ class Ensemble(object):
                 "Ensemble._gaussian_draw() error: the following cov names are not in "
                 "mean_values: {0}".format(",".join(missing))
             )
-        if cov.isdiagonal:
-            stds = {
-                name: std for name, std in zip(cov.row_names, np.sqrt(cov.x.flatten()))
-            }
-            snv = np.random.randn(num_reals, mean_values.shape[0])
-            reals = np.zeros_like(snv)
-            reals[:, :] = np.NaN
-            for i, name in enumerate(mean_values.index):
-                if name in cov_names:
-                    reals[:, i] = (snv[:, i] * stds[name]) + mean_values.loc[name]
-                elif fill:
-                    reals[:, i] = mean_values.loc[name]
+        mv_map = {
+            n: i for n, i in zip(mean_values.index, np.arange(mean_values.shape[0]))
+        }
+        mvals = mean_values.values.astype(np.float64)
+        reals = np.empty((num_reals, mean_values.shape[0]), dtype=dtype)
+        if fill:
+            reals[:, :] = mvals
         else:
-            reals = np.zeros((num_reals, mean_values.shape[0]))
             reals[:, :] = np.NaN
-            if fill:
-                for i, v in enumerate(mean_values.values):
-                    reals[:, i] = v
-            #cov_map = {n: i for n, i in zip(cov.row_names, np.arange(cov.shape[0]))}
-            mv_map = {
-                n: i for n, i in zip(mean_values.index, np.arange(mean_values.shape[0]))
-            }
-            if grouper is not None:
-
-                for grp_name, names in grouper.items():
+        seed_seq = None
+        if num_workers is not None or seed is not None:
+            seed_seq = Ensemble._get_seed_sequence(seed)
+        if cov.isdiagonal:
+            idxs = np.array([mv_map[name] for name in cov.row_names], dtype=int)
+            stds = np.zeros(mean_values.shape[0])
+            stds[idxs] = np.sqrt(cov.x.flatten())
+            idxs.sort()
+            stds = stds[idxs]
+            means = mvals[idxs]
+            idxs = Ensemble._as_slice(idxs)
+            if seed_seq is not None:
+                devs, _ = Ensemble._draw_stream(
+                    stds, num_reals, seed_seq.spawn(1)[0], dtype=dtype
+                )
+                reals[:, idxs] = means + devs
+            else:
+                # draw in blocks of realizations, one standard normal value per mean value
+                for rows in Ensemble._row_blocks(num_reals, mean_values.shape[0]):
+                    snv = np.random.randn(rows.stop - rows.start, mean_values.shape[0])
+                    reals[rows, idxs] = (snv[:, idxs] * stds) + means
+        elif seed_seq is not None:
+            groups = Ensemble._get_draw_groups(cov, grouper)
+            devs = Ensemble._draw_groups_stream(
+                cov,
+                groups,
+                num_reals,
+                seed_seq,
+                factor=factor,
+                dtype=dtype,
+                factor_cache=factor_cache,
+                num_workers=num_workers,
+            )
+            for (grp_name, cnames), grp_devs in zip(groups, devs):
+                idxs = np.array([mv_map[name] for name in cnames], dtype=int)
+                reals[:, Ensemble._as_slice(idxs)] = mvals[idxs] + grp_devs
+        else:
+            for grp_name, cnames in Ensemble._get_draw_groups(cov, grouper):
+                if grp_name is not None:
                     print("drawing from group", grp_name)
-                    # reorder names to be in cov matrix order
-                    # cnames = names
-                    cnames = []
-                    snames = set(names)
-                    for n in cov.names:
-                        if n in snames:
-                            cnames.append(n)
-                    names = None
-                    snames = None
-                    idxs = [mv_map[name] for name in cnames]
-                    snv = np.random.randn(num_reals, len(cnames))
-                    cov_grp = cov.get(cnames)
-                    if len(cnames) == 1:
-                        std = np.sqrt(cov_grp.x)
-                        reals[:, idxs] = mean_values.loc[cnames].values[0] + (snv * std)
-                    else:
-                        if factor == "eigen":
-                            try:
-                                cov_grp.inv
-                            except:
-                                covname = "trouble_{0}.cov".format(grp_name)
-                                cov_grp.to_ascii(covname)
-                                raise Exception(
-                                    "error inverting cov for group '{0}',"
-                                    + "saved trouble cov to {1}".format(
-                                        grp_name, covname
-                                    )
-                                )
-
-                            a, i = Ensemble._get_eigen_projection_matrix(cov_grp.as_2d)
-                        elif factor == "svd":
-                            a, i = Ensemble._get_svd_projection_matrix(cov_grp.as_2d)
-                            snv[:, i:] = 0.0
-                        # process each realization
-                        group_mean_values = mean_values.loc[cnames]
-                        for i in range(num_reals):
-                            reals[i, idxs] = group_mean_values + np.dot(a, snv[i, :])
+                idxs = np.array([mv_map[name] for name in cnames], dtype=int)
+                cov_grp = cov if grp_name is None else cov.get(cnames)
+                if len(cnames) == 1:
+                    a, nsing = np.sqrt(cov_grp.as_2d).reshape(1, 1), 1
+                else:
+                    try:
+                        a, nsing = Ensemble._get_projection_matrix(
+                            cov_grp.as_2d, factor, factor_cache=factor_cache
+                        )
+                    except np.linalg.LinAlgError as e:
+                        Ensemble._raise_trouble_cov(cov_grp, grp_name, e)
+                a = a.astype(dtype, copy=False)
+                means = mvals[idxs].astype(dtype)
+                idxs = Ensemble._as_slice(idxs)
+                for rows in Ensemble._row_blocks(num_reals, len(cnames)):
+                    snv = np.random.randn(rows.stop - rows.start, len(cnames))
+                    snv = snv[:, :nsing].astype(dtype, copy=False)
+                    reals[rows, idxs] = means + np.dot(snv, a.T)
+        nan_cols = np.isnan(reals).any(axis=0)
+        if nan_cols.any():
+            keep = ~nan_cols
+            return pd.DataFrame(reals[:, keep], columns=mean_values.index.values[keep])
+        return pd.DataFrame(reals, columns=mean_values.index.values)
+
+    @staticmethod
+    def _get_draw_groups(cov, grouper):
+        """private method to get a list of (group name, cov names) pairs for
+        `Ensemble._gaussian_draw()`, with the names of each group in cov order.  Empty
+        groups are skipped.  The group name is None if `grouper` is None"""
+        if grouper is None:
+            return [(None, cov.row_names)]
+        cov_map = {n: i for i, n in enumerate(cov.row_names)}
+        groups = []
+        for grp_name, names in grouper.items():
+            # reorder names to be in cov matrix order
+            cidxs = np.sort([cov_map[n] for n in names if n in cov_map])
+            if len(cidxs) > 0:
+                groups.append((grp_name, [cov.row_names[i] for i in cidxs]))
+        return groups
+
+    @staticmethod
+    def _raise_trouble_cov(cov_grp, grp_name, e):
+        if grp_name is None:
+            raise e
+        covname = "trouble_{0}.cov".format(grp_name)
+        cov_grp.to_ascii(covname)
+        raise Exception(
+            "error factoring cov for group '{0}', ".format(grp_name)
+            + "saved trouble cov to {0}: {1}".format(covname, str(e))
+        )
+
+    @staticmethod
+    def _get_seed_sequence(seed=None):
+        """private method to get a `numpy.random.SeedSequence` from `seed`.  If `seed`
+        is None, the entropy is drawn from `np.random`, so that `Ensemble.reseed()`
+        still controls the draws"""
+        if isinstance(seed, np.random.SeedSequence):
+            return seed
+        if seed is None:
+            seed = np.random.randint(0, 2 ** 31 - 1)
+        return np.random.SeedSequence(seed)
+
+    @staticmethod
+    def _draw_stream(x, num_reals, seed_seq, factor="eigen", dtype=None, proj=None):
+        """private method to draw deviations from a zero-mean gaussian distribution
+        with the `numpy.random.Generator` of `seed_seq`.
 
+        Args:
+            x (`numpy.ndarray`): 2-D covariance matrix or 1-D standard deviations
+            num_reals (`int`): number of realizations
+            seed_seq (`numpy.random.SeedSequence`): the seed of the random stream
+            factor (`str`): how to factorize `x`
+            dtype (`numpy.dtype`): floating point type of the deviations
+            proj ((`numpy.ndarray`,`int`), optional): an existing projection matrix of
+                `x` and its number of columns.  `x` is not used if `proj` is passed
+
+        Returns:
+            tuple containing
+
+            - **numpy.ndarray**: the num_reals X n deviations
+            - **(numpy.ndarray, int)**: the projection matrix and its number of columns
+
+        """
+        if dtype is None:
+            dtype = np.float64
+        if proj is None:
+            if x.ndim == 1:
+                proj = (x, x.shape[0])
+            elif x.shape[0] == 1:
+                proj = (np.sqrt(x), 1)
             else:
-                snv = np.random.randn(num_reals, cov.shape[0])
-                if factor == "eigen":
-                    a, i = Ensemble._get_eigen_projection_matrix(cov.as_2d)
-                elif factor == "svd":
-                    a, i = Ensemble._get_svd_projection_matrix(cov.as_2d)
-                    snv[:, i:] = 0.0
-                cov_mean_values = mean_values.loc[cov.row_names].values
-                idxs = [mv_map[name] for name in cov.row_names]
-                for i in range(num_reals):
-                    reals[i, idxs] = cov_mean_values + np.dot(a, snv[i, :])
-        df = pd.DataFrame(reals, columns=mean_values.index.values)
-        df.dropna(inplace=True, axis=1)
-        return df
+                proj = Ensemble._get_projection_matrix(x, factor)
+        a, nsing = proj
+        rng = np.random.default_rng(seed_seq)
+        devs = np.empty((num_reals, a.shape[0]), dtype=dtype)
+        ad = a.astype(dtype, copy=False)
+        for rows in Ensemble._row_blocks(num_reals, nsing):
+            snv = rng.standard_normal((rows.stop - rows.start, nsing))
+            snv = snv.astype(dtype, copy=False)
+            if ad.ndim == 1:
+                devs[rows, :] = snv * ad
+            else:
+                devs[rows, :] = np.dot(snv, ad.T)
+        return devs, proj
+
+    @staticmethod
+    def _draw_groups_stream(
+        cov,
+        groups,
+        num_reals,
+        seed_seq,
+        factor="eigen",
+        dtype=None,
+        factor_cache=None,
+        num_workers=None,
+    ):
+        """private method to draw the deviations of each group in `groups` from its
+        own random stream, in a pool of `num_workers` processes if more than one.
+        Returns a list of deviation arrays in `groups` order"""
+        children = seed_seq.spawn(len(groups))
+        tasks = []
+        for (grp_name, cnames), child in zip(groups, children):
+            cov_grp = cov if grp_name is None else cov.get(cnames)
+            x = cov_grp.as_2d
+            key, proj = None, None
+            if factor_cache is not None and len(cnames) > 1:
+                key = Ensemble._factor_key(x, factor)
+                proj = factor_cache.get(key, None)
+            tasks.append((grp_name, cov_grp, x if proj is None else None, key, proj))
+
+        results = []
+        if num_workers is not None and num_workers > 1 and len(tasks) > 1:
+            import multiprocessing as mp
+
+            pool = mp.Pool(processes=min(num_workers, len(tasks)))
+            try:
+                async_results = [
+                    pool.apply_async(
+                        Ensemble._draw_stream,
+                        args=(x, num_reals, child, factor, dtype, proj),
+                    )
+                    for (_, _, x, _, proj), child in zip(tasks, children)
+                ]
+                for (grp_name, cov_grp, _, _, _), r in zip(tasks, async_results):
+                    try:
+                        results.append(r.get())
+                    except np.linalg.LinAlgError as e:
+                        Ensemble._raise_trouble_cov(cov_grp, grp_name, e)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            for (grp_name, cov_grp, x, _, proj), child in zip(tasks, children):
+                if grp_name is not None:
+                    print("drawing from group", grp_name)
+                try:
+                    results.append(
+                        Ensemble._draw_stream(x, num_reals, child, factor, dtype, proj)
+                    )
+                except np.linalg.LinAlgError as e:
+                    Ensemble._raise_trouble_cov(cov_grp, grp_name, e)
+        devs = []
+        for (_, _, _, key, _), (grp_devs, proj) in zip(tasks, results):
+            if key is not None:
+                factor_cache[key] = proj
+            devs.append(grp_devs)
+        return devs
+
+    @staticmethod
+    def _as_slice(idxs):
+        """private method to swap an array of contiguous, increasing indices for a
+        slice, which is much faster to index with"""
+        if len(idxs) > 0 and np.all(np.diff(idxs) == 1):
+            return slice(idxs[0], idxs[-1] + 1)
+        return idxs
+
+    @staticmethod
+    def _row_blocks(num_reals, ncol, max_block_size=1.0e7):
+        """private generator of row slices that bound the number of values
+        (e.g. standard normal values drawn) processed at once"""
+        nrow = int(max(1, max_block_size // max(1, ncol)))
+        for start in range(0, num_reals, nrow):
+            yield slice(start, min(num_reals, start + nrow))
+
+    @staticmethod
+    def _get_projection_matrix(x, factor="eigen", factor_cache=None):
+        """private method to get the projection matrix `a` and the number of standard
+        normal values it uses (`a` is n X nsing), so that `snv[:,:nsing].dot(a.T)` has
+        the covariance `x`.
+
+        Args:
+            x (`numpy.ndarray`): covariance matrix
+            factor (`str`): "eigen", "svd" or "cholesky"
+            factor_cache (`dict`, optional): container to store and reuse projection
+                matrices across calls.  Entries are keyed on `factor` and a hash of `x`.
+
+        """
+        key = None
+        if factor_cache is not None:
+            key = Ensemble._factor_key(x, factor)
+            if key in factor_cache:
+                return factor_cache[key]
+        if factor == "eigen":
+            a, _ = Ensemble._get_eigen_projection_matrix(x)
+            nsing = a.shape[1]
+        elif factor == "svd":
+            a, nsing = Ensemble._get_svd_projection_matrix(x)
+            a = a[:, :nsing]
+        elif factor == "cholesky":
+            a = np.linalg.cholesky(x)
+            nsing = a.shape[1]
+        else:
+            raise Exception(
+                "Ensemble._get_projection_matrix() error: unrecognized"
+                + "'factor': {0}".format(factor)
+            )
+        if key is not None:
+            factor_cache[key] = (a, nsing)
+        return a, nsing
+
+    @staticmethod
+    def _factor_key(x, factor):
+        """private method to get the `factor_cache` key of a covariance matrix"""
+        x = np.ascontiguousarray(x, dtype=np.float64)
+        return factor, x.shape, hashlib.sha1(x.view(np.uint8)).hexdigest()
 
     @staticmethod
     def _get_svd_projection_matrix(x, maxsing=None, eigthresh=1.0e-7):
@@ -536,19 +899,11 @@ class Ensemble(object):
 
         if maxsing is None:
             maxsing = pyemu.Matrix.get_maxsing_from_s(s, eigthresh=eigthresh)
-        u = u[:, :maxsing]
-        s = s[:maxsing]
-        v = v[:, :maxsing]
-
-        # fill in full size svd component matrices
-        s_full = np.zeros(x.shape)
-        s_full[: s.shape[0], : s.shape[1]] = np.sqrt(
-            s
-        )  # sqrt since sing vals are eigvals**2
-        v_full = np.zeros_like(s_full)
-        v_full[: v.shape[0], : v.shape[1]] = v
-        # form the projection matrix
-        proj = np.dot(v_full, s_full)
+
+        # form the projection matrix - sqrt since sing vals are eigvals
+        # of a symmetric matrix. columns past maxsing are zero
+        proj = np.zeros(x.shape)
+        proj[:, :maxsing] = v[:, :maxsing] * np.sqrt(s[:maxsing])
         return proj, maxsing
 
     @staticmethod
@@ -557,27 +912,22 @@ class Ensemble(object):
         v, w = np.linalg.eigh(x)
 
         # check for near zero eig values
-        for i in range(v.shape[0]):
-            if v[i] > 1.0e-10:
-                pass
-            else:
-                print(
-                    "near zero eigen value found",
-                    v[i],
-                    "at index",
-                    i,
-                    " of ",
-                    v.shape[0],
-                )
-                v[i] = 0.0
+        near_zero = ~(v > 1.0e-10)
+        if near_zero.any():
+            print(
+                "{0} near zero eigen values found, at indices".format(
+                    near_zero.sum()
+                ),
+                np.where(near_zero)[0],
+                " of ",
+                v.shape[0],
+            )
+            v[near_zero] = 0.0
 
         # form the projection matrix
-        vsqrt = np.sqrt(v)
-        vsqrt[i + 1 :] = 0.0
-        v = np.diag(vsqrt)
-        a = np.dot(w, v)
+        a = w * np.sqrt(v)
 
-        return a, i
+        return a, v.shape[0] - 1
 
     def get_deviations(self, center_on=None):
         """get the deviations of the realizations around a certain
@@ -610,25 +960,29 @@ class Ensemble(object):
 
         """
 
-        retrans = False
-        if not self.istransformed:
-            self.transform()
-            retrans = True
-        mean_vec = self.mean()
+        values = self._get_transformed_values()
         if center_on is not None:
             if center_on not in self.index:
                 raise Exception(
                     "'center_on' realization {0} not found".format(center_on)
                 )
-            mean_vec = self._df.loc[center_on, :].copy()
-
-        df = self._df.copy()
-        for col in df.columns:
-            df.loc[:, col] -= mean_vec[col]
-        if retrans:
-            self.back_transform()
+            mean_vec = values[np.flatnonzero(self._df.index == center_on)[0]]
+        else:
+            with warnings.catch_warnings():
+                # all-NaN columns give NaN deviations
+                warnings.simplefilter("ignore", RuntimeWarning)
+                mean_vec = np.nanmean(values, axis=0)
+        df = pd.DataFrame(
+            values - mean_vec, index=self._df.index, columns=self._df.columns
+        )
         return type(self)(pst=self.pst, df=df, istransformed=self.istransformed)
 
+    def _get_transformed_values(self):
+        """private method to get the values of the ensemble in transformed
+        space without changing the ensemble.  Returns the underlying array
+        (not a copy) if no transformation is needed"""
+        return self._df.values
+
     def as_pyemu_matrix(self, typ=None):
         """get a `pyemu.Matrix` instance of `Ensemble`
 
@@ -650,7 +1004,7 @@ class Ensemble(object):
             typ = pyemu.Matrix
         return typ.from_dataframe(self._df)
 
-    def covariance_matrix(self, localizer=None, center_on=None):
+    def covariance_matrix(self, localizer=None, center_on=None, low_rank=False):
         """get a empirical covariance matrix implied by the
         correlations between realizations
 
@@ -660,20 +1014,199 @@ class Ensemble(object):
             center_on (`str`, optional): a realization name to use as the centering
                 point in ensemble space.  If `None`, the mean vector is
                 treated as the centering point.  Default is None
+            low_rank (`bool`): flag to return a `pyemu.LowRankCov` that stores the
+                (scaled) deviations rather than the dense covariance matrix.
+                Default is False
 
         Returns:
             `pyemu.Cov`: the empirical (and optionally localized) covariance matrix
 
+        Note:
+            With `low_rank` True, memory scales with the number of realizations times
+            the number of columns and localized covariances are only formed
+            blockwise, as needed.
+
+        Example::
+
+            pe = pyemu.ParameterEnsemble.from_gaussian_draw(pst,num_reals=1000)
+            cov = pe.covariance_matrix(low_rank=True)
+            var = cov.get_diagonal_vector()
+
         """
 
-        devs = self.get_deviations(center_on=center_on).as_pyemu_matrix()
-        devs *= 1.0 / np.sqrt(float(self.shape[0] - 1.0))
+        devs = self.get_deviations(center_on=center_on)._df.values
+        devs = devs / np.sqrt(float(self.shape[0] - 1.0))
+        names = list(self._df.columns)
+        if low_rank:
+            return pyemu.LowRankCov(devs=devs, names=names, localizer=localizer)
+        cov = np.dot(devs.T, devs)
 
         if localizer is not None:
-            devs = devs.T * devs
-            return devs.hadamard_product(localizer)
+            cov = pyemu.Matrix(x=cov, row_names=names, col_names=names)
+            return cov.hadamard_product(localizer)
+
+        return pyemu.Cov(cov, names=names)
+
+    def get_resample_indices(
+        self,
+        num_replicates=100,
+        how="bootstrap",
+        num_reals=None,
+        strata=None,
+        seed=None,
+    ):
+        """get arrays of realization (row) indices to resample the ensemble.  Indexing
+        with these arrays (or passing them to `Ensemble.get_resample_moments()`) avoids
+        copying the ensemble for every replicate.
+
+        Args:
+            num_replicates (`int`): number of replicates to draw.  Not used for
+                "jackknife".  Default is 100
+            how (`str`): the resampling scheme. Can be "bootstrap" (draw with
+                replacement), "subset" (draw without replacement) or "jackknife"
+                (leave one realization out of each replicate).  Default is "bootstrap"
+            num_reals (`int`, optional): number of realizations in each replicate.
+                Required for "subset".  If None and `how` is "bootstrap", the number
+                of realizations in the ensemble is used
+            strata (varies, optional): stratum labels of the realizations, either a
+                sequence with one label per realization or a `pandas.Series` indexed
+                on realization names.  If passed, each stratum is resampled separately
+                and the number of realizations drawn from each stratum is proportional
+                to the stratum size.  Not used for "jackknife".  Default is None
+            seed (`int`, optional): seed for the random draws.  If None, the seed is
+                drawn from `numpy.random`, so `Ensemble.reseed()` controls the draws
+
+        Returns:
+            `numpy.ndarray`: 2-D integer array of shape (number of replicates, `num_reals`),
+            each row holding the positional indices of the realizations in a replicate
+
+        Example::
+
+            oe = pyemu.ObservationEnsemble.from_csv(pst,"my.0.obs.csv")
+            idxs = oe.get_resample_indices(1000, how="bootstrap")
+            means, stds = oe.get_resample_moments(idxs)
+
+        """
+        nreal = self.shape[0]
+        how = how.lower().strip()
+        if how == "jackknife":
+            if strata is not None:
+                raise Exception(
+                    "Ensemble.get_resample_indices(): strata not supported for 'jackknife'"
+                )
+            if nreal < 2:
+                raise Exception(
+                    "Ensemble.get_resample_indices(): need at least 2 realizations"
+                )
+            idxs = np.arange(nreal - 1, dtype=np.int64)[None, :]
+            return idxs + (idxs >= np.arange(nreal, dtype=np.int64)[:, None])
+        if how not in ["bootstrap", "subset"]:
+            raise Exception(
+                "Ensemble.get_resample_indices(): unrecognized 'how': "
+                + "{0}, should be 'bootstrap', 'subset' or 'jackknife'".format(how)
+            )
+        if num_reals is None:
+            if how == "subset":
+                raise Exception(
+                    "Ensemble.get_resample_indices(): 'num_reals' required for 'subset'"
+                )
+            num_reals = nreal
+        num_reals, num_replicates = int(num_reals), int(num_replicates)
+        if strata is None:
+            labels = np.zeros(nreal, dtype=np.int64)
+        elif isinstance(strata, pd.Series):
+            labels = strata.reindex(self._df.index).values
+            if pd.isnull(labels).any():
+                raise Exception(
+                    "Ensemble.get_resample_indices(): realizations missing from strata"
+                )
+        else:
+            labels = np.asarray(strata)
+        if labels.shape[0] != nreal:
+            raise Exception(
+                "Ensemble.get_resample_indices(): len(strata) != number of realizations"
+            )
+        _, inv = np.unique(labels, return_inverse=True)
+        sizes = np.bincount(inv)
+        # proportional allocation, with the remainder going to the largest fractions
+        alloc = num_reals * sizes / float(nreal)
+        counts = np.floor(alloc).astype(np.int64)
+        rem = num_reals - counts.sum()
+        if rem > 0:
+            counts[np.argsort(counts - alloc, kind="stable")[:rem]] += 1
+        if how == "subset" and np.any(counts > sizes):
+            raise Exception(
+                "Ensemble.get_resample_indices(): 'num_reals' larger than the "
+                + "number of realizations available for 'subset'"
+            )
+        rng = np.random.default_rng(Ensemble._get_seed_sequence(seed))
+        idxs = []
+        for istrat, (size, count) in enumerate(zip(sizes, counts)):
+            if count == 0:
+                continue
+            members = np.flatnonzero(inv == istrat)
+            if how == "bootstrap":
+                picks = rng.integers(0, size, (num_replicates, count))
+            else:
+                picks = np.argsort(rng.random((num_replicates, size)), axis=1)
+                picks = picks[:, :count]
+            idxs.append(members[picks])
+        return np.hstack(idxs)
+
+    def get_resample_moments(self, indices, columns=None, ddof=1):
+        """get the mean and standard deviation of every resampled replicate at once,
+        without forming the replicate ensembles
+
+        Args:
+            indices (`numpy.ndarray`): 2-D integer array of positional realization
+                indices, one row per replicate, such as from `Ensemble.get_resample_indices()`
+            columns ([`str`], optional): the columns to calculate moments for.  If
+                None, all columns are used.  Default is None
+            ddof (`int`): delta degrees of freedom of the standard deviation.  Default
+                is 1, same as `pandas.DataFrame.std()`
+
+        Returns:
+            tuple containing
+
+            - **pandas.DataFrame**: the mean of each replicate (rows) and column
+            - **pandas.DataFrame**: the standard deviation of each replicate (rows) and column
+
+        Note:
+            The moments are found from the number of times each realization is drawn
+            in each replicate, so memory scales with the number of replicates times the
+            number of realizations plus the number of replicates times the number of columns
 
-        return pyemu.Cov((devs.T * devs).x, names=devs.col_names)
+        """
+        indices = np.atleast_2d(np.asarray(indices, dtype=np.int64))
+        nrep, nsamp = indices.shape
+        nreal = self.shape[0]
+        if indices.min() < 0 or indices.max() >= nreal:
+            raise Exception("Ensemble.get_resample_moments(): indices out of range")
+        if columns is None:
+            columns = list(self._df.columns)
+        values = self._df.loc[:, columns].values
+        means = np.empty((nrep, len(columns)))
+        stds = np.empty((nrep, len(columns)))
+        for reps in Ensemble._row_blocks(nrep, nreal):
+            # the number of times each realization is drawn in each replicate
+            rep_idx = np.repeat(np.arange(reps.stop - reps.start), nsamp)
+            weights = np.bincount(
+                rep_idx * nreal + indices[reps].ravel(),
+                minlength=(reps.stop - reps.start) * nreal,
+            ).reshape(-1, nreal) / float(nsamp)
+            for cols in Ensemble._row_blocks(len(columns), nreal):
+                vals = values[:, cols].astype(np.float64)
+                # shift for numerical stability
+                shift = vals.mean(axis=0)
+                vals -= shift
+                mean = np.dot(weights, vals)
+                var = np.dot(weights, vals ** 2) - mean ** 2
+                var *= nsamp / float(nsamp - ddof) if nsamp > ddof else np.nan
+                means[reps, cols] = mean + shift
+                stds[reps, cols] = np.sqrt(np.maximum(var, 0.0))
+        means = pd.DataFrame(means, columns=columns)
+        stds = pd.DataFrame(stds, columns=columns)
+        return means, stds
 
     def dropna(self, *args, **kwargs):
         """override of `pandas.DataFrame.dropna()`
@@ -712,7 +1245,17 @@ class ObservationEnsemble(Ensemble):
 
     @classmethod
     def from_gaussian_draw(
-        cls, pst, cov=None, num_reals=100, by_groups=True, fill=False, factor="eigen"
+        cls,
+        pst,
+        cov=None,
+        num_reals=100,
+        by_groups=True,
+        fill=False,
+        factor="eigen",
+        dtype=None,
+        factor_cache=None,
+        num_workers=None,
+        seed=None,
     ):
         """generate an `ObservationEnsemble` from a (multivariate) gaussian
         distribution
@@ -731,9 +1274,22 @@ class ObservationEnsemble(Ensemble):
             fill (`bool`): flag to fill in zero-weighted observations with control file
                 values.  Default is False.
             factor (`str`): how to factorize `cov` to form the projectin matrix.  Can
-                be "eigen" or "svd". The "eigen" option is default and is faster.  But
+                be "eigen", "svd" or "cholesky". The "eigen" option is default and is faster.  But
                 for (nearly) singular cov matrices (such as those generated empirically
-                from ensembles), "svd" is the only way.  Ignored for diagonal `cov`.
+                from ensembles), "svd" is the only way.  "cholesky" is the fastest but
+                requires a positive definite `cov`.  Ignored for diagonal `cov`.
+            dtype (`numpy.dtype`): floating point type of the realizations.  `np.float32`
+                halves the memory required.  Default is None (`np.float64`)
+            factor_cache (`dict`, optional): a container to store the factorizations of
+                `cov` in.  Passing the same container to later calls reuses the
+                factorizations of unchanged (group) covariance matrices.
+            num_workers (`int`, optional): number of processes to draw the groups with.
+                Passing `num_workers` (or `seed`) draws each group from its own random
+                stream.  Default is None (serial draws from `np.random`)
+            seed (`int` or `numpy.random.SeedSequence`, optional): seed for the random
+                streams of the groups.  The realizations are the same for any
+                `num_workers`.  If None and `num_workers` is passed, the seed is drawn
+                from `np.random`.  Default is None
 
         Returns:
             `ObservationEnsemble`: the realized `ObservationEnsemble` instance
@@ -790,6 +1346,10 @@ class ObservationEnsemble(Ensemble):
             grouper=grouper,
             fill=fill,
             factor=factor,
+            dtype=dtype,
+            factor_cache=factor_cache,
+            num_workers=num_workers,
+            seed=seed,
         )
         if fill:
             df.loc[:, pst.zero_weight_obs_names] = pst.observation_data.loc[
@@ -808,16 +1368,19 @@ class ObservationEnsemble(Ensemble):
             The ObservationEnsemble.pst.weights can be updated prior to calling
             this method to evaluate new weighting strategies
 
+            See `pyemu.metrics.calc_residual_stats()` for per-group phi and
+            fit metrics in the same pass
+
         """
         cols = self._df.columns
-        pst = self.pst
-        weights = self.pst.observation_data.loc[cols, "weight"]
-        obsval = self.pst.observation_data.loc[cols, "obsval"]
-        phi_vec = []
-        for idx in self._df.index.values:
-            simval = self._df.loc[idx, cols]
-            phi = (((simval - obsval) * weights) ** 2).sum()
-            phi_vec.append(phi)
+        weights = self.pst.observation_data.loc[cols, "weight"].values
+        obsval = self.pst.observation_data.loc[cols, "obsval"].values
+        weights, obsval = weights.astype(np.float64), obsval.astype(np.float64)
+        values = self._df.values
+        phi_vec = np.zeros(values.shape[0])
+        for rows in Ensemble._row_blocks(values.shape[0], values.shape[1]):
+            simval = values[rows].astype(np.float64)
+            phi_vec[rows] = np.nansum(((simval - obsval) * weights) ** 2, axis=1)
         return pd.Series(data=phi_vec, index=self.index)
 
     def add_base(self):
@@ -877,7 +1440,17 @@ class ParameterEnsemble(Ensemble):
 
     @classmethod
     def from_gaussian_draw(
-        cls, pst, cov=None, num_reals=100, by_groups=True, fill=True, factor="eigen"
+        cls,
+        pst,
+        cov=None,
+        num_reals=100,
+        by_groups=True,
+        fill=True,
+        factor="eigen",
+        dtype=None,
+        factor_cache=None,
+        num_workers=None,
+        seed=None,
     ):
         """generate a `ParameterEnsemble` from a (multivariate) (log) gaussian
         distribution
@@ -898,9 +1471,22 @@ class ParameterEnsemble(Ensemble):
             fill (`bool`): flag to fill in fixed and/or tied parameters with control file
                 values.  Default is True.
             factor (`str`): how to factorize `cov` to form the projection matrix.  Can
-                be "eigen" or "svd". The "eigen" option is default and is faster.  But
+                be "eigen", "svd" or "cholesky". The "eigen" option is default and is faster.  But
                 for (nearly) singular cov matrices (such as those generated empirically
-                from ensembles), "svd" is the only way.  Ignored for diagonal `cov`.
+                from ensembles), "svd" is the only way.  "cholesky" is the fastest but
+                requires a positive definite `cov`.  Ignored for diagonal `cov`.
+            dtype (`numpy.dtype`): floating point type of the realizations.  `np.float32`
+                halves the memory required.  Default is None (`np.float64`)
+            factor_cache (`dict`, optional): a container to store the factorizations of
+                `cov` in.  Passing the same container to later calls reuses the
+                factorizations of unchanged (group) covariance matrices.
+            num_workers (`int`, optional): number of processes to draw the groups with.
+                Passing `num_workers` (or `seed`) draws each group from its own random
+                stream.  Default is None (serial draws from `np.random`)
+            seed (`int` or `numpy.random.SeedSequence`, optional): seed for the random
+                streams of the groups.  The realizations are the same for any
+                `num_workers`.  If None and `num_workers` is passed, the seed is drawn
+                from `np.random`.  Default is None
 
         Returns:
             `ParameterEnsemble`: the parameter ensemble realized from the gaussian
@@ -950,6 +1536,11 @@ class ParameterEnsemble(Ensemble):
             num_reals=num_reals,
             grouper=grouper,
             fill=fill,
+            factor=factor,
+            dtype=dtype,
+            factor_cache=factor_cache,
+            num_workers=num_workers,
+            seed=seed,
         )
         df.loc[:, li] = 10.0 ** df.loc[:, li]
         return cls(pst, df, istransformed=False)
@@ -1215,21 +1806,19 @@ class ParameterEnsemble(Ensemble):
             pe_tri = ParameterEnsemble.from_triangular_draw(pst, num_reals=num_reals)
             pes.append(pe_tri)
 
-        df = pd.DataFrame(index=np.arange(num_reals), columns=par_org.parnme.values)
-
-        df.loc[:, :] = np.NaN
+        # fill a single array by column index rather than by label
+        columns = pd.Index(par_org.parnme.values)
+        values = np.full((num_reals, columns.shape[0]), np.NaN)
         if fill:
-            fixed_tied = par_org.loc[
-                par_org.partrans.apply(lambda x: x in ["fixed", "tied"]), "parval1"
-            ].to_dict()
-            for p, v in fixed_tied.items():
-                df.loc[:, p] = v
+            fixed_tied = par_org.partrans.isin(["fixed", "tied"]).values
+            values[:, fixed_tied] = par_org.parval1.values[fixed_tied]
 
         for pe in pes:
-            df.loc[pe.index, pe.columns] = pe
+            values[:, columns.get_indexer(pe.columns)] = pe._df.values
 
         # this dropna covers both "fill" and "partial"
-        df = df.dropna(axis=1)
+        keep = ~np.isnan(values).any(axis=0)
+        df = pd.DataFrame(values[:, keep], columns=columns[keep])
 
         pst.parameter_data = par_org
         pe = ParameterEnsemble(df=df, pst=pst)
@@ -1257,12 +1846,12 @@ class ParameterEnsemble(Ensemble):
         """
         if isinstance(pst, str):
             pst = pyemu.Pst(pst)
-        dfs = {}
         if real_names is not None:
             assert len(real_names) == len(parfile_names)
         else:
             real_names = np.arange(len(parfile_names))
 
+        names, values = None, []
         for rname, pfile in zip(real_names, parfile_names):
             assert os.path.exists(pfile), (
                 "ParameterEnsemble.from_parfiles() error: "
@@ -1278,11 +1867,13 @@ class ParameterEnsemble(Ensemble):
                     PyemuWarning,
                 )
                 # df.loc[:,"parval1"] *= df.scale
+            if names is None:
+                names = df.index
+            elif not df.index.equals(names):
+                df = df.reindex(names)
+            values.append(df.parval1.values.astype(np.float64))
 
-            dfs[rname] = df.parval1.values
-
-        df_all = pd.DataFrame(data=dfs).T
-        df_all.columns = df.index
+        df_all = pd.DataFrame(data=np.vstack(values), index=real_names, columns=names)
 
         if len(pst.par_names) != df_all.shape[1]:
             # if len(pst.par_names) < df_all.shape[1]:
@@ -1297,9 +1888,7 @@ class ParameterEnsemble(Ensemble):
                     ),
                     PyemuWarning,
                 )
-                blank_df = pd.DataFrame(index=df_all.index, columns=diff)
-
-                df_all = pd.concat([df_all, blank_df], axis=1)
+                df_all = df_all.reindex(columns=list(df_all.columns) + list(diff))
 
             diff = dset.difference(pset)
             if len(diff) > 0:
@@ -1351,6 +1940,19 @@ class ParameterEnsemble(Ensemble):
         df.loc[:, li] = df.loc[:, li].apply(np.log10)
         self._istransformed = True
 
+    def _get_transformed_values(self):
+        """private method to get the values of the ensemble in log_{10} space
+        without changing the ensemble.  Returns the underlying array (not a copy)
+        if the ensemble is already transformed"""
+        values = self._df.values
+        if self.istransformed:
+            return values
+        li = self.pst.parameter_data.partrans.reindex(self._df.columns).values == "log"
+        if np.any(li):
+            values = values.astype(np.float64)
+            values[:, li] = np.log10(values[:, li])
+        return values
+
     def add_base(self):
         """add the control file `obsval` values as a realization
 
@@ -1446,7 +2048,12 @@ class ParameterEnsemble(Ensemble):
         """project the ensemble using the null-space Monte Carlo method
 
         Args:
-            projection_matrix (`pyemu.Matrix`): null-space projection operator.
+            projection_matrix (`pyemu.Matrix`): null-space projection operator.  Can be
+                either the (square) null-space projection matrix V2V2^T or, if the
+                column names are not the parameter names, the solution-space right
+                singular vectors V1 (one row per parameter, as returned by
+                `ErrVar.get_null_proj(factored=True)`), in which case the projection
+                (I - V1V1^T) is applied without forming the square matrix.
             center_on (`str`): the name of the realization to use as the centering
                 point for the null-space differening operation.  If `center_on` is `None`,
                 the `ParameterEnsemble` mean vector is used.  Default is `None`
@@ -1458,6 +2065,9 @@ class ParameterEnsemble(Ensemble):
         Returns:
             `ParameterEnsemble`: untransformed, null-space projected ensemble.
 
+        Note:
+            all realizations are projected with one matrix-matrix product
+
         Example::
 
             ev = pyemu.ErrVar(jco="my.jco") #assumes my.pst exists
@@ -1465,6 +2075,9 @@ class ParameterEnsemble(Ensemble):
             pe_proj = pe.project(ev.get_null_proj(maxsing=25))
             pe_proj.to_csv("proj_par.csv")
 
+            # for high-dimensional problems, only use the solution-space vectors
+            pe_proj = pe.project(ev.get_null_proj(maxsing=25, factored=True))
+
         """
 
         retrans = False
@@ -1480,33 +2093,44 @@ class ParameterEnsemble(Ensemble):
                 base = center_on
             elif center_on in self._df.index:
                 base = self._df.loc[center_on, :].copy()
-            elif isinstance(center_on, "str"):
+            elif isinstance(center_on, str):
                 try:
-                    base = pyemu.pst_utils.read_parfile(center_on)
+                    base = pyemu.pst_utils.read_parfile(center_on).parval1
                 except:
                     raise Exception(
                         "'center_on' arg not found in index and couldnt be loaded as a '.par' file"
                     )
+                log_names = self.pst.parameter_data.loc[
+                    self.pst.parameter_data.partrans == "log", "parnme"
+                ]
+                log_names = base.index.intersection(log_names)
+                base.loc[log_names] = np.log10(base.loc[log_names])
             else:
                 raise Exception(
                     "error processing 'center_on' arg.  should be realization names, par file, or series"
                 )
         names = list(base.index)
-        projection_matrix = projection_matrix.get(names, names)
+        factored = set(projection_matrix.col_names) != set(projection_matrix.row_names)
+        if factored:
+            v1 = projection_matrix.get(row_names=names).x
+        else:
+            projection_matrix = projection_matrix.get(names, names).x
 
         new_en = self.copy()
+        if log is not None:
+            log("projecting {0} realizations".format(new_en.shape[0]))
+
+        # null space projection of the difference vectors of all realizations
+        base_vals = base.values.astype(np.float64)
+        pdiff = new_en._df.loc[:, names].values - base_vals
+        if factored:
+            pdiff -= np.dot(np.dot(pdiff, v1), v1.T)
+        else:
+            pdiff = np.dot(pdiff, projection_matrix.T)
+        new_en._df.loc[:, names] = base_vals + pdiff
 
-        for real in new_en.index:
-            if log is not None:
-                log("projecting realization {0}".format(real))
-
-            # null space projection of difference vector
-            pdiff = self._df.loc[real, names] - base
-            pdiff = np.dot(projection_matrix.x, pdiff.values)
-            new_en.loc[real, names] = base + pdiff
-
-            if log is not None:
-                log("projecting realization {0}".format(real))
+        if log is not None:
+            log("projecting {0} realizations".format(new_en.shape[0]))
 
         new_en.enforce(enforce_bounds)
 
@@ -1515,17 +2139,31 @@ class ParameterEnsemble(Ensemble):
             self.transform()
         return new_en
 
-    def enforce(self, how="reset", bound_tol=0.0):
+    def enforce(self, how="reset", bound_tol=0.0, inplace=True):
         """entry point for bounds enforcement.
 
         Args:
-            enforce_bounds (`str`): can be 'reset' to reset offending values or 'drop' to drop
-                offending realizations.  Default is "reset"
+            how (`str`): can be 'reset' to reset offending values, 'drop' to drop
+                offending realizations or 'scale' to shrink offending realizations
+                towards `parval1` until they are within bounds.  If `None`,
+                bounds are not enforced.  Default is "reset"
+            bound_tol (`float`): fractional amount to move the bounds inward
+                before enforcing.  Default is 0.0
+            inplace (`bool`): flag to enforce the bounds on the values of this
+                `ParameterEnsemble`.  If False, a new enforced `ParameterEnsemble`
+                is returned and this one is not changed.  Default is True
+
+        Returns:
+            `ParameterEnsemble`: the enforced ensemble.  Only returned if `inplace`
+            is False
 
         Note:
             In very high dimensions, the "drop" and "scale" `how` types will result in either very few realizations
             or very short realizations.
 
+            All `how` types operate on the numeric values in one pass, without
+            transforming the ensemble
+
         Example::
 
             pst = pyemu.Pst("my.pst")
@@ -1535,7 +2173,12 @@ class ParameterEnsemble(Ensemble):
 
 
         """
-
+        if not inplace:
+            new_en = self.copy()
+            new_en.enforce(how=how, bound_tol=bound_tol, inplace=True)
+            return new_en
+        if how is None:
+            return
         if how.lower().strip() == "reset":
             self._enforce_reset(bound_tol=bound_tol)
         elif how.lower().strip() == "drop":
@@ -1545,78 +2188,91 @@ class ParameterEnsemble(Ensemble):
         else:
             raise Exception(
                 "unrecognized enforce_bounds arg:"
-                + "{0}, should be 'reset' or 'drop'".format(enforce_bounds)
+                + "{0}, should be 'reset', 'drop' or 'scale'".format(how)
             )
 
+    def _get_enforce_bounds(self, bound_tol, transformed):
+        """private method to get the bounds in the order of the columns.
+        Columns that are not in the control file get NaN bounds, which are
+        not enforced
+
+        Args:
+            bound_tol (`float`): fractional amount to move the bounds inward
+            transformed (`bool`): flag to return log-transformed bounds
+
+        Returns:
+            tuple containing
+
+            - **numpy.ndarray**: upper bounds
+            - **numpy.ndarray**: lower bounds
+
+        """
+        ub = self.pst.parameter_data.parubnd.copy()
+        lb = self.pst.parameter_data.parlbnd.copy()
+        if transformed:
+            ub[self.log_indexer] = np.log10(ub[self.log_indexer])
+            lb[self.log_indexer] = np.log10(lb[self.log_indexer])
+        ub = ub.reindex(self._df.columns).values.astype(np.float64)
+        lb = lb.reindex(self._df.columns).values.astype(np.float64)
+        return ub * (1.0 - bound_tol), lb * (1.0 + bound_tol)
+
     def _enforce_scale(self, bound_tol):
-        retrans = False
-        if self.istransformed:
-            self.back_transform()
-            retrans = True
-        ub = self.ubnd * (1.0 - bound_tol)
-        lb = self.lbnd * (1.0 + bound_tol)
-        base_vals = self.pst.parameter_data.loc[self._df.columns, "parval1"].copy()
-        ub_dist = (ub - base_vals).apply(np.abs)
-        lb_dist = (base_vals - lb).apply(np.abs)
+        """enforce parameter bounds on the ensemble by scaling the
+        deviations from `parval1` of violating realizations so that
+        the realizations are within bounds
 
-        if ub_dist.min() <= 0.0:
+        Note:
+            bounds are enforced in arithmetic space
+
+        """
+        ub, lb = self._get_enforce_bounds(bound_tol, False)
+        base_vals = self.pst.parameter_data.parval1.reindex(self._df.columns)
+        base_vals = base_vals.values.astype(np.float64)
+        ub_dist = np.abs(ub - base_vals)
+        lb_dist = np.abs(base_vals - lb)
+        names = self._df.columns.values
+        if np.nanmin(ub_dist) <= 0.0:
             raise Exception(
                 "Ensemble._enforce_scale() error: the following parameter"
-                + "are at or over ubnd: {0}".format(
-                    ub_dist.loc[ub_dist <= 0.0].index.values
-                )
+                + "are at or over ubnd: {0}".format(names[ub_dist <= 0.0])
             )
-        if lb_dist.min() <= 0.0:
+        if np.nanmin(lb_dist) <= 0.0:
             raise Exception(
                 "Ensemble._enforce_scale() error: the following parameter"
-                + "are at or under lbnd: {0}".format(
-                    lb_dist.loc[ub_dist <= 0.0].index.values
-                )
+                + "are at or under lbnd: {0}".format(names[lb_dist <= 0.0])
             )
-        for ridx in self._df.index:
-            real = self._df.loc[ridx, :]
-            real_dist = (real - base_vals).apply(np.abs)
-            out_ubnd = real - ub
-            out_ubnd = out_ubnd.loc[out_ubnd > 0.0]
-            ubnd_facs = ub_dist.loc[out_ubnd.index] / real_dist.loc[out_ubnd.index]
-
-            out_lbnd = lb - real
-            out_lbnd = out_lbnd.loc[out_lbnd > 0.0]
-            lbnd_facs = lb_dist.loc[out_lbnd.index] / real_dist.loc[out_lbnd.index]
-
-            if ubnd_facs.shape[0] == 0 and lbnd_facs.shape[0] == 0:
+        li = None
+        if self.istransformed:
+            partrans = self.pst.parameter_data.partrans.reindex(self._df.columns)
+            li = np.flatnonzero(partrans.values == "log")
+        values = self._df.values
+        num_scaled, min_fac = 0, 1.0
+        for rows in Ensemble._row_blocks(values.shape[0], values.shape[1]):
+            real = values[rows].astype(np.float64)
+            if li is not None:
+                real[:, li] = 10.0 ** real[:, li]
+            real_dist = np.abs(real - base_vals)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                facs = np.where(real > ub, ub_dist / real_dist, np.inf)
+                facs = np.minimum(facs, np.where(real < lb, lb_dist / real_dist, np.inf))
+            facs = facs.min(axis=1)
+            scale = np.flatnonzero(np.isfinite(facs))
+            if scale.shape[0] == 0:
                 continue
-            lmin = 1.0
-            umin = 1.0
-            sign = np.ones((self.pst.npar_adj))
-            sign[
-                real.loc[self.pst.adj_par_names] < base_vals.loc[self.pst.adj_par_names]
-            ] = -1.0
-            if ubnd_facs.shape[0] > 0:
-                umin = ubnd_facs.min()
-                umin_idx = ubnd_facs.idxmin()
-                print(
-                    "enforce_scale ubnd controlling parameter, scale factor, "
-                    + "current value for realization {0}: {1}, {2}, {3}".format(
-                        ridx, umin_idx, umin, real.loc[umin_idx]
-                    )
-                )
-
-            if lbnd_facs.shape[0] > 0:
-                lmin = lbnd_facs.min()
-                lmin_idx = lbnd_facs.idxmin()
-                print(
-                    "enforce_scale lbnd controlling parameter, scale factor, "
-                    + "current value for realization {0}: {1}, {2}. {3}".format(
-                        ridx, lmin_idx, lmin, real.loc[lmin_idx]
-                    )
+            facs = np.minimum(facs[scale], 1.0)
+            num_scaled += scale.shape[0]
+            min_fac = min(min_fac, facs.min())
+            real = base_vals + ((real[scale] - base_vals) * facs[:, None])
+            if li is not None:
+                real[:, li] = np.log10(real[:, li])
+            values[rows.start + scale] = real
+        if num_scaled > 0:
+            print(
+                "enforce_scale: {0} realizations scaled, min scale factor: {1}".format(
+                    num_scaled, min_fac
                 )
-            min_fac = min(umin, lmin)
-
-            self._df.loc[ridx, :] = base_vals + (sign * real_dist * min_fac)
-
-        if retrans:
-            self.transform()
+            )
+            self._set_values(values)
 
     def _enforce_drop(self, bound_tol):
         """enforce parameter bounds on the ensemble by dropping
@@ -1628,29 +2284,24 @@ class ParameterEnsemble(Ensemble):
             bounds is large, meaning most realization will
             be dropped.
 
+            realizations with NaN values are also dropped
+
         """
-        ub = self.ubnd * (1.0 - bound_tol)
-        lb = self.lbnd * (1.0 + bound_tol)
-        drop = []
-        for ridx in self._df.index:
-            # mx = (ub - self.loc[id,:]).min()
-            # mn = (lb - self.loc[id,:]).max()
-            if (ub - self._df.loc[ridx, :]).min() < 0.0 or (
-                lb - self._df.loc[ridx, :]
-            ).max() > 0.0:
-                drop.append(ridx)
-        self.loc[drop, :] = np.NaN
-        self.dropna(inplace=True)
+        ub, lb = self._get_enforce_bounds(bound_tol, self.istransformed)
+        values = self._df.values
+        with np.errstate(invalid="ignore"):
+            drop = np.any((values > ub) | (values < lb) | np.isnan(values), axis=1)
+        if np.any(drop):
+            self._df = self._df.loc[~drop, :]
 
     def _enforce_reset(self, bound_tol):
         """enforce parameter bounds on the ensemble by resetting
         violating vals to bound
         """
 
-        ub = (self.ubnd * (1.0 - bound_tol)).to_dict()
-        lb = (self.lbnd * (1.0 + bound_tol)).to_dict()
-
-        val_arr = self._df.values
-        for iname, name in enumerate(self.columns):
-            val_arr[val_arr[:, iname] > ub[name], iname] = ub[name]
-            val_arr[val_arr[:, iname] < lb[name], iname] = lb[name]
+        ub, lb = self._get_enforce_bounds(bound_tol, self.istransformed)
+        values = self._df.values
+        # NaN bounds (columns not in the control file) are not enforced
+        np.minimum(values, np.where(np.isnan(ub), np.inf, ub), out=values)
+        np.maximum(values, np.where(np.isnan(lb), -np.inf, lb), out=values)
+        self._set_values(values)
@@ -292,12 +292,16 @@ class ErrVar(LinearAnalysis):
             self.log("loading omitted_parcov")
         return self.__omitted_parcov
 
-    def get_errvar_dataframe(self, singular_values=None):
+    def get_errvar_dataframe(self, singular_values=None, sweep=True):
         """primary entry point for error variance analysis.
 
         Args:
             singular_values ([`int`], optional): a list singular values to test. If `None`,
                 defaults to `range(0,min(nnz_obs,nadj_par) + 1)`.
+            sweep (`bool`, optional): flag to calculate the error variance terms for
+                all `singular_values` in one sweep over the singular components of
+                `xtqx`.  If False, `ErrVar.variance_at()` is called for each singular
+                value.  Default is True
 
         Returns:
             `pandas.DataFrame`: a multi-indexed pandas dataframe summarizing each of the
@@ -305,6 +309,12 @@ class ErrVar(LinearAnalysis):
             tested, columns are a multi-index of forecast name and error variance term number
             (e.g. 1,2 or (optionally) 3).
 
+        Note:
+            With `sweep`, the singular vectors of `xtqx` are projected onto the forecast
+            vectors once and the terms at each truncation point are accumulated from
+            these projections, so the cost of each additional singular value is
+            linear in the number of parameters rather than cubic
+
         Example::
 
             ev = pyemu.ErrVar(jco="my.jco",omitted_parameters=["wel1","wel2"])
@@ -317,6 +327,10 @@ class ErrVar(LinearAnalysis):
             singular_values, np.ndarray
         ):
             singular_values = [singular_values]
+        if sweep:
+            return pd.DataFrame(
+                self.__sweep_errvar(singular_values), index=singular_values
+            )
         results = {}
         for singular_value in singular_values:
             sv_results = self.variance_at(singular_value)
@@ -326,6 +340,101 @@ class ErrVar(LinearAnalysis):
                 results[key].append(val)
         return pd.DataFrame(results, index=singular_values)
 
+    def __sweep_errvar(self, singular_values):
+        """private method to calculate the prediction error variance terms at each
+        of `singular_values` from the singular components of `xtqx`.
+
+        With `a = V.T * y` for prediction vector `y`:
+
+        - the first term is `u.T * parcov * u`, where `u = y - V1 * a1` is updated
+          with one singular vector at a time
+        - the second term is the cumulative sum of `a**2 / s`
+        - the third term is `p.T * omitted_parcov * p`, where
+          `p = omitted_jco.T * obscov^-1 * jco * V1 * (a1 / s1) - omitted_y` is updated
+          with one singular vector at a time
+
+        Returns:
+            `dict`: dictionary of (err var term,prediction_name), lists of variance
+            at `singular_values`
+
+        """
+        if not self.predictions:
+            raise Exception("ErrVar.get_errvar_dataframe(): no predictions are set")
+        singular_values = np.asarray(singular_values, dtype=int)
+        mn = min(self.jco.shape)
+        try:
+            mn = min(self.pst.npar_adj, self.pst.nnz_obs)
+        except:
+            pass
+        ncol = self.jco.ncol
+        xtqx = self.xtqx
+        names = xtqx.row_names
+        # the number of singular components needed
+        nsing = min(max(int(singular_values.max()), 0), len(names))
+        self.log("sweeping {0} singular components".format(nsing))
+        v = xtqx.v.as_2d[:, :nsing]
+        s = xtqx.s.x.flatten()[:nsing]
+        forecast_names = self.forecast_names
+        y = self.predictions.get(row_names=names, col_names=forecast_names).as_2d
+        a = np.dot(v.T, y)
+
+        # first term
+        parcov = self.parcov.get(names)
+        if parcov.isdiagonal:
+            pdiag = parcov.x.flatten()
+            pv, pu = pdiag[:, None] * v, pdiag[:, None] * y
+        else:
+            pv, pu = np.dot(parcov.as_2d, v), np.dot(parcov.as_2d, y)
+        u = y.copy()
+        first = np.zeros((nsing + 1, len(forecast_names)))
+        first[0] = np.sum(u * pu, axis=0)
+        for i in range(nsing):
+            u -= np.outer(v[:, i], a[i])
+            pu -= np.outer(pv[:, i], a[i])
+            first[i + 1] = np.sum(u * pu, axis=0)
+
+        # second term
+        second = np.zeros((nsing + 1, len(forecast_names)))
+        second[1:] = np.cumsum(a ** 2 / s[:, None], axis=0)
+
+        # third term
+        third = np.zeros((nsing + 1, len(forecast_names)))
+        if self.__need_omitted:
+            onames = self.omitted_jco.col_names
+            oparcov = self.omitted_parcov.get(onames)
+            oy = [opred.get(row_names=onames) for opred in self.omitted_predictions]
+            oy = np.hstack([opred.as_2d for opred in oy])
+            w = self.omitted_jco.T * self._get_obscov_inv() * self.jco
+            c = np.dot(w.get(row_names=onames, col_names=names).as_2d, v)
+            p = -oy
+            if oparcov.isdiagonal:
+                odiag = oparcov.x.flatten()
+                third[0] = np.sum(odiag[:, None] * p ** 2, axis=0)
+            else:
+                third[0] = np.sum(p * np.dot(oparcov.as_2d, p), axis=0)
+            for i in range(nsing):
+                p += np.outer(c[:, i], a[i] / s[i])
+                if oparcov.isdiagonal:
+                    third[i + 1] = np.sum(odiag[:, None] * p ** 2, axis=0)
+                else:
+                    third[i + 1] = np.sum(p * np.dot(oparcov.as_2d, p), axis=0)
+        self.log("sweeping {0} singular components".format(nsing))
+
+        idx = np.minimum(np.maximum(singular_values, 0), nsing)
+        results = {}
+        for term, values, over, sv_max in [
+            ("first", first, 0.0, ncol),
+            ("second", second, 1.0e35, mn),
+            ("third", third, 1.0e35, mn),
+        ]:
+            if term == "third" and not self.__need_omitted:
+                over = 0.0
+            for j, name in enumerate(forecast_names):
+                results[(term, name)] = list(
+                    np.where(singular_values > sv_max, over, values[idx, j])
+                )
+        return results
+
     def get_identifiability_dataframe(self, singular_value=None, precondition=False):
         """primary entry point for identifiability analysis
 
@@ -352,7 +461,7 @@ class ErrVar(LinearAnalysis):
         # v1_df = self.qhalfx.v[:, :singular_value].to_dataframe() ** 2
         xtqx = self.xtqx
         if precondition:
-            xtqx = xtqx + self.parcov.inv
+            xtqx = xtqx + self._get_parcov_inv()
         # v1_df = self.xtqx.v[:, :singular_value].to_dataframe() ** 2
         v1_df = xtqx.v[:, :singular_value].to_dataframe() ** 2
         v1_df["ident"] = v1_df.sum(axis=1)
@@ -460,7 +569,7 @@ class ErrVar(LinearAnalysis):
         v1 = self.xtqx.v[:, :singular_value]
         # s1 = ((self.qhalfx.s[:singular_value]) ** 2).inv
         s1 = (self.xtqx.s[:singular_value]).inv
-        self.__G = v1 * s1 * v1.T * self.jco.T * self.obscov.inv
+        self.__G = v1 * s1 * v1.T * self.jco.T * self._get_obscov_inv()
         self.__G_sv = singular_value
         self.__G.row_names = self.jco.col_names
         self.__G.col_names = self.jco.row_names
@@ -705,7 +814,7 @@ class ErrVar(LinearAnalysis):
         self.log("calc third term parameter @" + str(singular_value))
         return result
 
-    def get_null_proj(self, maxsing=None, eigthresh=1.0e-6):
+    def get_null_proj(self, maxsing=None, eigthresh=1.0e-6, factored=False):
         """get a null-space projection matrix of XTQX
 
         Args:
@@ -716,12 +825,17 @@ class ErrVar(LinearAnalysis):
             eigthresh (`float`, optional): the ratio of smallest to largest singular
                 value to keep in the range (solution) space of XtQX.  Not used if
                 `maxsing` is not `None`.  Default is 1.0e-6
+            factored (`bool`, optional): flag to return the solution-space right
+                singular vectors (V1) instead of forming the (npar X npar) null-space
+                projection matrix.  `ParameterEnsemble.project()` accepts
+                either.  Default is False
 
         Note:
             used for null-space monte carlo operations.
 
         Returns:
-            `pyemu.Matrix` the null-space projection matrix (V2V2^T)
+            `pyemu.Matrix` the null-space projection matrix (V2V2^T), or V1 if `factored`
+            is True
 
         """
         if maxsing is None:
@@ -732,7 +846,10 @@ class ErrVar(LinearAnalysis):
             + "{0} of {1} singular components".format(maxsing, self.jco.shape[1])
         )
 
-        v2_proj = self.xtqx.v[:, maxsing:] * self.xtqx.v[:, maxsing:].T
+        if factored:
+            v2_proj = self.xtqx.v[:, :maxsing]
+        else:
+            v2_proj = self.xtqx.v[:, maxsing:] * self.xtqx.v[:, maxsing:].T
         self.log(
             "forming null space projection matrix with "
             + "{0} of {1} singular components".format(maxsing, self.jco.shape[1])
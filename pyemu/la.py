@@ -5,6 +5,7 @@
 from __future__ import print_function, division
 import os
 import copy
+from collections import OrderedDict
 from datetime import datetime
 import numpy as np
 import pandas as pd
@@ -119,6 +120,9 @@ class LinearAnalysis(object):
         self.__fehalf = None
         self.__prior_prediction = None
         self.prediction_extract = None
+        # factors of the matrices, shared with the instances created by get()
+        self._factor_cache = _FactorCache()
+        self._factor_sources = {}
 
         self.log("pre-loading base components")
         if jco is not None:
@@ -175,8 +179,8 @@ class LinearAnalysis(object):
                 self.resfile = None
                 self.res = None
             self.log("scaling obscov by residual phi components")
-        assert type(self.parcov) == Cov
-        assert type(self.obscov) == Cov
+        assert isinstance(self.parcov, Cov)
+        assert isinstance(self.obscov, Cov)
 
     def __fromfile(self, filename, astype=None):
         """a private method to deduce and load a filename into a matrix object.
@@ -714,7 +718,9 @@ class LinearAnalysis(object):
         if self.__qhalf != None:
             return self.__qhalf
         self.log("qhalf")
-        self.__qhalf = self.obscov ** (-0.5)
+        self.__qhalf = self._get_factor(
+            "qhalf", ["obscov"], lambda: self._get_obscov_inv().sqrt
+        )
         self.log("qhalf")
         return self.__qhalf
 
@@ -742,7 +748,11 @@ class LinearAnalysis(object):
         """
         if self.__xtqx is None:
             self.log("xtqx")
-            self.__xtqx = self.jco.T * (self.obscov ** -1) * self.jco
+            self.__xtqx = self._get_factor(
+                "xtqx",
+                ["jco", "obscov"],
+                lambda: self.jco.T * self._get_obscov_inv() * self.jco,
+            )
             self.log("xtqx")
         return self.__xtqx
 
@@ -754,7 +764,9 @@ class LinearAnalysis(object):
             `pyemu.Matrix`: maximum likelihood parameter covariance matrix
 
         """
-        return self.xtqx.inv
+        return self._get_factor(
+            "mle_covariance", ["jco", "obscov"], lambda: self.xtqx.inv
+        )
 
     @property
     def prior_parameter(self):
@@ -796,8 +808,13 @@ class LinearAnalysis(object):
         res_vec = Matrix.from_dataframe(res.loc[:, ["residual"]])
 
         # calc posterior expectation
-        upgrade = self.mle_covariance * self.jco.T * res_vec
-        upgrade.col_names = ["prior_expt"]
+        xtr = self.jco.T * res_vec
+        xtqx = self.xtqx
+        upgrade = Matrix(
+            x=np.linalg.solve(xtqx.as_2d, xtr.get(row_names=xtqx.row_names).as_2d),
+            row_names=xtqx.row_names,
+            col_names=["prior_expt"],
+        )
         post_expt = prior_expt + upgrade
 
         # post processing - back log transform
@@ -846,6 +863,58 @@ class LinearAnalysis(object):
         self.__jco.col_names = cnames
         self.__parcov = self.parcov.identity
 
+    def _get_factor_source(self, attr):
+        """get the matrix that the `attr` ("jco", "parcov" or "obscov") matrix
+        was selected from.  The matrices of instances created by `get()` are
+        selected from the matrices of the calling instance.  If the matrix has
+        been (re)loaded or reset since, it is its own source
+
+        """
+        mat = getattr(self, attr)
+        if attr in self._factor_sources:
+            selected, source = self._factor_sources[attr]
+            if selected is mat:
+                return source
+        self._factor_sources[attr] = (mat, mat)
+        return mat
+
+    def _get_factor_key(self, kind, attrs):
+        """get the cache key of a factor of the `attrs` matrices"""
+        sources, names = [], []
+        for attr in attrs:
+            mat = getattr(self, attr)
+            sources.append(self._get_factor_source(attr))
+            names.append((tuple(mat.row_names), tuple(mat.col_names)))
+        return kind, sources, names
+
+    def _get_factor(self, kind, attrs, func):
+        """get a factor (e.g. an inverse) of the `attrs` matrices from the cache
+        shared with the instances created by `get()`.  If the factor is not
+        cached, it is formed by calling `func`
+
+        Args:
+            kind (`str`): the kind of factor
+            attrs ([`str`]): the names of the matrices ("jco", "parcov" and/or
+                "obscov") the factor is formed from
+            func (`callable`): function with no args that forms the factor
+
+        """
+        kind, sources, names = self._get_factor_key(kind, attrs)
+        return self._factor_cache.get(kind, sources, names, func)
+
+    def _set_factor(self, kind, attrs, value):
+        """put a factor of the `attrs` matrices in the cache"""
+        kind, sources, names = self._get_factor_key(kind, attrs)
+        self._factor_cache.set(kind, sources, names, value)
+
+    def _get_parcov_inv(self):
+        """get the (cached) inverse of `parcov`"""
+        return self._get_factor("parcov_inv", ["parcov"], lambda: _cov_inv(self.parcov))
+
+    def _get_obscov_inv(self):
+        """get the (cached) inverse of `obscov`"""
+        return self._get_factor("obscov_inv", ["obscov"], lambda: _cov_inv(self.obscov))
+
     def clean(self):
         """drop regularization and prior information observation from the jco"""
         if self.pst_arg is None:
@@ -931,6 +1000,11 @@ class LinearAnalysis(object):
         Returns:
             `LinearAnalysis`: new instance
 
+        Note:
+            The new instance shares the cached factors (e.g. the inverse of
+            `parcov`) with this instance, so factors of the same selection of
+            the matrices are only formed once
+
         """
         # make sure we aren't fooling with unwanted prior information
         self.clean()
@@ -1006,6 +1080,13 @@ class LinearAnalysis(object):
                 predictions=new_preds,
                 verbose=False,
             )
+        # share the factors, the matrices of the new instance are selections of ours
+        new._factor_cache = self._factor_cache
+        for attr, selected in zip(
+            ["jco", "parcov", "obscov"], [new_jco, new_parcov, new_obscov]
+        ):
+            if selected is not None and getattr(new, attr) is selected:
+                new._factor_sources[attr] = (selected, self._get_factor_source(attr))
         return new
 
     def adjust_obscov_resfile(self, resfile=None):
@@ -1119,3 +1200,89 @@ class LinearAnalysis(object):
                 df.loc[oname, ooname] = oc
                 df.loc[ooname, oname] = oc
         return df
+
+
+def _solve_lower(lower, b):
+    """private function to solve `lower * x = b` for a lower triangular
+    `lower`.  Uses `scipy.linalg.solve_triangular` if available"""
+    try:
+        from scipy.linalg import solve_triangular
+    except ImportError:
+        return np.linalg.solve(lower, b)
+    return solve_triangular(lower, b, lower=True)
+
+
+def _cov_inv(cov):
+    """private function to invert a covariance matrix with a Cholesky
+    factorization.  Falls back to `Matrix.inv` for empty, diagonal, low-rank or
+    not positive definite matrices"""
+    if cov.isdiagonal or cov.shape[0] == 0 or type(cov) not in (Matrix, Cov):
+        return cov.inv
+    try:
+        lower = np.linalg.cholesky(cov.as_2d)
+    except np.linalg.LinAlgError:
+        return cov.inv
+    linv = _solve_lower(lower, np.eye(lower.shape[0]))
+    return type(cov)(
+        x=np.dot(linv.T, linv),
+        row_names=cov.row_names,
+        col_names=cov.col_names,
+        autoalign=cov.autoalign,
+    )
+
+
+class _FactorCache(object):
+    """private least-recently-used cache of matrix factors (inverses,
+    Cholesky factors, normal matrices) that is shared by a `LinearAnalysis`
+    and the instances created from it.
+
+    Factors are keyed by the identity of the source matrices and the row and
+    col names of the selection, so instances that work on (subsets of) the same
+    matrices reuse the factors.  The source matrices are held with the factors
+    so that their identities are not reused.
+
+    Args:
+        maxsize (`int`): the maximum number of factors to hold.  Default is 16
+
+    Note:
+        Changing the values of a matrix in place is not detected - use
+        `LinearAnalysis.reset_parcov()` or `LinearAnalysis.reset_obscov()`
+
+    """
+
+    def __init__(self, maxsize=16):
+        self.maxsize = int(maxsize)
+        self._entries = OrderedDict()
+
+    def __deepcopy__(self, memo):
+        # a copy is not connected to the source matrices
+        return _FactorCache(maxsize=self.maxsize)
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _key(kind, sources, names):
+        return (kind, tuple(id(source) for source in sources), tuple(names))
+
+    def get(self, kind, sources, names, func):
+        """get a factor, calling `func` to form it if it is not cached"""
+        key = self._key(kind, sources, names)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key][1]
+        value = func()
+        self.set(kind, sources, names, value)
+        return value
+
+    def set(self, kind, sources, names, value):
+        """put a factor in the cache"""
+        key = self._key(kind, sources, names)
+        self._entries[key] = (list(sources), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """drop all the factors"""
+        self._entries.clear()
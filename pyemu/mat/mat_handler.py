@@ -1,5 +1,6 @@
 from __future__ import print_function, division
 import os
+import sys
 import copy
 import struct
 import warnings
@@ -39,20 +40,8 @@ def save_coo(x, row_names, col_names, filename, chunk=None):
     data = np.core.records.fromarrays([x.row, x.col, x.data], dtype=Matrix.coo_rec_dt)
     data.tofile(f)
 
-    for name in col_names:
-        if len(name) > Matrix.new_par_length:
-            name = name[: Matrix.new_par_length - 1]
-        elif len(name) < Matrix.new_par_length:
-            for _ in range(len(name), Matrix.new_par_length):
-                name = name + " "
-        f.write(name.encode())
-    for name in row_names:
-        if len(name) > Matrix.new_obs_length:
-            name = name[: Matrix.new_obs_length - 1]
-        elif len(name) < Matrix.new_obs_length:
-            for i in range(len(name), Matrix.new_obs_length):
-                name = name + " "
-        f.write(name.encode())
+    Matrix._write_binary_names(f, col_names, Matrix.new_par_length, "par")
+    Matrix._write_binary_names(f, row_names, Matrix.new_obs_length, "obs")
     f.close()
 
 
@@ -92,25 +81,56 @@ def concat(mats):
         col_names = []
         for mat in mats:
             col_names.extend(copy.deepcopy(mat.col_names))
-        x = mats[0].newx.copy()
         for mat in mats[1:]:
             mat.align(mats[0].row_names, axis=0)
-            other_x = mat.newx
-            x = np.append(x, other_x, axis=1)
-
+        axis = 1
     else:
         col_names = copy.deepcopy(mats[0].col_names)
         row_names = []
         for mat in mats:
             row_names.extend(copy.deepcopy(mat.row_names))
-        x = mats[0].newx.copy()
         for mat in mats[1:]:
             mat.align(mats[0].col_names, axis=1)
-            other_x = mat.newx
-            x = np.append(x, other_x, axis=0)
+        axis = 0
+    if any([mat.issparse for mat in mats]):
+        import scipy.sparse as sparse
+
+        xs = [mat.x if mat.issparse else sparse.csr_matrix(mat.x) for mat in mats]
+        if axis == 1:
+            x = sparse.hstack(xs, format="csr")
+        else:
+            x = sparse.vstack(xs, format="csr")
+    else:
+        x = np.concatenate([mat.x for mat in mats], axis=axis)
     return Matrix(x=x, row_names=row_names, col_names=col_names)
 
 
+def _issparse(x):
+    """check if `x` is a `scipy.sparse` matrix without requiring scipy.  If
+    `scipy.sparse` has not been imported, `x` can't be sparse
+    """
+    sparse = sys.modules.get("scipy.sparse", None)
+    return sparse is not None and sparse.issparse(x)
+
+
+def _isdataframe(x):
+    """check if `x` is a `pandas.DataFrame` or a `pyemu.Ensemble` (which
+    wraps one) without importing `pyemu.en`
+    """
+    return isinstance(x, pd.DataFrame) or isinstance(
+        getattr(x, "_df", None), pd.DataFrame
+    )
+
+
+def _sparse_result(x):
+    """coerce the result of an operation involving a `scipy.sparse` matrix
+    into either a csr matrix or a 2D `numpy.ndarray`
+    """
+    if _issparse(x):
+        return x.tocsr()
+    return np.asarray(x)
+
+
 def get_common_elements(list1, list2):
     """find the common elements in two lists.  used to support auto align
         might be faster with sets
@@ -132,6 +152,314 @@ def get_common_elements(list1, list2):
     return result
 
 
+class _BinaryMatrixMap(object):
+    """private helper that memory-maps the records of a PEST-style binary
+    matrix file so that (sub-)matrices can be materialized on demand without
+    forming the full dense array.  Used by `Matrix.from_binary(mmap=True)`
+
+    Args:
+        filename (`str`): the binary matrix file
+        nrow (`int`): number of rows in the file
+        ncol (`int`): number of columns in the file
+        icount (`int`): number of (non-zero) records in the file
+        coo (`bool`): flag for the extended [int,int,float] record format.  If
+            False, the PEST [int,float] record format is assumed
+        rows (`numpy.ndarray`, optional): the file row indices that are "active".
+            If None, all rows are active
+        cols (`numpy.ndarray`, optional): the file column indices that are "active".
+            If None, all columns are active
+        chunk (`int`): number of records to process in a single pass.  Default is 1,000,000
+
+    """
+
+    def __init__(
+        self, filename, nrow, ncol, icount, coo=True, rows=None, cols=None, chunk=1000000
+    ):
+        self.filename = filename
+        self.nrow, self.ncol, self.icount = int(nrow), int(ncol), int(icount)
+        self.coo = bool(coo)
+        self.chunk = int(chunk)
+        if rows is None:
+            rows = np.arange(self.nrow)
+        if cols is None:
+            cols = np.arange(self.ncol)
+        self.rows = np.asarray(rows, dtype=np.int64)
+        self.cols = np.asarray(cols, dtype=np.int64)
+        if self.coo:
+            dt = Matrix.coo_rec_dt
+        else:
+            dt = Matrix.binary_rec_dt
+        if self.icount > 0:
+            self.records = np.memmap(
+                filename,
+                dtype=dt,
+                mode="r",
+                offset=Matrix.binary_header_dt.itemsize,
+                shape=(self.icount,),
+            )
+        else:
+            self.records = np.zeros(0, dtype=dt)
+
+    def __deepcopy__(self, memo):
+        # remap the file rather than copying the mapped records into memory
+        return self.subset()
+
+    @property
+    def shape(self):
+        return self.rows.shape[0], self.cols.shape[0]
+
+    def subset(self, row_idxs=None, col_idxs=None):
+        """get a new map that is restricted to a subset of the active rows and/or columns
+
+        Args:
+            row_idxs (`numpy.ndarray`, optional): indices into the active rows
+            col_idxs (`numpy.ndarray`, optional): indices into the active columns
+
+        Returns:
+            `_BinaryMatrixMap`: a new map on the same file
+
+        """
+        rows, cols = self.rows, self.cols
+        if row_idxs is not None:
+            rows = rows[row_idxs]
+        if col_idxs is not None:
+            cols = cols[col_idxs]
+        return _BinaryMatrixMap(
+            self.filename,
+            self.nrow,
+            self.ncol,
+            self.icount,
+            coo=self.coo,
+            rows=rows,
+            cols=cols,
+            chunk=self.chunk,
+        )
+
+    def read(self, row_idxs=None, col_idxs=None):
+        """materialize a dense array from the mapped records, one chunk of
+        records at a time
+
+        Args:
+            row_idxs (`numpy.ndarray`, optional): indices into the active rows to
+                materialize.  If None, all active rows are materialized
+            col_idxs (`numpy.ndarray`, optional): indices into the active columns to
+                materialize.  If None, all active columns are materialized
+
+        Returns:
+            `numpy.ndarray`: the dense (sub-)matrix
+
+        """
+        rows, cols = self.rows, self.cols
+        if row_idxs is not None:
+            rows = rows[np.asarray(row_idxs, dtype=np.int64)]
+        if col_idxs is not None:
+            cols = cols[np.asarray(col_idxs, dtype=np.int64)]
+        # map file positions to output positions, -1 for not requested
+        row_map = np.full(self.nrow, -1, dtype=np.int64)
+        row_map[rows] = np.arange(rows.shape[0])
+        col_map = np.full(self.ncol, -1, dtype=np.int64)
+        col_map[cols] = np.arange(cols.shape[0])
+        x = np.zeros((rows.shape[0], cols.shape[0]))
+        for start in range(0, self.icount, self.chunk):
+            recs = np.asarray(self.records[start : start + self.chunk])
+            if self.coo:
+                irows = recs["i"].astype(np.int64)
+                icols = recs["j"].astype(np.int64)
+                if irows.min() < 0:
+                    raise Exception("Matrix.from_binary(): 'i' index values less than 0")
+                if icols.min() < 0:
+                    raise Exception("Matrix.from_binary(): 'j' index values less than 0")
+            else:
+                j = recs["j"].astype(np.int64) - 1
+                icols = j // self.nrow
+                irows = j - (icols * self.nrow)
+            irows = row_map[irows]
+            icols = col_map[icols]
+            keep = np.logical_and(irows >= 0, icols >= 0)
+            x[irows[keep], icols[keep]] = recs["dtemp"][keep]
+        return x
+
+
+class _LowRankMap(object):
+    """private helper that represents the (optionally localized) covariance
+    matrix implied by a deviation matrix, `devs.T * devs`, without forming
+    it.  Blocks of the covariance matrix are formed on demand.  Used by `LowRankCov`
+
+    Args:
+        devs (`numpy.ndarray`): scaled deviations with shape (nreal, n)
+        localizer (`Matrix`, optional): localizing matrix, ordered like the
+            columns of `devs`.  If None, no localization is applied
+        rows (`numpy.ndarray`, optional): the column indices of `devs` that are
+            the "active" rows.  If None, all are active
+        cols (`numpy.ndarray`, optional): the column indices of `devs` that are
+            the "active" columns.  If None, all are active
+        max_block_size (`int`): maximum number of covariance matrix elements to
+            form in a single block.  Default is 10,000,000
+
+    """
+
+    def __init__(
+        self, devs, localizer=None, rows=None, cols=None, max_block_size=10000000
+    ):
+        self.devs = devs
+        self.localizer = localizer
+        self.max_block_size = int(max_block_size)
+        if rows is None:
+            rows = np.arange(devs.shape[1])
+        if cols is None:
+            cols = np.arange(devs.shape[1])
+        self.rows = np.asarray(rows, dtype=np.int64)
+        self.cols = np.asarray(cols, dtype=np.int64)
+
+    def __deepcopy__(self, memo):
+        # the deviations are never modified in place so they can be shared
+        return self.subset()
+
+    @property
+    def shape(self):
+        return self.rows.shape[0], self.cols.shape[0]
+
+    def subset(self, row_idxs=None, col_idxs=None):
+        """get a new map that is restricted to a subset of the active rows and/or columns
+
+        Args:
+            row_idxs (`numpy.ndarray`, optional): indices into the active rows
+            col_idxs (`numpy.ndarray`, optional): indices into the active columns
+
+        Returns:
+            `_LowRankMap`: a new map on the same deviations
+
+        """
+        rows, cols = self.rows, self.cols
+        if row_idxs is not None:
+            rows = rows[row_idxs]
+        if col_idxs is not None:
+            cols = cols[col_idxs]
+        return _LowRankMap(
+            self.devs,
+            localizer=self.localizer,
+            rows=rows,
+            cols=cols,
+            max_block_size=self.max_block_size,
+        )
+
+    def scale(self, fac):
+        """get a new map for the covariance matrix multiplied by a non-negative scalar
+
+        Args:
+            fac (`float`): the scalar
+
+        Returns:
+            `_LowRankMap`: a new map on the scaled deviations
+
+        """
+        if fac < 0.0:
+            raise Exception("_LowRankMap.scale(): fac must be non-negative")
+        return _LowRankMap(
+            self.devs * np.sqrt(fac),
+            localizer=self.localizer,
+            rows=self.rows,
+            cols=self.cols,
+            max_block_size=self.max_block_size,
+        )
+
+    def _blocks(self, n, nother):
+        """private generator of slices of at most `max_block_size` // `nother`
+        of `n` elements"""
+        nblock = max(1, self.max_block_size // max(1, nother))
+        for start in range(0, n, nblock):
+            yield slice(start, min(n, start + nblock))
+
+    def read(self, row_idxs=None, col_idxs=None):
+        """form a dense block of the covariance matrix, one row block at a time
+
+        Args:
+            row_idxs (`numpy.ndarray`, optional): indices into the active rows to
+                form.  If None, all active rows are formed
+            col_idxs (`numpy.ndarray`, optional): indices into the active columns to
+                form.  If None, all active columns are formed
+
+        Returns:
+            `numpy.ndarray`: the dense (sub-)matrix
+
+        """
+        rows, cols = self.rows, self.cols
+        if row_idxs is not None:
+            rows = rows[np.asarray(row_idxs, dtype=np.int64)]
+        if col_idxs is not None:
+            cols = cols[np.asarray(col_idxs, dtype=np.int64)]
+        dcols = self.devs[:, cols]
+        x = np.empty((rows.shape[0], cols.shape[0]))
+        for blk in self._blocks(rows.shape[0], cols.shape[0]):
+            x[blk] = np.dot(self.devs[:, rows[blk]].T, dcols)
+            if self.localizer is not None:
+                x[blk] *= self.localizer._read_block(rows[blk], cols)
+        return x
+
+    def dot(self, other):
+        """dot product of the covariance matrix with an array
+
+        Args:
+            other (`numpy.ndarray`): 2-D array with shape[0] equal to the
+                number of active columns
+
+        Returns:
+            `numpy.ndarray`: the product, with shape (nrow, other.shape[1])
+
+        """
+        drows = self.devs[:, self.rows]
+        dcols = self.devs[:, self.cols]
+        if self.localizer is None:
+            return np.dot(drows.T, np.dot(dcols, other))
+        x = np.empty((self.rows.shape[0], other.shape[1]))
+        for blk in self._blocks(self.rows.shape[0], self.cols.shape[0]):
+            block = np.dot(drows[:, blk].T, dcols)
+            block *= self.localizer._read_block(self.rows[blk], self.cols)
+            x[blk] = np.dot(block, other)
+        return x
+
+    def rdot(self, other):
+        """dot product of an array with the covariance matrix
+
+        Args:
+            other (`numpy.ndarray`): 2-D array with shape[1] equal to the
+                number of active rows
+
+        Returns:
+            `numpy.ndarray`: the product, with shape (other.shape[0], ncol)
+
+        """
+        drows = self.devs[:, self.rows]
+        dcols = self.devs[:, self.cols]
+        if self.localizer is None:
+            return np.dot(np.dot(other, drows.T), dcols)
+        x = np.empty((other.shape[0], self.cols.shape[0]))
+        for blk in self._blocks(self.cols.shape[0], self.rows.shape[0]):
+            block = np.dot(drows.T, dcols[:, blk])
+            block *= self.localizer._read_block(self.rows, self.cols[blk])
+            x[:, blk] = np.dot(other, block)
+        return x
+
+    def diagonal(self):
+        """get the diagonal of the covariance matrix
+
+        Returns:
+            `numpy.ndarray`: the diagonal elements
+
+        """
+        if self.rows.shape[0] != self.cols.shape[0]:
+            raise Exception("_LowRankMap.diagonal(): not square")
+        diag = np.einsum(
+            "ij,ij->j", self.devs[:, self.rows], self.devs[:, self.cols]
+        )
+        if self.localizer is not None:
+            n = self.rows.shape[0]
+            for blk in self._blocks(n, n):
+                block = self.localizer._read_block(self.rows[blk], self.cols[blk])
+                diag[blk] *= np.diag(block)
+        return diag
+
+
 class Matrix(object):
     """Easy linear algebra in the PEST(++) realm
 
@@ -163,6 +491,10 @@ class Matrix(object):
         this class makes heavy use of property decorators to encapsulate
         private attributes
 
+        `x` can also be a `scipy.sparse` matrix, in which case the values are
+        stored in compressed sparse row format and linear algebra operations
+        keep results sparse where possible.  See `Matrix.to_sparse()`
+
     """
 
     integer = np.int32
@@ -175,6 +507,20 @@ class Matrix(object):
     binary_rec_dt = np.dtype([("j", integer), ("dtemp", double)])
     coo_rec_dt = np.dtype([("i", integer), ("j", integer), ("dtemp", double)])
 
+    columnar_magic = b"PYEMUCOL"
+    columnar_header_dt = np.dtype(
+        [
+            ("version", np.int64),
+            ("nrow", np.int64),
+            ("ncol", np.int64),
+            ("itemsize", np.int64),
+            ("row_length", np.int64),
+            ("col_length", np.int64),
+            ("int_rows", np.int64),
+            ("reserved", np.int64),
+        ]
+    )
+
     par_length = 12
     obs_length = 20
     new_par_length = 200
@@ -191,9 +537,18 @@ class Matrix(object):
         self.__u = None
         self.__s = None
         self.__v = None
+        self.__lazy = None
         if x is not None:
             if x.ndim != 2:
                 raise Exception("ndim != 2")
+            if _issparse(x):
+                if isdiagonal:
+                    raise Exception(
+                        "Matrix.__init__(): sparse x not supported for diagonal"
+                    )
+                import scipy.sparse as sparse
+
+                x = sparse.csr_matrix(x)
             # x = np.atleast_2d(x)
             if isdiagonal and len(row_names) > 0:
                 # assert 1 in x.shape,"Matrix error: diagonal matrix must have " +\
@@ -271,7 +626,7 @@ class Matrix(object):
             + "col names: "
             + str(self.col_names)
             + "\n"
-            + str(self.__x)
+            + str(self.x)
         )
         return s
 
@@ -286,9 +641,14 @@ class Matrix(object):
 
         """
         if self.isdiagonal and isinstance(item, tuple):
-            submat = np.atleast_2d((self.__x[item[0]]))
+            submat = np.atleast_2d((self.x[item[0]]))
+        elif self.issparse:
+            submat = self.x[item]
+            if _issparse(submat):
+                submat = submat.toarray()
+            submat = np.atleast_2d(submat)
         else:
-            submat = np.atleast_2d(self.__x[item])
+            submat = np.atleast_2d(self.x[item])
         # transpose a row vector to a column vector
         if submat.shape[0] == 1:
             submat = submat.transpose()
@@ -343,8 +703,12 @@ class Matrix(object):
                     + "for fractional powers except 0.5"
                 )
         else:
+            if self.issparse:
+                x = self.__x.power(power)
+            else:
+                x = self.x ** power
             return type(self)(
-                self.__x ** power,
+                x,
                 row_names=self.row_names,
                 col_names=self.col_names,
                 isdiagonal=self.isdiagonal,
@@ -376,14 +740,22 @@ class Matrix(object):
         """
 
         if np.isscalar(other):
+            if self.issparse:
+                # a non-zero scalar touches every element, so densify
+                if other == 0:
+                    x = self.x.copy()
+                else:
+                    x = self.x.toarray() - other
+            else:
+                x = self.x - other
             return Matrix(
-                x=self.x - other,
+                x=x,
                 row_names=self.row_names,
                 col_names=self.col_names,
                 isdiagonal=self.isdiagonal,
             )
         else:
-            if isinstance(other, pd.DataFrame):
+            if _isdataframe(other):
                 other = Matrix.from_dataframe(other)
 
             if isinstance(other, np.ndarray):
@@ -404,7 +776,7 @@ class Matrix(object):
                     )
                 else:
                     return type(self)(
-                        x=self.x - other,
+                        x=_sparse_result(self.x - other),
                         row_names=self.row_names,
                         col_names=self.col_names,
                     )
@@ -441,6 +813,14 @@ class Matrix(object):
                         row_names=first.row_names,
                         col_names=first.col_names,
                     )
+                elif first.issparse or second.issparse:
+                    return type(self)(
+                        x=_sparse_result(
+                            first._sparse_compatible_x() - second._sparse_compatible_x()
+                        ),
+                        row_names=first.row_names,
+                        col_names=first.col_names,
+                    )
                 elif first.isdiagonal:
                     elem_sub = -1.0 * second.newx
                     for j in range(first.shape[0]):
@@ -489,14 +869,22 @@ class Matrix(object):
 
         """
         if np.isscalar(other):
+            if self.issparse:
+                # a non-zero scalar touches every element, so densify
+                if other == 0:
+                    x = self.x.copy()
+                else:
+                    x = self.x.toarray() + other
+            else:
+                x = self.x + other
             return type(self)(
-                x=self.x + other,
+                x=x,
                 row_names=self.row_names,
                 col_names=self.col_names,
                 isdiagonal=self.isdiagonal,
             )
 
-        if isinstance(other, pd.DataFrame):
+        if _isdataframe(other):
             other = Matrix.from_dataframe(other)
 
         if isinstance(other, np.ndarray):
@@ -512,7 +900,9 @@ class Matrix(object):
                 )
             else:
                 return type(self)(
-                    x=self.x + other, row_names=self.row_names, col_names=self.col_names
+                    x=_sparse_result(self.x + other),
+                    row_names=self.row_names,
+                    col_names=self.col_names,
                 )
 
         elif isinstance(other, Matrix):
@@ -543,6 +933,14 @@ class Matrix(object):
                     row_names=first.row_names,
                     col_names=first.col_names,
                 )
+            elif first.issparse or second.issparse:
+                return type(self)(
+                    x=_sparse_result(
+                        first._sparse_compatible_x() + second._sparse_compatible_x()
+                    ),
+                    row_names=first.row_names,
+                    col_names=first.col_names,
+                )
             elif first.isdiagonal:
                 ox = second.newx
                 for j in range(first.shape[0]):
@@ -551,7 +949,7 @@ class Matrix(object):
                     x=ox, row_names=first.row_names, col_names=first.col_names
                 )
             elif second.isdiagonal:
-                x = first.x
+                x = first.newx
                 for j in range(second.shape[0]):
                     x[j, j] += second.x[j]
                 return type(self)(
@@ -598,7 +996,7 @@ class Matrix(object):
         if np.isscalar(other):
             return type(self)(x=self.x * other)
 
-        if isinstance(other, pd.DataFrame):
+        if _isdataframe(other):
             other = Matrix.from_dataframe(other)
 
         if isinstance(other, np.ndarray):
@@ -613,6 +1011,12 @@ class Matrix(object):
                 raise NotImplementedError(
                     "Matrix.hadamard_product() not supported for" + "diagonal self"
                 )
+            elif self.issparse:
+                return type(self)(
+                    x=_sparse_result(self.x.multiply(other)),
+                    row_names=self.row_names,
+                    col_names=self.col_names,
+                )
             else:
                 return type(self)(
                     x=self.x * other, row_names=self.row_names, col_names=self.col_names
@@ -647,6 +1051,16 @@ class Matrix(object):
                     row_names=first.row_names,
                     col_names=first.col_names,
                 )
+            elif first.issparse or second.issparse:
+                if first.issparse:
+                    x = first.x.multiply(second._sparse_compatible_x())
+                else:
+                    x = second.x.multiply(first._sparse_compatible_x())
+                return type(self)(
+                    x=_sparse_result(x),
+                    row_names=first.row_names,
+                    col_names=first.col_names,
+                )
             # elif first.isdiagonal:
             #     #ox = second.as_2d
             #     #for j in range(first.shape[0]):
@@ -698,8 +1112,11 @@ class Matrix(object):
 
         """
 
-        if isinstance(other, pd.DataFrame):
+        if _isdataframe(other):
             other = Matrix.from_dataframe(other)
+        if isinstance(other, LowRankCov) and other.islowrank:
+            # keep the product low-rank
+            return other.__rmul__(self)
 
         if np.isscalar(other):
             return type(self)(
@@ -722,8 +1139,10 @@ class Matrix(object):
                 return type(self)(
                     x=np.dot(np.diag(self.__x.flatten()).transpose(), other)
                 )
+            elif self.issparse:
+                return type(self)(x=np.atleast_2d(self.__x @ other))
             else:
-                return type(self)(x=np.atleast_2d(np.dot(self.__x, other)))
+                return type(self)(x=np.atleast_2d(np.dot(self.x, other)))
         elif isinstance(other, Matrix):
             if self.autoalign and other.autoalign and not self.mult_isaligned(other):
                 common = get_common_elements(self.col_names, other.row_names)
@@ -764,6 +1183,14 @@ class Matrix(object):
                 )
                 elem_prod.isdiagonal = True
                 return elem_prod
+            elif first.issparse or second.issparse:
+                return type(self)(
+                    x=_sparse_result(
+                        first._sparse_compatible_x() @ second._sparse_compatible_x()
+                    ),
+                    row_names=first.row_names,
+                    col_names=second.col_names,
+                )
             elif first.isdiagonal:
                 ox = second.newx
                 for j in range(first.shape[0]):
@@ -838,8 +1265,10 @@ class Matrix(object):
                 return type(self)(
                     x=np.dot(other, np.diag(self.__x.flatten()).transpose())
                 )
+            elif self.issparse:
+                return type(self)(x=np.atleast_2d(other @ self.__x))
             else:
-                return type(self)(x=np.dot(other, self.__x))
+                return type(self)(x=np.dot(other, self.x))
         elif isinstance(other, Matrix):
             if self.autoalign and other.autoalign and not self.mult_isaligned(other):
                 common = get_common_elements(self.row_names, other.col_names)
@@ -877,6 +1306,14 @@ class Matrix(object):
                 )
                 elem_prod.isdiagonal = True
                 return elem_prod
+            elif first.issparse or second.issparse:
+                return type(self)(
+                    x=_sparse_result(
+                        first._sparse_compatible_x() @ second._sparse_compatible_x()
+                    ),
+                    row_names=first.row_names,
+                    col_names=second.col_names,
+                )
             elif first.isdiagonal:
                 ox = second.newx
                 for j in range(first.shape[0]):
@@ -914,8 +1351,8 @@ class Matrix(object):
         if self.isdiagonal:
             x = np.diag(self.x.flatten())
         else:
-            # just a pointer to x
-            x = self.x
+            # just a pointer to x (unless sparse)
+            x = self.as_2d
         try:
 
             u, s, v = np.linalg.svd(x, full_matrices=True)
@@ -1000,7 +1437,7 @@ class Matrix(object):
             `numpy.ndarray`: a copy `Matrix.x`
 
         """
-        return self.__x.copy()
+        return self.x.copy()
 
     @property
     def x(self):
@@ -1009,9 +1446,73 @@ class Matrix(object):
         Returns:
             `numpy.ndarray`: reference to `Matrix.x`
 
+        Note:
+            if `Matrix` was loaded with `Matrix.from_binary(mmap=True)`, the
+            full dense array is materialized on the first access
+
         """
+        if self.__x is None and self.__lazy is not None:
+            self.__x = self.__lazy.read()
+            self.__lazy = None
         return self.__x
 
+    @property
+    def issparse(self):
+        """flag for `scipy.sparse` storage of `Matrix.x`
+
+        Returns:
+            `bool`: True if `Matrix.x` is a `scipy.sparse` matrix
+
+        """
+        return _issparse(self.__x)
+
+    def _sparse_compatible_x(self):
+        """private method to get the numeric values in a form that supports
+        linear algebra with `scipy.sparse` matrices: diagonal instances are
+        returned as a sparse diagonal matrix, otherwise a reference to `Matrix.x`
+
+        """
+        if self.isdiagonal:
+            import scipy.sparse as sparse
+
+            return sparse.diags(self.__x.flatten(), format="csr")
+        return self.x
+
+    def to_sparse(self, droptol=None):
+        """get a `scipy.sparse`-backed `Matrix` representation of `Matrix`
+
+        Args:
+            droptol (`float`): absolute value tolerance to make values
+                smaller than `droptol` zero.  Default is None (no dropping)
+
+        Returns:
+            `Matrix`: new `Matrix` instance with values stored in compressed
+            sparse row format
+
+        Note:
+            requires scipy
+
+        Example::
+
+            cov = pyemu.Cov.from_binary("prior.jcb").to_sparse(droptol=1.0e-10)
+            print(cov.x.nnz)
+
+        """
+        try:
+            import scipy.sparse as sparse
+        except Exception as e:
+            raise Exception("Matrix.to_sparse() requires scipy: {0}".format(str(e)))
+        x = sparse.csr_matrix(self._sparse_compatible_x(), copy=True)
+        if droptol is not None:
+            x.data[np.abs(x.data) < droptol] = 0.0
+        x.eliminate_zeros()
+        return type(self)(
+            x=x,
+            row_names=self.row_names,
+            col_names=self.col_names,
+            autoalign=self.autoalign,
+        )
+
     @property
     def as_2d(self):
         """get a 2D numeric representation of `Matrix.x`.  If not `isdiagonal`, simply
@@ -1029,6 +1530,8 @@ class Matrix(object):
             print(cov.shape,cov.x.shape,x2d.shape)
 
         """
+        if self.issparse:
+            return self.__x.toarray()
         if not self.isdiagonal:
             return self.x
         return np.diag(self.x.flatten())
@@ -1039,7 +1542,7 @@ class Matrix(object):
                 instance that is stored as diagonal
 
         Returns:
-            `Martrix`: non-diagonal form of `Matrix`
+            `Martrix`: non-diagonal (and non-sparse) form of `Matrix`
 
         Exmaple::
 
@@ -1049,10 +1552,10 @@ class Matrix(object):
             print(cov.shape,cov.x.shape,cov2d.shape,cov2d.x.shape)
 
         """
-        if not self.isdiagonal:
+        if not self.isdiagonal and not self.issparse:
             return self.copy()
         return type(self)(
-            x=np.diag(self.x.flatten()),
+            x=self.as_2d.copy(),
             row_names=self.row_names,
             col_names=self.col_names,
             isdiagonal=False,
@@ -1072,6 +1575,8 @@ class Matrix(object):
             nrow,ncol = shape #unpack to ints
 
         """
+        if self.__x is None and self.__lazy is not None:
+            return self.__lazy.shape
         if self.__x is not None:
             if self.isdiagonal:
                 return (max(self.__x.shape), max(self.__x.shape))
@@ -1136,7 +1641,7 @@ class Matrix(object):
         """
         if not self.isdiagonal:
             return type(self)(
-                x=self.__x.copy().transpose(),
+                x=self.x.copy().transpose(),
                 row_names=self.col_names,
                 col_names=self.row_names,
                 autoalign=self.autoalign,
@@ -1158,7 +1663,8 @@ class Matrix(object):
             `Matrix`: inverse of `Matrix`
 
         Note:
-            uses `numpy.linalg.inv` for the inversion
+            uses `numpy.linalg.inv` for the inversion.  The inverse of a
+            sparse `Matrix` is dense
 
         Example::
 
@@ -1190,7 +1696,7 @@ class Matrix(object):
             )
         else:
             return type(self)(
-                x=np.linalg.inv(self.__x),
+                x=np.linalg.inv(self.as_2d),
                 row_names=self.row_names,
                 col_names=self.col_names,
                 autoalign=self.autoalign,
@@ -1365,9 +1871,16 @@ class Matrix(object):
                 col_names=self.col_names,
                 autoalign=self.autoalign,
             )
+        elif self.issparse:
+            return type(self)(
+                x=self.__x.sqrt(),
+                row_names=self.row_names,
+                col_names=self.col_names,
+                autoalign=self.autoalign,
+            )
         elif self.shape[1] == 1:  # a vector
             return type(self)(
-                x=np.sqrt(self.__x),
+                x=np.sqrt(self.x),
                 isdiagonal=False,
                 row_names=self.row_names,
                 col_names=self.col_names,
@@ -1375,7 +1888,7 @@ class Matrix(object):
             )
         else:
             return type(self)(
-                x=np.sqrt(self.__x),
+                x=np.sqrt(self.x),
                 row_names=self.row_names,
                 col_names=self.col_names,
                 autoalign=self.autoalign,
@@ -1593,6 +2106,8 @@ class Matrix(object):
 
             if self.isdiagonal:
                 self.__x = self.__x[row_idxs]
+            elif self.__x is None and self.__lazy is not None:
+                self.__lazy = self.__lazy.subset(row_idxs, col_idxs)
             else:
                 self.__x = self.__x[row_idxs, :]
                 self.__x = self.__x[:, col_idxs]
@@ -1611,7 +2126,10 @@ class Matrix(object):
                     raise Exception(
                         "Matrix.align(): not all names found in self.row_names"
                     )
-                self.__x = self.__x[row_idxs, :]
+                if self.__x is None and self.__lazy is not None:
+                    self.__lazy = self.__lazy.subset(row_idxs=row_idxs)
+                else:
+                    self.__x = self.__x[row_idxs, :]
                 row_names = []
                 _ = [row_names.append(self.row_names[i]) for i in row_idxs]
                 self.row_names = row_names
@@ -1620,7 +2138,10 @@ class Matrix(object):
                     raise Exception(
                         "Matrix.align(): not all names found in self.col_names"
                     )
-                self.__x = self.__x[:, col_idxs]
+                if self.__x is None and self.__lazy is not None:
+                    self.__lazy = self.__lazy.subset(col_idxs=col_idxs)
+                else:
+                    self.__x = self.__x[:, col_idxs]
                 col_names = []
                 _ = [col_names.append(self.col_names[i]) for i in row_idxs]
                 self.col_names = col_names
@@ -1673,26 +2194,51 @@ class Matrix(object):
 
             if self.isdiagonal:
                 extract = self.__x[idxs].copy()
+            elif self.__x is None and self.__lazy is not None:
+                extract = self.__lazy.read(idxs, idxs)
             else:
                 extract = self.__x[idxs, :].copy()
                 extract = extract[:, idxs]
             if drop:
                 self.drop(names, 0)
             return Cov(x=extract, names=names, isdiagonal=self.isdiagonal)
+        if self.__x is None and self.__lazy is not None:
+            # only materialize the requested rows and cols
+            row_idxs, col_idxs = None, None
+            if row_names is not None:
+                row_idxs = self.indices(row_names, axis=0)
+            if col_names is not None:
+                col_idxs = self.indices(col_names, axis=1)
+            extract = self.__lazy.read(row_idxs, col_idxs)
+            if drop and row_names is not None:
+                self.drop(row_names, axis=0)
+            if drop and col_names is not None:
+                self.drop(col_names, axis=1)
+            if row_names is None:
+                row_names = self.row_names
+            if col_names is None:
+                col_names = copy.deepcopy(self.col_names)
+            return type(self)(x=extract, row_names=row_names, col_names=col_names)
         if self.isdiagonal:
             extract = np.diag(self.__x[:, 0])
         else:
             extract = self.__x.copy()
         if row_names is not None:
             row_idxs = self.indices(row_names, axis=0)
-            extract = np.atleast_2d(extract[row_idxs, :].copy())
+            if self.issparse:
+                extract = extract[row_idxs, :]
+            else:
+                extract = np.atleast_2d(extract[row_idxs, :].copy())
             if drop:
                 self.drop(row_names, axis=0)
         else:
             row_names = self.row_names
         if col_names is not None:
             col_idxs = self.indices(col_names, axis=1)
-            extract = np.atleast_2d(extract[:, col_idxs].copy())
+            if _issparse(extract):
+                extract = extract[:, col_idxs]
+            else:
+                extract = np.atleast_2d(extract[:, col_idxs].copy())
             if drop:
                 self.drop(col_names, axis=1)
         else:
@@ -1700,6 +2246,18 @@ class Matrix(object):
 
         return type(self)(x=extract, row_names=row_names, col_names=col_names)
 
+    def _read_block(self, row_idxs, col_idxs):
+        """private method to get a dense block of values by row and column
+        indices without materializing a memory-mapped or low-rank `Matrix`"""
+        if self.__x is None and self.__lazy is not None:
+            return self.__lazy.read(row_idxs, col_idxs)
+        if self.isdiagonal:
+            block = row_idxs[:, None] == col_idxs[None, :]
+            return block * self.__x[row_idxs, 0][:, None]
+        if self.issparse:
+            return self.__x[row_idxs, :][:, col_idxs].toarray()
+        return self.__x[np.ix_(row_idxs, col_idxs)]
+
     def copy(self):
         """get a copy of `Matrix`
 
@@ -1736,7 +2294,31 @@ class Matrix(object):
 
         idxs = self.indices(names, axis=axis)
 
-        if self.isdiagonal:
+        if self.issparse or (self.__x is None and self.__lazy is not None):
+            # index-based drop for storage that doesn't support np.delete
+            sdrop = set(names)
+            row_keep, col_keep = None, None
+            if isinstance(self, Cov):
+                row_keep = np.delete(np.arange(self.shape[0]), idxs)
+                col_keep = row_keep
+            elif axis == 0:
+                row_keep = np.delete(np.arange(self.shape[0]), idxs)
+            elif axis == 1:
+                col_keep = np.delete(np.arange(self.shape[1]), idxs)
+            else:
+                raise Exception("Matrix.drop(): axis argument must be 0 or 1")
+            if self.issparse:
+                if row_keep is not None:
+                    self.__x = self.__x[row_keep, :]
+                if col_keep is not None:
+                    self.__x = self.__x[:, col_keep]
+            else:
+                self.__lazy = self.__lazy.subset(row_keep, col_keep)
+            if row_keep is not None:
+                self.row_names = [name for name in self.row_names if name not in sdrop]
+            if col_keep is not None:
+                self.col_names = [name for name in self.col_names if name not in sdrop]
+        elif self.isdiagonal:
             self.__x = np.delete(self.__x, idxs, 0)
             keep_names = [name for name in self.row_names if name not in names]
             if len(keep_names) != self.__x.shape[0]:
@@ -1848,14 +2430,36 @@ class Matrix(object):
             raise Exception("already diagonal")
         if not isinstance(col_name, str):
             raise Exception("col_name must be type str")
+        if self.issparse:
+            diag = self.x.diagonal()
+        else:
+            diag = np.diag(self.x)
         return type(self)(
-            x=np.atleast_2d(np.diag(self.x)).transpose(),
+            x=np.atleast_2d(diag).transpose(),
             row_names=self.row_names,
             col_names=[col_name],
             isdiagonal=False,
         )
 
-    def to_coo(self, filename, droptol=None, chunk=None):
+    def __row_blocks(self, row_block=None):
+        """private generator of dense (or sparse) row blocks of at most
+        `row_block` elements - used by the binary writers"""
+        nrow, ncol = self.shape
+        if row_block is None:
+            nblock = max(1, nrow)
+        else:
+            nblock = max(1, int(row_block) // max(1, ncol))
+        for start in range(0, nrow, nblock):
+            end = min(nrow, start + nblock)
+            if self.isdiagonal:
+                block = np.zeros((end - start, ncol))
+                idx = np.arange(start, end)
+                block[idx - start, idx] = self.__x[start:end, 0]
+            else:
+                block = self.x[start:end, :]
+            yield block
+
+    def to_coo(self, filename, droptol=None, chunk=None, row_block=None):
         """write an extended PEST-format binary file.  The data format is
         [int,int,float] for i,j,value.  It is autodetected during
         the read with `Matrix.from_binary()`.
@@ -1867,86 +2471,36 @@ class Matrix(object):
             chunk (`int`): number of elements to write in a single pass.
                 Default is `None`, which writes the entire numeric part of the
                 `Matrix` at once. This is faster but requires more memory.
+            row_block (`int`): number of elements in each row block of the
+                `Matrix` that is processed at once.  Default is `None`, which
+                processes the whole `Matrix` at once
 
         Note:
             This method is needed when the number of dimensions times 2 is larger
             than the max value for a 32-bit integer.  happens!
             This method is used by pyemu.Ensemble.to_binary()
 
+            Calls `Matrix.write_binary_blocks()` with row blocks of `row_block` elements
+
         """
-        if self.isdiagonal:
-            # raise NotImplementedError()
-            self.__x = self.as_2d
-            self.isdiagonal = False
-        if droptol is not None:
-            self.x[np.abs(self.x) < droptol] = 0.0
-        f = open(filename, "wb")
-        # print("counting nnz")
-        nnz = np.count_nonzero(self.x)  # number of non-zero entries
-        # write the header
-        header = np.array(
-            (self.shape[1], self.shape[0], nnz), dtype=self.binary_header_dt
+        Matrix.write_binary_blocks(
+            filename,
+            self.__row_blocks(row_block),
+            row_names=self.row_names,
+            col_names=self.col_names,
+            coo=True,
+            droptol=droptol,
+            chunk=chunk,
         )
-        header.tofile(f)
-        # get the indices of non-zero entries
-        # print("getting nnz idxs")
-        row_idxs, col_idxs = np.nonzero(self.x)
-
-        if chunk is None:
-            flat = self.x[row_idxs, col_idxs].flatten()
-            data = np.core.records.fromarrays(
-                [row_idxs, col_idxs, flat], dtype=self.coo_rec_dt
-            )
-            data.tofile(f)
-        else:
-
-            start, end = 0, min(chunk, row_idxs.shape[0])
-            while True:
-                # print(row_idxs[start],row_idxs[end])
-                # print("chunk",start,end)
-                flat = self.x[row_idxs[start:end], col_idxs[start:end]].flatten()
-                data = np.core.records.fromarrays(
-                    [row_idxs[start:end], col_idxs[start:end], flat],
-                    dtype=self.coo_rec_dt,
-                )
-                data.tofile(f)
-                if end == row_idxs.shape[0]:
-                    break
-                start = end
-                end = min(row_idxs.shape[0], start + chunk)
-
-        for name in self.col_names:
-            if len(name) > self.new_par_length:
-                warnings.warn(
-                    "par name '{0}' greater than {1} chars".format(
-                        name, self.new_par_length
-                    )
-                )
-                name = name[: self.new_par_length - 1]
-            elif len(name) < self.new_par_length:
-                for _ in range(len(name), self.new_par_length):
-                    name = name + " "
-            f.write(name.encode())
-        for name in self.row_names:
-            if len(name) > self.new_obs_length:
-                warnings.warn(
-                    "obs name '{0}' greater than {1} chars".format(
-                        name, self.new_obs_length
-                    )
-                )
-                name = name[: self.new_obs_length - 1]
-            elif len(name) < self.new_obs_length:
-                for _ in range(len(name), self.new_obs_length):
-                    name = name + " "
-            f.write(name.encode())
-        f.close()
 
-    def to_dense(self, filename, close=True):
+    def to_dense(self, filename, close=True, append=False):
         """experimental new dense matrix storage format to support faster I/O with ensembles
 
         Args:
             filename (`str`): the filename to save to
             close (`bool`): flag to close the filehandle after saving
+            append (`bool`): flag to append the rows to an existing dense file.
+                Default is `False`
 
         Returns:
             f (`file`): the file handle.  Only returned if `close` is False
@@ -1962,10 +2516,11 @@ class Matrix(object):
             col_names=self.col_names,
             data=self.x,
             close=close,
+            append=append,
         )
 
     @staticmethod
-    def write_dense(filename, row_names, col_names, data, close=False):
+    def write_dense(filename, row_names, col_names, data, close=False, append=False):
         """experimental new dense matrix storage format to support faster I/O with ensembles
 
         Args:
@@ -1974,40 +2529,99 @@ class Matrix(object):
             col_names ([`str`]): col names of the matrix
             data (`np.ndarray`): matrix elements
             close (`bool`): flag to close the file after writing
+            append (`bool`): flag to append the rows to an existing dense file
+                named `filename` rather than overwriting it.  The `col_names` must
+                match the col names in the existing file.  If `filename` does not
+                exist, it is created. Ignored if `filename` is an open file.
+                Default is `False`
 
         Returns:
             f (`file`): the file handle.  Only returned if `close` is False
 
+        Example::
+
+            # add the realizations of each iteration to the same file
+            for i, oe in enumerate(oes):
+                pyemu.Matrix.write_dense("obs.bin", oe.index.tolist(), oe.columns.tolist(),
+                                         oe.values, close=True, append=i > 0)
+
         """
 
         if isinstance(filename, str):
-            f = open(filename, "wb")
-            header = np.array(
-                (0, -len(col_names), -len(col_names)), dtype=Matrix.binary_header_dt
-            )
-            header.tofile(f)
-            slengths = np.array(
-                [len(col_name) for col_name in col_names], dtype=Matrix.integer
-            )
-            slengths.tofile(f)
-            for i, col_name in enumerate(col_names):
-                # slengths[[i]].tofile(f)
-                f.write(col_name.encode())
+            if append and os.path.exists(filename):
+                with open(filename, "rb") as f:
+                    _, file_col_names = Matrix._read_dense_header(f)
+                if file_col_names != [str(c).strip().lower() for c in col_names]:
+                    raise Exception(
+                        "Matrix.write_dense(): col_names do not match the col names "
+                        + "in '{0}', can't append".format(filename)
+                    )
+                f = open(filename, "ab")
+            else:
+                f = open(filename, "wb")
+                header = np.array(
+                    (0, -len(col_names), -len(col_names)),
+                    dtype=Matrix.binary_header_dt,
+                )
+                header.tofile(f)
+                col_names = [str(col_name).encode() for col_name in col_names]
+                slengths = np.array(
+                    [len(col_name) for col_name in col_names], dtype=Matrix.integer
+                )
+                slengths.tofile(f)
+                f.write(b"".join(col_names))
         else:
             f = filename
-        slengths = np.array(
-            [len(row_name) for row_name in row_names], dtype=Matrix.integer
-        )
-        for i in range(data.shape[0]):
-            slengths[[i]].tofile(f)
-            f.write(row_names[i].encode())
-            data[i, :].astype(Matrix.double).tofile(f)
+        Matrix._write_dense_rows(f, row_names, data)
         if close:
             f.close()
         else:
             return f
 
-    def to_binary(self, filename, droptol=None, chunk=None):
+    @staticmethod
+    def _write_dense_rows(f, row_names, data, max_block_size=1.0e7):
+        """private method to write row records to an open dense-format binary
+        file.  Runs of rows with the same name length are written as one
+        block of fixed-size records.
+
+        Args:
+            f (`file`): open file handle
+            row_names ([`str`]): row names
+            data (`np.ndarray`): values of the rows
+            max_block_size (`int`): the max number of values in a block
+
+        """
+        row_names = [str(row_name).encode() for row_name in row_names]
+        if len(row_names) != data.shape[0]:
+            raise Exception(
+                "Matrix.write_dense(): {0} row names for {1} rows".format(
+                    len(row_names), data.shape[0]
+                )
+            )
+        slengths = np.array([len(row_name) for row_name in row_names], dtype=int)
+        ncol = data.shape[1]
+        nblock = max(1, int(max_block_size / max(ncol, 1)))
+        # the start of each run of equal name lengths
+        starts = np.concatenate(
+            ([0], np.flatnonzero(np.diff(slengths) != 0) + 1, [len(row_names)])
+        )
+        for start, end in zip(starts[:-1], starts[1:]):
+            rec_dt = np.dtype(
+                [
+                    ("slen", Matrix.integer),
+                    ("name", "S{0}".format(slengths[start])),
+                    ("data", Matrix.double, (ncol,)),
+                ]
+            )
+            for bstart in range(start, end, nblock):
+                bend = min(end, bstart + nblock)
+                recs = np.empty(bend - bstart, dtype=rec_dt)
+                recs["slen"] = slengths[start]
+                recs["name"] = row_names[bstart:bend]
+                recs["data"] = data[bstart:bend]
+                recs.tofile(f)
+
+    def to_binary(self, filename, droptol=None, chunk=None, row_block=None):
         """write a PEST-compatible binary file.  The format is the same
         as the format used to storage a PEST Jacobian matrix
 
@@ -2018,91 +2632,363 @@ class Matrix(object):
             chunk (`int`): number of elements to write in a single pass.
                 Default is `None`, which writes the entire numeric part of the
                 `Matrix` at once. This is faster but requires more memory.
+            row_block (`int`): number of elements in each row block of the
+                `Matrix` that is processed at once.  Default is `None`, which
+                processes the whole `Matrix` at once
 
-        """
-        # print(self.x)
-        # print(type(self.x))
+        Note:
+            Calls `Matrix.write_binary_blocks()` with row blocks of `row_block` elements
 
-        if np.any(np.isnan(self.x)):
+        """
+        if self.issparse:
+            if np.any(np.isnan(self.x.data)):
+                raise Exception("Matrix.to_binary(): nans found")
+        elif np.any(np.isnan(self.x)):
             raise Exception("Matrix.to_binary(): nans found")
-        if self.isdiagonal:
-            # raise NotImplementedError()
-            self.__x = self.as_2d
-            self.isdiagonal = False
-        if droptol is not None:
-            self.x[np.abs(self.x) < droptol] = 0.0
-        f = open(filename, "wb")
-        nnz = np.count_nonzero(self.x)  # number of non-zero entries
-        # write the header
-        header = np.array(
-            (-self.shape[1], -self.shape[0], nnz), dtype=self.binary_header_dt
+        Matrix.write_binary_blocks(
+            filename,
+            self.__row_blocks(row_block),
+            row_names=self.row_names,
+            col_names=self.col_names,
+            coo=False,
+            droptol=droptol,
+            chunk=chunk,
         )
-        header.tofile(f)
-        # get the indices of non-zero entries
-        row_idxs, col_idxs = np.nonzero(self.x)
-        icount = row_idxs + 1 + col_idxs * self.shape[0]
-        # flatten the array
-        # flat = self.x[row_idxs, col_idxs].flatten()
-        # zip up the index position and value pairs
-        # data = np.array(list(zip(icount, flat)), dtype=self.binary_rec_dt)
-
-        if chunk is None:
-            flat = self.x[row_idxs, col_idxs].flatten()
-            data = np.core.records.fromarrays([icount, flat], dtype=self.binary_rec_dt)
-            # write
-            data.tofile(f)
-        else:
-            start, end = 0, min(chunk, row_idxs.shape[0])
-            while True:
-                # print(row_idxs[start],row_idxs[end])
-                flat = self.x[row_idxs[start:end], col_idxs[start:end]].flatten()
-                data = np.core.records.fromarrays(
-                    [icount[start:end], flat], dtype=self.binary_rec_dt
-                )
-                data.tofile(f)
-                if end == row_idxs.shape[0]:
-                    break
-                start = end
-                end = min(row_idxs.shape[0], start + chunk)
 
-        for name in self.col_names:
-            if len(name) > self.par_length:
-                warnings.warn(
-                    "par name '{0}' greater than {1} chars".format(
-                        name, self.par_length
+    @staticmethod
+    def write_binary_blocks(
+        filename,
+        blocks,
+        row_names=None,
+        col_names=None,
+        axis=0,
+        coo=True,
+        droptol=None,
+        chunk=None,
+    ):
+        """write a PEST-compatible binary file from a sequence of row (or column)
+        blocks without holding the entire matrix in memory
+
+        Args:
+            filename (`str`): filename to save binary file
+            blocks (iterable): an iterable (for example a generator) of blocks.
+                Each block can be a `Matrix`, a `pandas.DataFrame`, a 2-D
+                `numpy.ndarray` or a `scipy.sparse` matrix.  Names along the
+                streamed axis are taken from `Matrix` and `DataFrame` blocks if they
+                are not passed.
+            row_names ([`str`]): row names.  Required if `axis` is 1 and the blocks
+                are not named.  Also required for row blocks in the standard PEST
+                format (`coo` is False) since the record index depends on the
+                number of rows.
+            col_names ([`str`]): col names.  Required if `axis` is 0 and the blocks
+                are not named.
+            axis (`int`): the axis the blocks are stacked along.  0 for row blocks
+                (for example realizations), 1 for column blocks (for example
+                jacobian columns).  Default is 0
+            coo (`bool`): flag to write the extended [int,int,float] format
+                (same as `Matrix.to_coo()`).  If False, the standard PEST format
+                (same as `Matrix.to_binary()`) is written.  Default is True
+            droptol (`float`): absolute value tolerance to make values
+                smaller than `droptol` zero.  Default is None (no dropping)
+            chunk (`int`): number of records to write in a single pass.  Default
+                is `None`, which writes the records of each block at once
+
+        Returns:
+            `int`: the number of non-zero entries written
+
+        Note:
+            The header is written with a placeholder count that is patched once
+            all the blocks have been written.  Blocks with named fixed-axis entries
+            are aligned to `col_names` (`axis` = 0) or `row_names` (`axis` = 1).
+
+        Example::
+
+            def blocks(pe, nreal=100):
+                for i in range(0, pe.shape[0], nreal):
+                    yield pe._df.iloc[i:i + nreal, :]
+
+            nnz = pyemu.Matrix.write_binary_blocks("pe.jcb", blocks(pe))
+
+        """
+        if axis not in [0, 1]:
+            raise Exception("Matrix.write_binary_blocks(): axis must be 0 or 1")
+        if axis == 0:
+            fixed_names, stream_names = col_names, row_names
+        else:
+            fixed_names, stream_names = row_names, col_names
+        if not coo and axis == 0 and row_names is None:
+            raise Exception(
+                "Matrix.write_binary_blocks(): row_names required to "
+                + "write row blocks in PEST format"
+            )
+        if fixed_names is not None:
+            fixed_names = list(fixed_names)
+        block_names = []
+        nnz, offset = 0, 0
+        rec_dt = Matrix.coo_rec_dt if coo else Matrix.binary_rec_dt
+        f = open(filename, "wb")
+        np.zeros(1, dtype=Matrix.binary_header_dt).tofile(f)
+        for block in blocks:
+            if isinstance(block, Matrix):
+                names = (block.row_names, block.col_names)
+                x = block.as_2d if block.isdiagonal else block.x
+            elif isinstance(block, pd.DataFrame):
+                names = (block.index.tolist(), block.columns.tolist())
+                x = block.values
+            else:
+                names = None
+                x = block
+            if not _issparse(x):
+                x = np.asarray(x, dtype=Matrix.double)
+                if x.ndim == 1:
+                    x = x.reshape((1, -1)) if axis == 0 else x.reshape((-1, 1))
+            if names is None:
+                if stream_names is None or fixed_names is None:
+                    f.close()
+                    raise Exception(
+                        "Matrix.write_binary_blocks(): row_names and col_names "
+                        + "required for unnamed blocks"
                     )
+            else:
+                bfixed = list(names[1 - axis])
+                if fixed_names is None:
+                    fixed_names = bfixed
+                elif bfixed != fixed_names:
+                    bidx = {n: i for i, n in enumerate(bfixed)}
+                    missing = [n for n in fixed_names if n not in bidx]
+                    if len(missing) > 0:
+                        f.close()
+                        raise Exception(
+                            "Matrix.write_binary_blocks(): block missing names: "
+                            + ",".join(missing)
+                        )
+                    idx = np.array([bidx[n] for n in fixed_names], dtype=int)
+                    x = x[:, idx] if axis == 0 else x[idx, :]
+                if stream_names is None:
+                    block_names.extend(names[axis])
+            if x.shape[1 - axis] != len(fixed_names):
+                f.close()
+                raise Exception(
+                    "Matrix.write_binary_blocks(): block shape {0} ".format(x.shape)
+                    + "incompatible with {0} names".format(len(fixed_names))
                 )
-                name = name[: self.par_length - 1]
-            elif len(name) < self.par_length:
-                for i in range(len(name), self.par_length):
-                    name = name + " "
-            f.write(name.encode())
-        for name in self.row_names:
-            if len(name) > self.obs_length:
-                warnings.warn(
-                    "obs name '{0}' greater than {1} chars".format(
-                        name, self.obs_length
+            if _issparse(x):
+                x = x.tocoo()
+                vals = x.data
+                keep = vals != 0.0
+                if droptol is not None:
+                    keep &= np.abs(vals) >= droptol
+                rows, cols, vals = x.row[keep], x.col[keep], vals[keep]
+            else:
+                keep = x != 0.0
+                if droptol is not None:
+                    keep &= ~(np.abs(x) < droptol)
+                rows, cols = np.nonzero(keep)
+                vals = x[rows, cols]
+            if not coo and np.any(np.isnan(vals)):
+                f.close()
+                raise Exception("Matrix.write_binary_blocks(): nans found")
+            if axis == 0:
+                rows = rows.astype(np.int64) + offset
+            else:
+                cols = cols.astype(np.int64) + offset
+            offset += x.shape[axis]
+            if coo:
+                arrs = [rows, cols, vals]
+            else:
+                nrow = len(row_names) if axis == 0 else len(fixed_names)
+                if axis == 0 and offset > nrow:
+                    f.close()
+                    raise Exception(
+                        "Matrix.write_binary_blocks(): more rows than row_names"
                     )
+                arrs = [rows + 1 + cols * nrow, vals]
+            step = vals.shape[0] if chunk is None else max(1, int(chunk))
+            for start in range(0, vals.shape[0], step):
+                np.core.records.fromarrays(
+                    [arr[start : start + step] for arr in arrs], dtype=rec_dt
+                ).tofile(f)
+            nnz += vals.shape[0]
+
+        if fixed_names is None:
+            f.close()
+            raise Exception("Matrix.write_binary_blocks(): no names found")
+        if stream_names is None:
+            stream_names = block_names
+        if len(stream_names) != offset:
+            f.close()
+            raise Exception(
+                "Matrix.write_binary_blocks(): number of names along axis "
+                + "{0} ({1}) != number written ({2})".format(
+                    axis, len(stream_names), offset
                 )
-                name = name[: self.obs_length - 1]
-            elif len(name) < self.obs_length:
-                for i in range(len(name), self.obs_length):
-                    name = name + " "
-            f.write(name.encode())
-
+            )
+        if axis == 0:
+            row_names, col_names = stream_names, fixed_names
+        else:
+            row_names, col_names = fixed_names, stream_names
+        if coo:
+            header = (len(col_names), len(row_names), nnz)
+            par_length, obs_length = Matrix.new_par_length, Matrix.new_obs_length
+        else:
+            header = (-len(col_names), -len(row_names), nnz)
+            par_length, obs_length = Matrix.par_length, Matrix.obs_length
+        Matrix._write_binary_names(f, col_names, par_length, "par")
+        Matrix._write_binary_names(f, row_names, obs_length, "obs")
+        f.seek(0)
+        np.array(header, dtype=Matrix.binary_header_dt).tofile(f)
         f.close()
+        return nnz
+
+    @staticmethod
+    def _write_binary_names(f, names, length, kind):
+        """private method to write a block of fixed-width names to
+        an open binary file in one pass
+
+        Args:
+            f (`file`): open file handle
+            names ([`str`]): names to write
+            length (`int`): the fixed width of each name
+            kind (`str`): "par" or "obs" - only used in warnings
+
+        """
+        names = np.array(names, dtype=str)
+        if names.shape[0] == 0:
+            return
+        long = np.char.str_len(names) > length
+        if np.any(long):
+            warnings.warn(
+                "{0} {1} names greater than {2} chars, first: '{3}'".format(
+                    long.sum(), kind, length, names[long][0]
+                ),
+                PyemuWarning,
+            )
+            names = np.where(long, names.astype("U{0}".format(length - 1)), names)
+        np.char.ljust(names, length).astype("S{0}".format(length)).tofile(f)
+
+    @staticmethod
+    def _read_dense_header(f):
+        """private method to read the header and col names of a dense-format
+        binary file
+
+        Args:
+            f (`file`): file handle open at the start of the file
+
+        Returns:
+            tuple containing
+
+            - **int**: the number of columns
+            - **[`str`]**: list of col_names
+
+        """
+        header = np.fromfile(f, Matrix.binary_header_dt, 1)
+        if header.shape[0] != 1:
+            raise Exception("Matrix.read_dense(): incomplete header")
+        itemp1, itemp2, icount = header[0]
+        if itemp1 != 0:
+            raise Exception("Matrix.read_dense() itemp1 != 0")
+        if itemp2 != icount:
+            raise Exception("Matrix.read_dense() itemp2 != icount")
+        ncol = int(np.abs(itemp2))
+        col_slens = np.fromfile(f, Matrix.integer, ncol)
+        if col_slens.shape[0] != ncol:
+            raise Exception("Matrix.read_dense(): incomplete col name lengths")
+        names = f.read(int(col_slens.sum()))
+        if len(names) != col_slens.sum():
+            raise Exception("Matrix.read_dense(): incomplete col names")
+        ends = np.cumsum(col_slens)
+        col_names = [
+            names[end - slen : end].strip().lower().decode()
+            for slen, end in zip(col_slens, ends)
+        ]
+        return ncol, col_names
 
     @staticmethod
-    def read_dense(filename, forgive=False, close=True):
+    def read_dense_index(filename, forgive=False):
+        """build an index of the row records in a dense-format binary file.
+        Only the header, col names and row names are read; the index
+        can be passed to `Matrix.read_dense()` to read any subset of rows
+        without scanning the file again.
+
+        Args:
+            filename (`str`): the dense-format binary file
+            forgive (`bool`): flag to forgive an incomplete final record.  If True,
+                the incomplete record is left out of the index.  If False,
+                an exception is raised.  Default is False
+
+        Returns:
+            tuple containing
+
+            - **['str']**: list of row names
+            - **[`str`]**: list of col_names
+            - **numpy.ndarray**: the byte offset of the values of each row
+
+        Example::
+
+            row_names, col_names, offsets = pyemu.Matrix.read_dense_index("obs.bin")
+            # read the last 10 realizations appended to the file
+            index = (row_names, col_names, offsets)
+            x, rnames, cnames = pyemu.Matrix.read_dense("obs.bin", index=index,
+                                    rows=np.arange(len(row_names) - 10, len(row_names)))
+
+        """
+        if not os.path.exists(filename):
+            raise Exception(
+                "Matrix.read_dense_index(): filename '{0}' not found".format(filename)
+            )
+        with open(filename, "rb") as f:
+            ncol, col_names = Matrix._read_dense_header(f)
+            pos = f.tell()
+        size = os.path.getsize(filename)
+        row_names, offsets = [], []
+        if size > pos:
+            buf = np.memmap(filename, dtype=np.uint8, mode="r")
+        isize, dsize = Matrix.integer(0).itemsize, ncol * Matrix.double(0).itemsize
+        while pos < size:
+            # the records are located in runs of equal name length: all the records
+            # in a run have the same size, so the run is found with one strided read
+            slen = -1
+            if size - pos >= isize:
+                slen = int(np.ndarray((1,), Matrix.integer, buf, pos)[0])
+            recsize = isize + slen + dsize
+            nrec = 0 if slen < 1 else (size - pos) // recsize
+            if nrec == 0:
+                message = "incomplete record at byte {0}".format(pos)
+                if forgive:
+                    print("error reading row {0}: {1}".format(len(row_names), message))
+                    break
+                raise Exception(
+                    "error reading row {0}: {1}".format(len(row_names), message)
+                )
+            slens = np.ndarray((nrec,), Matrix.integer, buf, pos, (recsize,))
+            nrun = np.argmin(slens == slen) if np.any(slens != slen) else nrec
+            names = np.ndarray(
+                (nrun,), "S{0}".format(slen), buf, pos + isize, (recsize,)
+            )
+            row_names.extend(np.char.lower(np.char.strip(np.char.decode(names))))
+            offsets.append(pos + isize + slen + np.arange(nrun, dtype=np.int64) * recsize)
+            pos += nrun * recsize
+        if len(offsets) > 0:
+            offsets = np.concatenate(offsets)
+        else:
+            offsets = np.zeros(0, dtype=np.int64)
+        return [str(n) for n in row_names], col_names, offsets
+
+    @staticmethod
+    def read_dense(filename, forgive=False, close=True, rows=None, index=None):
         """read a dense-format binary file.
 
         Args:
-            filename (`str`): the filename or the open filehandle
+            filename (`str`): the filename
             forgive (`bool`): flag to forgive incomplete records.  If True and
                 an incomplete record is encountered, only the previously read
                 records are returned.  If False, an exception is raised for an
                 incomplete record
-            close (`bool`): flag to close the filehandle.  Default is True
+            close (`bool`): not used - retained for compatibility
+            rows ([`int`]): the zero-based positions of the rows (records) to read.
+                If `None`, all rows are read.  Default is `None`
+            index (`tuple`): the index of the file from `Matrix.read_dense_index()`.  If
+                `None`, the index is built. Default is `None`
 
         Returns:
             tuple containing
@@ -2111,73 +2997,268 @@ class Matrix(object):
             - **['str']**: list of row names
             - **[`str`]**: list of col_names
 
+        Note:
+            runs of records with the same row name length are read as one block
+
+        """
+        if index is None:
+            index = Matrix.read_dense_index(filename, forgive=forgive)
+        row_names, col_names, offsets = index
+        if rows is not None:
+            rows = np.atleast_1d(np.asarray(rows, dtype=int))
+            if rows.shape[0] > 0 and (rows.min() < -len(row_names) or rows.max() >= len(row_names)):
+                raise Exception(
+                    "Matrix.read_dense(): rows out of range for {0} records".format(
+                        len(row_names)
+                    )
+                )
+            offsets = offsets[rows]
+            row_names = [row_names[i] for i in rows]
+        ncol = len(col_names)
+        data = np.empty((offsets.shape[0], ncol), dtype=Matrix.double)
+        if data.size == 0:
+            return data, row_names, col_names
+        buf = np.memmap(filename, dtype=np.uint8, mode="r")
+        # read each run of equally-spaced records as one strided block
+        strides = np.diff(offsets)
+        changes = np.flatnonzero(strides[1:] != strides[:-1]) + 1
+        start = 0
+        while start < offsets.shape[0]:
+            end = start + 1
+            if start < strides.shape[0] and strides[start] > 0:
+                end = np.searchsorted(changes, start, side="right")
+                end = changes[end] + 1 if end < changes.shape[0] else offsets.shape[0]
+                stride = strides[start]
+            else:
+                stride = Matrix.double(0).itemsize * ncol
+            data[start:end] = np.ndarray(
+                (end - start, ncol),
+                Matrix.double,
+                buf,
+                offsets[start],
+                (stride, Matrix.double(0).itemsize),
+            )
+            start = end
+        return data, row_names, col_names
+
+    @staticmethod
+    def write_columnar(filename, row_names, col_names, data, dtype=None):
+        """write a columnar binary file.  The file holds a fixed-size header, the
+        row and column names as fixed-width tables and the values stored column-major
+        (all rows of column 1, then all rows of column 2, ...) so that one or more
+        columns can be read (or memory-mapped) without reading the rest of the file.
+
+        Args:
+            filename (`str`): the file to write to
+            row_names ([`str`]): row names of the matrix.  If all row names are
+                integers, they are restored as integers by `Matrix.read_columnar()`
+            col_names ([`str`]): col names of the matrix
+            data (`np.ndarray`): matrix elements
+            dtype (`np.dtype`): the floating point type to store the values as.  Must
+                be `np.float64` or `np.float32`.  Default is `None` (`np.float64`)
+
+        Example::
+
+            pyemu.Matrix.write_columnar("obs.col", oe.index.tolist(),
+                                        oe.columns.tolist(), oe.values)
+
+        """
+        if dtype is None:
+            dtype = Matrix.double
+        dtype = np.dtype(dtype)
+        if dtype not in [np.dtype(np.float64), np.dtype(np.float32)]:
+            raise Exception(
+                "Matrix.write_columnar(): dtype must be float64 or float32, "
+                + "not {0}".format(dtype)
+            )
+        row_names = list(row_names)
+        col_names = list(col_names)
+        if data.shape != (len(row_names), len(col_names)):
+            raise Exception(
+                "Matrix.write_columnar(): data shape {0} does not match ".format(
+                    data.shape
+                )
+                + "names shape {0}".format((len(row_names), len(col_names)))
+            )
+        int_rows = len(row_names) > 0 and all(
+            isinstance(n, (int, np.integer)) for n in row_names
+        )
+        row_names = np.array([str(n).encode() for n in row_names], dtype=bytes)
+        col_names = np.array([str(n).encode() for n in col_names], dtype=bytes)
+        row_length = max(row_names.dtype.itemsize, 1)
+        col_length = max(col_names.dtype.itemsize, 1)
+        header = np.array(
+            (
+                1,
+                data.shape[0],
+                data.shape[1],
+                dtype.itemsize,
+                row_length,
+                col_length,
+                int(int_rows),
+                0,
+            ),
+            dtype=Matrix.columnar_header_dt,
+        )
+        with open(filename, "wb") as f:
+            f.write(Matrix.columnar_magic)
+            header.tofile(f)
+            row_names.astype("S{0}".format(row_length)).tofile(f)
+            col_names.astype("S{0}".format(col_length)).tofile(f)
+            # pad so the values start on an 8-byte boundary
+            f.write(b"\0" * (-f.tell() % 8))
+            # write blocks of columns so that only one block is transposed at a time
+            nblock = max(1, int(1.0e7 / max(data.shape[0], 1)))
+            for start in range(0, data.shape[1], nblock):
+                np.ascontiguousarray(
+                    data[:, start : start + nblock].T, dtype=dtype
+                ).tofile(f)
+
+    @staticmethod
+    def read_columnar_header(filename):
+        """read the header and name tables of a columnar binary file written
+        by `Matrix.write_columnar()`
+
+        Args:
+            filename (`str`): the columnar file
+
+        Returns:
+            tuple containing
+
+            - **dict**: the header entries, including the byte "offset" of the values
+            - **[`str`]**: list of row names (`int` if the names were written as integers)
+            - **[`str`]**: list of col names
 
         """
         if not os.path.exists(filename):
             raise Exception(
-                "Matrix.read_dense(): filename '{0}' not found".format(filename)
+                "Matrix.read_columnar_header(): filename '{0}' not found".format(
+                    filename
+                )
             )
-        if isinstance(filename, str):
-            f = open(filename, "rb")
-        else:
-            f = filename
-        # the header datatype
-        itemp1, itemp2, icount = np.fromfile(f, Matrix.binary_header_dt, 1)[0]
-        # print(itemp1,itemp2,icount)
-        if itemp1 != 0:
-            raise Exception("Matrix.read_dense() itemp1 != 0")
-        if itemp2 != icount:
-            raise Exception("Matrix.read_dense() itemp2 != icount")
-        ncol = np.abs(itemp2)
-        col_names = []
-        row_names = []
-        data_rows = []
-        col_slens = np.fromfile(f, Matrix.integer, ncol)
-        i = 0
-        # for j in range(ncol):
-        for slen in col_slens:
-            # slen = np.fromfile(f, Matrix.integer,1)[0]
-            name = (
-                struct.unpack(str(slen) + "s", f.read(slen))[0].strip().lower().decode()
+        with open(filename, "rb") as f:
+            magic = f.read(len(Matrix.columnar_magic))
+            if magic != Matrix.columnar_magic:
+                raise Exception(
+                    "Matrix.read_columnar_header(): '{0}' is not a ".format(filename)
+                    + "columnar binary file"
+                )
+            header = np.fromfile(f, Matrix.columnar_header_dt, 1)
+            if header.shape[0] != 1:
+                raise Exception(
+                    "Matrix.read_columnar_header(): incomplete header in '{0}'".format(
+                        filename
+                    )
+                )
+            header = {n: int(header[n][0]) for n in Matrix.columnar_header_dt.names}
+            if header["version"] != 1:
+                raise Exception(
+                    "Matrix.read_columnar_header(): unsupported version {0}".format(
+                        header["version"]
+                    )
+                )
+            row_names = np.fromfile(
+                f, "S{0}".format(header["row_length"]), header["nrow"]
             )
-            col_names.append(name)
-        while True:
-            try:
-                slen = np.fromfile(f, Matrix.integer, 1)[0]
-            except Exception as e:
-                break
-            try:
-                name = (
-                    struct.unpack(str(slen) + "s", f.read(slen))[0]
-                    .strip()
-                    .lower()
-                    .decode()
+            col_names = np.fromfile(
+                f, "S{0}".format(header["col_length"]), header["ncol"]
+            )
+            if (
+                row_names.shape[0] != header["nrow"]
+                or col_names.shape[0] != header["ncol"]
+            ):
+                raise Exception(
+                    "Matrix.read_columnar_header(): incomplete name tables in "
+                    + "'{0}'".format(filename)
                 )
+            offset = f.tell()
+        header["offset"] = offset + (-offset % 8)
+        if header["int_rows"]:
+            row_names = row_names.astype(np.int64).tolist()
+        else:
+            row_names = np.char.decode(row_names).tolist()
+        col_names = np.char.decode(col_names).tolist()
+        return header, row_names, col_names
 
-                data_row = np.fromfile(f, Matrix.double, ncol)
-                if data_row.shape[0] != ncol:
-                    raise Exception(
-                        "incomplete data in row {0}: {1} vs {2}".format(
-                            i, data_row.shape[0], ncol
-                        )
+    @staticmethod
+    def read_columnar(filename, row_names=None, col_names=None, mmap=False):
+        """read a columnar binary file written by `Matrix.write_columnar()`.  Only
+        the requested columns are read from the file.
+
+        Args:
+            filename (`str`): the columnar file
+            row_names ([`str`]): the row names to read.  If `None`, all rows are read.
+                Default is `None`
+            col_names ([`str`]): the col names to read.  If `None`, all columns
+                are read. Default is `None`
+            mmap (`bool`): flag to return a (copy-on-write) memory-mapped array
+                rather than reading the values into memory.  Only possible if
+                `row_names` is `None` and `col_names` is `None` or a contiguous
+                run of columns in the file - otherwise the requested values are
+                read into memory. Default is `False`
+
+        Returns:
+            tuple containing
+
+            - **numpy.ndarray**: the numeric values, with shape (nrow, ncol)
+            - **['str']**: list of row names
+            - **[`str`]**: list of col_names
+
+        Example::
+
+            # read two observations for all realizations
+            x, reals, names = pyemu.Matrix.read_columnar("obs.col",
+                                                         col_names=["h1","h2"])
+
+        """
+        header, all_row_names, all_col_names = Matrix.read_columnar_header(filename)
+        dtype = np.float64 if header["itemsize"] == 8 else np.float32
+        shape = (header["ncol"], header["nrow"])
+        if shape[0] * shape[1] == 0:
+            data = np.zeros(shape, dtype=dtype)
+        else:
+            data = np.memmap(
+                filename, dtype=dtype, mode="c", offset=header["offset"], shape=shape
+            )
+
+        def _get_idxs(names, all_names, kind):
+            idx_map = {n: i for i, n in enumerate(all_names)}
+            missing = [n for n in names if n not in idx_map]
+            if len(missing) > 0:
+                raise Exception(
+                    "Matrix.read_columnar(): the following {0} names are not in ".format(
+                        kind
                     )
-            except Exception as e:
-                if forgive:
-                    print("error reading row {0}: {1}".format(i, str(e)))
-                    break
-                else:
-                    raise Exception("error reading row {0}: {1}".format(i, str(e)))
-            row_names.append(name)
-            data_rows.append(data_row)
-            i += 1
+                    + "'{0}': {1}".format(filename, ",".join([str(m) for m in missing]))
+                )
+            return np.array([idx_map[n] for n in names], dtype=int)
 
-        data_rows = np.array(data_rows)
-        if close:
-            f.close()
-        return data_rows, row_names, col_names
+        if col_names is None:
+            col_names = all_col_names
+        else:
+            col_names = list(col_names)
+            cidxs = _get_idxs(col_names, all_col_names, "col")
+            if (
+                cidxs.shape[0] > 0
+                and mmap
+                and row_names is None
+                and np.all(np.diff(cidxs) == 1)
+            ):
+                data = data[cidxs[0] : cidxs[-1] + 1]
+            else:
+                # fancy indexing only touches the pages of the requested columns
+                data = data[cidxs]
+        if row_names is None:
+            row_names = all_row_names
+        else:
+            row_names = list(row_names)
+            data = data[:, _get_idxs(row_names, all_row_names, "row")]
+        if not mmap and isinstance(data, np.memmap):
+            data = np.array(data)
+        return data.T, row_names, col_names
 
     @classmethod
-    def from_binary(cls, filename, forgive=False):
+    def from_binary(cls, filename, forgive=False, mmap=False, sparse=False):
         """class method load from PEST-compatible binary file into a
         Matrix instance
 
@@ -2185,6 +3266,15 @@ class Matrix(object):
             filename (`str`): filename to read
             forgive (`bool`): flag to forgive incomplete data records. Only
                 applicable to dense binary format.  Default is `False`
+            mmap (`bool`): flag to memory-map the records in the file rather than
+                loading them.  If True, only the row and column names are read and
+                numeric values are materialized as needed: `Matrix.get()` and
+                `Matrix.extract()` only form the requested sub-matrix, while accessing
+                `Matrix.x` forms the full matrix.  Not supported for the dense
+                binary format.  Default is `False`
+            sparse (`bool`): flag to store the values as a `scipy.sparse` matrix
+                without forming the dense matrix.  Ignored if `mmap` is True.
+                Default is `False`
 
         Returns:
             `Matrix`: `Matrix` loaded from binary file
@@ -2194,9 +3284,33 @@ class Matrix(object):
             mat = pyemu.Matrix.from_binary("my.jco")
             cov = pyemu.Cov.from_binary("large_cov.jcb")
 
+            # only load the forecast rows of a large jacobian
+            jco = pyemu.Jco.from_binary("big.jcb", mmap=True)
+            fore_jco = jco.get(row_names=pst.forecast_names)
+
         """
-        x, row_names, col_names = Matrix.read_binary(filename, forgive=forgive)
-        if np.any(np.isnan(x)):
+        if mmap:
+            itemp1, itemp2, icount = Matrix.read_binary_header(filename)
+            if (itemp1 == 0 and itemp2 == icount) or (
+                itemp1 > 0 and itemp2 < 0 and icount < 0
+            ):
+                warnings.warn(
+                    "Matrix.from_binary(): mmap not supported for this "
+                    + "binary format, reading entire file",
+                    PyemuWarning,
+                )
+            else:
+                lazy, row_names, col_names = Matrix._map_binary(filename)
+                mat = cls(row_names=row_names, col_names=col_names)
+                mat.__lazy = lazy
+                return mat
+        x, row_names, col_names = Matrix.read_binary(
+            filename, forgive=forgive, sparse=sparse
+        )
+        if sparse:
+            if np.any(np.isnan(x.data)):
+                warnings.warn("Matrix.from_binary(): nans in matrix", PyemuWarning)
+        elif np.any(np.isnan(x)):
             warnings.warn("Matrix.from_binary(): nans in matrix", PyemuWarning)
         return cls(x=x, row_names=row_names, col_names=col_names)
 
@@ -2226,13 +3340,90 @@ class Matrix(object):
         return itemp1, itemp2, icount
 
     @staticmethod
-    def read_binary(filename, forgive=False):
+    def __to_csr(arg, nrow=None, ncol=None):
+        """private method to form a `scipy.sparse` csr matrix from either
+        a dense array or a (data,(i,j)) tuple"""
+        try:
+            import scipy.sparse as sparse
+        except Exception as e:
+            raise Exception("Matrix.read_binary(): sparse requires scipy: " + str(e))
+        if nrow is None:
+            return sparse.csr_matrix(arg)
+        return sparse.csr_matrix(arg, shape=(nrow, ncol))
+
+    @staticmethod
+    def _read_binary_names(f, count, length):
+        """private method to read a block of fixed-width names from
+        an open binary file in one pass
+
+        Args:
+            f (`file`): open file handle positioned at the start of the names
+            count (`int`): number of names to read
+            length (`int`): the fixed width of each name
+
+        Returns:
+            [`str`]: list of (stripped, lower case) names
+
+        """
+        raw = np.fromfile(f, dtype="S{0}".format(length), count=count)
+        return [name.strip().lower().decode() for name in raw]
+
+    @staticmethod
+    def _map_binary(filename):
+        """private method to memory-map the records of a PEST-format
+        binary file and read the row and column names
+
+        Args:
+            filename (`str`): filename to map
+
+        Returns:
+            tuple containing
+
+            - **_BinaryMatrixMap**: the memory-mapped records
+            - **['str']**: list of row names
+            - **[`str`]**: list of col_names
+
+        """
+        if not os.path.exists(filename):
+            raise Exception(
+                "Matrix.from_binary(): filename '{0}' not found".format(filename)
+            )
+        itemp1, itemp2, icount = Matrix.read_binary_header(filename)
+        ncol, nrow = abs(int(itemp1)), abs(int(itemp2))
+        coo = itemp1 >= 0
+        lazy = _BinaryMatrixMap(filename, nrow, ncol, icount, coo=coo)
+        if coo:
+            par_length, obs_length = Matrix.new_par_length, Matrix.new_obs_length
+        else:
+            par_length, obs_length = Matrix.par_length, Matrix.obs_length
+        with open(filename, "rb") as f:
+            f.seek(Matrix.binary_header_dt.itemsize + lazy.records.nbytes)
+            col_names = Matrix._read_binary_names(f, ncol, par_length)
+            row_names = Matrix._read_binary_names(f, nrow, obs_length)
+        if len(row_names) != nrow:
+            raise Exception(
+                "Matrix.from_binary() len(row_names) ({0}) != nrow ({1})".format(
+                    len(row_names), nrow
+                )
+            )
+        if len(col_names) != ncol:
+            raise Exception(
+                "Matrix.from_binary() len(col_names) ({0}) != ncol ({1})".format(
+                    len(col_names), ncol
+                )
+            )
+        return lazy, row_names, col_names
+
+    @staticmethod
+    def read_binary(filename, forgive=False, sparse=False):
         """static method to read PEST-format binary files
 
         Args:
             filename (`str`): filename to read
             forgive (`bool`): flag to forgive incomplete data records. Only
                 applicable to dense binary format.  Default is `False`
+            sparse (`bool`): flag to return the numeric values as a
+                `scipy.sparse` csr matrix.  Default is `False`
 
 
         Returns:
@@ -2257,10 +3448,16 @@ class Matrix(object):
                 + " Matrix.from_fortranfile()"
             )
             f.close()
-            return Matrix.from_fortranfile(filename)
+            x, row_names, col_names = Matrix.from_fortranfile(filename)
+            if sparse:
+                x = Matrix.__to_csr(x)
+            return x, row_names, col_names
         if itemp1 == 0 and itemp2 == icount:
             f.close()
-            return Matrix.read_dense(filename, forgive=forgive)
+            x, row_names, col_names = Matrix.read_dense(filename, forgive=forgive)
+            if sparse:
+                x = Matrix.__to_csr(x)
+            return x, row_names, col_names
 
         ncol, nrow = abs(itemp1), abs(itemp2)
         if itemp1 >= 0:
@@ -2274,32 +3471,15 @@ class Matrix(object):
                 raise Exception("Matrix.from_binary(): 'i' index values less than 0")
             if data["j"].min() < 0:
                 raise Exception("Matrix.from_binary(): 'j' index values less than 0")
-            x = np.zeros((nrow, ncol))
-            x[data["i"], data["j"]] = data["dtemp"]
-            data = x
+            if sparse:
+                data = Matrix.__to_csr((data["dtemp"], (data["i"], data["j"])), nrow, ncol)
+            else:
+                x = np.zeros((nrow, ncol))
+                x[data["i"], data["j"]] = data["dtemp"]
+                data = x
             # read obs and parameter names
-            col_names = []
-            row_names = []
-            for j in range(ncol):
-                name = (
-                    struct.unpack(
-                        str(Matrix.new_par_length) + "s", f.read(Matrix.new_par_length)
-                    )[0]
-                    .strip()
-                    .lower()
-                    .decode()
-                )
-                col_names.append(name)
-            for i in range(nrow):
-                name = (
-                    struct.unpack(
-                        str(Matrix.new_obs_length) + "s", f.read(Matrix.new_obs_length)
-                    )[0]
-                    .strip()
-                    .lower()
-                    .decode()
-                )
-                row_names.append(name)
+            col_names = Matrix._read_binary_names(f, ncol, Matrix.new_par_length)
+            row_names = Matrix._read_binary_names(f, nrow, Matrix.new_obs_length)
             f.close()
         else:
 
@@ -2308,33 +3488,17 @@ class Matrix(object):
             data = np.fromfile(f, Matrix.binary_rec_dt, icount)
             icols = ((data["j"] - 1) // nrow) + 1
             irows = data["j"] - ((icols - 1) * nrow)
-            x = np.zeros((nrow, ncol))
-            x[irows - 1, icols - 1] = data["dtemp"]
-            data = x
-            # read obs and parameter names
-            col_names = []
-            row_names = []
-            for j in range(ncol):
-                name = (
-                    struct.unpack(
-                        str(Matrix.par_length) + "s", f.read(Matrix.par_length)
-                    )[0]
-                    .strip()
-                    .lower()
-                    .decode()
-                )
-                col_names.append(name)
-            for i in range(nrow):
-
-                name = (
-                    struct.unpack(
-                        str(Matrix.obs_length) + "s", f.read(Matrix.obs_length)
-                    )[0]
-                    .strip()
-                    .lower()
-                    .decode()
+            if sparse:
+                data = Matrix.__to_csr(
+                    (data["dtemp"], (irows - 1, icols - 1)), nrow, ncol
                 )
-                row_names.append(name)
+            else:
+                x = np.zeros((nrow, ncol))
+                x[irows - 1, icols - 1] = data["dtemp"]
+                data = x
+            # read obs and parameter names
+            col_names = Matrix._read_binary_names(f, ncol, Matrix.par_length)
+            row_names = Matrix._read_binary_names(f, nrow, Matrix.obs_length)
             f.close()
         if len(row_names) != data.shape[0]:
             raise Exception(
@@ -2450,10 +3614,10 @@ class Matrix(object):
         f_out.write(" {0:7.0f} {1:7.0f} {2:7.0f}\n".format(nrow, ncol, icode))
         f_out.close()
         f_out = open(filename, "ab")
-        if self.isdiagonal and icode != -1:
-            x = np.diag(self.__x[:, 0])
+        if (self.isdiagonal and icode != -1) or self.issparse:
+            x = self.as_2d
         else:
-            x = self.__x
+            x = self.x
         np.savetxt(f_out, x, fmt="%15.7E", delimiter="")
         f_out.close()
         f_out = open(filename, "a")
@@ -2611,7 +3775,7 @@ class Matrix(object):
          `pandas.DataFrame`
 
         Args:
-            df (`pandas.DataFrame`): dataframe
+            df (`pandas.DataFrame`): dataframe.  Can also be a `pyemu.Ensemble`
 
         Returns:
             `Matrix`: `Matrix` instance derived from `df`.
@@ -2622,8 +3786,10 @@ class Matrix(object):
             mat = pyemu.Matrix.from_dataframe(df)
 
         """
-        if not isinstance(df, pd.DataFrame):
+        if not _isdataframe(df):
             raise Exception("df is not a DataFrame")
+        if not isinstance(df, pd.DataFrame):
+            df = df._df
         row_names = copy.deepcopy(list(df.index))
         col_names = copy.deepcopy(list(df.columns))
         return cls(x=df.values, row_names=row_names, col_names=col_names)
@@ -2680,14 +3846,14 @@ class Matrix(object):
             `pandas.DataFrame`: a dataframe derived from `Matrix`
 
         Note:
-            if `self.isdiagonal` is True, the full matrix is used to fill
+            if `self.isdiagonal` or `self.issparse` is True, the full matrix is used to fill
             the dataframe - lots of zeros.
 
         """
-        if self.isdiagonal:
-            x = np.diag(self.__x[:, 0])
+        if self.isdiagonal or self.issparse:
+            x = self.as_2d
         else:
-            x = self.__x
+            x = self.x
         return pd.DataFrame(data=x, index=self.row_names, columns=self.col_names)
 
     def extend(self, other):
@@ -2723,15 +3889,23 @@ class Matrix(object):
         new_col_names = copy.copy(self.col_names)
         new_col_names.extend(other.col_names)
 
-        new_x = np.zeros((len(new_row_names), len(new_col_names)))
-        new_x[0 : self.shape[0], 0 : self.shape[1]] = self.as_2d
-        new_x[
-            self.shape[0] : self.shape[0] + other.shape[0],
-            self.shape[1] : self.shape[1] + other.shape[1],
-        ] = other.as_2d
         isdiagonal = True
         if not self.isdiagonal or not other.isdiagonal:
             isdiagonal = False
+        if self.issparse or other.issparse:
+            import scipy.sparse as sparse
+
+            new_x = sparse.block_diag(
+                [self._sparse_compatible_x(), other._sparse_compatible_x()],
+                format="csr",
+            )
+        else:
+            new_x = np.zeros((len(new_row_names), len(new_col_names)))
+            new_x[0 : self.shape[0], 0 : self.shape[1]] = self.as_2d
+            new_x[
+                self.shape[0] : self.shape[0] + other.shape[0],
+                self.shape[1] : self.shape[1] + other.shape[1],
+            ] = other.as_2d
 
         return type(self)(
             x=new_x,
@@ -2979,6 +4153,8 @@ class Cov(Matrix):
         Note:
             operates in place.  Other must have the same row-col names as self
 
+            if this `Cov` is sparse, it stays sparse
+
         """
         if not isinstance(other, Cov):
             raise Exception(
@@ -2997,6 +4173,22 @@ class Cov(Matrix):
         if self.isdiagonal and other.isdiagonal:
             self._Matrix__x[self_idxs] = other.x[other_idxs]
             return
+        if self.issparse:
+            import scipy.sparse as sparse
+
+            # drop the self entries being replaced, then append the other entries
+            self_x = self.x.tocoo()
+            replaced = np.zeros(self.shape[0], dtype=bool)
+            replaced[self_idxs] = True
+            keep = ~np.logical_and(replaced[self_x.row], replaced[self_x.col])
+            other_x = sparse.coo_matrix(
+                other._sparse_compatible_x()[other_idxs, :][:, other_idxs]
+            )
+            rows = np.concatenate([self_x.row[keep], self_idxs[other_x.row]])
+            cols = np.concatenate([self_x.col[keep], self_idxs[other_x.col]])
+            vals = np.concatenate([self_x.data[keep], other_x.data])
+            self._Matrix__x = sparse.csr_matrix((vals, (rows, cols)), shape=self.shape)
+            return
         if self.isdiagonal:
             self._Matrix__x = self.as_2d
             self.isdiagonal = False
@@ -3198,47 +4390,47 @@ class Cov(Matrix):
             par_dat = pst.parameter_data.loc[subset, :]
         else:
             par_dat = pst.parameter_data
-        npar = (~par_dat.partrans.isin(["fixed", "tied"])).sum()
-        x = np.zeros((npar, 1))
-        names = []
-        idx = 0
-        for i, row in par_dat.iterrows():
-            t = row["partrans"]
-            if t in ["fixed", "tied"]:
-                continue
-            if "standard_deviation" in row.index and pd.notna(row["standard_deviation"]):
-                if t == "log":
-                    var = (np.log10(row["standard_deviation"])) ** 2
-                else:
-                    var = row["standard_deviation"] ** 2
-            else:
-                if scale_offset:
-                    lb = row.parlbnd * row.scale + row.offset
-                    ub = row.parubnd * row.scale + row.offset
-                else:
-                    lb = row.parlbnd
-                    ub = row.parubnd
-
-                if t == "log":
-                    var = ((np.log10(np.abs(ub)) - np.log10(np.abs(lb))) / sigma_range) ** 2
-                else:
-                    var = ((ub - lb) / sigma_range) ** 2
-            if np.isnan(var) or not np.isfinite(var):
-                raise Exception(
-                    "Cov.from_parameter_data() error: "
-                    + "variance for parameter {0} is nan".format(row["parnme"])
+        par_dat = par_dat.loc[~par_dat.partrans.isin(["fixed", "tied"]), :]
+        islog = (par_dat.partrans == "log").values
+        lb = par_dat.parlbnd.values.astype(float)
+        ub = par_dat.parubnd.values.astype(float)
+        if scale_offset:
+            scale = par_dat.scale.values.astype(float)
+            offset = par_dat.offset.values.astype(float)
+            lb = lb * scale + offset
+            ub = ub * scale + offset
+        with np.errstate(divide="ignore", invalid="ignore"):
+            var = np.where(
+                islog,
+                ((np.log10(np.abs(ub)) - np.log10(np.abs(lb))) / sigma_range) ** 2,
+                ((ub - lb) / sigma_range) ** 2,
+            )
+            if "standard_deviation" in par_dat.columns:
+                std = pd.to_numeric(par_dat.standard_deviation).values.astype(float)
+                has_std = pd.notna(std)
+                std_var = np.where(islog, np.log10(std) ** 2, std ** 2)
+                var = np.where(has_std, std_var, var)
+        names = [n.lower() for n in par_dat.parnme.values]
+        bad = ~np.isfinite(var)
+        if bad.any():
+            raise Exception(
+                "Cov.from_parameter_data() error: "
+                + "variance for parameter {0} is nan".format(
+                    par_dat.parnme.values[bad][0]
                 )
-            if var == 0.0:
-                s = (
-                    "Cov.from_parameter_data() error: "
-                    + "variance for parameter {0} is 0.0.".format(row["parnme"])
+            )
+        bad = var == 0.0
+        if bad.any():
+            s = (
+                "Cov.from_parameter_data() error: "
+                + "variance for parameter {0} is 0.0.".format(
+                    par_dat.parnme.values[bad][0]
                 )
-                s += "  This might be from enforcement of scale/offset and log transform."
-                s += "  Try changing 'scale_offset' arg"
-                raise Exception(s)
-            x[idx] = var
-            names.append(row["parnme"].lower())
-            idx += 1
+            )
+            s += "  This might be from enforcement of scale/offset and log transform."
+            s += "  Try changing 'scale_offset' arg"
+            raise Exception(s)
+        x = var.reshape(-1, 1)
 
         return cls(x=x, names=names, isdiagonal=True)
 
@@ -3513,3 +4705,448 @@ class Cov(Matrix):
         for i, iname in enumerate(self.row_names[:-1]):
             pearson[i + 1 :, i] = pearson[i, i + 1 :]
         return Matrix(x=pearson, row_names=self.row_names, col_names=self.col_names)
+
+
+class LowRankCov(Cov):
+    """Low-rank (empirical) covariance matrix stored as a matrix of
+    deviations, optionally with localization.  The covariance matrix is
+    `devs.T * devs` (Hadamard-multiplied by `localizer`), which is never
+    formed unless `LowRankCov.x` is accessed.
+
+    Args:
+        x (`numpy.ndarray`, optional): numeric values of a dense instance.  Only
+            used if `devs` is None
+        names ([`str`]): list of row and column names
+        isdiagonal (`bool`): flag if the dense instance is diagonal.  Only
+            used if `devs` is None
+        autoalign (`bool`): flag to control the autoalignment of Matrix during
+            linear algebra operations
+        devs (`numpy.ndarray`): deviations with shape (nreal, len(names)).  These
+            should already be scaled by 1/sqrt(nreal - 1)
+        localizer (`Matrix`, optional): a matrix to localize the covariances.  Must
+            contain all `names` in rows and columns.  Default is None
+
+    Example::
+
+        pe = pyemu.ParameterEnsemble.from_gaussian_draw(pst,num_reals=1000)
+        cov = pe.covariance_matrix(low_rank=True)
+        # only the diagonal is formed
+        var = cov.get_diagonal_vector()
+        # only a 10 X 10 block is formed
+        sub_cov = cov.get(pst.par_names[:10]).x
+
+    Note:
+        Accessing `LowRankCov.x` (directly or through an operation that is not
+        supported in low-rank form) forms (and stores) the dense covariance matrix.
+        After that, the instance behaves like a dense `Cov`
+
+        `get()`, `get_diagonal_vector()`, `condition_on()`, `copy()` and
+        dot products with `Matrix` and `numpy.ndarray` instances are supported
+        in low-rank form
+
+        `x`, `row_names`, `col_names` and `isdiagonal` args are supported in the
+        contructor so support inheritance.  However, users should only pass `devs`,
+        `names` and `localizer`
+
+    """
+
+    def __init__(
+        self,
+        x=None,
+        names=[],
+        row_names=[],
+        col_names=[],
+        isdiagonal=False,
+        autoalign=True,
+        devs=None,
+        localizer=None,
+    ):
+        super(LowRankCov, self).__init__(
+            x=x,
+            names=names,
+            row_names=row_names,
+            col_names=col_names,
+            isdiagonal=isdiagonal,
+            autoalign=autoalign,
+        )
+        if devs is None:
+            if localizer is not None:
+                raise Exception("LowRankCov(): localizer requires devs")
+            return
+        if x is not None:
+            raise Exception("LowRankCov(): can't pass both devs and x")
+        devs = np.atleast_2d(np.asarray(devs, dtype=np.float64))
+        if devs.ndim != 2:
+            raise Exception("LowRankCov(): devs must be 2-D")
+        if devs.shape[1] != len(self.row_names):
+            raise Exception(
+                "LowRankCov(): devs.shape[1] != len(names) "
+                + str(devs.shape)
+                + " "
+                + str(len(self.row_names))
+            )
+        if localizer is not None:
+            if not isinstance(localizer, Matrix):
+                raise Exception(
+                    "LowRankCov(): localizer must be a Matrix, not {0}".format(
+                        type(localizer)
+                    )
+                )
+            if (
+                localizer.row_names != self.row_names
+                or localizer.col_names != self.row_names
+            ):
+                missing = set(self.row_names) - set(localizer.row_names)
+                missing |= set(self.row_names) - set(localizer.col_names)
+                if len(missing) > 0:
+                    raise Exception(
+                        "LowRankCov(): names missing from localizer: "
+                        + ",".join(list(missing)[:10])
+                    )
+                localizer = localizer.get(
+                    row_names=self.row_names, col_names=self.row_names
+                )
+        self._Matrix__lazy = _LowRankMap(devs, localizer=localizer)
+
+    @classmethod
+    def _from_map(cls, lr_map, names, autoalign=True):
+        """private method to instantiate from a `_LowRankMap`"""
+        cov = cls(names=names, autoalign=autoalign)
+        cov._Matrix__lazy = lr_map
+        return cov
+
+    @property
+    def islowrank(self):
+        """flag for instances that have not (yet) formed the dense covariance matrix
+
+        Returns:
+            `bool`: True if stored in low-rank form
+
+        """
+        return self._Matrix__x is None and isinstance(self._Matrix__lazy, _LowRankMap)
+
+    @property
+    def devs(self):
+        """the (scaled) deviations of the low-rank covariance matrix
+
+        Returns:
+            `numpy.ndarray`: array of deviations with shape (nreal, len(names))
+
+        """
+        if not self.islowrank:
+            raise Exception("LowRankCov.devs: not stored in low-rank form")
+        lr_map = self._Matrix__lazy
+        return lr_map.devs[:, lr_map.cols]
+
+    @property
+    def localizer(self):
+        """the localizing matrix, ordered on the deviations
+
+        Returns:
+            `Matrix`: the localizer.  None if not localized
+
+        """
+        if not self.islowrank:
+            return None
+        return self._Matrix__lazy.localizer
+
+    @property
+    def nreal(self):
+        """the number of deviations (realizations) of the low-rank covariance matrix
+
+        Returns:
+            `int`: number of deviations
+
+        """
+        if not self.islowrank:
+            raise Exception("LowRankCov.nreal: not stored in low-rank form")
+        return self._Matrix__lazy.devs.shape[0]
+
+    def copy(self):
+        """get a copy of `LowRankCov`
+
+        Returns:
+            `LowRankCov`: copy of this `LowRankCov`.  The deviations are shared
+
+        """
+        if not self.islowrank:
+            return super(LowRankCov, self).copy()
+        return LowRankCov._from_map(
+            self._Matrix__lazy.subset(), self.row_names, autoalign=self.autoalign
+        )
+
+    @property
+    def transpose(self):
+        """transpose operation of self
+
+        Returns:
+            `LowRankCov`: transpose of `LowRankCov`
+
+        """
+        if not self.islowrank:
+            return super(LowRankCov, self).transpose
+        if self.localizer is None:
+            return self.copy()
+        lr_map = self._Matrix__lazy
+        lr_map = _LowRankMap(
+            lr_map.devs,
+            localizer=lr_map.localizer.T,
+            rows=lr_map.cols,
+            cols=lr_map.rows,
+            max_block_size=lr_map.max_block_size,
+        )
+        return LowRankCov._from_map(lr_map, self.row_names, autoalign=self.autoalign)
+
+    def get(self, row_names=None, col_names=None, drop=False):
+        """get a new `LowRankCov` or `Matrix` instance ordered on row_names and/or col_names
+
+        Args:
+            row_names (['str'], optional): row_names for new Matrix.  If `None`,
+                all row_names are used.
+            col_names (['str'], optional): col_names for new Matrix. If `None`,
+                all col_names are used.
+            drop (`bool`): flag to remove row_names and/or col_names from this `LowRankCov`
+
+        Returns:
+            `LowRankCov`: a new `LowRankCov` that shares deviations with
+            this instance if only `row_names` or only `col_names` is passed (or
+            if they are the same).  Otherwise, only the requested (dense) block is formed
+
+        """
+        if not self.islowrank:
+            return super(LowRankCov, self).get(
+                row_names=row_names, col_names=col_names, drop=drop
+            )
+        if row_names is not None and not isinstance(row_names, list):
+            row_names = [row_names]
+        if col_names is not None and not isinstance(col_names, list):
+            col_names = [col_names]
+        if row_names is None or col_names is None or row_names == col_names:
+            names = row_names
+            if names is None:
+                names = col_names
+            if names is None:
+                raise Exception(
+                    "Matrix.get(): must pass at least" + " row_names or col_names"
+                )
+            idxs = self.indices(names, axis=0)
+            cov = LowRankCov._from_map(
+                self._Matrix__lazy.subset(idxs, idxs), names, autoalign=self.autoalign
+            )
+            if drop:
+                self.drop(names, 0)
+            return cov
+        return super(LowRankCov, self).get(
+            row_names=row_names, col_names=col_names, drop=drop
+        )
+
+    def get_diagonal_vector(self, col_name="diag"):
+        """Get a new Matrix instance that is the diagonal of self.  The
+        shape of the new matrix is (self.shape[0],1).
+
+        Args:
+            col_name (`str`): the name of the single column in the new Matrix
+
+        Returns:
+            `Matrix`: vector-shaped `Matrix` instance of the diagonal of this `LowRankCov`
+
+        """
+        if not self.islowrank:
+            return super(LowRankCov, self).get_diagonal_vector(col_name=col_name)
+        if not isinstance(col_name, str):
+            raise Exception("col_name must be type str")
+        return Matrix(
+            x=np.atleast_2d(self._Matrix__lazy.diagonal()).transpose(),
+            row_names=self.row_names,
+            col_names=[col_name],
+        )
+
+    def dot(self, other):
+        """dot product of this `LowRankCov` and an array, without forming the
+        dense covariance matrix.
+
+        Args:
+            other (`numpy.ndarray`): 1-D or 2-D array to multiply
+
+        Returns:
+            `numpy.ndarray`: the product, with the same number of dimensions as `other`
+
+        Example::
+
+            cov = pe.covariance_matrix(low_rank=True)
+            v = cov.dot(np.ones(cov.shape[1]))
+
+        """
+        other = np.asarray(other)
+        if other.shape[0] != self.shape[1]:
+            raise Exception(
+                "LowRankCov.dot(): not aligned: "
+                + str(self.shape)
+                + " "
+                + str(other.shape)
+            )
+        if not self.islowrank:
+            return np.dot(self.as_2d, other)
+        if other.ndim == 1:
+            return self._Matrix__lazy.dot(other[:, None])[:, 0]
+        return self._Matrix__lazy.dot(other)
+
+    def __mul__(self, other):
+        """Dot product multiplication overload that does not form the dense
+        covariance matrix.
+
+        Args:
+            other : (`int`,`float`,`numpy.ndarray`,`Matrix`): the thing to dot product
+
+        Returns:
+            `Matrix`: the result of dot product.  If `other` is a non-negative
+            scalar, a `LowRankCov` is returned.
+
+        """
+        if not self.islowrank:
+            return super(LowRankCov, self).__mul__(other)
+        if isinstance(other, pd.DataFrame):
+            other = Matrix.from_dataframe(other)
+        if np.isscalar(other):
+            if other < 0.0:
+                return super(LowRankCov, self).__mul__(other)
+            return LowRankCov._from_map(
+                self._Matrix__lazy.scale(other), self.row_names, autoalign=self.autoalign
+            )
+        elif isinstance(other, np.ndarray):
+            return Matrix(x=np.atleast_2d(self.dot(other)))
+        elif isinstance(other, Matrix):
+            first, second = self, other
+            if self.autoalign and other.autoalign and not self.mult_isaligned(other):
+                common = get_common_elements(self.col_names, other.row_names)
+                if len(common) == 0:
+                    raise Exception(
+                        "LowRankCov.__mul__():self.col_names "
+                        + "and other.row_names"
+                        + "don't share any common elements.  first 10: "
+                        + ",".join(self.col_names[:9])
+                        + "...and.."
+                        + ",".join(other.row_names[:9])
+                    )
+                first = self.get(common)
+                if isinstance(other, Cov):
+                    second = other.get(row_names=common, col_names=common)
+                else:
+                    second = other.get(row_names=common, col_names=other.col_names)
+            elif self.shape[1] != other.shape[0]:
+                raise Exception(
+                    "LowRankCov.__mul__(): matrices are not aligned: "
+                    + str(self.shape)
+                    + " "
+                    + str(other.shape)
+                )
+            return Matrix(
+                x=first.dot(second.as_2d),
+                row_names=first.row_names,
+                col_names=second.col_names,
+            )
+        else:
+            raise Exception(
+                "LowRankCov.__mul__(): unrecognized other arg type in __mul__: "
+                + str(type(other))
+            )
+
+    def __rmul__(self, other):
+        """Reverse order dot product multiplication overload that does not
+        form the dense covariance matrix.
+
+        Args:
+            other : (`int`,`float`,`numpy.ndarray`,`Matrix`): the thing to dot product
+
+        Returns:
+            `Matrix`: the result of dot product.  If `other` is a non-negative
+            scalar, a `LowRankCov` is returned.
+
+        """
+        if not self.islowrank:
+            return super(LowRankCov, self).__rmul__(other)
+        if np.isscalar(other):
+            return self.__mul__(other)
+        elif isinstance(other, np.ndarray):
+            if self.shape[0] != other.shape[1]:
+                raise Exception(
+                    "LowRankCov.__rmul__(): matrices are not aligned: "
+                    + str(other.shape)
+                    + " "
+                    + str(self.shape)
+                )
+            return Matrix(x=self._Matrix__lazy.rdot(np.atleast_2d(other)))
+        elif isinstance(other, Matrix):
+            first, second = other, self
+            if self.autoalign and other.autoalign and not other.mult_isaligned(self):
+                common = get_common_elements(other.col_names, self.row_names)
+                if len(common) == 0:
+                    raise Exception(
+                        "LowRankCov.__rmul__():other.col_names "
+                        + "and self.row_names"
+                        + "don't share any common elements.  first 10: "
+                        + ",".join(other.col_names[:9])
+                        + "...and.."
+                        + ",".join(self.row_names[:9])
+                    )
+                if isinstance(other, Cov):
+                    first = other.get(row_names=common, col_names=common)
+                else:
+                    first = other.get(row_names=other.row_names, col_names=common)
+                second = self.get(common)
+            elif other.shape[1] != self.shape[0]:
+                raise Exception(
+                    "LowRankCov.__rmul__(): matrices are not aligned: "
+                    + str(other.shape)
+                    + " "
+                    + str(self.shape)
+                )
+            return Matrix(
+                x=second._Matrix__lazy.rdot(first.as_2d),
+                row_names=first.row_names,
+                col_names=second.col_names,
+            )
+        else:
+            raise Exception(
+                "LowRankCov.__rmul__(): unrecognized other arg type: "
+                + str(type(other))
+            )
+
+    def condition_on(self, conditioning_elements):
+        """get a new Covariance object that is conditional on knowing some
+        elements.  Without localization, the conditioning is done by
+        projecting the deviations onto the complement of the space spanned
+        by the deviations of `conditioning_elements`, so the result is also low-rank
+
+        Args:
+            conditioning_elements (['str']): list of names of elements to condition on
+
+        Returns:
+            `LowRankCov`: new conditional `LowRankCov` that assumes `conditioning_elements`
+            have become known.  If this instance is localized (or not in low-rank form),
+            the conditional covariance is dense.
+
+        Note:
+            the projection uses the pseudo-inverse of the conditioning block, which
+            is the same as the inverse used by `Cov.condition_on()` if the
+            conditioning block is not singular
+
+        """
+        if not self.islowrank or self.localizer is not None:
+            return super(LowRankCov, self).condition_on(conditioning_elements)
+        if not isinstance(conditioning_elements, list):
+            conditioning_elements = [conditioning_elements]
+        for iname, name in enumerate(conditioning_elements):
+            conditioning_elements[iname] = name.lower()
+            if name.lower() not in self.col_names:
+                raise Exception("Cov.condition_on() name not found: " + name)
+        scond = set(conditioning_elements)
+        keep_names = [name for name in self.col_names if name not in scond]
+        keep_devs = self.get(keep_names).devs
+        cond_devs = self.get(conditioning_elements).devs
+        # orthonormal basis for the deviations of the conditioning elements
+        u, s, _ = np.linalg.svd(cond_devs, full_matrices=False)
+        tol = s.max() * max(cond_devs.shape) * np.finfo(np.float64).eps
+        u = u[:, s > tol]
+        new_devs = keep_devs - np.dot(u, np.dot(u.T, keep_devs))
+        return LowRankCov(devs=new_devs, names=keep_names, autoalign=self.autoalign)
@@ -99,7 +99,7 @@ class MonteCarlo(LinearAnalysis):
             nsing = None
         return nsing
 
-    def get_null_proj(self, nsing=None):
+    def get_null_proj(self, nsing=None, factored=False):
         """get a null-space projection matrix of XTQX
 
         Parameters
@@ -108,11 +108,16 @@ class MonteCarlo(LinearAnalysis):
             optional number of singular components to use
             If Nonte, then nsing is determined from
             call to MonteCarlo.get_nsing()
+        factored: bool
+            flag to return the solution-space right singular vectors (V1)
+            instead of forming the null-space projection matrix.
+            Default is False
 
         Returns
         -------
         v2_proj : pyemu.Matrix
-            the null-space projection matrix (V2V2^T)
+            the null-space projection matrix (V2V2^T), or V1 if factored
+            is True
 
         """
         if nsing is None:
@@ -125,7 +130,10 @@ class MonteCarlo(LinearAnalysis):
             + "{0} of {1} singular components".format(nsing, self.jco.shape[1])
         )
 
-        v2_proj = self.xtqx.v[:, nsing:] * self.xtqx.v[:, nsing:].T
+        if factored:
+            v2_proj = self.xtqx.v[:, :nsing]
+        else:
+            v2_proj = self.xtqx.v[:, nsing:] * self.xtqx.v[:, nsing:].T
         self.log(
             "forming null space projection matrix with "
             + "{0} of {1} singular components".format(nsing, self.jco.shape[1])
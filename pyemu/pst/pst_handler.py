@@ -80,6 +80,7 @@ class Pst(object):
         self.comments = {}
         self.other_sections = {}
         self.new_filename = None
+        self._io_executor = None
         for key, value in pst_utils.pst_config.items():
             self.__setattr__(key, copy.copy(value))
         # self.tied = None
@@ -147,6 +148,36 @@ class Pst(object):
         """
         return pst_utils.generic_pst(par_names=par_names, obs_names=obs_names)
 
+    @property
+    def io_executor(self):
+        """get the persistent executor used to write model input files and
+        process model output files
+
+        Returns:
+            `pyemu.pst_utils.IOExecutor`: the executor, created on first access
+
+        Note:
+            the executor caches parsed template and instruction files and starts a
+            pool of worker processes for large jobs only.  Assign a new
+            `IOExecutor` to change the number of workers.
+
+        Example::
+
+            pst = pyemu.Pst("my.pst")
+            pst.io_executor = pyemu.pst_utils.IOExecutor(num_workers=4)
+            pst.write_input_files()
+
+        """
+        if self._io_executor is None:
+            self._io_executor = pst_utils.IOExecutor()
+        return self._io_executor
+
+    @io_executor.setter
+    def io_executor(self, executor):
+        if self._io_executor is not None and self._io_executor is not executor:
+            self._io_executor.close()
+        self._io_executor = executor
+
     @staticmethod
     def get_constraint_tags(ltgt='lt'):
         if ltgt == 'lt':
@@ -3152,6 +3183,8 @@ class Pst(object):
             adds "parval1_trans" column to Pst.parameter_data that includes the
             effect of scale and offset
 
+            parsed template files are cached by `Pst.io_executor` between calls
+
         Example::
 
             pst = pyemu.Pst("my.pst")
@@ -3181,6 +3214,8 @@ class Pst(object):
             requires a complete set of model input files at relative path
             from where python is running to `pst_path`
 
+            parsed instruction files are cached by `Pst.io_executor` between calls
+
         Example::
 
             pst = pyemu.Pst("pest.pst")
@@ -2,6 +2,7 @@
 from __future__ import print_function, division
 import os
 import warnings
+import weakref
 import multiprocessing as mp
 import re
 import numpy as np
@@ -442,54 +443,16 @@ def write_input_files(pst, pst_path="."):
         This function uses template files with the current parameter \
         values (stored in `pst.parameter_data.parval1`).
 
-        This function uses multiprocessing - one process per template file
+        This function uses `pst.io_executor` - small jobs are written in-process
+        and large jobs are spread over a persistent pool of worker processes.  See
+        `IOExecutor` for details.
 
         This is a simple implementation of what PEST does.  It does not
         handle all the special cases, just a basic function...user beware
 
 
     """
-    par = pst.parameter_data
-    par.loc[:, "parval1_trans"] = (par.parval1 * par.scale) + par.offset
-    pairs = np.array(list(zip(pst.template_files, pst.input_files)))
-    num_tpl = len(pairs)
-    chunk_len = 50
-    num_chunk_floor = num_tpl // chunk_len
-    main_chunks = (
-        pairs[: num_chunk_floor * chunk_len].reshape([-1, chunk_len, 2]).tolist()
-    )  # the list of files broken down into chunks
-    remainder = pairs[num_chunk_floor * chunk_len :].tolist()  # remaining files
-    chunks = main_chunks + [remainder]
-    #    procs = []
-    #   for chunk in chunks:
-    #        # write_to_template(pst.parameter_data.parval1_trans,os.path.join(pst_path,tpl_file),
-    #        #                  os.path.join(pst_path,in_file))
-    #        p = mp.Process(
-    #            target=_write_chunk_to_template,
-    #            args=[chunk, pst.parameter_data.parval1_trans, pst_path],
-    #        )
-    #        p.start()
-    #        procs.append(p)
-    #    for p in procs:
-    #        p.join()
-    pool = mp.Pool(processes=min(mp.cpu_count(), len(chunks), 60))
-    x = [
-        pool.apply_async(
-            _write_chunk_to_template,
-            args=(chunk, pst.parameter_data.parval1_trans, pst_path),
-        )
-        for i, chunk in enumerate(chunks)
-    ]
-    [xx.get() for xx in x]
-    pool.close()
-    pool.join()
-
-
-def _write_chunk_to_template(chunk, parvals, pst_path):
-    for tpl_file, in_file in chunk:
-        tpl_file = os.path.join(pst_path, tpl_file)
-        in_file = os.path.join(pst_path, in_file)
-        write_to_template(parvals, tpl_file, in_file)
+    pst.io_executor.write_input_files(pst, pst_path=pst_path)
 
 
 def write_to_template(parvals, tpl_file, in_file):
@@ -499,7 +462,8 @@ def write_to_template(parvals, tpl_file, in_file):
     Args:
         parvals (`dict`): a container of parameter names and values.  Can
             also be a `pandas.Series`
-        tpl_file (`str`): path and name of a template file
+        tpl_file (`str` or `TemplateFile`): path and name of a template file or
+            an already-parsed `TemplateFile` instance
         in_file (`str`): path and name of model input file to write
 
     Examples::
@@ -508,51 +472,9 @@ def write_to_template(parvals, tpl_file, in_file):
                                           "my.tpl","my.input")
 
     """
-    f_in = open(in_file, "w")
-    f_tpl = open(tpl_file, "r")
-    header = f_tpl.readline().strip().split()
-    if header[0].lower() not in ["ptf", "jtf"]:
-        raise Exception(
-            "template file error: must start with [ptf,jtf], not:" + str(header[0])
-        )
-    if len(header) != 2:
-        raise Exception(
-            "template file error: header line must have two entries: " + str(header)
-        )
-
-    marker = header[1]
-    if len(marker) != 1:
-        raise Exception(
-            "template file error: marker must be a single character, not:" + str(marker)
-        )
-    for line in f_tpl:
-        if marker not in line:
-            f_in.write(line)
-        else:
-            line = line.rstrip()
-            par_names = line.lower().split(marker)[1::2]
-            par_names = [name.strip() for name in par_names]
-            start, end = _get_marker_indices(marker, line)
-            if len(par_names) != len(start):
-                raise Exception("par_names != start")
-            new_line = line[: start[0]]
-            between = [line[e:s] for s, e in zip(start[1:], end[:-1])]
-            for i, name in enumerate(par_names):
-                s, e = start[i], end[i]
-                w = e - s
-                if w > 15:
-                    d = 6
-                else:
-                    d = 3
-                fmt = "{0:" + str(w) + "." + str(d) + "E}"
-                val_str = fmt.format(parvals[name])
-                new_line += val_str
-                if i != len(par_names) - 1:
-                    new_line += between[i]
-            new_line += line[end[-1] :]
-            f_in.write(new_line + "\n")
-    f_tpl.close()
-    f_in.close()
+    if not isinstance(tpl_file, TemplateFile):
+        tpl_file = TemplateFile(tpl_file)
+    tpl_file.write(parvals, in_file)
 
 
 def _get_marker_indices(marker, line):
@@ -567,6 +489,150 @@ def _get_marker_indices(marker, line):
     return start, end
 
 
+class TemplateFile(object):
+    """class for a parsed template file.  The template file is parsed once
+    into literal text segments and parameter slots so that model input files
+    can be written repeatedly without re-parsing the template.
+
+    Args:
+        tpl_filename (`str`): path and name of an existing template file
+
+    Note:
+        `TemplateFile` instances are picklable, so they can be cached or
+        passed to other processes.
+
+    Example::
+
+        t = TemplateFile("my.tpl")
+        for i,parvals in enumerate(par_dicts):
+            t.write(parvals,"my.input")
+
+    """
+
+    def __init__(self, tpl_filename):
+        self.tpl_filename = tpl_filename
+        self.marker = None
+        # the literal text between (and around) the parameter slots
+        self._segments = []
+        # the parameter name, format and width of each slot
+        self._slot_names = []
+        self._slot_widths = []
+        self.read_tpl_file()
+
+    @property
+    def par_names(self):
+        """the unique parameter names in the template file
+
+        Returns:
+            [`str`]: the parameter names, in order of first occurence
+
+        """
+        return list(self._unique_names)
+
+    def read_tpl_file(self):
+        """read and parse the template file.
+
+        Note:
+
+            This is called by the constructor
+
+        """
+        with open(self.tpl_filename, "r") as f:
+            header = f.readline().strip().split()
+            if len(header) == 0 or header[0].lower() not in ["ptf", "jtf"]:
+                raise Exception(
+                    "template file error: must start with [ptf,jtf], not:"
+                    + str(header[:1])
+                )
+            if len(header) != 2:
+                raise Exception(
+                    "template file error: header line must have two entries: "
+                    + str(header)
+                )
+            marker = header[1]
+            if len(marker) != 1:
+                raise Exception(
+                    "template file error: marker must be a single character, not:"
+                    + str(marker)
+                )
+            lines = f.readlines()
+        self.marker = marker
+        segments, names, widths = [], [], []
+        literal = []
+        for line in lines:
+            if marker not in line:
+                literal.append(line)
+                continue
+            line = line.rstrip()
+            par_names = line.lower().split(marker)[1::2]
+            start, end = _get_marker_indices(marker, line)
+            if len(par_names) != len(start):
+                raise Exception(
+                    "template file error: unbalanced markers on line: " + line
+                )
+            literal.append(line[: start[0]])
+            for i, name in enumerate(par_names):
+                segments.append("".join(literal))
+                names.append(name.strip())
+                widths.append(end[i] - start[i])
+                if i != len(par_names) - 1:
+                    literal = [line[end[i] : start[i + 1]]]
+            literal = [line[end[-1] :], "\n"]
+        segments.append("".join(literal))
+        self._segments = segments
+        self._slot_names = names
+        self._slot_widths = np.array(widths, dtype=int)
+        # unique names in order of first occurence and the index of each slot
+        # into them
+        order = {}
+        slot_idx = [order.setdefault(name, len(order)) for name in names]
+        self._unique_names = list(order.keys())
+        self._slot_idx = np.array(slot_idx, dtype=int)
+        # one format string for the whole file, using the same formats as
+        # PEST: more digits for wider slots
+        fmts = [
+            "%{0}.{1}E".format(w, 6 if w > 15 else 3) for w in self._slot_widths
+        ]
+        parts = [seg.replace("%", "%%") for seg in self._segments]
+        self._format_string = "".join(
+            [p + f for p, f in zip(parts[:-1], fmts)] + [parts[-1]]
+        )
+
+    def get_values_string(self, parvals):
+        """get the contents of the model input file for a set of parameter
+        values
+
+        Args:
+            parvals (`dict`): a container of parameter names and values.  Can
+                also be a `pandas.Series`
+
+        Returns:
+            `str`: the contents of the model input file
+
+        """
+        if len(self._slot_names) == 0:
+            return self._segments[0]
+        if isinstance(parvals, pd.Series):
+            vals = parvals.loc[self._unique_names].values
+        else:
+            vals = [parvals[name] for name in self._unique_names]
+        vals = np.asarray(vals, dtype=np.float64)[self._slot_idx]
+        return self._format_string % tuple(vals.tolist())
+
+    def write(self, parvals, in_file):
+        """write a model input file for a set of parameter values
+
+        Args:
+            parvals (`dict`): a container of parameter names and values.  Can
+                also be a `pandas.Series`
+            in_file (`str`): path and name of model input file to write
+
+        """
+        contents = self.get_values_string(parvals)
+        with open(in_file, "w") as f:
+            f.write(contents)
+
+
 def parse_ins_file(ins_file):
     """parse a PEST-style instruction file to get observation names
 
@@ -1236,6 +1302,15 @@ class InstructionFile(object):
         pst (`pyemu.Pst`, optional): Pst instance - used for checking that instruction file is
             compatible with the control file (e.g. no duplicates)
 
+    Note:
+        Instruction lines that only use line advances with whitespace-delimited
+        observations ("w" and "!obsnme!") or only use line advances with fixed observations
+        ("[obsnme]s:e") are compiled into an execution plan of token indices or column
+        spans on the first call to `InstructionFile.read_output_file()` and reused by
+        later calls.  All other instruction lines (primary and secondary markers,
+        semi-fixed observations) are interpreted.  The output file is read in a
+        single pass.
+
     Example::
 
         i = InstructionFile("my.ins")
@@ -1250,7 +1325,7 @@ class InstructionFile(object):
         # self._pst = pst
         self._marker = None
         self._ins_filehandle = None
-        self._out_filehandle = None
+        self._out_lines = None
         self._last_line = ""
         self._full_oname_set = None
         if pst is not None:
@@ -1259,6 +1334,7 @@ class InstructionFile(object):
 
         self._instruction_lines = []
         self._instruction_lcount = []
+        self._instruction_plan = None
 
         self.read_ins_file()
 
@@ -1356,6 +1432,116 @@ class InstructionFile(object):
 
             self._instruction_lines.append(line)
             self._instruction_lcount.append(self._ins_linecount)
+        if self._ins_filehandle is not None:
+            self._ins_filehandle.close()
+            self._ins_filehandle = None
+        self._instruction_plan = None
+
+    def _compile_ins_line(self, ins_line):
+        """private method to compile an instruction line into an execution plan entry.
+        Returns None if the instruction line can not be compiled.
+
+        The plan entries are either ("w", nlines, lead_w, need, obs) for whitespace
+        delimited observations, where obs is a list of (token index, obs name) and
+        `lead_w` flags a leading "w" instruction (which skips the first token only if
+        the output line does not start with whitespace), or ("f", nlines, max_col, obs)
+        for fixed observations, where obs is a list of (start col, end col, obs name)
+
+        """
+        if len(ins_line) == 0 or ins_line[0][:1] != "l":
+            return None
+        try:
+            nlines = int(ins_line[0][1:])
+        except Exception:
+            return None
+        if nlines < 1:
+            return None
+        tokens = ins_line[1:]
+        if len(tokens) > 0 and tokens[0][:1] == "[":
+            obs, cursor_pos = [], 0
+            for ins in tokens:
+                if ins[:1] != "[":
+                    return None
+                try:
+                    oname, raw = ins[1:].split("]", 1)
+                    s_idx, e_idx = [int(i) for i in raw.split(":")]
+                except Exception:
+                    return None
+                s_idx -= 1
+                if cursor_pos > s_idx or e_idx <= s_idx:
+                    return None
+                obs.append((s_idx, e_idx, oname.lower()))
+                cursor_pos = e_idx
+            return ("f", nlines, cursor_pos, obs)
+        # the token index an obs instruction would read next and the state of
+        # the cursor: at the start of the line ("ls"), at the start of a token ("s")
+        # or at the end of a token ("e").  idx never decreases, so the last index
+        # used is the largest token index needed
+        obs, idx, state, lead_w, need = [], 0, "ls", False, -1
+        for ins in tokens:
+            if ins == "w":
+                if state == "ls":
+                    lead_w = True
+                elif state == "s":
+                    idx += 1
+                state = "s"
+                need = idx
+            elif (
+                ins[:1] == "!"
+                and ins[-1:] == "!"
+                and len(ins) > 2
+                and ins.count("!") == 2
+            ):
+                obs.append((idx, ins[1:-1]))
+                need = idx
+                idx += 1
+                state = "e"
+            else:
+                return None
+        return ("w", nlines, lead_w, need, obs)
+
+    def _execute_plan(self, plan, ins_line, ins_lcount):
+        """private method to process output file lines with a compiled instruction
+        line.  Falls back to `InstructionFile._execute_ins_line()` for output lines that
+        do not suit the plan, for example lines with tabs or missing values"""
+        start_linecount = self._out_linecount
+        nlines = plan[1]
+        for i in range(nlines):
+            line = self._readline_output()
+            if line is None:
+                self.throw_out_error(
+                    "EOF when trying to read {0} lines for line "
+                    "advance instruction '{1}', from instruction "
+                    "file line number {2}".format(nlines, ins_line[0], ins_lcount)
+                )
+        val_dict = {}
+        try:
+            if plan[0] == "f":
+                if len(line) < plan[2]:
+                    raise ValueError()
+                for s_idx, e_idx, oname in plan[3]:
+                    val_str = line[s_idx:e_idx]
+                    if oname == "dum":
+                        continue
+                    val_dict[oname] = float(val_str)
+            else:
+                if "\t" in line:
+                    raise ValueError()
+                tokens = line.replace(",", " ").split()
+                shift = 0
+                if plan[2] and line[:1] not in [",", " ", "\t"]:
+                    shift = 1
+                if plan[3] + shift >= len(tokens):
+                    raise ValueError()
+                for idx, oname in plan[4]:
+                    if oname == "dum":
+                        continue
+                    val_dict[oname] = float(tokens[idx + shift])
+        except ValueError:
+            # let the interpreter process (or report errors for) this line
+            self._out_linecount = start_linecount
+            return self._execute_ins_line(ins_line, ins_lcount)
+        return val_dict
 
     def throw_ins_warning(self, message, lcount=None):
         """throw a verbose PyemuWarning
@@ -1418,15 +1604,26 @@ class InstructionFile(object):
 
 
         """
+        if self._instruction_plan is None:
+            self._instruction_plan = [
+                self._compile_ins_line(line) for line in self._instruction_lines
+            ]
         self._out_filename = output_file
+        self._out_linecount = 0
+        self._out_lines = None
         val_dict = {}
-        for ins_line, ins_lcount in zip(
-            self._instruction_lines, self._instruction_lcount
-        ):
-            # try:
-            val_dict.update(self._execute_ins_line(ins_line, ins_lcount))
-            # except Exception as e:
-            #    raise Exception(str(e))
+        try:
+            for ins_line, ins_lcount, plan in zip(
+                self._instruction_lines,
+                self._instruction_lcount,
+                self._instruction_plan,
+            ):
+                if plan is None:
+                    val_dict.update(self._execute_ins_line(ins_line, ins_lcount))
+                else:
+                    val_dict.update(self._execute_plan(plan, ins_line, ins_lcount))
+        finally:
+            self._out_lines = None
         df = pd.DataFrame.from_dict(val_dict, orient="index", columns=["obsval"])
         # s = pd.Series(val_dict)
         # s.sort_index(inplace=True)
@@ -1757,24 +1954,31 @@ class InstructionFile(object):
         return tokens
 
     def _readline_output(self):
-        """consolidate private method to read the next output file line.  Casts to lower"""
-        if self._out_filehandle is None:
+        """consolidate private method to read the next output file line.  Casts to lower.
+        The output file is read (and cast to lower) in a single pass on the first call"""
+        if self._out_lines is None:
             if not os.path.exists(self._out_filename):
                 raise Exception(
                     "output file '{0}' not found".format(self._out_filename)
                 )
-            self._out_filehandle = open(self._out_filename, "r")
-        line = self._out_filehandle.readline()
+            with open(self._out_filename, "r") as f:
+                self._out_lines = f.read().lower().split("\n")
+        nlines = len(self._out_lines)
         self._out_linecount += 1
-        if line == "":
+        if self._out_linecount > nlines:
+            return None
+        line = self._out_lines[self._out_linecount - 1]
+        if self._out_linecount < nlines:
+            line += "\n"
+        elif line == "":
             return None
         self._last_line = line
-        return line.lower()
+        return line
 
 
 def process_output_files(pst, pst_path="."):
     """helper function to process output files using the
-      InstructionFile class
+      InstructionFile class and `pst.io_executor`
 
     Args:
          pst (`pyemu.Pst`): control file instance
@@ -1797,21 +2001,260 @@ def process_output_files(pst, pst_path="."):
         raise Exception(
             "process_output_files error: 'pst' arg must be pyemu.Pst instance"
         )
-    series = []
-    for ins, out in zip(pst.instruction_files, pst.output_files):
-        ins = os.path.join(pst_path, ins)
-        out = os.path.join(pst_path, out)
-        if not os.path.exists(out):
-            warnings.warn("out file '{0}' not found".format(out), PyemuWarning)
-        f = os.path.join(pst_path, ins)
-        i = InstructionFile(ins, pst=pst)
+    return pst.io_executor.process_output_files(pst, pst_path=pst_path)
+
+
+class IOExecutor(object):
+    """a persistent executor to write model input files from template files and
+    to process model output files with instruction files
+
+    Args:
+        num_workers (`int`, optional): the number of worker processes used for large
+            jobs.  If None, `min(mp.cpu_count(), 60)` is used.
+        min_parallel_files (`int`): the number of file pairs below which jobs are
+            run in the current process.  Default is 50.
+
+    Note:
+        Parsed `TemplateFile` and `InstructionFile` instances are cached by file path,
+        modification time and size, so repeated calls only parse changed files.  Small
+        jobs run in-process with no pool startup cost.  The worker pool is started by
+        the first large job and reused by later jobs; each worker keeps its own cache
+        and is only sent the parameter values needed by its template files.
+
+        Each `Pst` has an executor at `Pst.io_executor`, used by `Pst.write_input_files()`
+        and `Pst.process_output_files()`.  The pool and caches are not copied or pickled.
+
+        The pool is shut down by `close()`, on leaving a `with` block, or when the
+        executor is garbage collected or the interpreter exits.
+
+    Example::
+
+        pst = pyemu.Pst("my.pst")
+        pst.write_input_files()  # parses the template files
+        pst.parameter_data.loc[:, "parval1"] *= 1.1
+        pst.write_input_files()  # reuses the parsed template files
+        pst.io_executor.close()
+
+        with pyemu.pst_utils.IOExecutor(num_workers=4) as ex:
+            ex.write_input_files(pst)
+
+    """
+
+    def __init__(self, num_workers=None, min_parallel_files=50):
+        if num_workers is None:
+            num_workers = min(mp.cpu_count(), 60)
+        self.num_workers = max(1, int(num_workers))
+        self.min_parallel_files = min_parallel_files
+        self._pool = None
+        self._finalizer = None
+        self._tpl_cache = {}
+        self._ins_cache = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        state["_finalizer"] = None
+        state["_tpl_cache"] = {}
+        state["_ins_cache"] = {}
+        return state
+
+    @staticmethod
+    def _get_cached(cache, cls, filename):
+        filename = os.path.abspath(filename)
+        st = os.stat(filename)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = cache.get(filename)
+        if cached is None or cached[0] != key:
+            cached = (key, cls(filename))
+            cache[filename] = cached
+        return cached[1]
+
+    def get_template_file(self, tpl_file):
+        """get a (cached) parsed template file
+
+        Args:
+            tpl_file (`str`): path and name of the template file
+
+        Returns:
+            `TemplateFile`: the parsed template file
+
+        """
+        return self._get_cached(self._tpl_cache, TemplateFile, tpl_file)
+
+    def get_instruction_file(self, ins_file):
+        """get a (cached) parsed instruction file
+
+        Args:
+            ins_file (`str`): path and name of the instruction file
+
+        Returns:
+            `InstructionFile`: the parsed instruction file
+
+        """
+        return self._get_cached(self._ins_cache, InstructionFile, ins_file)
+
+    def clear(self):
+        """clear the cached template and instruction files"""
+        self._tpl_cache = {}
+        self._ins_cache = {}
+
+    def close(self):
+        """shut down the worker pool, if it has been started"""
+        if self._pool is not None:
+            self._finalizer.detach()
+            self._finalizer = None
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def _get_chunks(self, pairs):
+        if self.num_workers < 2 or len(pairs) < max(2, self.min_parallel_files):
+            return None
+        if self._pool is None:
+            self._pool = mp.Pool(processes=self.num_workers)
+            # release the workers if the executor is dropped without close()
+            self._finalizer = weakref.finalize(self, self._pool.terminate)
+        return [
+            c.tolist()
+            for c in np.array_split(np.arange(len(pairs)), self.num_workers)
+            if len(c) > 0
+        ]
+
+    def write_input_files(self, pst, pst_path="."):
+        """write model input files with the current parameter values
+
+        Args:
+            pst (`pyemu.Pst`): a Pst instance
+            pst_path (`str`): the path to where the control file and template
+                files reside.  Default is '.'.
+
+        Note:
+            adds "parval1_trans" column to Pst.parameter_data that includes the
+            effect of scale and offset
+
+        """
+        par = pst.parameter_data
+        par.loc[:, "parval1_trans"] = (par.parval1 * par.scale) + par.offset
+        parvals = par.parval1_trans
+        pairs = [
+            (os.path.join(pst_path, tpl_file), os.path.join(pst_path, in_file))
+            for tpl_file, in_file in zip(pst.template_files, pst.input_files)
+        ]
+        tpls = [self.get_template_file(tpl_file) for tpl_file, _ in pairs]
+        chunks = self._get_chunks(pairs)
+        if chunks is None:
+            for tpl, (_, in_file) in zip(tpls, pairs):
+                tpl.write(parvals, in_file)
+            return
+        parvals = parvals.to_dict()
+        results = []
+        for chunk in chunks:
+            names = set()
+            for i in chunk:
+                names.update(tpls[i].par_names)
+            missing = names - set(parvals.keys())
+            if len(missing) > 0:
+                raise KeyError(
+                    "parameters missing from parameter data: {0}".format(
+                        ",".join(sorted(missing)[:10])
+                    )
+                )
+            results.append(
+                self._pool.apply_async(
+                    _io_write_chunk,
+                    args=(
+                        [pairs[i] for i in chunk],
+                        {n: parvals[n] for n in names},
+                    ),
+                )
+            )
+        [r.get() for r in results]
+
+    def _read_output_file(self, ins_file, out_file):
         try:
-            s = i.read_output_file(out)
-            series.append(s)
+            ins = self.get_instruction_file(ins_file)
+            return ins.read_output_file(out_file), None
         except Exception as e:
-            warnings.warn("error processing output file '{0}': {1}".format(out, str(e)))
-    if len(series) == 0:
-        return None
-    series = pd.concat(series)
-    # print(series)
-    return series
+            return None, str(e)
+
+    def process_output_files(self, pst, pst_path="."):
+        """process model output files with instruction files
+
+        Args:
+            pst (`pyemu.Pst`): control file instance
+            pst_path (`str`): path to instruction and output files to append to the front
+                of the names in the Pst instance
+
+        Returns:
+            `pd.DataFrame`: dataframe of observation names and simulated values
+            extracted from the model output files listed in `pst`
+
+        """
+        pairs = [
+            (os.path.join(pst_path, ins_file), os.path.join(pst_path, out_file))
+            for ins_file, out_file in zip(pst.instruction_files, pst.output_files)
+        ]
+        obs_names = set(pst.obs_names)
+        for ins_file, out_file in pairs:
+            if not os.path.exists(out_file):
+                warnings.warn(
+                    "out file '{0}' not found".format(out_file), PyemuWarning
+                )
+            missing = self.get_instruction_file(ins_file).obs_name_set - obs_names
+            if len(missing) > 0:
+                raise Exception(
+                    "InstructionFile error processing instruction file {0}: "
+                    "obs name(s) not in pst: {1}".format(
+                        ins_file, ",".join(sorted(missing)[:10])
+                    )
+                )
+        chunks = self._get_chunks(pairs)
+        if chunks is None:
+            results = [self._read_output_file(ins, out) for ins, out in pairs]
+        else:
+            results = [
+                self._pool.apply_async(
+                    _io_read_chunk, args=([pairs[i] for i in chunk],)
+                )
+                for chunk in chunks
+            ]
+            results = [rr for r in results for rr in r.get()]
+        series = []
+        for (ins_file, out_file), (df, err) in zip(pairs, results):
+            if df is None:
+                warnings.warn(
+                    "error processing output file '{0}': {1}".format(out_file, err)
+                )
+            else:
+                series.append(df)
+        if len(series) == 0:
+            return None
+        return pd.concat(series)
+
+
+# the executor used inside IOExecutor worker processes - persists between jobs
+_io_worker_executor = None
+
+
+def _io_worker():
+    global _io_worker_executor
+    if _io_worker_executor is None:
+        _io_worker_executor = IOExecutor(num_workers=1)
+    return _io_worker_executor
+
+
+def _io_write_chunk(pairs, parvals):
+    ex = _io_worker()
+    for tpl_file, in_file in pairs:
+        ex.get_template_file(tpl_file).write(parvals, in_file)
+
+
+def _io_read_chunk(pairs):
+    ex = _io_worker()
+    return [ex._read_output_file(ins_file, out_file) for ins_file, out_file in pairs]
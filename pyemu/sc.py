@@ -6,8 +6,9 @@ from __future__ import print_function, division
 from os import name
 import numpy as np
 import pandas as pd
-from pyemu.la import LinearAnalysis
-from pyemu.mat import Cov, Matrix
+from pyemu.la import LinearAnalysis, _solve_lower
+from pyemu.mat import Cov, LowRankCov, Matrix
+from pyemu.mat.mat_handler import get_common_elements
 
 
 class Schur(LinearAnalysis):
@@ -108,14 +109,28 @@ class Schur(LinearAnalysis):
             return self.__posterior_parameter
         else:
             self.clean()
+            if isinstance(self.parcov, LowRankCov) and self.parcov.islowrank:
+                self.log("low-rank Schur's complement")
+                self.__posterior_parameter = self.__low_rank_posterior_parameter()
+                self.log("low-rank Schur's complement")
+                return self.__posterior_parameter
             self.log("Schur's complement")
+            pinv = None
             try:
-                pinv = self.parcov.inv
-                r = self.xtqx + pinv
-                r = r.inv
+                pinv = self._get_parcov_inv()
+                r, lower = self.__get_posterior_factor(pinv)
+                if lower is None:
+                    r = r.inv
+                else:
+                    linv = _solve_lower(lower, np.eye(lower.shape[0]))
+                    r = Matrix(
+                        x=np.dot(linv.T, linv),
+                        row_names=r.row_names,
+                        col_names=r.col_names,
+                    )
             except Exception as e:
-
-                pinv.to_ascii("parcov_inv.err.cov")
+                if pinv is not None:
+                    pinv.to_ascii("parcov_inv.err.cov")
                 self.logger.warn("error forming schur's complement: {0}".format(str(e)))
                 self.xtqx.to_binary("xtqx.err.jcb")
                 self.logger.warn("problemtic xtqx saved to xtqx.err.jcb")
@@ -130,6 +145,72 @@ class Schur(LinearAnalysis):
             self.log("Schur's complement")
             return self.__posterior_parameter
 
+    def __get_posterior_factor(self, pinv):
+        """private method to get the posterior precision matrix `xtqx + pinv`
+        and its lower Cholesky factor from the factors shared with the instances
+        created by `get()`.  The factor is `None` if the precision matrix is not
+        positive definite
+        """
+
+        def factor():
+            r = self.xtqx + pinv
+            try:
+                lower = np.linalg.cholesky(r.as_2d)
+            except np.linalg.LinAlgError:
+                lower = None
+            return r, lower
+
+        return self._get_factor(
+            "posterior_factor", ["jco", "obscov", "parcov"], factor
+        )
+
+    def __solve_posterior_prediction(self):
+        """private method to get the posterior prediction variances with a
+        triangular solve against the Cholesky factor of the posterior precision
+        matrix, without forming the posterior parameter covariance matrix.
+        Returns `None` if the factor is not available
+        """
+        if isinstance(self.parcov, LowRankCov) and self.parcov.islowrank:
+            return None
+        self.clean()
+        try:
+            r, lower = self.__get_posterior_factor(self._get_parcov_inv())
+        except Exception:
+            return None
+        if lower is None or set(r.row_names) != set(self.predictions.row_names):
+            return None
+        z = _solve_lower(lower, self.predictions.get(row_names=r.row_names).as_2d)
+        post = np.sum(z ** 2, axis=0)
+        return {n: v for n, v in zip(self.predictions.col_names, post)}
+
+    def __low_rank_posterior_parameter(self):
+        """private method to form the posterior parameter covariance matrix
+        for a `LowRankCov` prior without forming (or inverting) the dense prior.
+
+        Note:
+            Without localization, the posterior is low-rank: `devs.T * W * devs`, where
+            `W = (I + G.T * G)^-1` and `G = qhalfx * devs.T`.  With localization, the
+            dense posterior `C - C * X.T * (X * C * X.T + I)^-1 * X * C` is formed
+            with `X = qhalfx`, using blockwise products with the prior
+
+        """
+        names = get_common_elements(self.jco.col_names, self.parcov.row_names)
+        parcov = self.parcov.get(names)
+        qhalfx = self.qhalfx.get(row_names=self.qhalfx.row_names, col_names=names)
+        if parcov.localizer is None:
+            devs = parcov.devs
+            g = (qhalfx * devs.T).x
+            # W = V (I + L)^-1 V.T, so new devs = (I + L)^-1/2 V.T devs
+            lam, v = np.linalg.eigh(np.dot(g.T, g))
+            lam = np.maximum(lam, 0.0)
+            new_devs = np.dot((v / np.sqrt(1.0 + lam)).T, devs)
+            return LowRankCov(devs=new_devs, names=names)
+        x = qhalfx.as_2d
+        cxt = parcov.dot(x.T)
+        xcxt = np.dot(x, cxt) + np.eye(x.shape[0])
+        post = parcov.x - np.dot(cxt, np.linalg.solve(xcxt, cxt.T))
+        return Cov(x=post, names=names)
+
     # @property
     # def map_parameter_estimate(self):
     #     """ get the posterior expectation for parameters using Bayes linear
@@ -239,12 +320,15 @@ class Schur(LinearAnalysis):
                     self.log("propagating posterior to predictions")
                 except:
                     pass
-                post_cov = (
-                    self.predictions.T * self.posterior_parameter * self.predictions
-                )
-                self.__posterior_prediction = {
-                    n: v for n, v in zip(post_cov.row_names, np.diag(post_cov.x))
-                }
+                if self.__posterior_parameter is None:
+                    self.__posterior_prediction = self.__solve_posterior_prediction()
+                if self.__posterior_prediction is None:
+                    post_cov = (
+                        self.predictions.T * self.posterior_parameter * self.predictions
+                    )
+                    self.__posterior_prediction = {
+                        n: v for n, v in zip(post_cov.row_names, np.diag(post_cov.x))
+                    }
                 self.log("propagating posterior to predictions")
             else:
                 self.__posterior_prediction = {}
@@ -278,8 +362,8 @@ class Schur(LinearAnalysis):
         if prior_mat.isdiagonal:
             prior = prior_mat.x.flatten()
         else:
-            prior = np.diag(prior_mat.x)
-        post = np.diag(self.posterior_parameter.x)
+            prior = prior_mat.get_diagonal_vector().x.flatten()
+        post = self.posterior_parameter.get_diagonal_vector().x.flatten()
 
         ureduce = 100.0 * (1.0 - (post / prior))
 
@@ -390,6 +474,26 @@ class Schur(LinearAnalysis):
             predictions=cond_preds,
             verbose=False,
         )
+        # the inverse of the conditional parcov is a block of the parcov inverse
+        # and the normal matrix is a block of ours, so share them
+        la_cond._factor_cache = self._factor_cache
+        for attr in ["jco", "obscov"]:
+            la_cond._factor_sources[attr] = (
+                getattr(la_cond, attr),
+                self._get_factor_source(attr),
+            )
+        cond_names = la_cond.parcov.row_names
+        la_cond._set_factor(
+            "parcov_inv",
+            ["parcov"],
+            self._get_parcov_inv().get(row_names=cond_names, col_names=cond_names),
+        )
+        if la_cond.jco.col_names == keep_names:
+            la_cond._set_factor(
+                "xtqx",
+                ["jco", "obscov"],
+                self.xtqx.get(row_names=keep_names, col_names=keep_names),
+            )
         return la_cond
 
     def get_par_contribution(self, parlist_dict=None, include_prior_results=False):
@@ -529,7 +633,11 @@ class Schur(LinearAnalysis):
         )
 
     def get_added_obs_importance(
-        self, obslist_dict=None, base_obslist=None, reset_zero_weight=1.0
+        self,
+        obslist_dict=None,
+        base_obslist=None,
+        reset_zero_weight=1.0,
+        num_workers=None,
     ):
         """A dataworth method to analyze the posterior uncertainty as a result of gathering
          some additional observations
@@ -551,6 +659,9 @@ class Schur(LinearAnalysis):
                 a flag to reset observations with zero weight in `obslist_dict`
                 If `reset_zero_weights` passed as 0.0, no weights adjustments are made.
                 Default is 1.0.
+            num_workers (`int`, optional): number of processes to use to evaluate
+                the cases in `obslist_dict`.  If `None` or 1, the cases are evaluated
+                in this process.  Default is `None`
 
         Returns:
             `pandas.DataFrame`: a dataframe with row labels (index) of `obslist_dict.keys()` and
@@ -571,6 +682,11 @@ class Schur(LinearAnalysis):
             dataworth testing process. If `reset_zero_weights` == 0, no weights adjustments will be made - this is
             most appropriate if different weights are assigned to the added observation values in `Schur.pst`
 
+            For a diagonal `obscov`, the base posterior parameter covariance matrix is formed
+            once and each case is evaluated with a rank-k (Woodbury) update of the base
+            posterior forecast variances, where k is the number of observations in the case.
+            Otherwise, the posterior is formed for each case
+
         Example::
 
             sc = pyemu.Schur("my.jco")
@@ -581,11 +697,100 @@ class Schur(LinearAnalysis):
 
         """
 
+        obslist_dict, base_obslist, reset, org_obscov, org_pst = (
+            self.__prepare_added_obs(obslist_dict, base_obslist, reset_zero_weight)
+        )
+
+        results = {}
+        names = ["base"]
+
+        if base_obslist is None or len(base_obslist) == 0:
+            self.logger.statement(
+                "no base observation passed, 'base' case"
+                + " is just the prior of the forecasts"
+            )
+            for forecast, pr in self.prior_forecast.items():
+                results[forecast] = [pr]
+            # reset base obslist for use later
+            base_obslist = []
+
+        else:
+            base_sc = self.get(par_names=self.jco.par_names, obs_names=base_obslist)
+            base_posterior = base_sc.posterior_forecast
+            for forecast, pt in base_posterior.items():
+                results[forecast] = [pt]
+
+        if self.predictions is not None and self.obscov.isdiagonal:
+            # factor the base posterior once and evaluate each case as an update
+            self.log("calculating importance of added observations")
+            base_parcov = None
+            if len(base_obslist) > 0:
+                base_parcov = base_sc.posterior_parameter
+            case_dict, engine = self.__get_added_obs_engine(
+                obslist_dict, base_obslist, base_parcov
+            )
+            case_df = engine.score(case_dict, sign=1.0, num_workers=num_workers)
+            names.extend(case_dict.keys())
+            for forecast in results.keys():
+                results[forecast].extend(case_df.loc[:, forecast].tolist())
+            self.log("calculating importance of added observations")
+        else:
+            for case_name, obslist in obslist_dict.items():
+                names.append(case_name)
+                if not isinstance(obslist, list):
+                    obslist = [obslist]
+                self.log(
+                    "calculating importance of observations by adding: "
+                    + str(obslist)
+                    + "\n"
+                )
+                # this case is the combination of the base obs plus whatever unique
+                # obs names in obslist
+                case_obslist = list(base_obslist)
+                dedup_obslist = [
+                    oname for oname in obslist if oname not in case_obslist
+                ]
+                case_obslist.extend(dedup_obslist)
+                # print(self.pst.observation_data.loc[case_obslist,:])
+                case_post = self.get(
+                    par_names=self.jco.col_names, obs_names=case_obslist
+                ).posterior_forecast
+                for forecast, pt in case_post.items():
+                    results[forecast].append(pt)
+                self.log(
+                    "calculating importance of observations by adding: "
+                    + str(obslist)
+                    + "\n"
+                )
+        df = pd.DataFrame(results, index=names)
+
+        if reset:
+            self.reset_obscov(org_obscov)
+            if org_pst is not None:
+                self.reset_pst(org_pst)
+
+        return df
+
+    def __prepare_added_obs(self, obslist_dict, base_obslist, reset_zero_weight):
+        """private method to check the added observation args and, if needed,
+        reset the zero weights of the observations to add.
+
+        Returns:
+            tuple containing
+
+            - **dict**: the cases of observations to add
+            - **[`str`]**: the base observations
+            - **bool**: flag if weights were reset
+            - **pyemu.Cov**: the obscov before resetting weights (`None` if not reset)
+            - **pyemu.Pst**: the pst before resetting weights (`None` if not reset)
+
+        """
         if obslist_dict is not None:
             if type(obslist_dict) == list:
                 obslist_dict = dict(zip(obslist_dict, obslist_dict))
 
         reset = False
+        org_obscov, org_pst = None, None
         if reset_zero_weight > 0:
 
             if not self.obscov.isdiagonal:
@@ -595,7 +800,6 @@ class Schur(LinearAnalysis):
             reset = True
             weight = reset_zero_weight
             org_obscov = self.obscov.copy()
-            org_pst = None
             try:
                 org_pst = self.pst.get()
             except:
@@ -693,61 +897,62 @@ class Schur(LinearAnalysis):
             self.reset_obscov(self.pst)
             self.log("resetting self.obscov")
 
-        results = {}
-        names = ["base"]
-
-        if base_obslist is None or len(base_obslist) == 0:
-            self.logger.statement(
-                "no base observation passed, 'base' case"
-                + " is just the prior of the forecasts"
-            )
-            for forecast, pr in self.prior_forecast.items():
-                results[forecast] = [pr]
-            # reset base obslist for use later
-            base_obslist = []
-
-        else:
-            base_posterior = self.get(
-                par_names=self.jco.par_names, obs_names=base_obslist
-            ).posterior_forecast
-            for forecast, pt in base_posterior.items():
-                results[forecast] = [pt]
+        return obslist_dict, base_obslist, reset, org_obscov, org_pst
 
+    def __get_added_obs_engine(self, obslist_dict, base_obslist, base_parcov=None):
+        """private method to get the cases in `obslist_dict` less the observations
+        in `base_obslist` and an `_ObsWorthEngine` that uses the posterior parameter
+        covariance matrix of `base_obslist` (`base_parcov`, if passed) as reference
+        """
+        sbase_obslist = set(base_obslist)
+        case_dict = {}
         for case_name, obslist in obslist_dict.items():
-            names.append(case_name)
             if not isinstance(obslist, list):
                 obslist = [obslist]
-            self.log(
-                "calculating importance of observations by adding: "
-                + str(obslist)
-                + "\n"
-            )
-            # this case is the combination of the base obs plus whatever unique
-            # obs names in obslist
-            case_obslist = list(base_obslist)
-            dedup_obslist = [oname for oname in obslist if oname not in case_obslist]
-            case_obslist.extend(dedup_obslist)
-            # print(self.pst.observation_data.loc[case_obslist,:])
-            case_post = self.get(
-                par_names=self.jco.col_names, obs_names=case_obslist
-            ).posterior_forecast
-            for forecast, pt in case_post.items():
-                results[forecast].append(pt)
-            self.log(
-                "calculating importance of observations by adding: "
-                + str(obslist)
-                + "\n"
+            case_dict[case_name] = [
+                oname for oname in obslist if oname not in sbase_obslist
+            ]
+        if base_parcov is None:
+            if len(base_obslist) == 0:
+                base_parcov = self.parcov.get(
+                    [
+                        pname
+                        for pname in self.jco.col_names
+                        if pname in self.parcov.col_names
+                    ]
+                )
+            else:
+                base_parcov = self.get(
+                    par_names=self.jco.col_names, obs_names=base_obslist
+                ).posterior_parameter
+        return case_dict, self.__get_obs_worth_engine(case_dict, base_parcov)
+
+    def __get_obs_worth_engine(self, obslist_dict, parcov):
+        """private method to get an `_ObsWorthEngine` for the observations
+        in `obslist_dict` that uses `parcov` as the reference parameter
+        covariance matrix
+        """
+        self.clean()
+        obs_names = []
+        for obslist in obslist_dict.values():
+            obs_names.extend(obslist)
+        obs_names = list(dict.fromkeys(obs_names))
+        sjco_names = set(self.jco.row_names)
+        missing = [oname for oname in obs_names if oname not in sjco_names]
+        if len(missing) > 0:
+            raise Exception(
+                "the following observations are not in the jco: " + ",".join(missing)
             )
-        df = pd.DataFrame(results, index=names)
-
-        if reset:
-            self.reset_obscov(org_obscov)
-            if org_pst is not None:
-                self.reset_pst(org_pst)
-
-        return df
+        return _ObsWorthEngine.from_matrices(
+            self.jco.get(row_names=obs_names, col_names=self.jco.col_names),
+            self.obscov.get(row_names=obs_names).x.flatten(),
+            parcov,
+            self.predictions.get(row_names=self.jco.col_names),
+        )
 
-    def get_removed_obs_importance(self, obslist_dict=None, reset_zero_weight=None):
+    def get_removed_obs_importance(
+        self, obslist_dict=None, reset_zero_weight=None, num_workers=None
+    ):
         """A dataworth method to analyze the posterior uncertainty as a result of losing
          some existing observations
 
@@ -757,6 +962,9 @@ class Schur(LinearAnalysis):
                 row labels in returned dataframe. If `None`, then every zero-weighted
                 observation is tested sequentially. Default is `None`
             reset_zero_weight DEPRECATED
+            num_workers (`int`, optional): number of processes to use to evaluate
+                the cases in `obslist_dict`.  If `None` or 1, the cases are evaluated
+                in this process.  Default is `None`
 
         Returns:
             `pandas.DataFrame`: A dataframe with index of obslist_dict.keys() and columns
@@ -771,6 +979,12 @@ class Schur(LinearAnalysis):
             Note:
             All observations that may be evaluated as removed must have non-zero weight
 
+            For a diagonal `obscov`, the posterior parameter covariance matrix of the
+            retained observations is formed once and the observations of each case are
+            removed with a rank-k downdate of the posterior forecast variances, where k
+            is the number of observations in the case.  Otherwise, the posterior is
+            formed for each case
+
 
         Example::
 
@@ -860,47 +1074,92 @@ class Schur(LinearAnalysis):
         for forecast, pt in self.posterior_forecast.items():
             results[forecast] = [pt]
         base_obslist.sort()
-        # for case_name, obslist in obslist_dict.items():
-        for case_name in cases:
-            obslist = obslist_dict[case_name]
-            if not isinstance(obslist, list):
-                obslist = [obslist]
-            names.append(case_name)
-            self.log(
-                "calculating importance of observations by removing: "
-                + str(obslist)
-                + "\n"
-            )
+        if self.predictions is not None and self.obscov.isdiagonal:
             # check for missing names
-            missing_onames = [
-                oname for oname in obslist if oname not in self.jco.row_names
+            sjco_names = set(self.jco.row_names)
+            for case_name in cases:
+                missing_onames = [
+                    oname
+                    for oname in obslist_dict[case_name]
+                    if oname not in sjco_names
+                ]
+                if len(missing_onames) > 0:
+                    raise Exception(
+                        "case {0} has observation names ".format(case_name)
+                        + "not found: "
+                        + ",".join(missing_onames)
+                    )
+            # factor the posterior of the retained observations once and
+            # remove the observations of each case with a downdate
+            sforecast_names = set(self.forecast_names)
+            ref_obslist = [
+                oname for oname in base_obslist if oname not in sforecast_names
             ]
-            if len(missing_onames) > 0:
-                raise Exception(
-                    "case {0} has observation names ".format(case_name)
-                    + "not found: "
-                    + ",".join(missing_onames)
+            if set(ref_obslist) == sjco_names:
+                ref_parcov = self.posterior_parameter
+            else:
+                ref_parcov = self.get(
+                    par_names=self.jco.col_names, obs_names=ref_obslist
+                ).posterior_parameter
+            sref_obslist = set(ref_obslist)
+            case_dict = {
+                case_name: [
+                    oname
+                    for oname in obslist_dict[case_name]
+                    if oname in sref_obslist
+                ]
+                for case_name in cases
+            }
+            engine = self.__get_obs_worth_engine(case_dict, ref_parcov)
+            case_df = engine.score(case_dict, sign=-1.0, num_workers=num_workers)
+            names.extend(cases)
+            for forecast in results.keys():
+                results[forecast].extend(case_df.loc[:, forecast].tolist())
+        else:
+            # for case_name, obslist in obslist_dict.items():
+            for case_name in cases:
+                obslist = obslist_dict[case_name]
+                if not isinstance(obslist, list):
+                    obslist = [obslist]
+                names.append(case_name)
+                self.log(
+                    "calculating importance of observations by removing: "
+                    + str(obslist)
+                    + "\n"
                 )
-            # find the set difference between obslist and jco obs names
-            # diff_onames = [oname for oname in self.jco.obs_names if oname not in obslist]
-            diff_onames = [
-                oname
-                for oname in base_obslist
-                if oname not in obslist and oname not in self.forecast_names
-            ]
+                # check for missing names
+                missing_onames = [
+                    oname for oname in obslist if oname not in self.jco.row_names
+                ]
+                if len(missing_onames) > 0:
+                    raise Exception(
+                        "case {0} has observation names ".format(case_name)
+                        + "not found: "
+                        + ",".join(missing_onames)
+                    )
+                # find the set difference between obslist and jco obs names
+                # diff_onames = [oname for oname in self.jco.obs_names if oname not in obslist]
+                diff_onames = [
+                    oname
+                    for oname in base_obslist
+                    if oname not in obslist and oname not in self.forecast_names
+                ]
 
-            # calculate the increase in forecast variance by not using the obs
-            # in obslist
-            case_post = self.get(
-                par_names=self.jco.col_names, obs_names=diff_onames
-            ).posterior_forecast
+                # calculate the increase in forecast variance by not using the obs
+                # in obslist
+                case_post = self.get(
+                    par_names=self.jco.col_names, obs_names=diff_onames
+                ).posterior_forecast
 
-            for forecast, pt in case_post.items():
-                results[forecast].append(pt)
+                for forecast, pt in case_post.items():
+                    results[forecast].append(pt)
+            self.log(
+                "calculating importance of observations by removing: "
+                + str(obslist)
+                + "\n"
+            )
         df = pd.DataFrame(results, index=names)
-        self.log(
-            "calculating importance of observations by removing: " + str(obslist) + "\n"
-        )
+        self.log("calculating importance of observations")
 
         # if reset:
         self.reset_obscov(org_obscov)
@@ -1012,6 +1271,7 @@ class Schur(LinearAnalysis):
         obslist_dict=None,
         base_obslist=None,
         reset_zero_weight=1.0,
+        lazy=False,
     ):
         """find the most important observation(s) by sequentially evaluating
         the importance of the observations in `obslist_dict`.
@@ -1038,6 +1298,10 @@ class Schur(LinearAnalysis):
                 a flag to reset observations with zero weight in `obslist_dict`
                 If `reset_zero_weights` passed as 0.0, no weights adjustments are made.
                 Default is 1.0.
+            lazy (`bool`, optional): flag to use lazy-greedy evaluation: after the first
+                iteration, cases are only re-evaluated (in order of their variance reduction
+                from previous iterations) until no remaining case can beat the best case
+                found so far.  Only used for a diagonal `obscov`.  Default is False
 
         Returns:
             `pandas.DataFrame`: a dataFrame with columns of `obslist_dict` key for each iteration
@@ -1052,6 +1316,13 @@ class Schur(LinearAnalysis):
             observation importance values include the conditional information from
             the last iteration.
 
+            For a diagonal `obscov`, the posterior is factored once and updated with the
+            observations selected in each iteration; all the remaining cases are evaluated
+            against the current posterior without forming the posterior of each case.
+
+            The lazy-greedy evaluation assumes the variance reduction of a case does not
+            grow as observations are added, which holds in most, but not all, settings
+
 
         Example::
 
@@ -1084,47 +1355,142 @@ class Schur(LinearAnalysis):
             obs_being_used = []
 
         best_case, best_results = [], []
-        for iiter in range(niter):
-            self.log("next most important added obs iteration {0}".format(iiter + 1))
-            df = self.get_added_obs_importance(
-                obslist_dict=obslist_dict,
-                base_obslist=obs_being_used,
-                reset_zero_weight=reset_zero_weight,
+        if self.predictions is not None and self.obscov.isdiagonal:
+            org_obslist_dict = obslist_dict
+            snames = set()
+            if reset_zero_weight > 0.0:
+                snames = set(self.pst.nnz_obs_names)
+            obslist_dict, obs_being_used, reset, org_obscov, org_pst = (
+                self.__prepare_added_obs(
+                    obslist_dict, obs_being_used, reset_zero_weight
+                )
             )
-
-            if iiter == 0:
-                init_base = df.loc["base", forecast].copy()
-            fore_df = df.loc[:, forecast]
-            fore_diff_df = fore_df - fore_df.loc["base"]
-            fore_diff_df.sort_values(inplace=True)
-            iter_best_name = fore_diff_df.index[0]
-            iter_best_result = df.loc[iter_best_name, forecast]
-            iter_base_result = df.loc["base", forecast]
-            diff_percent_init = 100.0 * (init_base - iter_best_result) / init_base
-            diff_percent_iter = (
-                100.0 * (iter_base_result - iter_best_result) / iter_base_result
+            self.log("factoring base posterior for next most important added obs")
+            case_dict, engine = self.__get_added_obs_engine(
+                obslist_dict, obs_being_used
             )
-            self.log("next most important added obs iteration {0}".format(iiter + 1))
+            self.log("factoring base posterior for next most important added obs")
+            iforecast = engine.forecast_names.index(forecast)
+            init_base = engine.var[iforecast]
+            case_names = list(case_dict.keys())
+            case_idxs = engine.get_case_idxs(case_dict)
+            bounds = None
+            added_names = []
+            for iiter in range(niter):
+                self.log(
+                    "next most important added obs iteration {0}".format(iiter + 1)
+                )
+                iter_base_result = engine.var[iforecast]
+                if lazy and bounds is None:
+                    # the reductions of the first iteration bound those of later ones
+                    bounds = engine.score_idxs(case_idxs)[:, iforecast]
+                ibest, quad = engine.next_best(case_idxs, iforecast, bounds=bounds)
+                if ibest is None or quad <= 0.0:
+                    self.log(
+                        "next most important added obs iteration {0}".format(iiter + 1)
+                    )
+                    best_results.append(
+                        [
+                            "base",
+                            iter_base_result,
+                            0.0,
+                            100.0 * (init_base - iter_base_result) / init_base,
+                        ]
+                    )
+                    best_case.append("base")
+                    break
+                iter_best_name = case_names.pop(ibest)
+                iter_best_idxs = case_idxs.pop(ibest)
+                if bounds is not None:
+                    bounds = np.delete(bounds, ibest)
+                engine.add(iter_best_idxs, update_all=not lazy)
+                iter_best_result = engine.var[iforecast]
+                self.log(
+                    "next most important added obs iteration {0}".format(iiter + 1)
+                )
+                best_results.append(
+                    [
+                        iter_best_name,
+                        iter_best_result,
+                        100.0
+                        * (iter_base_result - iter_best_result)
+                        / iter_base_result,
+                        100.0 * (init_base - iter_best_result) / init_base,
+                    ]
+                )
+                best_case.append(iter_best_name)
+                # the selected observations are now part of the base
+                case_idxs = [
+                    idxs[~np.isin(idxs, iter_best_idxs)] for idxs in case_idxs
+                ]
+                onames = obslist_dict[iter_best_name]
+                if isinstance(org_obslist_dict, dict):
+                    org_obslist_dict.pop(iter_best_name)
+                if not isinstance(onames, list):
+                    onames = [onames]
+                obs_being_used.extend(onames)
+                added_names.extend(onames)
+            if reset:
+                self.reset_obscov(org_obscov)
+                if org_pst is not None:
+                    self.reset_pst(org_pst)
+                reset_names = [o for o in added_names if o not in snames]
+                self.pst.observation_data.loc[
+                    reset_names, "weight"
+                ] = reset_zero_weight
+        else:
+            for iiter in range(niter):
+                self.log(
+                    "next most important added obs iteration {0}".format(iiter + 1)
+                )
+                df = self.get_added_obs_importance(
+                    obslist_dict=obslist_dict,
+                    base_obslist=obs_being_used,
+                    reset_zero_weight=reset_zero_weight,
+                )
 
-            best_results.append(
-                [iter_best_name, iter_best_result, diff_percent_iter, diff_percent_init]
-            )
-            best_case.append(iter_best_name)
+                if iiter == 0:
+                    init_base = df.loc["base", forecast].copy()
+                fore_df = df.loc[:, forecast]
+                fore_diff_df = fore_df - fore_df.loc["base"]
+                fore_diff_df.sort_values(inplace=True)
+                iter_best_name = fore_diff_df.index[0]
+                iter_best_result = df.loc[iter_best_name, forecast]
+                iter_base_result = df.loc["base", forecast]
+                diff_percent_init = 100.0 * (init_base - iter_best_result) / init_base
+                diff_percent_iter = (
+                    100.0 * (iter_base_result - iter_best_result) / iter_base_result
+                )
+                self.log(
+                    "next most important added obs iteration {0}".format(iiter + 1)
+                )
 
-            if iter_best_name.lower() == "base":
-                break
+                best_results.append(
+                    [
+                        iter_best_name,
+                        iter_best_result,
+                        diff_percent_iter,
+                        diff_percent_init,
+                    ]
+                )
+                best_case.append(iter_best_name)
 
-            if obslist_dict is None:
-                onames = [iter_best_name]
-            else:
-                onames = obslist_dict.pop(iter_best_name)
-            if not isinstance(onames, list):
-                onames = [onames]
-            obs_being_used.extend(onames)
-            if reset_zero_weight > 0.0:
-                snames = set(self.pst.nnz_obs_names)
-                reset_names = [o for o in onames if o not in snames]
-                self.pst.observation_data.loc[reset_names, "weight"] = reset_zero_weight
+                if iter_best_name.lower() == "base":
+                    break
+
+                if obslist_dict is None:
+                    onames = [iter_best_name]
+                else:
+                    onames = obslist_dict.pop(iter_best_name)
+                if not isinstance(onames, list):
+                    onames = [onames]
+                obs_being_used.extend(onames)
+                if reset_zero_weight > 0.0:
+                    snames = set(self.pst.nnz_obs_names)
+                    reset_names = [o for o in onames if o not in snames]
+                    self.pst.observation_data.loc[
+                        reset_names, "weight"
+                    ] = reset_zero_weight
         columns = [
             "best_obs",
             forecast + "_variance",
@@ -1133,7 +1499,9 @@ class Schur(LinearAnalysis):
         ]
         return pd.DataFrame(best_results, index=best_case, columns=columns)
 
-    def next_most_par_contribution(self, niter=3, forecast=None, parlist_dict=None):
+    def next_most_par_contribution(
+        self, niter=3, forecast=None, parlist_dict=None, lazy=False
+    ):
         """find the parameter(s) contributing most to posterior
         forecast  by sequentially evaluating the contribution of parameters in
         `parlist_dict`.
@@ -1155,12 +1523,20 @@ class Schur(LinearAnalysis):
                 either not change or decrease as a result of knowing parameter perfectly.  The magnitude
                 of the decrease represents the worth of gathering information about the parameter(s) being
                 tested.
+            lazy (`bool`, optional): flag to use lazy-greedy evaluation: after the first
+                iteration, cases are only re-evaluated (in order of their variance reduction
+                from previous iterations) until no remaining case can beat the best case
+                found so far.  Default is False
 
         Note:
             The largest contributing parameters from each iteration are
             treated as known perfectly for the remaining iterations.  In this way, the
             next iteration seeks the next most influential group of parameters.
 
+            Knowing parameters perfectly is treated as adding noise-free observations
+            of them to the posterior parameter covariance matrix, which is factored
+            once and updated with the parameters selected in each iteration
+
         Returns:
             `pandas.DataFrame`: a dataframe with index of iteration number and columns
             of `parlist_dict.keys()`.  The values are the results of the knowing
@@ -1171,36 +1547,326 @@ class Schur(LinearAnalysis):
             assert len(self.forecasts) == 1, (
                 "forecast arg list one and only one" + " forecast"
             )
+            forecast = self.forecast_names[0]
         elif forecast not in self.prediction_arg:
             raise Exception("forecast {0} not found".format(forecast))
-        org_parcov = self.parcov.get(row_names=self.parcov.row_names)
         if parlist_dict is None:
             parlist_dict = dict(zip(self.pst.adj_par_names, self.pst.adj_par_names))
 
-        base_prior, base_post = self.prior_forecast, self.posterior_forecast
+        base_post = self.posterior_forecast
         iter_results = [base_post[forecast].copy()]
         iter_names = ["base"]
+
+        self.log("factoring posterior for next most par contribution")
+        post = self.posterior_parameter
+        par_names = post.row_names
+        case_dict = {}
+        for case, parlist in parlist_dict.items():
+            if not isinstance(parlist, list):
+                parlist = [parlist]
+            case_dict[case] = [str(pname).lower() for pname in parlist]
+        cand_names = []
+        for parlist in case_dict.values():
+            cand_names.extend(parlist)
+        cand_names = list(dict.fromkeys(cand_names))
+        spar_names = set(par_names)
+        missing = [pname for pname in cand_names if pname not in spar_names]
+        if len(missing) > 0:
+            raise Exception(
+                "the following parameters are not in the posterior: "
+                + ",".join(missing)
+            )
+        # knowing a parameter is a noise-free observation with a row of the identity
+        par_idx = {pname: i for i, pname in enumerate(par_names)}
+        cand_idxs = np.array([par_idx[pname] for pname in cand_names], dtype=int)
+        x = np.zeros((cand_idxs.shape[0], len(par_names)))
+        x[np.arange(cand_idxs.shape[0]), cand_idxs] = 1.0
+        post_arr = post.as_2d
+        y = self.predictions.get(row_names=par_names).as_2d
+        py = np.dot(post_arr, y)
+        engine = _ObsWorthEngine(
+            x,
+            np.zeros(cand_idxs.shape[0]),
+            post_arr[cand_idxs],
+            py,
+            np.einsum("ij,ij->j", y, py),
+            cand_names,
+            self.predictions.col_names,
+        )
+        self.log("factoring posterior for next most par contribution")
+
+        iforecast = engine.forecast_names.index(forecast)
+        case_names = list(case_dict.keys())
+        case_idxs = engine.get_case_idxs(case_dict)
+        bounds = None
         for iiter in range(niter):
-            iter_contrib = {forecast: [base_post[forecast]]}
-            iter_case_names = ["base"]
             self.log("next most par iteration {0}".format(iiter + 1))
-
-            for case, parlist in parlist_dict.items():
-                iter_case_names.append(case)
-                la_cond = self.get_conditional_instance(parlist)
-                iter_contrib[forecast].append(la_cond.posterior_forecast[forecast])
-            df = pd.DataFrame(iter_contrib, index=iter_case_names)
-            df.sort_values(by=forecast, inplace=True)
-            iter_best = df.index[0]
+            if lazy and bounds is None:
+                # the reductions of the first iteration bound those of later ones
+                bounds = engine.score_idxs(case_idxs)[:, iforecast]
+            ibest, quad = engine.next_best(case_idxs, iforecast, bounds=bounds)
+            iter_best = "base"
+            if ibest is not None and engine.var[iforecast] - quad < base_post[forecast]:
+                iter_best = case_names[ibest]
             self.logger.statement(
                 "next best iter {0}: {1}".format(iiter + 1, iter_best)
             )
             self.log("next most par iteration {0}".format(iiter + 1))
             if iter_best.lower() == "base":
                 break
-            iter_results.append(df.loc[iter_best, forecast])
+            case_names.pop(ibest)
+            iter_best_idxs = case_idxs.pop(ibest)
+            if bounds is not None:
+                bounds = np.delete(bounds, ibest)
+            engine.add(iter_best_idxs, update_all=not lazy)
+            iter_results.append(engine.var[iforecast])
             iter_names.append(iter_best)
-            self.reset_parcov(self.parcov.condition_on(parlist_dict.pop(iter_best)))
+            # the selected parameters are now known
+            case_idxs = [idxs[~np.isin(idxs, iter_best_idxs)] for idxs in case_idxs]
+            parlist_dict.pop(iter_best)
 
-        self.reset_parcov(org_parcov)
         return pd.DataFrame(iter_results, index=iter_names)
+
+
+def _score_obs_cases(case_idxs, w, x, r, b, sign, xu=None):
+    """private function to score data worth cases with a rank-k update of
+    a parameter covariance matrix `P`.  Module-level so it can be run in a
+    process pool.
+
+    Args:
+        case_idxs ([`numpy.ndarray`]): the rows of `x` in each case
+        w (`numpy.ndarray`): `x * P0`
+        x (`numpy.ndarray`): the jacobian rows of the observations
+        r (`numpy.ndarray`): the noise variances of the observations
+        b (`numpy.ndarray`): `x * P * y` for the forecast sensitivity vectors `y`
+        sign (`float`): 1.0 to add the observations of a case to `P`, -1.0 to remove them
+        xu (`numpy.ndarray`, optional): `x * U` if `P = P0 - U * U.T`.  If `None`,
+            `P = P0`
+
+    Returns:
+        `numpy.ndarray`: the quadratic form `b.T * S^-1 * b` for each case (rows)
+        and forecast (columns), where `S = diag(r) + sign * x * P * x.T`.  The
+        forecast variances change by `-sign` times this amount
+
+    """
+    quad = np.zeros((len(case_idxs), b.shape[1]))
+    sizes = np.array([len(idxs) for idxs in case_idxs], dtype=int)
+    # single observation cases are scored all at once
+    singles = np.flatnonzero(sizes == 1)
+    if singles.shape[0] > 0:
+        idxs = np.array([case_idxs[i][0] for i in singles], dtype=int)
+        xpx = np.einsum("ij,ij->i", w[idxs], x[idxs])
+        if xu is not None:
+            xpx -= np.einsum("ij,ij->i", xu[idxs], xu[idxs])
+        quad[singles] = b[idxs] ** 2 / (r[idxs] + sign * xpx)[:, None]
+    for i in np.flatnonzero(sizes > 1):
+        idxs = case_idxs[i]
+        xpx = np.dot(w[idxs], x[idxs].T)
+        if xu is not None:
+            xpx -= np.dot(xu[idxs], xu[idxs].T)
+        s = np.diag(r[idxs]) + sign * xpx
+        quad[i] = np.sum(b[idxs] * np.linalg.solve(s, b[idxs]), axis=0)
+    return quad
+
+
+class _ObsWorthEngine(object):
+    """private helper for data worth that factors a reference parameter
+    covariance matrix `P0` once and scores each case (a group of observations)
+    with a low-rank (Woodbury) update of `P0` that is only applied to the
+    forecast sensitivity vectors.  Cases can also be added to the reference
+    state, which is kept as `P = P0 - U * U.T`, for greedy (sequential) designs.
+
+    Args:
+        x (`numpy.ndarray`): jacobian rows of the candidate observations.  Rows of
+            the identity matrix treat parameters as (noise-free) observations
+        obsvar (`numpy.ndarray`): noise variances of the candidate observations
+        w (`numpy.ndarray`): `x * P0`
+        py (`numpy.ndarray`): `P0 * y` for the forecast sensitivity vectors `y`
+        var (`numpy.ndarray`): the forecast variances `diag(y.T * P0 * y)`
+        obs_names ([`str`]): names of the candidate observations (rows of `x`)
+        forecast_names ([`str`]): names of the forecasts
+
+    """
+
+    def __init__(self, x, obsvar, w, py, var, obs_names, forecast_names):
+        self.obs_names = list(obs_names)
+        self.forecast_names = list(forecast_names)
+        self.obsvar = np.asarray(obsvar, dtype=float)
+        self.x = x
+        self.w = w
+        self.var = np.array(var, dtype=float)
+        self.b = np.dot(x, py)
+        # the updates of the reference state: P = P0 - u * u.T, with
+        # uy = u.T * y and xu = x * u (only filled to xu_ncol for each row)
+        self.u = np.zeros((x.shape[1], 0))
+        self.uy = np.zeros((0, self.b.shape[1]))
+        self.xu = np.zeros((x.shape[0], 0))
+        self.xu_ncol = np.zeros(x.shape[0], dtype=int)
+
+    @classmethod
+    def from_matrices(cls, jco, obsvar, parcov, predictions):
+        """instantiate from the jacobian rows of the candidate observations,
+        their noise variances, the reference parameter covariance matrix and
+        the forecast sensitivity vectors (parameters by forecasts)"""
+        py = (parcov * predictions).as_2d
+        return cls(
+            jco.as_2d,
+            obsvar,
+            (jco * parcov).as_2d,
+            py,
+            np.einsum("ij,ij->j", predictions.as_2d, py),
+            jco.row_names,
+            predictions.col_names,
+        )
+
+    def get_case_idxs(self, obslist_dict):
+        """get the candidate rows in each case, dropping duplicate names"""
+        idx_map = {name: i for i, name in enumerate(self.obs_names)}
+        case_idxs = []
+        for obslist in obslist_dict.values():
+            idxs = [idx_map[name] for name in obslist]
+            case_idxs.append(np.array(list(dict.fromkeys(idxs)), dtype=int))
+        return case_idxs
+
+    def _get_xu(self, rows):
+        """private method to bring `xu` up to date for `rows`"""
+        m = self.u.shape[1]
+        for ncol in np.unique(self.xu_ncol[rows]):
+            if ncol == m:
+                continue
+            urows = rows[self.xu_ncol[rows] == ncol]
+            self.xu[urows, ncol:] = np.dot(self.x[urows], self.u[:, ncol:])
+            self.xu_ncol[urows] = m
+        return self.xu
+
+    def _get_b(self, rows):
+        """private method to get `x * P * y` for `rows` of the current state"""
+        if self.u.shape[1] == 0:
+            return self.b[rows]
+        return self.b[rows] - np.dot(self._get_xu(rows)[rows], self.uy)
+
+    def score_idxs(self, case_idxs):
+        """get the forecast variance reductions from adding the rows in each
+        of `case_idxs` to the current state.  Returns cases by forecasts"""
+        if len(case_idxs) == 0:
+            return np.zeros((0, self.b.shape[1]))
+        rows = np.unique(np.concatenate(case_idxs)).astype(int)
+        b = np.zeros_like(self.b)
+        b[rows] = self._get_b(rows)
+        xu = None
+        if self.u.shape[1] > 0:
+            xu = self._get_xu(rows)
+        return _score_obs_cases(case_idxs, self.w, self.x, self.obsvar, b, 1.0, xu=xu)
+
+    def add(self, idxs, update_all=True):
+        """add the rows `idxs` to the current state with a rank-k update of the
+        factors.  If `update_all`, `x * U` is updated for all the rows, otherwise
+        rows are updated as they are scored"""
+        idxs = np.asarray(idxs, dtype=int)
+        if idxs.shape[0] == 0:
+            return
+        xu = self._get_xu(idxs)[idxs]
+        g = self.w[idxs] - np.dot(xu, self.u.T)
+        s = np.diag(self.obsvar[idxs]) + np.dot(g, self.x[idxs].T)
+        lower = np.linalg.cholesky(0.5 * (s + s.T))
+        u_new = np.linalg.solve(lower, g).T
+        uy_new = np.linalg.solve(lower, self.b[idxs] - np.dot(xu, self.uy))
+        m = self.u.shape[1]
+        self.u = np.hstack((self.u, u_new))
+        self.uy = np.vstack((self.uy, uy_new))
+        self.var = self.var - np.sum(uy_new ** 2, axis=0)
+        self.xu = np.hstack((self.xu, np.zeros((self.xu.shape[0], u_new.shape[1]))))
+        if update_all:
+            self.xu[self.xu_ncol == m, m:] = np.dot(self.x[self.xu_ncol == m], u_new)
+            self.xu_ncol[self.xu_ncol == m] = self.u.shape[1]
+
+    def next_best(self, case_idxs, iforecast, bounds=None):
+        """find the case that most reduces the variance of a forecast from the
+        current state.
+
+        Args:
+            case_idxs ([`numpy.ndarray`]): the rows in each case
+            iforecast (`int`): index of the forecast
+            bounds (`numpy.ndarray`, optional): upper bounds of the reduction of
+                each case, e.g. from previous iterations.  If passed, lazy-greedy
+                pruning is used: cases are scored in order of decreasing bound
+                until no remaining bound exceeds the best reduction.  The
+                bounds of the scored cases are updated in place.
+
+        Returns:
+            tuple containing
+
+            - **int**: the index of the best case in `case_idxs` (`None` if no cases)
+            - **float**: the variance reduction of the best case
+
+        """
+        if len(case_idxs) == 0:
+            return None, 0.0
+        if bounds is None:
+            quad = self.score_idxs(case_idxs)[:, iforecast]
+            ibest = int(np.argmax(quad))
+            return ibest, quad[ibest]
+        ibest, best = None, -np.inf
+        for i in np.argsort(-bounds, kind="stable"):
+            if bounds[i] <= best:
+                break
+            bounds[i] = self.score_idxs([case_idxs[i]])[0, iforecast]
+            if bounds[i] > best:
+                ibest, best = int(i), bounds[i]
+        return ibest, best
+
+    def score(self, obslist_dict, sign=1.0, num_workers=None):
+        """get the forecast variances resulting from adding (`sign` = 1.0) or
+        removing (`sign` = -1.0) the observations in each case of `obslist_dict`
+        to/from the reference parameter covariance matrix
+
+        Args:
+            obslist_dict (`dict`): case names and lists of observations
+            sign (`float`): 1.0 to add observations, -1.0 to remove them
+            num_workers (`int`): number of processes to score the cases
+                with.  If `None` or 1, the cases are scored in this process
+
+        Returns:
+            `pandas.DataFrame`: forecast variances with an index of cases and
+            columns of forecast names
+
+        """
+        case_idxs = self.get_case_idxs(obslist_dict)
+        if num_workers is not None and num_workers > 1 and len(case_idxs) > 1:
+            import multiprocessing as mp
+
+            chunks = np.array_split(np.arange(len(case_idxs)), num_workers)
+            chunks = [chunk for chunk in chunks if chunk.shape[0] > 0]
+            pool = mp.Pool(processes=len(chunks))
+            try:
+                async_results = []
+                for chunk in chunks:
+                    # only send the rows needed by the cases in this chunk
+                    rows = np.unique(np.concatenate([case_idxs[i] for i in chunk]))
+                    chunk_idxs = [np.searchsorted(rows, case_idxs[i]) for i in chunk]
+                    async_results.append(
+                        pool.apply_async(
+                            _score_obs_cases,
+                            args=(
+                                chunk_idxs,
+                                self.w[rows],
+                                self.x[rows],
+                                self.obsvar[rows],
+                                self.b[rows],
+                                sign,
+                            ),
+                        )
+                    )
+                quad = np.vstack([r.get() for r in async_results])
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            quad = _score_obs_cases(
+                case_idxs, self.w, self.x, self.obsvar, self.b, sign
+            )
+        return pd.DataFrame(
+            self.var - sign * quad,
+            index=list(obslist_dict.keys()),
+            columns=self.forecast_names,
+        )
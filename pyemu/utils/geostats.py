@@ -13,6 +13,7 @@ from pyemu.utils.pp_utils import pp_file_to_dataframe
 from ..pyemu_warnings import PyemuWarning
 
 EPSILON = 1.0e-7
+BINARY_FACTORS_MAGIC = b"PYEMUFAC"
 
 # class KrigeFactors(pd.DataFrame):
 #     def __init__(self,*args,**kwargs):
@@ -131,9 +132,9 @@ class GeoStruct(object):
             y ([`float`]): y-coordinate locations
             names ([`str`] (optional)): names of location. If None,
                 cov must not be None.  Default is None.
-            cov (`pyemu.Cov`): an existing Cov instance.  The contribution
-                of this GeoStruct is added to cov.  If cov is None,
-                names must not be None. Default is None
+            cov (`pyemu.Cov`): an existing (non-diagonal) Cov instance.  The
+                contribution of this GeoStruct is added to cov in place.  If cov
+                is None, names must not be None. Default is None
 
         Returns:
             `pyemu.Cov`: the covariance matrix implied by this
@@ -168,17 +169,16 @@ class GeoStruct(object):
         elif cov is not None:
             assert cov.shape[0] == x.shape[0]
             names = cov.row_names
-            c = np.zeros((len(names), 1))
-            c += self.nugget
-            cont = Cov(x=c, names=names, isdiagonal=True)
-            cov += cont
+            # add to the diagonal of cov in place
+            idx = np.arange(len(names))
+            cov.x[idx, idx] += self.nugget
 
         else:
             raise Exception(
                 "GeoStruct.covariance_matrix() requires either " + "names or cov arg"
             )
         for v in self.variograms:
-            v.covariance_matrix(x, y, cov=cov)
+            cov = v.covariance_matrix(x, y, cov=cov)
         return cov
 
     def covariance(self, pt0, pt1):
@@ -872,6 +872,7 @@ class OrdinaryKrige(object):
         var_filename=None,
         forgive=False,
         num_threads=1,
+        use_kdtree=False,
     ):
         """calculate kriging factors (weights) for a structured grid.
 
@@ -905,6 +906,8 @@ class OrdinaryKrige(object):
                 is raised for failed matrix inversion.
             num_threads (`int`): number of multiprocessing workers to use to try to speed up
                 kriging in python.  Default is 1.
+            use_kdtree (`bool`): flag to use the kd-tree neighbor search and batched
+                solution engine.  See `OrdinaryKrige.calc_factors()`. Default is False
 
         Returns:
             `pandas.DataFrame`: a dataframe with information summarizing the ordinary kriging
@@ -958,6 +961,7 @@ class OrdinaryKrige(object):
                 verbose=verbose,
                 forgive=forgive,
                 num_threads=num_threads,
+                use_kdtree=use_kdtree,
             )
 
             if var_filename is not None:
@@ -1003,6 +1007,7 @@ class OrdinaryKrige(object):
                     pt_zone=pt_data_zone,
                     forgive=forgive,
                     num_threads=num_threads,
+                    use_kdtree=use_kdtree,
                 )
 
                 dfs.append(df)
@@ -1110,6 +1115,7 @@ class OrdinaryKrige(object):
         num_threads=1,
         idx_vals=None,
         remove_negative_factors=True,
+        use_kdtree=False,
     ):
         """calculate ordinary kriging factors (weights) for the points
         represented by arguments x and y
@@ -1141,13 +1147,19 @@ class OrdinaryKrige(object):
                 used to set the proper node number in the factors file for unstructured grids.
             remove_negative_factors (`bool`): option to remove negative Kriging factors, following the method of
                 Deutsch (1996) https://doi.org/10.1016/0098-3004(96)00005-2. Default is True
+            use_kdtree (`bool`): flag to find the `maxpts_interp` nearest point data entries for all
+                interpolation points with a `scipy.spatial.cKDTree` and to solve the kriging
+                systems of interpolation points that share the same neighbors together.  If
+                `num_threads` > 1, contiguous chunks of interpolation points are processed
+                in a `multiprocessing.Pool`.  Requires scipy.  Default is False
         Returns:
             `pandas.DataFrame`: a dataframe with information summarizing the ordinary kriging
             process for each interpolation points
 
         Note:
             this method calls either `OrdinaryKrige.calc_factors_org()` or
-            `OrdinaryKrige.calc_factors_mp()` depending on the value of `num_threads`
+            `OrdinaryKrige.calc_factors_mp()` depending on the value of `num_threads`, or
+            `OrdinaryKrige._calc_factors_kdtree()` if `use_kdtree` is True
 
         Example::
 
@@ -1186,6 +1198,21 @@ class OrdinaryKrige(object):
             pty_array = pt_data.loc[pt_data.zone == pt_zone, "y"].values
             ptnames = pt_data.loc[pt_data.zone == pt_zone, "name"].values
             # pt_data = pt_data.loc[ptnames]
+        if use_kdtree:
+            return self._calc_factors_kdtree(
+                df,
+                ptx_array,
+                pty_array,
+                ptnames,
+                minpts_interp,
+                maxpts_interp,
+                search_radius,
+                verbose,
+                pt_zone,
+                forgive,
+                num_threads,
+                remove_negative_factors,
+            )
         if num_threads == 1:
             return self._calc_factors_org(
                 df,
@@ -1570,8 +1597,202 @@ class OrdinaryKrige(object):
             #     td = (datetime.now()-start).total_seconds()
             #     print("...took {0}".format(td))
 
+    def _calc_factors_kdtree(
+        self,
+        df,
+        ptx_array,
+        pty_array,
+        ptnames,
+        minpts_interp=1,
+        maxpts_interp=20,
+        search_radius=1.0e10,
+        verbose=False,
+        pt_zone=None,
+        forgive=False,
+        num_threads=1,
+        remove_negative_factors=True,
+    ):
+        """private: kd-tree neighbor search and batched kriging solutions"""
+        from scipy.spatial import cKDTree
+
+        print("starting kdtree interp for {0} points".format(df.shape[0]))
+        start_loop = datetime.now()
+        ptnames = np.asarray(ptnames)
+        ix = df.x.values.astype(np.float64)
+        iy = df.y.values.astype(np.float64)
+        npts = ptnames.shape[0]
+        k = min(maxpts_interp, npts)
+        nbr_idx = np.zeros((ix.shape[0], k), dtype=np.int64) + npts
+        nbr_dist = np.zeros((ix.shape[0], k)) + np.inf
+        valid = ~(np.isnan(ix) | np.isnan(iy))
+        if k > 0 and valid.any():
+            tree = cKDTree(np.column_stack([ptx_array, pty_array]))
+            dist, idx = tree.query(
+                np.column_stack([ix[valid], iy[valid]]),
+                k=k,
+                distance_upper_bound=np.nextafter(search_radius, np.inf),
+            )
+            nbr_dist[valid] = dist.reshape((-1, k))
+            nbr_idx[valid] = idx.reshape((-1, k))
+        if verbose:
+            td = (datetime.now() - start_loop).total_seconds()
+            print("neighbor search took {0} seconds".format(td))
+
+        point_cov_data = self.point_cov_df.loc[ptnames, ptnames].values
+        args = (
+            np.asarray(ptx_array, dtype=np.float64),
+            np.asarray(pty_array, dtype=np.float64),
+            point_cov_data,
+            self.geostruct,
+            EPSILON,
+            minpts_interp,
+            forgive,
+        )
+        chunks = np.array_split(np.arange(ix.shape[0]), max(1, num_threads))
+        chunks = [c for c in chunks if c.shape[0] > 0]
+        if len(chunks) <= 1:
+            results = [
+                OrdinaryKrige._kdtree_worker(
+                    ix, iy, nbr_idx, nbr_dist, valid, *args
+                )
+            ]
+        else:
+            pool = mp.Pool(processes=min(num_threads, len(chunks)))
+            x = [
+                pool.apply_async(
+                    OrdinaryKrige._kdtree_worker,
+                    args=(ix[c], iy[c], nbr_idx[c], nbr_dist[c], valid[c]) + args,
+                )
+                for c in chunks
+            ]
+            results = [xx.get() for xx in x]
+            pool.close()
+            pool.join()
+        count = np.concatenate([r[0] for r in results])
+        nbr_idx = np.concatenate([r[1] for r in results])
+        nbr_dist = np.concatenate([r[2] for r in results])
+        facs = np.concatenate([r[3] for r in results])
+        err_var = np.concatenate([r[4] for r in results])
+
+        inames, idist, ifacts = [], [], []
+        for c, i, d, f in zip(count, nbr_idx, nbr_dist, facs):
+            inames.append(ptnames[i[:c]])
+            idist.append(d[:c])
+            ifacts.append(f[:c])
+        df["idist"] = idist
+        df["inames"] = inames
+        df["ifacts"] = ifacts
+        df["err_var"] = err_var
+
+        if pt_zone is None:
+            self.interp_data = df
+        else:
+            if self.interp_data is None:
+                self.interp_data = df
+            else:
+                self.interp_data = pd.concat([self.interp_data, df])
+        # correct for negative kriging factors, if requested
+        if remove_negative_factors == True:
+            self._remove_neg_factors()
+        td = (datetime.now() - start_loop).total_seconds()
+        print("took {0} seconds".format(td))
+        return df
+
+    @staticmethod
+    def _kdtree_worker(
+        ix,
+        iy,
+        nbr_idx,
+        nbr_dist,
+        valid,
+        ptx_array,
+        pty_array,
+        full_point_cov,
+        geostruct,
+        epsilon,
+        minpts_interp,
+        forgive,
+        batch_size=10000,
+    ):
+        """private: solve the kriging systems for a contiguous chunk of interpolation
+        points.  Points with the same neighbor set share one (batched) inverse of the
+        kriging matrix.  Returns plain arrays of the number of factors, neighbor indices
+        and distances, factors (in nearest-first order) and kriging variance"""
+        sill = geostruct.sill
+        npts = ptx_array.shape[0]
+        count = np.isfinite(nbr_dist).sum(axis=1)
+        facs = np.zeros(nbr_dist.shape)
+        err_var = np.zeros(ix.shape[0]) + np.NaN
+        err_var[valid] = sill
+        count[count < minpts_interp] = 0
+        count[~valid] = 0
+        # if one of the points is super close, just use it and skip
+        close = (count > 0) & (nbr_dist[:, 0] <= epsilon)
+        count[close] = 1
+        facs[close, 0] = 1.0
+        nbr_dist[close, 0] = epsilon
+        err_var[close] = geostruct.nugget
+        solve = (count > 0) & ~close
+        for m in np.unique(count[solve]):
+            rows = np.where(solve & (count == m))[0]
+            order = np.argsort(nbr_idx[rows, :m], axis=1)
+            nbr_set = np.take_along_axis(nbr_idx[rows, :m], order, axis=1)
+            uset, inv = np.unique(nbr_set, axis=0, return_inverse=True)
+            inv = inv.reshape(-1)
+            # form the kriging matrices for each unique neighbor set
+            A = np.ones((uset.shape[0], m + 1, m + 1))
+            A[:, :m, :m] = full_point_cov[uset[:, :, None], uset[:, None, :]]
+            A[:, m, m] = 0.0  # unbiaised constraint
+            ok = np.ones(uset.shape[0], dtype=bool)
+            try:
+                Ainv = np.linalg.inv(A)
+            except np.linalg.LinAlgError:
+                Ainv = np.zeros_like(A)
+                for i in range(A.shape[0]):
+                    try:
+                        Ainv[i] = np.linalg.inv(A[i])
+                    except np.linalg.LinAlgError as e:
+                        if not forgive:
+                            raise Exception(
+                                "error solving for factors:{0}".format(str(e))
+                            )
+                        print("error solving for factors: {0}".format(str(e)))
+                        ok[i] = False
+            for start in range(0, rows.shape[0], batch_size):
+                brows = rows[start : start + batch_size]
+                bset = nbr_set[start : start + batch_size]
+                binv = inv[start : start + batch_size]
+                # the interp point to points covariance
+                rhs = np.ones((brows.shape[0], m + 1))
+                rhs[:, :m] = geostruct.covariance_points(
+                    np.repeat(ix[brows], m),
+                    np.repeat(iy[brows], m),
+                    ptx_array[bset.ravel()],
+                    pty_array[bset.ravel()],
+                ).reshape((-1, m))
+                bfacs = np.einsum("pij,pj->pi", Ainv[binv], rhs)
+                err_var[brows] = (
+                    sill + bfacs[:, m] - (bfacs[:, :m] * rhs[:, :m]).sum(axis=1)
+                )
+                # back to nearest-first order
+                bfacs_d = np.zeros((brows.shape[0], m))
+                np.put_along_axis(
+                    bfacs_d, order[start : start + batch_size], bfacs[:, :m], axis=1
+                )
+                facs[brows, :m] = bfacs_d
+            failed = rows[~ok[inv]]
+            count[failed] = 0
+            err_var[failed] = np.NaN
+        nbr_idx[count == 0] = npts
+        return count, nbr_idx, nbr_dist, facs, err_var
+
     def to_grid_factors_file(
-        self, filename, points_file="points.junk", zone_file="zone.junk", ncol=None
+        self,
+        filename,
+        points_file="points.junk",
+        zone_file="zone.junk",
+        ncol=None,
+        binary=False,
     ):
         """write a PEST-style factors file.  This file can be used with
         the fac2real() method to write an interpolated structured or unstructured array
@@ -1587,28 +1808,22 @@ class OrdinaryKrige(object):
                 from the spatial reference and should only be passed for unstructured grids -
                 it should be equal to the number of nodes in the current property file. Default is None.
                 Required for unstructured grid models.
+            binary (`bool`): flag to write the compact binary factors format instead of
+                the PEST-style ASCII format.  The binary format is read by `fac2real()`,
+                `fac2real_ensemble()` and `compile_factors()` but not by the PEST
+                utilities.  Requires scipy.  Default is False
 
         Note:
             this method should be called after OrdinaryKrige.calc_factors_grid() for structured
             models or after OrdinaryKrige.calc_factors() for unstructured models.
 
         """
-        if self.interp_data is None:
-            raise Exception(
-                "ok.interp_data is None, must call calc_factors_grid() first"
+        if binary:
+            _write_binary_factors(
+                filename, self.to_sparse_factors(ncol), points_file, zone_file
             )
-        if self.spatial_reference is None:
-            print(
-                "OrdinaryKrige.to_grid_factors_file(): spatial_reference attr is None, assuming unstructured grid"
-            )
-            if ncol is None:
-                raise Exception("'ncol' arg must be passed for unstructured grids")
-            nrow = 1
-            if ncol < self.interp_data.shape[0]:
-                raise Exception("something is wrong")
-        else:
-            nrow = self.spatial_reference.nrow
-            ncol = self.spatial_reference.ncol
+            return
+        nrow, ncol = self._factors_grid_shape(ncol)
         with open(filename, "w") as f:
             f.write(points_file + "\n")
             f.write(zone_file + "\n")
@@ -1632,6 +1847,135 @@ class OrdinaryKrige(object):
                 ]
                 f.write("\n")
 
+    def _factors_grid_shape(self, ncol=None):
+        """private method to get the (nrow, ncol) of the grid that
+        the factors are written for"""
+        if self.interp_data is None:
+            raise Exception(
+                "ok.interp_data is None, must call calc_factors_grid() first"
+            )
+        if self.spatial_reference is None:
+            print(
+                "OrdinaryKrige.to_grid_factors_file(): spatial_reference attr is None, assuming unstructured grid"
+            )
+            if ncol is None:
+                raise Exception("'ncol' arg must be passed for unstructured grids")
+            nrow = 1
+            if ncol < self.interp_data.shape[0]:
+                raise Exception("something is wrong")
+        else:
+            nrow = self.spatial_reference.nrow
+            ncol = self.spatial_reference.ncol
+        return nrow, ncol
+
+    def to_sparse_factors(self, ncol=None):
+        """get the kriging factors as a sparse interpolation operator - the
+        in-memory equivalent of `to_grid_factors_file()` and `compile_factors()`
+
+        Args:
+            ncol (`int`): column value of the grid.  Only required for unstructured grids
+                (see `to_grid_factors_file()`).  Default is None
+
+        Returns:
+            `dict`: the compiled factors, with a (number of interpolated nodes by number
+            of points) `scipy.sparse` csr matrix of weights ("weights"), the
+            zero-based grid node indices ("nodes"), the log-transform mask ("log"),
+            the point names ("pp_names") and the grid dimensions ("nrow", "ncol", "npp")
+
+        Note:
+            Requires scipy
+
+        """
+        import scipy.sparse as sparse
+
+        nrow, ncol = self._factors_grid_shape(ncol)
+        pt_names = list(self.point_data.name)
+        pt_idx = {name: i for i, name in enumerate(pt_names)}
+        nodes, rows, cols, weights = [], [], [], []
+        for idx, names, facts in zip(
+            self.interp_data.index, self.interp_data.inames, self.interp_data.ifacts
+        ):
+            if len(facts) == 0:
+                continue
+            rows.extend([len(nodes)] * len(facts))
+            nodes.append(int(idx))
+            cols.extend([pt_idx[name] for name in names])
+            weights.extend(facts)
+        npp = len(pt_names)
+        w = sparse.csr_matrix(
+            (
+                np.array(weights, dtype=np.float64),
+                (np.array(rows, dtype=np.int64), np.array(cols, dtype=np.int64)),
+            ),
+            shape=(len(nodes), npp),
+        )
+        log = np.zeros(len(nodes), dtype=bool)
+        if self.geostruct.transform == "log":
+            log[:] = True
+        return {
+            "weights": w,
+            "nodes": np.array(nodes, dtype=np.int64),
+            "log": log,
+            "pp_names": [str(name).lower() for name in pt_names],
+            "nrow": nrow,
+            "ncol": ncol,
+            "npp": npp,
+        }
+
+    def ensemble_to_grid(
+        self,
+        pe,
+        par_names=None,
+        out_file=None,
+        ncol=None,
+        upper_lim=1.0e30,
+        lower_lim=-1.0e30,
+        fill_value=1.0e30,
+    ):
+        """interpolate every realization of a parameter ensemble to the grid
+        with the kriging factors in a single sparse matrix product
+
+        Args:
+            pe (`pyemu.ParameterEnsemble` or `pandas.DataFrame`): ensemble with
+                the point values
+            par_names ([`str`] or `dict`): the ensemble columns that hold the
+                values of `OrdinaryKrige.point_data` entries (in the same order), or a dict
+                of point name to column name.  If None, the point names are used.
+                Default is None
+            out_file (`str`): filename template with a "{0}" placeholder for the
+                realization name.  If None, the arrays are returned.  Default is None
+            ncol (`int`): column value of the grid.  Only required for unstructured grids.
+            upper_lim (`float`): maximum interpolated value in the arrays
+            lower_lim (`float`): minimum interpolated value in the arrays
+            fill_value (`float`): the value to assign array nodes that are not interpolated
+
+        Returns:
+            `numpy.ndarray`: a 3-D (nreal, nrow, ncol) array if `out_file` is None
+
+            [`str`]: the filenames written if `out_file` is not None
+
+        Note:
+            should be called after `OrdinaryKrige.calc_factors_grid()` or
+            `OrdinaryKrige.calc_factors()`. See `fac2real_ensemble()` to use an
+            existing factors file.
+
+        Example::
+
+            ok.calc_factors_grid(sr)
+            pe = pyemu.ParameterEnsemble.from_gaussian_draw(pst,cov=cov)
+            arrs = ok.ensemble_to_grid(pe,par_names=pp_df.parnme.tolist())
+
+        """
+        return _ensemble_to_grid(
+            self.to_sparse_factors(ncol),
+            pe,
+            par_names,
+            out_file,
+            upper_lim,
+            lower_lim,
+            fill_value,
+        )
+
 
 class Vario2d(object):
     """base class for 2-D variograms.
@@ -1763,8 +2107,8 @@ class Vario2d(object):
             x ([`float`]): x-coordinate locations
             y ([`float`]): y-coordinate locations
             names ([`str`]): names of locations. If None, cov must not be None
-            cov (`pyemu.Cov`): an existing Cov instance.  Vario2d contribution is added to cov
-            in place
+            cov (`pyemu.Cov`): an existing (non-diagonal) Cov instance.  Vario2d contribution
+                is added to cov in place
 
         Returns:
             `pyemu.Cov`: the covariance matrix for `x`, `y` implied by `Vario2d`
@@ -1787,9 +2131,9 @@ class Vario2d(object):
         elif cov is not None:
             assert cov.shape[0] == x.shape[0]
             names = cov.row_names
-            c = np.zeros((len(names), 1)) + self.contribution
-            cont = Cov(x=c, names=names, isdiagonal=True)
-            cov += cont
+            # add to the diagonal of cov in place
+            idx = np.arange(len(names))
+            cov.x[idx, idx] += self.contribution
 
         else:
             raise Exception(
@@ -2315,6 +2659,7 @@ def fac2real(
     upper_lim=1.0e30,
     lower_lim=-1.0e30,
     fill_value=1.0e30,
+    compiled=True,
 ):
     """A python replication of the PEST fac2real utility for creating a
     structure grid array from previously calculated kriging factors (weights)
@@ -2329,6 +2674,13 @@ def fac2real(
         lower_lim (`float`): minimum interpolated value in the array.  Values less than
             `lower_lim` are set to fill_value
         fill_value (`float`): the value to assign array nodes that are not interpolated
+        compiled (`bool`): flag to use the compiled sparse form of the factors
+            file (see `compile_factors()`).  The compiled form is created and saved
+            next to `factors_file` the first time it is needed (or just used in
+            memory if it can't be saved there).  If False, or if
+            scipy is not available, the factors file is parsed line by line.
+            Binary factors files (see `OrdinaryKrige.to_grid_factors_file()`) are
+            always read directly.  Default is True
 
 
     Returns:
@@ -2359,6 +2711,26 @@ def fac2real(
             )
         )
     assert os.path.exists(factors_file), "factors file not found"
+    if compiled or _is_binary_factors(factors_file):
+        try:
+            factors = _load_compiled_factors(factors_file)
+        except ImportError:
+            if _is_binary_factors(factors_file):
+                raise
+            factors = None
+        if factors is not None:
+            _check_factor_pp_names(factors["pp_names"], pp_data)
+            arr = _apply_compiled_factors(
+                factors, _factor_pp_values(pp_data, factors["npp"]), fill_value
+            )
+            arr = arr.reshape((factors["nrow"], factors["ncol"]))
+            arr[arr < lower_lim] = lower_lim
+            arr[arr > upper_lim] = upper_lim
+            if out_file is not None:
+                np.savetxt(out_file, arr, fmt="%15.6E", delimiter="")
+                return out_file
+            return arr
+
     f_fac = open(factors_file, "r")
     fpp_file = f_fac.readline()
     if pp_file is None and pp_data is None:
@@ -2371,13 +2743,7 @@ def fac2real(
     pp_names = [f_fac.readline().strip().lower() for _ in range(npp)]
 
     # check that pp_names is sync'd with pp_data
-    diff = set(list(pp_data.name)).symmetric_difference(set(pp_names))
-    if len(diff) > 0:
-        raise Exception(
-            "the following pilot point names are not common "
-            + "between the factors file and the pilot points file "
-            + ",".join(list(diff))
-        )
+    _check_factor_pp_names(pp_names, pp_data)
 
     arr = np.zeros((nrow, ncol), dtype=np.float64) + fill_value
     pp_dict = {int(name): val for name, val in zip(pp_data.index, pp_data.parval1)}
@@ -2422,6 +2788,107 @@ def fac2real(
     return arr
 
 
+def fac2real_ensemble(
+    pe,
+    factors_file="factors.dat",
+    par_names=None,
+    out_file=None,
+    upper_lim=1.0e30,
+    lower_lim=-1.0e30,
+    fill_value=1.0e30,
+):
+    """interpolate every realization of a parameter ensemble with previously
+    calculated kriging factors (weights) in a single sparse matrix product.
+    The ensemble equivalent of `fac2real()`
+
+    Args:
+        pe (`pyemu.ParameterEnsemble` or `pandas.DataFrame`): ensemble with the
+            pilot point values.  A transformed `ParameterEnsemble` is back
+            transformed (for the pilot point columns only) before interpolation
+        factors_file (`str`): PEST-style factors file
+        par_names ([`str`] or `dict`): the ensemble columns that hold the pilot
+            point values, in the same order as the pilot points in `factors_file`,
+            or a dict of pilot point name to column name.  If None, the pilot point names
+            in `factors_file` are used.  Default is None
+        out_file (`str`): filename template with a "{0}" placeholder for the
+            realization name.  If None, the arrays are returned.  Default is None
+        upper_lim (`float`): maximum interpolated value in the arrays
+        lower_lim (`float`): minimum interpolated value in the arrays
+        fill_value (`float`): the value to assign array nodes that are not interpolated
+
+    Returns:
+        `numpy.ndarray`: a 3-D (nreal, nrow, ncol) array if `out_file` is None
+
+        [`str`]: the filenames written if `out_file` is not None
+
+    Note:
+        uses (and creates if needed) the compiled form of `factors_file` - see
+        `compile_factors()`.  Requires scipy
+
+    Example::
+
+        pe = pyemu.ParameterEnsemble.from_binary(pst,"prior.jcb")
+        arrs = pyemu.geostats.fac2real_ensemble(pe,"hk_layer_1.fac",
+                                                par_names=pp_df.parnme.tolist())
+
+    """
+    assert os.path.exists(factors_file), "factors file not found"
+    return _ensemble_to_grid(
+        _load_compiled_factors(factors_file),
+        pe,
+        par_names,
+        out_file,
+        upper_lim,
+        lower_lim,
+        fill_value,
+    )
+
+
+def _ensemble_to_grid(
+    factors, pe, par_names, out_file, upper_lim, lower_lim, fill_value
+):
+    """apply compiled factors to the realizations of an ensemble.
+    Used by fac2real_ensemble() and OrdinaryKrige.ensemble_to_grid()"""
+    pp_names = factors["pp_names"]
+    if par_names is None:
+        par_names = pp_names
+    elif isinstance(par_names, dict):
+        par_names = [par_names[name] for name in pp_names]
+    par_names = [str(name).lower() for name in par_names]
+    if len(par_names) != len(pp_names):
+        raise Exception(
+            "len(par_names) ({0}) != number of points in factors ({1})".format(
+                len(par_names), len(pp_names)
+            )
+        )
+    if isinstance(pe, pd.DataFrame):
+        df, istransformed = pe, False
+    else:
+        df, istransformed = pe._df, pe.istransformed
+    missing = set(par_names) - set(df.columns)
+    if len(missing) > 0:
+        raise Exception(
+            "the following par_names are not in the ensemble: "
+            + ",".join(sorted(missing))
+        )
+    vals = df.loc[:, par_names].values.astype(np.float64)
+    if istransformed:
+        log = (pe.pst.parameter_data.loc[par_names, "partrans"] == "log").values
+        vals[:, log] = 10.0 ** vals[:, log]
+    arr = _apply_compiled_factors(factors, vals.T, fill_value)
+    arr = arr.T.reshape((df.shape[0], factors["nrow"], factors["ncol"]))
+    arr[arr < lower_lim] = lower_lim
+    arr[arr > upper_lim] = upper_lim
+    if out_file is None:
+        return arr
+    out_files = []
+    for real, real_arr in zip(df.index, arr):
+        filename = out_file.format(real)
+        np.savetxt(filename, real_arr, fmt="%15.6E", delimiter="")
+        out_files.append(filename)
+    return out_files
+
+
 def _parse_factor_line(line):
     """function to parse a factor file line.  Used by fac2real()"""
 
@@ -2436,3 +2903,284 @@ def _parse_factor_line(line):
     #     fac = float(raw[ifac+1])
     #     fac_data[pnum] = fac
     return inode, itrans, fac_data
+
+
+def _check_factor_pp_names(pp_names, pp_data):
+    """check that the pilot point names in a factors file are sync'd
+    with the pilot point dataframe.  Used by fac2real()"""
+    diff = set(list(pp_data.name)).symmetric_difference(set(pp_names))
+    if len(diff) > 0:
+        raise Exception(
+            "the following pilot point names are not common "
+            + "between the factors file and the pilot points file "
+            + ",".join(list(diff))
+        )
+
+
+def _factor_pp_values(pp_data, npp):
+    """get the pilot point values in factors file order (the integer index
+    of `pp_data`).  Used by fac2real()"""
+    vals = np.zeros(npp, dtype=np.float64) + np.nan
+    for name, val in zip(pp_data.index, pp_data.parval1):
+        if 0 <= int(name) < npp:
+            vals[int(name)] = val
+    return vals
+
+
+def compile_factors(factors_file, compiled_file=None):
+    """compile a PEST-style factors file into a sparse interpolation operator.
+    The operator is a (number of interpolated nodes by number of pilot points)
+    `scipy.sparse` csr matrix of kriging weights, plus the node indices and
+    log-transform mask, saved in numpy npz format.
+
+    Args:
+        factors_file (`str`): PEST-style (or binary) factors file
+        compiled_file (`str`): the npz file to save the compiled factors to.  If None,
+            `factors_file` + ".npz" is used, which is where `fac2real()` looks
+            for it.  Default is None.
+
+    Returns:
+        `str`: the name of the compiled factors file
+
+    Note:
+        The size and modification time (in nanoseconds) of `factors_file` are stored
+        in the compiled file so that `fac2real()` can detect (and rebuild) a stale
+        compiled file.
+
+        Requires scipy
+
+    Example::
+
+        pyemu.geostats.compile_factors("hk_layer_1.fac")
+        pyemu.geostats.fac2real("hkpp.dat","hk_layer_1.fac",out_file="hk_layer_1.ref")
+
+    """
+    if compiled_file is None:
+        compiled_file = factors_file + ".npz"
+    stat = os.stat(factors_file)
+    if _is_binary_factors(factors_file):
+        factors = _read_binary_factors(factors_file)
+    else:
+        factors = _read_ascii_factors(factors_file)
+    w = factors["weights"]
+    tmp_file = "{0}.{1}.tmp.npz".format(compiled_file, os.getpid())
+    try:
+        np.savez(
+            tmp_file,
+            data=w.data,
+            indices=w.indices,
+            indptr=w.indptr,
+            nodes=factors["nodes"],
+            log=factors["log"],
+            pp_names=np.array(factors["pp_names"]),
+            grid=np.array(
+                [factors["nrow"], factors["ncol"], factors["npp"]], dtype=np.int64
+            ),
+            source=np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64),
+        )
+        os.replace(tmp_file, compiled_file)
+    except OSError:
+        if os.path.isfile(tmp_file):
+            os.remove(tmp_file)
+        raise
+    return compiled_file
+
+
+def _read_ascii_factors(factors_file):
+    """read a PEST-style factors file into a sparse interpolation operator.
+    Used by compile_factors()"""
+    import scipy.sparse as sparse
+
+    nodes, itrans, rows, cols, weights = [], [], [], [], []
+    with open(factors_file, "r") as f:
+        f.readline()
+        f.readline()
+        ncol, nrow = [int(i) for i in f.readline().strip().split()]
+        npp = int(f.readline().strip())
+        pp_names = [f.readline().strip().lower() for _ in range(npp)]
+        for line in f:
+            raw = line.strip().split()
+            if len(raw) == 0:
+                continue
+            try:
+                nfac = int(raw[2])
+                nodes.append(int(raw[0]) - 1)
+                itrans.append(int(raw[1]))
+                cols.extend(raw[4 : 4 + nfac * 2 : 2])
+                weights.extend(raw[5 : 5 + nfac * 2 : 2])
+            except Exception as e:
+                raise Exception(
+                    "error parsing factor line {0}:{1}".format(line, str(e))
+                )
+            rows.extend([len(nodes) - 1] * nfac)
+    nodes = np.array(nodes, dtype=np.int64)
+    itrans = np.array(itrans, dtype=np.int64)
+    rows = np.array(rows, dtype=np.int64)
+    cols = np.array(cols, dtype=np.int64) - 1
+    weights = np.array(weights, dtype=np.float64)
+    # the last line for a node wins, same as the line by line fac2real
+    unodes, ulast = np.unique(nodes[::-1], return_index=True)
+    keep = np.zeros(nodes.shape[0], dtype=bool)
+    keep[nodes.shape[0] - 1 - ulast] = True
+    rmap = np.cumsum(keep) - 1
+    rkeep = keep[rows]
+    w = sparse.csr_matrix(
+        (weights[rkeep], (rmap[rows[rkeep]], cols[rkeep])),
+        shape=(int(keep.sum()), npp),
+    )
+    return {
+        "weights": w,
+        "nodes": nodes[keep],
+        "log": itrans[keep] != 0,
+        "pp_names": pp_names,
+        "nrow": nrow,
+        "ncol": ncol,
+        "npp": npp,
+    }
+
+
+def _is_binary_factors(factors_file):
+    """check if a factors file is in the binary factors format"""
+    with open(factors_file, "rb") as f:
+        return f.read(len(BINARY_FACTORS_MAGIC)) == BINARY_FACTORS_MAGIC
+
+
+def _write_binary_factors(filename, factors, points_file="", zone_file=""):
+    """write the compiled factors in the binary factors format.  The format is:
+
+    - header: the magic string, format version (int32), the length-prefixed
+      points and zone filenames, then nrow, ncol, number of points, number of
+      nodes and number of factors (int64)
+    - the point name width (int32) and the fixed-width point names
+    - zero-based node indices (int64), transform flags (int8) and row
+      offsets into the factors (int64, number of nodes + 1)
+    - point indices (int32) and factors (float64)
+
+    Used by OrdinaryKrige.to_grid_factors_file()"""
+    w = factors["weights"].tocsr()
+    w.sort_indices()
+    names = np.array([str(name) for name in factors["pp_names"]])
+    width = max(1, int(np.char.str_len(names).max())) if names.shape[0] > 0 else 1
+    with open(filename, "wb") as f:
+        f.write(BINARY_FACTORS_MAGIC)
+        np.array([1], dtype="<i4").tofile(f)
+        for fname in [points_file, zone_file]:
+            fname = str(fname).encode()
+            np.array([len(fname)], dtype="<i4").tofile(f)
+            f.write(fname)
+        np.array(
+            [factors["nrow"], factors["ncol"], factors["npp"], w.shape[0], w.nnz],
+            dtype="<i8",
+        ).tofile(f)
+        np.array([width], dtype="<i4").tofile(f)
+        names.astype("S{0}".format(width)).tofile(f)
+        np.asarray(factors["nodes"], dtype="<i8").tofile(f)
+        np.asarray(factors["log"], dtype="i1").tofile(f)
+        w.indptr.astype("<i8").tofile(f)
+        w.indices.astype("<i4").tofile(f)
+        w.data.astype("<f8").tofile(f)
+
+
+def _read_binary_factors(factors_file):
+    """read a binary factors file into a sparse interpolation operator.
+    Used by fac2real() and compile_factors()"""
+    import scipy.sparse as sparse
+
+    with open(factors_file, "rb") as f:
+        if f.read(len(BINARY_FACTORS_MAGIC)) != BINARY_FACTORS_MAGIC:
+            raise Exception(
+                "'{0}' is not a binary factors file".format(factors_file)
+            )
+        version = int(np.fromfile(f, dtype="<i4", count=1)[0])
+        if version != 1:
+            raise Exception(
+                "unsupported binary factors file version {0}".format(version)
+            )
+        for _ in range(2):
+            f.read(int(np.fromfile(f, dtype="<i4", count=1)[0]))
+        nrow, ncol, npp, nnode, nnz = [
+            int(i) for i in np.fromfile(f, dtype="<i8", count=5)
+        ]
+        width = int(np.fromfile(f, dtype="<i4", count=1)[0])
+        pp_names = [
+            name.decode().strip().lower()
+            for name in np.fromfile(f, dtype="S{0}".format(width), count=npp)
+        ]
+        nodes = np.fromfile(f, dtype="<i8", count=nnode)
+        log = np.fromfile(f, dtype="i1", count=nnode) != 0
+        indptr = np.fromfile(f, dtype="<i8", count=nnode + 1)
+        indices = np.fromfile(f, dtype="<i4", count=nnz)
+        data = np.fromfile(f, dtype="<f8", count=nnz)
+    if data.shape[0] != nnz or len(pp_names) != npp or nodes.shape[0] != nnode:
+        raise Exception(
+            "incomplete binary factors file '{0}'".format(factors_file)
+        )
+    return {
+        "weights": sparse.csr_matrix((data, indices, indptr), shape=(nnode, npp)),
+        "nodes": nodes,
+        "log": log,
+        "pp_names": pp_names,
+        "nrow": nrow,
+        "ncol": ncol,
+        "npp": npp,
+    }
+
+
+def _load_compiled_factors(factors_file):
+    """load (and build if needed) the compiled form of a factors file.
+    Used by fac2real()"""
+    import scipy.sparse as sparse
+
+    if _is_binary_factors(factors_file):
+        return _read_binary_factors(factors_file)
+    compiled_file = factors_file + ".npz"
+    stat = os.stat(factors_file)
+    if os.path.exists(compiled_file):
+        with np.load(compiled_file) as data:
+            factors = {k: data[k] for k in data.files}
+        source = factors.get("source", None)
+        if (
+            source is None
+            or source.dtype != np.int64
+            or source.tolist() != [stat.st_size, stat.st_mtime_ns]
+        ):
+            factors = None
+    else:
+        factors = None
+    if factors is None:
+        try:
+            compile_factors(factors_file, compiled_file)
+        except OSError:
+            # the compiled file can't be written next to factors_file (e.g. a
+            # read-only directory), so just use the factors without saving them
+            return _read_ascii_factors(factors_file)
+        with np.load(compiled_file) as data:
+            factors = {k: data[k] for k in data.files}
+    nrow, ncol, npp = [int(i) for i in factors["grid"]]
+    factors["nrow"], factors["ncol"], factors["npp"] = nrow, ncol, npp
+    factors["pp_names"] = list(factors["pp_names"])
+    factors["weights"] = sparse.csr_matrix(
+        (factors.pop("data"), factors.pop("indices"), factors.pop("indptr")),
+        shape=(factors["nodes"].shape[0], npp),
+    )
+    return factors
+
+
+def _apply_compiled_factors(factors, pp_vals, fill_value):
+    """apply the compiled factors to pilot point values, one (npp) or many
+    (npp by nreal) columns.  Returns the flattened grid values.
+    Used by fac2real()"""
+    w, log = factors["weights"], factors["log"]
+    nnode = factors["nrow"] * factors["ncol"]
+    if log.all():
+        vals = 10 ** (w @ np.log10(pp_vals))
+    elif not log.any():
+        vals = w @ pp_vals
+    else:
+        if pp_vals.ndim > 1:
+            log = log[:, None]
+        with np.errstate(over="ignore"):
+            vals = np.where(log, 10 ** (w @ np.log10(pp_vals)), w @ pp_vals)
+    arr = np.zeros((nnode,) + pp_vals.shape[1:], dtype=np.float64) + fill_value
+    arr[factors["nodes"]] = vals
+    return arr
@@ -235,7 +235,7 @@ def autocorrelated_draw(pst,struct_dict,time_distance_col="distance",num_reals=1
 
 def geostatistical_draws(
     pst, struct_dict, num_reals=100, sigma_range=4, verbose=True,
-        scale_offset=True, subset=None
+        scale_offset=True, subset=None, num_workers=None, seed=None
 ):
     """construct a parameter ensemble from a prior covariance matrix
     implied by geostatistical structure(s) and parameter bounds.
@@ -259,6 +259,13 @@ def geostatistical_draws(
             Default is True.
         subset (`array-like`, optional): list, array, set or pandas index defining subset of paramters
             for draw.
+        num_workers (`int`, optional): number of processes used to build the covariance
+            matrices of, and draw, the geostatistical zones.  Passing `num_workers` (or `seed`)
+            draws each zone from its own random stream.  Default is None (serial draws
+            from `np.random`)
+        seed (`int` or `numpy.random.SeedSequence`, optional): seed for the random streams
+            of the zones.  The realizations are the same for any `num_workers`.  If None
+            and `num_workers` is passed, the seed is drawn from `np.random`.  Default is None
 
     Returns
         **pyemu.ParameterEnsemble**: the realized parameter ensemble.
@@ -266,6 +273,10 @@ def geostatistical_draws(
     Note:
         Parameters are realized by parameter group.
 
+        With `num_workers` or `seed`, each zone of each geostructure (and the remaining,
+        uncorrelated parameters) is drawn with a `numpy.random.Generator` spawned from
+        a `numpy.random.SeedSequence`.
+
         The variance of each parameter is used to scale the resulting geostatistical
         covariance matrix Therefore, the sill of the geostatistical structures
         in `struct_dict` should be 1.0
@@ -304,6 +315,7 @@ def geostatistical_draws(
     par = pst.parameter_data
     par_ens = []
     pars_in_cov = set()
+    zone_dfs = []
     keys = list(struct_dict.keys())
     keys.sort()
 
@@ -375,32 +387,39 @@ def geostatistical_draws(
 
                 # df_zone.sort_values(by="parnme",inplace=True)
                 df_zone.sort_index(inplace=True)
-                if verbose:
-                    print("build cov matrix")
-                cov = gs.covariance_matrix(df_zone.x, df_zone.y, df_zone.parnme)
-                if verbose:
-                    print("done")
-
-                if verbose:
-                    print("getting diag var cov", df_zone.shape[0])
-
-                # tpl_var = max([full_cov_dict[pn] for pn in df_zone.parnme])
-                if verbose:
-                    print("scaling full cov by diag var cov")
-
-                # for i in range(cov.shape[0]):
-                #     cov.x[i, :] *= tpl_var
-                for i, name in enumerate(cov.row_names):
-                    # print(name,full_cov_dict[name])
-                    cov.x[:, i] *= np.sqrt(full_cov_dict[name])
-                    cov.x[i, :] *= np.sqrt(full_cov_dict[name])
-                    cov.x[i, i] = full_cov_dict[name]
-                # no fixed values here
-                pe = pyemu.ParameterEnsemble.from_gaussian_draw(
-                    pst=pst, cov=cov, num_reals=num_reals, by_groups=False, fill=False
-                )
-                par_ens.append(pe._df)
-                pars_in_cov.update(set(pe.columns))
+                zone_dfs.append((gs, df_zone))
+
+    seed_seq = None
+    if num_workers is not None or seed is not None:
+        seed_seq = pyemu.en.Ensemble._get_seed_sequence(seed)
+        children = seed_seq.spawn(len(zone_dfs) + 1)
+        par_ens = _geostatistical_draws_stream(
+            pst, zone_dfs, full_cov_dict, num_reals, children[:-1], num_workers, verbose
+        )
+        for df in par_ens:
+            pars_in_cov.update(set(df.columns))
+    else:
+        for gs, df_zone in zone_dfs:
+            if verbose:
+                print("build cov matrix")
+            cov = gs.covariance_matrix(df_zone.x, df_zone.y, df_zone.parnme)
+            if verbose:
+                print("done")
+
+            if verbose:
+                print("getting diag var cov", df_zone.shape[0])
+
+            # tpl_var = max([full_cov_dict[pn] for pn in df_zone.parnme])
+            if verbose:
+                print("scaling full cov by diag var cov")
+
+            _scale_geostat_cov(cov.x, [full_cov_dict[name] for name in cov.row_names])
+            # no fixed values here
+            pe = pyemu.ParameterEnsemble.from_gaussian_draw(
+                pst=pst, cov=cov, num_reals=num_reals, by_groups=False, fill=False
+            )
+            par_ens.append(pe._df)
+            pars_in_cov.update(set(pe.columns))
 
     if verbose:
         print("adding remaining parameters to diagonal")
@@ -413,7 +432,11 @@ def geostatistical_draws(
         # cov = full_cov.get(diff,diff)
         # here we fill in the fixed values
         pe = pyemu.ParameterEnsemble.from_gaussian_draw(
-            pst, cov, num_reals=num_reals, fill=False
+            pst,
+            cov,
+            num_reals=num_reals,
+            fill=False,
+            seed=None if seed_seq is None else children[-1],
         )
         par_ens.append(pe._df)
     par_ens = pd.concat(par_ens, axis=1)
@@ -421,8 +444,75 @@ def geostatistical_draws(
     return par_ens
 
 
+def _scale_geostat_cov(x, variances):
+    """scale a (unit sill) geostatistical covariance matrix in place by the
+    standard deviations implied by `variances`, with `variances` on the diagonal"""
+    variances = np.asarray(variances, dtype=float)
+    std = np.sqrt(variances)
+    x *= std[:, None]
+    x *= std[None, :]
+    np.fill_diagonal(x, variances)
+
+
+def _geostatistical_draw_worker(gs, x, y, names, variances, num_reals, seed_seq):
+    """build, scale and draw from the covariance matrix of one geostatistical zone
+    using the random stream of `seed_seq`"""
+    cov = gs.covariance_matrix(x, y, names)
+    _scale_geostat_cov(cov.x, variances)
+    devs, _ = pyemu.en.Ensemble._draw_stream(cov.x, num_reals, seed_seq)
+    return devs
+
+
+def _geostatistical_draws_stream(
+    pst, zone_dfs, full_cov_dict, num_reals, seed_seqs, num_workers=None, verbose=True
+):
+    """draw the zones of `geostatistical_draws()`, each from its own random stream,
+    in a pool of `num_workers` processes if more than one.  Returns a list of
+    dataframes"""
+    tasks = []
+    for (gs, df_zone), seed_seq in zip(zone_dfs, seed_seqs):
+        names = df_zone.parnme.tolist()
+        variances = [full_cov_dict[name] for name in names]
+        tasks.append(
+            (gs, df_zone.x.values, df_zone.y.values, names, variances, num_reals, seed_seq)
+        )
+    if num_workers is not None and num_workers > 1 and len(tasks) > 1:
+        if verbose:
+            print("drawing {0} zones with {1} workers".format(len(tasks), num_workers))
+        pool = mp.Pool(processes=min(num_workers, len(tasks)))
+        try:
+            results = [
+                pool.apply_async(_geostatistical_draw_worker, args=task)
+                for task in tasks
+            ]
+            results = [r.get() for r in results]
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        results = []
+        for i, task in enumerate(tasks):
+            if verbose:
+                print("drawing zone {0} of {1}".format(i + 1, len(tasks)))
+            results.append(_geostatistical_draw_worker(*task))
+
+    par = pst.parameter_data
+    dfs = []
+    for task, devs in zip(tasks, results):
+        names = task[3]
+        islog = (par.loc[names, "partrans"] == "log").values
+        means = par.loc[names, "parval1"].values.astype(float)
+        means[islog] = np.log10(means[islog])
+        reals = means + devs
+        reals[:, islog] = 10.0 ** reals[:, islog]
+        df = pd.DataFrame(reals, columns=names)
+        # parameter data order, as from ParameterEnsemble.from_gaussian_draw()
+        dfs.append(df.loc[:, par.index[par.index.isin(names)]])
+    return dfs
+
+
 def geostatistical_prior_builder(
-    pst, struct_dict, sigma_range=4, verbose=False, scale_offset=False
+    pst, struct_dict, sigma_range=4, verbose=False, scale_offset=False, sparse=False
 ):
     """construct a full prior covariance matrix using geostastical structures
     and parameter bounds information.
@@ -441,6 +531,8 @@ def geostatistical_prior_builder(
         scale_offset (`bool`): a flag to apply scale and offset to parameter upper and lower bounds
             before applying log transform.  Passed to pyemu.Cov.from_parameter_data().  Default
             is False
+        sparse (`bool`): flag to assemble the covariance matrix in `scipy.sparse` storage so that
+            only the geostatistical blocks and the diagonal are held in memory.  Default is False
 
     Returns:
         **pyemu.Cov**: a covariance matrix that includes all adjustable parameters in the control
@@ -456,7 +548,7 @@ def geostatistical_prior_builder(
         If the number of parameters exceeds about 20,000 this function may use all available memory
         then crash your computer.  In these high-dimensional cases, you probably dont need the prior
         covariance matrix itself, but rather an ensemble of paraaeter realizations.  In this case,
-        please use the `geostatistical_draws()` function.
+        please use the `geostatistical_draws()` function or `sparse=True`.
 
     Example::
 
@@ -479,6 +571,8 @@ def geostatistical_prior_builder(
     )
 
     full_cov_dict = {n: float(v) for n, v in zip(full_cov.col_names, full_cov.x)}
+    if sparse:
+        full_cov = full_cov.to_sparse()
     # full_cov = None
     par = pst.parameter_data
     for gs, items in struct_dict.items():
@@ -1,3 +1,4 @@
+import os
 import pandas as pd
 import numpy as np
 import pyemu
@@ -250,27 +251,18 @@ ALLMETRICS = {
 }
 
 
-def calc_metric_res(res, metric="all", bygroups=True, drop_zero_weight=True):
-    """Calculates unweighted metrics to quantify fit to observations for residuals
 
-    Args:
-        res (pandas DataFrame or filename): DataFrame read from a residuals file or filename
-        metric (list of str): metric to calculate (PBIAS, RMSE, MSE, NSE, MAE, NRMSE_SD,
-            NRMSE_MEAN, NRMSE_IQ, NRMSE_MAXMIN) case insensitive
-            Defaults to 'all' which calculates all available metrics
-        bygroups (Bool): Flag to summarize by groups or not. Defaults to True.
-        drop_zero_weight (Bool): flag to exclude zero-weighted observations
 
-    Returns:
-        **pandas.DataFrame**: single row. Columns are groups. Content is requested metrics
-    """
+def _get_metric_list(metric):
+    """private method to check the requested metrics and return them as
+    a list of lower-case metric names"""
     # check that metrics are a list - if 'all' calculate for them all
     if isinstance(metric, str):
         if metric.lower() == "all":
             metric = list(ALLMETRICS.keys())
         else:
-            metric = list(metric)
-    missing_metrics = ()
+            metric = [metric]
+    missing_metrics = []
     for cm in metric:
         if cm.lower() not in ALLMETRICS:
             missing_metrics.append(cm)
@@ -278,6 +270,376 @@ def calc_metric_res(res, metric="all", bygroups=True, drop_zero_weight=True):
         raise Exception(
             "Requested metrics: {} not implemented".format(" ".join(missing_metrics))
         )
+    return [cm.lower() for cm in metric]
+
+
+def _calc_metric_arrays(mod, obs, metric):
+    """vectorized version of the `ALLMETRICS` functions: calculates the
+    requested metrics for all the rows of `mod` at once.
+
+    Args:
+        mod (numpy.ndarray): 2-D array of modeled values, one realization per row
+        obs (numpy.ndarray): 1-D array of observed values
+        metric ([str]): lower-case names of the metrics to calculate
+
+    Returns:
+        **dict**: metric name keys with 1-D arrays (one value per row of `mod`)
+
+    Note:
+        the arguments are passed the same way as the `ALLMETRICS` functions are
+        called by `calc_metric_res()` and `calc_metric_ensemble()`, i.e. `f(mod, obs)`.
+        NaN modeled values are skipped like the pandas reductions do in the
+        `ALLMETRICS` functions
+
+    """
+    n = obs.shape[0]
+    dev = mod - obs
+    sum_obs = np.nansum(obs)
+    mean_obs = np.nanmean(obs)
+    std_obs = np.nanstd(obs)
+    sum_dev = np.nansum(dev, axis=1)
+    mse = np.nanmean(dev ** 2, axis=1)
+    rmse = np.sqrt(mse)
+    bias = (sum_dev / sum_obs) / n
+    ret = {}
+    for cm in metric:
+        if cm == "pbias":
+            ret[cm] = 100 * (sum_dev / sum_obs)
+        elif cm == "bias":
+            ret[cm] = bias
+        elif cm == "relative_bias":
+            ret[cm] = bias / mean_obs
+        elif cm == "rmse":
+            ret[cm] = rmse
+        elif cm == "mse":
+            ret[cm] = mse
+        elif cm in ["nse", "nnse"]:
+            # _NSE() is called as _NSE(mod, obs), so the variance is that of mod
+            mod_dev = mod - np.nanmean(mod, axis=1)[:, None]
+            nse = 1 - (np.nansum(dev ** 2, axis=1) / np.nansum(mod_dev ** 2, axis=1))
+            ret[cm] = nse if cm == "nse" else 1 / (2 - nse)
+        elif cm == "mae":
+            ret[cm] = np.nanmean(np.abs(dev), axis=1)
+        elif cm == "kge":
+            d_obs = obs - mean_obs
+            d_mod = mod - np.nanmean(mod, axis=1)[:, None]
+            r = np.nansum(d_obs * d_mod, axis=1) / np.sqrt(
+                np.nansum(d_mod ** 2, axis=1) * np.nansum(d_obs ** 2)
+            )
+            alpha = np.nanstd(mod, axis=1) / std_obs
+            beta = np.nansum(mod, axis=1) / sum_obs
+            ret[cm] = 1 - np.sqrt((r - 1) ** 2 + (alpha - 1) ** 2 + (beta - 1) ** 2)
+        elif cm == "nrmse_sd":
+            ret[cm] = rmse / std_obs
+        elif cm == "nrmse_mean":
+            ret[cm] = rmse / mean_obs
+        elif cm == "nrmse_iq":
+            ret[cm] = rmse / (np.percentile(obs, 75) - np.percentile(obs, 25))
+        elif cm == "nrmse_maxmin":
+            ret[cm] = rmse / (np.nanmax(obs) - np.nanmin(obs))
+        elif cm in ["standard_error", "relative_standard_error"]:
+            se = np.sqrt(np.nansum(dev ** 2, axis=1) / (n - 1))
+            if cm == "relative_standard_error":
+                se = se / np.sqrt(np.nansum((obs - mean_obs) ** 2) / (n - 1))
+            ret[cm] = se
+        elif cm == "volumetric_efficiency":
+            ret[cm] = 1 - (np.nansum(np.abs(dev), axis=1) / sum_obs)
+    return ret
+
+
+def _get_residual_stat_names(metric, group_names, phi):
+    """private method to get the column names of the `calc_residual_stats()`
+    dataframe"""
+    names = []
+    if phi:
+        names.append("PHI_total")
+        names.extend(["PHI_{}".format(cg) for cg in group_names])
+    for cm in metric:
+        names.append("{}_total".format(cm.upper()))
+        names.extend(["{}_{}".format(cm.upper(), cg) for cg in group_names])
+    return names
+
+
+def _calc_residual_block(mod, obs, weights, groups, metric, phi):
+    """the residual kernel: calculates weighted phi, per-group phi and the
+    requested metrics for a block of realizations in one pass
+
+    Args:
+        mod (numpy.ndarray): 2-D array of modeled values, one realization per row
+        obs (numpy.ndarray): 1-D array of observed values
+        weights (numpy.ndarray): 1-D array of observation weights
+        groups ([(str,slice or numpy.ndarray)]): list of group name and column
+            index pairs.  Can be empty
+        metric ([str]): lower-case names of the metrics to calculate
+        phi (bool): flag to include the (weighted) phi columns
+
+    Returns:
+        **numpy.ndarray**: 2-D array with one row per realization and the columns
+        named by `_get_residual_stat_names()`
+
+    """
+    # the row reductions need c-ordered blocks to sum like the 1-D functions do
+    mod = np.ascontiguousarray(mod, dtype=np.float64)
+    stats = []
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if phi:
+            wres = ((mod - obs) * weights) ** 2
+            stats.append(np.nansum(wres, axis=1))
+            for _, idxs in groups:
+                stats.append(np.nansum(wres[:, idxs], axis=1))
+        if len(metric) > 0:
+            total = _calc_metric_arrays(mod, obs, metric)
+            by_group = [
+                _calc_metric_arrays(
+                    np.ascontiguousarray(mod[:, idxs]), obs[idxs], metric
+                )
+                for _, idxs in groups
+            ]
+            for cm in metric:
+                stats.append(total[cm])
+                stats.extend([grp_stats[cm] for grp_stats in by_group])
+    return np.column_stack(stats).reshape(mod.shape[0], len(stats))
+
+
+def _get_residual_groups(group_values, group_names):
+    """private method to get a list of group name and column index
+    pairs for the residual kernel"""
+    group_values = np.asarray(group_values)
+    groups = []
+    for cg in group_names:
+        idxs = np.flatnonzero(group_values == cg)
+        groups.append((cg, pyemu.en.Ensemble._as_slice(idxs)))
+    return groups
+
+
+def _get_residual_obs(pst, drop_zero_weight, bygroups):
+    """private method to get the observation names, values, weights and groups
+    used by `calc_residual_stats()` and `calc_residual_stats_stream()`"""
+    if not isinstance(pst, pyemu.Pst):
+        raise Exception("pst object must be of type pyemu.Pst")
+    obs = pst.observation_data
+    if drop_zero_weight:
+        obs = obs.loc[pst.nnz_obs_names]
+    groups = []
+    if bygroups is True:
+        groups = _get_residual_groups(obs.obgnme.values, obs.obgnme.unique())
+    return (
+        obs.obsnme.tolist(),
+        obs.obsval.values.astype(np.float64),
+        obs.weight.values.astype(np.float64),
+        groups,
+    )
+
+
+def calc_residual_stats(
+    ens,
+    pst,
+    metric="all",
+    bygroups=True,
+    subset_realizations=None,
+    drop_zero_weight=True,
+    phi=True,
+    max_block_size=1.0e7,
+):
+    """Calculates weighted phi, per-group phi and unweighted metrics for all the
+    realizations of an observation ensemble in one pass over the realization
+    by observation array.
+
+    Args:
+        ens (pandas DataFrame or pyemu.ObservationEnsemble): the ensemble of modeled
+            values.  Columns are observation names, rows are realizations
+        pst (pyemu.Pst object):  needed to obtain observation values, weights and groups
+        metric (list of str): metric to calculate (any of `ALLMETRICS`) case insensitive.
+            Defaults to 'all' which calculates all available metrics.  Can be
+            an empty list to only calculate phi
+        bygroups (Bool): Flag to summarize by groups or not. Defaults to True.
+        subset_realizations (iterable, optional): Subset of realizations for which
+                to report statistics. Defaults to None which returns all realizations.
+        drop_zero_weight (Bool): flag to exclude zero-weighted observations
+        phi (Bool): flag to include "PHI_total" and "PHI_<group>" columns of
+            the weighted sum of squared residuals.  Defaults to True.
+        max_block_size (float): the maximum number of values in the blocks of
+            realizations processed at once.  Defaults to 1.0e7
+
+    Returns:
+        **pandas.DataFrame**: rows are realizations. Columns are phi and then the
+        requested metrics for the total and each group, like `calc_metric_ensemble()`
+
+    Example::
+
+        pst = pyemu.Pst("my.pst")
+        oe = pyemu.ObservationEnsemble.from_csv(pst=pst, filename="my.0.obs.csv")
+        stats = pyemu.metrics.calc_residual_stats(oe, pst, metric=["rmse", "nse"])
+
+    """
+    metric = _get_metric_list(metric)
+    if isinstance(ens, pyemu.Ensemble):
+        ens = ens._df
+    if "real_name" in ens.columns:
+        ens = ens.set_index("real_name")
+    names, obsval, weights, groups = _get_residual_obs(pst, drop_zero_weight, bygroups)
+
+    col_idxs = ens.columns.get_indexer(names)
+    if np.any(col_idxs < 0):
+        raise Exception(
+            "the following observations are not in ens: {0}".format(
+                ",".join([n for n, i in zip(names, col_idxs) if i < 0])
+            )
+        )
+    col_idxs = pyemu.en.Ensemble._as_slice(col_idxs)
+    index = ens.index
+    values = ens.values
+    if subset_realizations is not None:
+        row_idxs = ens.index.get_indexer(list(subset_realizations))
+        if np.any(row_idxs < 0):
+            raise Exception("subset_realizations not in ens")
+        index = ens.index[row_idxs]
+        values = values[row_idxs]
+
+    stat_names = _get_residual_stat_names(metric, [g[0] for g in groups], phi)
+    stats = np.zeros((values.shape[0], len(stat_names)))
+    for rows in pyemu.en.Ensemble._row_blocks(
+        values.shape[0], len(names), max_block_size=max_block_size
+    ):
+        stats[rows] = _calc_residual_block(
+            values[rows, col_idxs], obsval, weights, groups, metric, phi
+        )
+    return pd.DataFrame(stats, index=index, columns=stat_names)
+
+
+def _iter_ensemble_chunks(filename, names, chunksize):
+    """private generator of (values, realization names) chunks of an ensemble
+    file.  The columns of the values are ordered like `names`
+
+    Args:
+        filename (str): the ensemble file.  Can be a CSV file, a dense or
+            standard PEST-format binary file or a columnar binary file
+        names ([str]): the observation names to read
+        chunksize (int): the number of realizations in each chunk
+
+    """
+
+    def _get_col_idxs(file_names):
+        col_idxs = pd.Index(file_names).get_indexer(names)
+        if np.any(col_idxs < 0):
+            raise Exception(
+                "the following observations are not in '{0}': {1}".format(
+                    filename, ",".join([n for n, i in zip(names, col_idxs) if i < 0])
+                )
+            )
+        return pyemu.en.Ensemble._as_slice(col_idxs)
+
+    if filename.lower().endswith(".csv"):
+        col_idxs = None
+        for df in pd.read_csv(filename, index_col=0, chunksize=chunksize):
+            if col_idxs is None:
+                col_idxs = _get_col_idxs(df.columns)
+            yield df.values[:, col_idxs], df.index
+        return
+
+    with open(filename, "rb") as f:
+        is_columnar = f.read(len(pyemu.Matrix.columnar_magic)) == (
+            pyemu.Matrix.columnar_magic
+        )
+    if is_columnar:
+        data, row_names, col_names = pyemu.Matrix.read_columnar(filename, mmap=True)
+        col_idxs = _get_col_idxs(col_names)
+        for start in range(0, len(row_names), chunksize):
+            rows = slice(start, start + chunksize)
+            yield np.array(data[rows][:, col_idxs]), row_names[rows]
+        return
+
+    itemp1, itemp2, icount = pyemu.Matrix.read_binary_header(filename)
+    if itemp1 == 0 and itemp2 == icount:
+        index = pyemu.Matrix.read_dense_index(filename)
+        row_names = index[0]
+        col_idxs = _get_col_idxs(index[1])
+        for start in range(0, len(row_names), chunksize):
+            rows = np.arange(start, min(len(row_names), start + chunksize))
+            data, _, _ = pyemu.Matrix.read_dense(filename, rows=rows, index=index)
+            yield data[:, col_idxs], row_names[start : start + chunksize]
+        return
+
+    mat = pyemu.Matrix.from_binary(filename, mmap=True)
+    _get_col_idxs(mat.col_names)
+    for start in range(0, mat.shape[0], chunksize):
+        row_names = mat.row_names[start : start + chunksize]
+        yield mat.get(row_names=row_names, col_names=names).x, row_names
+
+
+def calc_residual_stats_stream(
+    filename,
+    pst,
+    metric="all",
+    bygroups=True,
+    drop_zero_weight=True,
+    phi=True,
+    chunksize=1000,
+):
+    """Calculates weighted phi, per-group phi and unweighted metrics for all the
+    realizations of an observation ensemble file, reading the file in chunks of
+    realizations so that the full ensemble is never in memory.
+
+    Args:
+        filename (str): the ensemble file.  Files ending in ".csv" are read as CSV
+            (like `ObservationEnsemble.from_csv()`), otherwise the file can be a columnar
+            binary file (`ObservationEnsemble.to_columnar()`), a dense-format binary
+            file (`ObservationEnsemble.to_dense()`) or a standard PEST-format
+            binary file (`ObservationEnsemble.to_binary()`)
+        pst (pyemu.Pst object):  needed to obtain observation values, weights and groups
+        metric (list of str): metric to calculate (any of `ALLMETRICS`) case insensitive.
+            Defaults to 'all' which calculates all available metrics.  Can be
+            an empty list to only calculate phi
+        bygroups (Bool): Flag to summarize by groups or not. Defaults to True.
+        drop_zero_weight (Bool): flag to exclude zero-weighted observations
+        phi (Bool): flag to include "PHI_total" and "PHI_<group>" columns of
+            the weighted sum of squared residuals.  Defaults to True.
+        chunksize (int): the number of realizations read and processed at once.
+            Defaults to 1000
+
+    Returns:
+        **pandas.DataFrame**: rows are realizations. Columns are phi and then the
+        requested metrics for the total and each group, same as `calc_residual_stats()`
+
+    Example::
+
+        pst = pyemu.Pst("my.pst")
+        stats = pyemu.metrics.calc_residual_stats_stream("my.0.obs.bin", pst)
+        print(stats.PHI_total.describe())
+
+    """
+    metric = _get_metric_list(metric)
+    if not os.path.exists(filename):
+        raise Exception("filename '{0}' not found".format(filename))
+    chunksize = int(max(1, chunksize))
+    names, obsval, weights, groups = _get_residual_obs(pst, drop_zero_weight, bygroups)
+    stat_names = _get_residual_stat_names(metric, [g[0] for g in groups], phi)
+    stats, index = [], []
+    for values, row_names in _iter_ensemble_chunks(filename, names, chunksize):
+        stats.append(
+            _calc_residual_block(values, obsval, weights, groups, metric, phi)
+        )
+        index.extend(list(row_names))
+    if len(stats) == 0:
+        stats = [np.zeros((0, len(stat_names)))]
+    return pd.DataFrame(np.vstack(stats), index=index, columns=stat_names)
+
+
+def calc_metric_res(res, metric="all", bygroups=True, drop_zero_weight=True):
+    """Calculates unweighted metrics to quantify fit to observations for residuals
+
+    Args:
+        res (pandas DataFrame or filename): DataFrame read from a residuals file or filename
+        metric (list of str): metric to calculate (PBIAS, RMSE, MSE, NSE, MAE, NRMSE_SD,
+            NRMSE_MEAN, NRMSE_IQ, NRMSE_MAXMIN) case insensitive
+            Defaults to 'all' which calculates all available metrics
+        bygroups (Bool): Flag to summarize by groups or not. Defaults to True.
+        drop_zero_weight (Bool): flag to exclude zero-weighted observations
+
+    Returns:
+        **pandas.DataFrame**: single row. Columns are groups. Content is requested metrics
+    """
+    metric = _get_metric_list(metric)
 
     # sort out the res arg to be a file (to read) or already a dataframe
     if isinstance(res, str):
@@ -293,20 +655,24 @@ def calc_metric_res(res, metric="all", bygroups=True, drop_zero_weight=True):
     if drop_zero_weight:
         res = res.loc[res.weight != 0]
 
-    ret_df = pd.DataFrame(index=["single_realization"])
-
-    # calculate the matrics
-    for cm in metric:
-        f = ALLMETRICS[cm.lower()]
-        ret_df["{}_total".format(cm.upper())] = [
-            f(res.modelled, res.measured) for i in ret_df.index
-        ]
-
-        # if bygroups, do the groups as columns
-        if bygroups is True:
-            for cn, cg in res.groupby("group"):
-                ret_df["{}_{}".format(cm.upper(), cn)] = f(cg.modelled, cg.measured)
-    return ret_df
+    groups = []
+    if bygroups is True:
+        groups = _get_residual_groups(
+            res.group.values, [cn for cn, _ in res.groupby("group")]
+        )
+    stats = _calc_residual_block(
+        res.modelled.values.reshape(1, -1),
+        res.measured.values.astype(np.float64),
+        None,
+        groups,
+        metric,
+        False,
+    )
+    return pd.DataFrame(
+        stats,
+        index=["single_realization"],
+        columns=_get_residual_stat_names(metric, [g[0] for g in groups], False),
+    )
 
 
 def calc_metric_ensemble(
@@ -331,64 +697,28 @@ def calc_metric_ensemble(
         drop_zero_weight (Bool): flag to exclude zero-weighted observations
     Returns:
         **pandas.DataFrame**: rows are realizations. Columns are groups. Content is requested metrics
+
+    Note:
+        calls `calc_residual_stats()` without the phi columns
     """
 
     # TODO: handle zero weights due to PDC
-    # check that metrics are a list - if 'all' calculate for them all
-    if isinstance(metric, str):
-        if metric.lower() == "all":
-            metric = list(ALLMETRICS.keys())
-        else:
-            metric = list(metric)
-    missing_metrics = ()
-    for cm in metric:
-        if cm.lower() not in ALLMETRICS:
-            missing_metrics.append(cm)
-    if len(missing_metrics) > 0:
-        raise Exception(
-            "Requested metrics: {} not implemented".format(" ".join(missing_metrics))
-        )
-
-    # make sure subset_realizations is a list
-    if not isinstance(subset_realizations, list) and subset_realizations is not None:
-        subset_realizations = list(subset_realizations)
-
     if "real_name" in ens.columns:
         ens.set_index("real_name", inplace=True)
 
     if not isinstance(pst, pyemu.Pst):
         raise Exception("pst object must be of type pyemu.Pst")
 
-    # get the observation data
-    obs = pst.observation_data.copy()
-
     # confirm that the indices and observations line up
-    if False in np.unique(ens.columns == obs.index):
+    if False in np.unique(ens.columns == pst.observation_data.index):
         raise Exception("ens and pst observation names do not align")
 
-    if drop_zero_weight:
-        # subset to only include non-zero-weighted obs
-        ens = ens[pst.nnz_obs_names]
-        obs = obs.loc[pst.nnz_obs_names]
-
-    ret_df = pd.DataFrame(index=ens.index)
-    if subset_realizations is not None:
-        ret_df = ret_df.loc[subset_realizations]
-
-    # calculate the rmse total first
-    for cm in metric:
-        f = ALLMETRICS[cm.lower()]
-        ret_df["{}_total".format(cm.upper())] = [
-            f(ens.loc[i], obs.obsval) for i in ret_df.index
-        ]
-
-        # if bygroups, do the groups as columns
-        if bygroups is True:
-            for cg in obs.obgnme.unique():
-                cnames = obs.loc[obs.obgnme == cg].obsnme
-                ret_df["{}_{}".format(cm.upper(), cg)] = [
-                    f(ens.loc[i][cnames], obs.loc[cnames].obsval) for i in ret_df.index
-                ]
-        ret_df = ret_df.copy()
-
-    return ret_df
+    return calc_residual_stats(
+        ens,
+        pst,
+        metric=metric,
+        bygroups=bygroups,
+        subset_realizations=subset_realizations,
+        drop_zero_weight=drop_zero_weight,
+        phi=False,
+    )